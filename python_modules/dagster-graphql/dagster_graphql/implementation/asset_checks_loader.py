@@ -6,7 +6,6 @@
 from dagster._core.definitions.asset_check_evaluation import AssetCheckEvaluation
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
-from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.selector import RepositorySelector
 from dagster._core.host_representation.code_location import CodeLocation
 from dagster._core.host_representation.external import ExternalRepository
@@ -36,6 +35,8 @@
     GrapheneAssetCheckExecution,
 )
 from .fetch_asset_checks import asset_checks_iter
+from .loader import BatchRunLoader
+from .snapshot_cache import get_workspace_asset_graph
 
 
 class AssetChecksLoader:
@@ -125,7 +126,7 @@ def _fetch_checks(
             self._context.instance, check_keys=all_check_keys
         )
 
-        asset_graph = ExternalAssetGraph.from_workspace(self._context)
+        asset_graph = get_workspace_asset_graph(self._context)
         graphene_checks: Mapping[AssetKey, AssetChecksOrErrorUnion] = {}
         for asset_key in self._asset_keys:
             if asset_key in errors:
@@ -178,10 +179,10 @@ def get_checks_for_asset(
 
 
 def _execution_targets_latest_materialization(
-    instance: DagsterInstance,
     asset_record: Optional[AssetRecord],
     execution: AssetCheckExecutionRecord,
     resolved_status: AssetCheckExecutionResolvedStatus,
+    run_loader: BatchRunLoader,
 ) -> bool:
     # always show in progress checks
     if resolved_status == AssetCheckExecutionResolvedStatus.IN_PROGRESS:
@@ -225,10 +226,10 @@ def _execution_targets_latest_materialization(
         AssetCheckExecutionResolvedStatus.SKIPPED,
     ]:
         # As a last ditch effort, check if the check's run was launched after the materialization's
-        latest_materialization_run_record = instance.get_run_record_by_id(
+        latest_materialization_run_record = run_loader.get_run_record_by_run_id(
             latest_materialization_run_id
         )
-        execution_run_record = instance.get_run_record_by_id(execution.run_id)
+        execution_run_record = run_loader.get_run_record_by_run_id(execution.run_id)
         return bool(
             latest_materialization_run_record
             and execution_run_record
@@ -266,6 +267,23 @@ def _fetch_executions(self) -> Mapping[AssetCheckKey, Optional[GrapheneAssetChec
             )
         }
 
+        # runs are only needed to order executions that didn't complete relative to the latest
+        # materialization, so fetch all of them up front in a single query
+        run_ids = set()
+        for check_key, execution in latest_executions_by_check_key.items():
+            if statuses_by_execution_id[execution.id] in [
+                AssetCheckExecutionResolvedStatus.EXECUTION_FAILED,
+                AssetCheckExecutionResolvedStatus.SKIPPED,
+            ]:
+                run_ids.add(execution.run_id)
+                asset_record = asset_records_by_asset_key.get(check_key.asset_key)
+                latest_materialization = (
+                    asset_record.asset_entry.last_materialization if asset_record else None
+                )
+                if latest_materialization:
+                    run_ids.add(latest_materialization.run_id)
+        run_loader = BatchRunLoader(self._instance, run_ids)
+
         self._executions = {}
         for check_key in self._check_keys:
             execution = latest_executions_by_check_key.get(check_key)
@@ -276,10 +294,10 @@ def _fetch_executions(self) -> Mapping[AssetCheckKey, Optional[GrapheneAssetChec
                 self._executions[check_key] = (
                     GrapheneAssetCheckExecution(execution, resolved_status)
                     if _execution_targets_latest_materialization(
-                        instance=self._instance,
                         asset_record=asset_records_by_asset_key.get(check_key.asset_key),
                         execution=execution,
                         resolved_status=resolved_status,
+                        run_loader=run_loader,
                     )
                     else None
                 )
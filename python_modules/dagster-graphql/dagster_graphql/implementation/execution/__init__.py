@@ -1,7 +1,7 @@
 import asyncio
 import os
 import sys
-from typing import TYPE_CHECKING, Any, AsyncIterator, Mapping, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, AsyncIterator, Mapping, Optional, Sequence, Union
 
 # re-exports
 import dagster._check as check
@@ -21,9 +21,6 @@
 from dagster._core.storage.dagster_run import CANCELABLE_RUN_STATUSES
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.error import serializable_error_info_from_exc_info
-from starlette.concurrency import (
-    run_in_threadpool,  # can provide this indirectly if we dont want starlette dep in dagster-graphql
-)
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.roots.mutation import (
@@ -36,6 +33,7 @@
     create_and_launch_partition_backfill as create_and_launch_partition_backfill,
     resume_partition_backfill as resume_partition_backfill,
 )
+from .run_event_hub import get_run_event_hub
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.logs.compute_logs import (
@@ -239,7 +237,6 @@ async def gen_events_for_run(
         GraphenePipelineRunLogsSubscriptionFailure,
         GraphenePipelineRunLogsSubscriptionSuccess,
     )
-    from ..events import from_event_record
 
     check.str_param(run_id, "run_id")
     after_cursor = check.opt_str_param(after_cursor, "after_cursor")
@@ -261,49 +258,34 @@ async def gen_events_for_run(
         dont_send_past_records = True
         after_cursor = None
 
-    chunk_size = get_chunk_size()
-    # load the existing events in chunks
-    has_more = True
-    while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
-            run_id=run_id,
-            cursor=after_cursor,
-            limit=chunk_size,
-        )
+    # subscribers watching the same run share a single storage watch, and the conversion of each
+    # new event, through the run's event hub
+    hub = get_run_event_hub(instance, run_id, run.job_name)
+    subscription = await hub.subscribe(after_cursor)
+    try:
         if not dont_send_past_records:
-            yield GraphenePipelineRunLogsSubscriptionSuccess(
-                run=GrapheneRun(record),
-                messages=[
-                    from_event_record(record.event_log_entry, run.job_name)
-                    for record in connection.records
-                ],
-                hasMorePastEvents=connection.has_more,
-                cursor=connection.cursor,
-            )
-        has_more = connection.has_more
-        after_cursor = connection.cursor
-
-    loop = asyncio.get_event_loop()
-    queue: asyncio.Queue[Tuple[Any, Any]] = asyncio.Queue()
+            chunk_size = get_chunk_size()
+            has_more = True
+            while has_more:
+                batch = await subscription.next_past_batch(chunk_size)
+                yield GraphenePipelineRunLogsSubscriptionSuccess(
+                    run=GrapheneRun(record),
+                    messages=[message.message for message in batch.messages],
+                    hasMorePastEvents=batch.has_more_past_events,
+                    cursor=batch.cursor,
+                )
+                has_more = batch.has_more_past_events
 
-    def _enqueue(event, cursor):
-        loop.call_soon_threadsafe(queue.put_nowait, (event, cursor))
-
-    # watch for live events
-    instance.watch_event_logs(run_id, after_cursor, _enqueue)
-    try:
         while True:
-            event, cursor = await queue.get()
+            message = await subscription.next_live_message()
             yield GraphenePipelineRunLogsSubscriptionSuccess(
                 run=GrapheneRun(record),
-                messages=[from_event_record(event, run.job_name)],
+                messages=[message.message],
                 hasMorePastEvents=False,
-                cursor=cursor,
+                cursor=message.cursor,
             )
     finally:
-        instance.end_watch_event_logs(run_id, _enqueue)
+        subscription.close()
 
 
 async def gen_compute_logs(
@@ -15,6 +15,7 @@
 from dagster._utils import utc_datetime_from_timestamp
 from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
+from ..snapshot_cache import get_workspace_asset_graph
 from ..utils import (
     AssetBackfillPreviewParams,
     BackfillParams,
@@ -78,7 +79,7 @@ def get_asset_backfill_preview(
 ) -> Sequence["GrapheneAssetPartitions"]:
     from ...schema.backfill import GrapheneAssetPartitions
 
-    asset_graph = ExternalAssetGraph.from_workspace(graphene_info.context)
+    asset_graph = get_workspace_asset_graph(graphene_info.context)
 
     check.invariant(backfill_preview_params.get("assetSelection") is not None)
     check.invariant(backfill_preview_params.get("partitionNames") is not None)
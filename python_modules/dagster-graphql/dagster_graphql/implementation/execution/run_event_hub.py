@@ -0,0 +1,283 @@
+import asyncio
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import dagster._check as check
+from dagster._core.event_api import EventLogCursor, EventLogRecord
+from dagster._core.events.log import EventLogEntry
+from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.base import EventLogConnection
+from starlette.concurrency import run_in_threadpool
+
+
+def get_event_hub_buffer_size() -> int:
+    return int(os.getenv("DAGSTER_UI_EVENT_HUB_BUFFER_SIZE", "2000"))
+
+
+class RunEventMessage(NamedTuple):
+    storage_id: int
+    cursor: str
+    # the converted graphene event, shared between every subscriber it is sent to
+    message: Any
+
+
+class RunEventBatch(NamedTuple):
+    messages: List[RunEventMessage]
+    cursor: Optional[str]
+    has_more_past_events: bool
+
+
+def _to_run_event_message(
+    event: EventLogEntry, storage_id: int, cursor: str, job_name: str
+) -> RunEventMessage:
+    from ..events import from_event_record
+
+    return RunEventMessage(
+        storage_id=storage_id, cursor=cursor, message=from_event_record(event, job_name)
+    )
+
+
+class RunEventHub:
+    """Fans out the events of a single run to every subscriber watching it in this process.
+
+    The hub holds a single event log watch for the run, converts each new event into its graphene
+    representation once, and keeps the most recent converted events in a bounded ring buffer. A new
+    subscription is served the events it has not seen from storage up to the start of the buffer,
+    then from the buffer, and then receives live events as they are published to the hub.
+    """
+
+    def __init__(
+        self, instance: DagsterInstance, run_id: str, job_name: str, buffer_size: int
+    ) -> None:
+        self._instance = check.inst_param(instance, "instance", DagsterInstance)
+        self._run_id = check.str_param(run_id, "run_id")
+        self._job_name = check.str_param(job_name, "job_name")
+        self._loop = asyncio.get_running_loop()
+        check.int_param(buffer_size, "buffer_size")
+        check.invariant(buffer_size > 0, "buffer_size must be positive")
+        self._buffer: Deque[RunEventMessage] = deque(maxlen=buffer_size)
+        # events with a storage id up to and including this one are not in the buffer and must be
+        # read from storage; None if every event of the run has been published to the hub
+        self._buffer_start_id: Optional[int] = None
+        self._latest_id: Optional[int] = None
+        self._subscribers: Set["asyncio.Queue[RunEventMessage]"] = set()
+        self._num_subscribers = 0
+        self._start_lock = asyncio.Lock()
+        self._watching = False
+        self._closed = False
+
+    @property
+    def num_subscribers(self) -> int:
+        return self._num_subscribers
+
+    async def _ensure_watching(self) -> None:
+        async with self._start_lock:
+            if self._watching or self._closed:
+                return
+
+            # only events written after the current latest event are published through the hub,
+            # earlier ones are read from storage by each subscriber as needed
+            connection = await run_in_threadpool(
+                self._instance.get_records_for_run,
+                run_id=self._run_id,
+                limit=1,
+                ascending=False,
+            )
+            if self._closed:
+                return
+
+            if connection.records:
+                self._buffer_start_id = connection.records[0].storage_id
+                self._latest_id = self._buffer_start_id
+            self._instance.watch_event_logs(
+                self._run_id,
+                str(EventLogCursor.from_storage_id(self._latest_id))
+                if self._latest_id is not None
+                else None,
+                self._on_event,
+            )
+            self._watching = True
+
+    def _on_event(self, event: EventLogEntry, cursor: str) -> None:
+        # called from the storage watcher thread
+        self._loop.call_soon_threadsafe(self._publish, event, cursor)
+
+    def _publish(self, event: EventLogEntry, cursor: str) -> None:
+        storage_id = EventLogCursor.parse(cursor).storage_id()
+        if self._latest_id is not None and storage_id <= self._latest_id:
+            return
+
+        self._latest_id = storage_id
+        message = _to_run_event_message(event, storage_id, cursor, self._job_name)
+        if len(self._buffer) == self._buffer.maxlen:
+            self._buffer_start_id = self._buffer[0].storage_id
+        self._buffer.append(message)
+
+        for queue in self._subscribers:
+            queue.put_nowait(message)
+
+    def _close(self) -> None:
+        self._closed = True
+        if self._watching:
+            self._instance.end_watch_event_logs(self._run_id, self._on_event)
+            self._watching = False
+
+    async def subscribe(self, after_cursor: Optional[str]) -> "RunEventSubscription":
+        """Subscribes to the events of the run after the given cursor. The returned subscription
+        must be closed once it is no longer used.
+        """
+        self._num_subscribers += 1
+        try:
+            await self._ensure_watching()
+            after_id = await self._resolve_storage_id(after_cursor)
+        except BaseException:
+            self._unsubscribe(None)
+            raise
+
+        # registering the queue and snapshotting the buffer happen without yielding to the event
+        # loop, so every event is either in the snapshot or delivered to the queue
+        queue: asyncio.Queue[RunEventMessage] = asyncio.Queue()
+        self._subscribers.add(queue)
+        return RunEventSubscription(
+            hub=self,
+            queue=queue,
+            after_cursor=after_cursor,
+            after_id=after_id,
+            buffered=list(self._buffer),
+            buffer_start_id=self._buffer_start_id,
+        )
+
+    def _unsubscribe(self, queue: Optional["asyncio.Queue[RunEventMessage]"]) -> None:
+        if queue is not None:
+            self._subscribers.discard(queue)
+        self._num_subscribers -= 1
+        if not self._num_subscribers:
+            self._close()
+            _remove_hub(self)
+
+    async def _resolve_storage_id(self, cursor: Optional[str]) -> Optional[int]:
+        """Returns the storage id of the last event before the given cursor, if any."""
+        if not cursor:
+            return None
+
+        parsed = EventLogCursor.parse(cursor)
+        if parsed.is_id_cursor():
+            return parsed.storage_id()
+
+        # offset based cursor, find the storage id of the first event after it
+        connection = await run_in_threadpool(
+            self._instance.get_records_for_run, run_id=self._run_id, cursor=cursor, limit=1
+        )
+        if connection.records:
+            return connection.records[0].storage_id - 1
+        return self._latest_id
+
+    async def _fetch_records(self, cursor: Optional[str], limit: int) -> EventLogConnection:
+        return await run_in_threadpool(
+            self._instance.get_records_for_run, run_id=self._run_id, cursor=cursor, limit=limit
+        )
+
+    def _to_message(self, record: EventLogRecord) -> RunEventMessage:
+        return _to_run_event_message(
+            record.event_log_entry,
+            record.storage_id,
+            str(EventLogCursor.from_storage_id(record.storage_id)),
+            self._job_name,
+        )
+
+
+class RunEventSubscription:
+    """A single subscriber's view of a run event hub. Past events are read with
+    `next_past_batch` until it returns a batch without `has_more_past_events`, after which live
+    events are read with `next_live_message`.
+    """
+
+    def __init__(
+        self,
+        hub: RunEventHub,
+        queue: "asyncio.Queue[RunEventMessage]",
+        after_cursor: Optional[str],
+        after_id: Optional[int],
+        buffered: List[RunEventMessage],
+        buffer_start_id: Optional[int],
+    ) -> None:
+        self._hub = hub
+        self._queue = queue
+        self._cursor = after_cursor
+        self._last_id = after_id
+        # events up to and including the buffer start are read from storage, the rest were in the
+        # buffer when subscribing
+        self._buffer_start_id = buffer_start_id
+        self._reading_storage = buffer_start_id is not None and (
+            after_id is None or after_id < buffer_start_id
+        )
+        self._unseen_buffered = [
+            message for message in buffered if after_id is None or message.storage_id > after_id
+        ]
+        self._closed = False
+
+    async def next_past_batch(self, chunk_size: int) -> RunEventBatch:
+        """Returns the next chunk of at most `chunk_size` past events. Always returns at least one
+        batch, even if there are no past events.
+        """
+        messages: List[RunEventMessage] = []
+        if self._reading_storage:
+            connection = await self._hub._fetch_records(self._cursor, chunk_size)  # noqa: SLF001
+            buffer_start_id = check.not_none(self._buffer_start_id)
+            records = [
+                record for record in connection.records if record.storage_id <= buffer_start_id
+            ]
+            self._reading_storage = (
+                connection.has_more
+                and bool(records)
+                and len(records) == len(connection.records)
+                and records[-1].storage_id < buffer_start_id
+            )
+            messages = [self._hub._to_message(record) for record in records]  # noqa: SLF001
+        else:
+            messages = self._unseen_buffered[:chunk_size]
+            self._unseen_buffered = self._unseen_buffered[chunk_size:]
+
+        if messages:
+            self._last_id = messages[-1].storage_id
+            self._cursor = messages[-1].cursor
+
+        return RunEventBatch(
+            messages=messages,
+            cursor=self._cursor,
+            has_more_past_events=self._reading_storage or bool(self._unseen_buffered),
+        )
+
+    async def next_live_message(self) -> RunEventMessage:
+        """Waits for the next event published to the hub after the events already returned."""
+        while True:
+            message = await self._queue.get()
+            if self._last_id is None or message.storage_id > self._last_id:
+                self._last_id = message.storage_id
+                self._cursor = message.cursor
+                return message
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._hub._unsubscribe(self._queue)  # noqa: SLF001
+
+
+# hubs are scoped to the event loop that their subscribers run on
+_run_event_hubs: Dict[Tuple[asyncio.AbstractEventLoop, int, str], RunEventHub] = {}
+
+
+def get_run_event_hub(instance: DagsterInstance, run_id: str, job_name: str) -> RunEventHub:
+    key = (asyncio.get_running_loop(), id(instance), run_id)
+    if key not in _run_event_hubs:
+        _run_event_hubs[key] = RunEventHub(
+            instance, run_id, job_name, buffer_size=get_event_hub_buffer_size()
+        )
+    return _run_event_hubs[key]
+
+
+def _remove_hub(hub: RunEventHub) -> None:
+    for key, existing in list(_run_event_hubs.items()):
+        if existing is hub:
+            del _run_event_hubs[key]
@@ -10,6 +10,7 @@
 from dagster._core.workspace.context import BaseWorkspaceRequestContext, WorkspaceRequestContext
 from dagster._utils.error import serializable_error_info_from_exc_info
 
+from .snapshot_cache import get_cached_location_value
 from .utils import UserFacingGraphQLError
 
 if TYPE_CHECKING:
@@ -52,7 +53,15 @@ def _get_external_job_or_raise(
     else:
         code_location = ctx.get_code_location(selector.location_name)
         try:
-            external_job = code_location.get_external_job(selector)
+            # subsetting a job requires a call to the code server, so cache the result until the
+            # code location is reloaded
+            external_job = get_cached_location_value(
+                ctx,
+                selector.location_name,
+                "external_job",
+                selector,
+                lambda: code_location.get_external_job(selector),
+            )
         except Exception:
             error_info = serializable_error_info_from_exc_info(sys.exc_info())
             raise UserFacingGraphQLError(
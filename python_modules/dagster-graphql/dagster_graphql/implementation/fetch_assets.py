@@ -24,7 +24,6 @@
     _check as check,
 )
 from dagster._core.definitions.data_time import CachingDataTimeResolver
-from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.definitions.partition import (
     CachingDynamicPartitionsLoader,
     PartitionsDefinition,
@@ -43,6 +42,7 @@
 from dagster._core.host_representation.external import ExternalRepository
 from dagster._core.host_representation.external_data import ExternalAssetNode
 from dagster._core.instance import DynamicPartitionsStore
+from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.storage.partition_status_cache import (
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
@@ -56,6 +56,7 @@
     CrossRepoAssetDependedByLoader,
     StaleStatusLoader,
 )
+from dagster_graphql.implementation.snapshot_cache import get_workspace_asset_graph
 
 if TYPE_CHECKING:
     from ..schema.asset_graph import GrapheneAssetNode, GrapheneAssetNodeDefinitionCollision
@@ -188,7 +189,7 @@ def get_asset_nodes_by_asset_key(
 
     stale_status_loader = StaleStatusLoader(
         instance=graphene_info.context.instance,
-        asset_graph=lambda: ExternalAssetGraph.from_workspace(graphene_info.context),
+        asset_graph=lambda: get_workspace_asset_graph(graphene_info.context),
     )
 
     dynamic_partitions_loader = CachingDynamicPartitionsLoader(graphene_info.context.instance)
@@ -353,9 +354,13 @@ def get_partition_subsets(
     asset_key: AssetKey,
     dynamic_partitions_loader: DynamicPartitionsStore,
     partitions_def: Optional[PartitionsDefinition] = None,
+    asset_record: Optional[AssetRecord] = None,
 ) -> Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]:
     """Returns a tuple of PartitionSubset objects: the first is the materialized partitions,
     the second is the failed partitions, and the third are in progress.
+
+    If the asset record for the asset has already been fetched (e.g. by a batch loader), it can be
+    passed in to avoid fetching it again when reading the asset status cache.
     """
     if not partitions_def:
         return None, None, None
@@ -364,7 +369,7 @@ def get_partition_subsets(
         # When the "cached_status_data" column exists in storage, update the column to contain
         # the latest partition status values
         updated_cache_value = get_and_update_asset_status_cache_value(
-            instance, asset_key, partitions_def, dynamic_partitions_loader
+            instance, asset_key, partitions_def, dynamic_partitions_loader, asset_record
         )
         materialized_subset = (
             updated_cache_value.deserialize_materialized_partition_subsets(partitions_def)
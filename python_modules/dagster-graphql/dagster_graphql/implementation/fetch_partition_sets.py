@@ -24,6 +24,8 @@
 
 from dagster_graphql.schema.util import ResolveInfo
 
+from .snapshot_cache import get_cached_location_value
+
 if TYPE_CHECKING:
     from dagster_graphql.schema.errors import GraphenePartitionSetNotFoundError
     from dagster_graphql.schema.partition_sets import (
@@ -48,11 +50,28 @@ def get_partition_sets_or_error(
     check.str_param(pipeline_name, "pipeline_name")
     location = graphene_info.context.get_code_location(repository_selector.location_name)
     repository = location.get_repository(repository_selector.repository_name)
-    partition_sets = [
-        partition_set
-        for partition_set in repository.get_external_partition_sets()
-        if partition_set.job_name == pipeline_name
-    ]
+
+    def _get_partition_sets_for_job() -> Sequence[ExternalPartitionSet]:
+        return sorted(
+            [
+                partition_set
+                for partition_set in repository.get_external_partition_sets()
+                if partition_set.job_name == pipeline_name
+            ],
+            key=lambda partition_set: (
+                partition_set.job_name,
+                partition_set.mode,
+                partition_set.name,
+            ),
+        )
+
+    partition_sets = get_cached_location_value(
+        graphene_info.context,
+        repository_selector.location_name,
+        "partition_sets",
+        (repository_selector.repository_name, pipeline_name),
+        _get_partition_sets_for_job,
+    )
 
     return GraphenePartitionSets(
         results=[
@@ -60,14 +79,7 @@ def get_partition_sets_or_error(
                 external_repository_handle=repository.handle,
                 external_partition_set=partition_set,
             )
-            for partition_set in sorted(
-                partition_sets,
-                key=lambda partition_set: (
-                    partition_set.job_name,
-                    partition_set.mode,
-                    partition_set.name,
-                ),
-            )
+            for partition_set in partition_sets
         ]
     )
 
@@ -25,6 +25,7 @@
 from dagster._core.storage.tags import TagType, get_tag_type
 
 from .external import ensure_valid_config, get_external_job_or_raise
+from .utils import MaybeAwaitable, map_storage_result, run_storage_call
 
 if TYPE_CHECKING:
     from ..schema.asset_graph import GrapheneAssetLatestInfo, GrapheneAssetNode
@@ -40,16 +41,20 @@
 
 def get_run_by_id(
     graphene_info: "ResolveInfo", run_id: str
-) -> Union["GrapheneRun", "GrapheneRunNotFoundError"]:
+) -> MaybeAwaitable[Union["GrapheneRun", "GrapheneRunNotFoundError"]]:
     from ..schema.errors import GrapheneRunNotFoundError
     from ..schema.pipelines.pipeline import GrapheneRun
 
+    def _to_graphene(
+        record: Optional[RunRecord],
+    ) -> Union["GrapheneRun", "GrapheneRunNotFoundError"]:
+        if not record:
+            return GrapheneRunNotFoundError(run_id)
+        else:
+            return GrapheneRun(record)
+
     instance = graphene_info.context.instance
-    record = instance.get_run_record_by_id(run_id)
-    if not record:
-        return GrapheneRunNotFoundError(run_id)
-    else:
-        return GrapheneRun(record)
+    return map_storage_result(run_storage_call(instance.get_run_record_by_id, run_id), _to_graphene)
 
 
 def get_run_tag_keys(graphene_info: "ResolveInfo") -> "GrapheneRunTagKeys":
@@ -114,7 +119,7 @@ def get_runs(
     filters: Optional[RunsFilter],
     cursor: Optional[str] = None,
     limit: Optional[int] = None,
-) -> Sequence["GrapheneRun"]:
+) -> MaybeAwaitable[Sequence["GrapheneRun"]]:
     from ..schema.pipelines.pipeline import GrapheneRun
 
     check.opt_inst_param(filters, "filters", RunsFilter)
@@ -123,10 +128,10 @@ def get_runs(
 
     instance = graphene_info.context.instance
 
-    return [
-        GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
-    ]
+    return map_storage_result(
+        run_storage_call(instance.get_run_records, filters=filters, cursor=cursor, limit=limit),
+        lambda records: [GrapheneRun(record) for record in records],
+    )
 
 
 def get_run_ids(
@@ -134,14 +139,14 @@ def get_run_ids(
     filters: Optional[RunsFilter],
     cursor: Optional[str] = None,
     limit: Optional[int] = None,
-) -> Sequence[str]:
+) -> MaybeAwaitable[Sequence[str]]:
     check.opt_inst_param(filters, "filters", RunsFilter)
     check.opt_str_param(cursor, "cursor")
     check.opt_int_param(limit, "limit")
 
     instance = graphene_info.context.instance
 
-    return instance.get_run_ids(filters=filters, cursor=cursor, limit=limit)
+    return run_storage_call(instance.get_run_ids, filters=filters, cursor=cursor, limit=limit)
 
 
 PENDING_STATUSES = [
@@ -318,8 +323,10 @@ def _get_in_progress_runs_for_assets(
     return in_progress_run_ids_by_asset, unstarted_run_ids_by_asset
 
 
-def get_runs_count(graphene_info: "ResolveInfo", filters: Optional[RunsFilter]) -> int:
-    return graphene_info.context.instance.get_runs_count(filters)
+def get_runs_count(
+    graphene_info: "ResolveInfo", filters: Optional[RunsFilter]
+) -> MaybeAwaitable[int]:
+    return run_storage_call(graphene_info.context.instance.get_runs_count, filters)
 
 
 def validate_pipeline_config(
@@ -379,19 +386,25 @@ def get_logs_for_run(
     run_id: str,
     cursor: Optional[str] = None,
     limit: Optional[int] = None,
-) -> Union["GrapheneRunNotFoundError", "GrapheneEventConnection"]:
+) -> MaybeAwaitable[Union["GrapheneRunNotFoundError", "GrapheneEventConnection"]]:
     from ..schema.errors import GrapheneRunNotFoundError
     from ..schema.pipelines.pipeline import GrapheneEventConnection
     from .events import from_event_record
 
     instance = graphene_info.context.instance
-    run = instance.get_run_by_id(run_id)
-    if not run:
-        return GrapheneRunNotFoundError(run_id)
-
-    conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
-    return GrapheneEventConnection(
-        events=[from_event_record(record.event_log_entry, run.job_name) for record in conn.records],
-        cursor=conn.cursor,
-        hasMore=conn.has_more,
-    )
+
+    def _fetch() -> Union["GrapheneRunNotFoundError", "GrapheneEventConnection"]:
+        run = instance.get_run_by_id(run_id)
+        if not run:
+            return GrapheneRunNotFoundError(run_id)
+
+        conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
+        return GrapheneEventConnection(
+            events=[
+                from_event_record(record.event_log_entry, run.job_name) for record in conn.records
+            ],
+            cursor=conn.cursor,
+            hasMore=conn.has_more,
+        )
+
+    return run_storage_call(_fetch)
@@ -3,15 +3,27 @@
 import dagster._check as check
 from dagster._core.host_representation import ExternalRepository
 
+from .snapshot_cache import get_cached_location_value
 from .utils import GraphSelector
 
 
-def get_solid(repo, name):
-    return get_used_solid_map(repo)[name]
+def get_solid(graphene_info, repo, name):
+    return _get_cached_used_solid_map(graphene_info, repo)[name]
 
 
-def get_solids(repo):
-    return get_used_solid_map(repo).values()
+def get_solids(graphene_info, repo):
+    return _get_cached_used_solid_map(graphene_info, repo).values()
+
+
+def _get_cached_used_solid_map(graphene_info, repo):
+    check.inst_param(repo, "repo", ExternalRepository)
+    return get_cached_location_value(
+        graphene_info.context,
+        repo.handle.location_name,
+        "used_solid_map",
+        repo.name,
+        lambda: get_used_solid_map(repo),
+    )
 
 
 def get_used_solid_map(repo):
@@ -7,8 +7,10 @@
     DagsterInstance,
     _check as check,
 )
+from dagster._core.definitions.data_time import CachingDataTimeResolver
 from dagster._core.definitions.data_version import CachingStaleStatusResolver
 from dagster._core.definitions.events import AssetKey
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
 from dagster._core.events.log import EventLogEntry
 from dagster._core.host_representation import ExternalRepository
 from dagster._core.host_representation.external_data import (
@@ -18,7 +20,9 @@
 )
 from dagster._core.scheduler.instigation import InstigatorState, InstigatorType
 from dagster._core.storage.dagster_run import RunRecord, RunsFilter
+from dagster._core.storage.event_log.base import AssetRecord
 from dagster._core.workspace.context import WorkspaceRequestContext
+from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
 
 class RepositoryDataType(Enum):
@@ -163,54 +167,99 @@ def __init__(self, instance: DagsterInstance, run_ids: Iterable[str]):
         self._instance = instance
         self._run_ids: Set[str] = set(run_ids)
         self._records: Dict[str, RunRecord] = {}
+        self._fetched = False
 
     def get_run_record_by_run_id(self, run_id: str) -> Optional[RunRecord]:
         if run_id not in self._run_ids:
             check.failed(
                 f"Run id {run_id} not recognized for this loader.  Expected one of: {self._run_ids}"
             )
-        if self._records.get(run_id) is None:
+        if not self._fetched:
             self._fetch()
         return self._records.get(run_id)
 
     def _fetch(self) -> None:
+        self._fetched = True
+        if not self._run_ids:
+            return
         records = self._instance.get_run_records(RunsFilter(run_ids=list(self._run_ids)))
         for record in records:
             self._records[record.dagster_run.run_id] = record
 
 
 class BatchMaterializationLoader:
-    """A batch loader that fetches materializations for asset keys.  This loader is expected to be
-    instantiated with a set of asset keys.
+    """A batch loader that fetches asset records, and through them the latest materializations, for
+    a set of asset keys. This loader is expected to be instantiated with a set of asset keys, and
+    fetches the asset records for all of them with a single storage call the first time any of them
+    is requested.
     """
 
     def __init__(self, instance: DagsterInstance, asset_keys: Iterable[AssetKey]):
         self._instance = instance
-        self._asset_keys: List[AssetKey] = list(asset_keys)
+        self._asset_keys: Set[AssetKey] = set(asset_keys)
         self._fetched = False
-        self._materializations: Mapping[AssetKey, Optional[EventLogEntry]] = {}
+        self._asset_records: Mapping[AssetKey, AssetRecord] = {}
 
-    def get_latest_materialization_for_asset_key(
-        self, asset_key: AssetKey
-    ) -> Optional[EventLogEntry]:
+    def _check_asset_key(self, asset_key: AssetKey) -> None:
         if asset_key not in self._asset_keys:
             check.failed(
                 f"Asset key {asset_key} not recognized for this loader.  Expected one of:"
                 f" {self._asset_keys}"
             )
 
+    def get_asset_record(self, asset_key: AssetKey) -> Optional[AssetRecord]:
+        self._check_asset_key(asset_key)
         if not self._fetched:
             self._fetch()
-        return self._materializations.get(asset_key)
+        return self._asset_records.get(asset_key)
+
+    def get_latest_materialization_for_asset_key(
+        self, asset_key: AssetKey
+    ) -> Optional[EventLogEntry]:
+        asset_record = self.get_asset_record(asset_key)
+        return asset_record.asset_entry.last_materialization if asset_record else None
 
     def _fetch(self) -> None:
         self._fetched = True
-        self._materializations = {
-            record.asset_entry.asset_key: record.asset_entry.last_materialization
-            for record in self._instance.get_asset_records(self._asset_keys)
+        self._asset_records = {
+            record.asset_entry.asset_key: record
+            for record in self._instance.get_asset_records(list(self._asset_keys))
         }
 
 
+class BatchDataTimeResolverLoader:
+    """A batch loader that shares a single CachingDataTimeResolver, and the CachingInstanceQueryer
+    backing it, between all asset nodes of a repository. The asset records of every asset with a
+    freshness policy in the repository are prefetched in a single storage call when the resolver is
+    first created.
+    """
+
+    def __init__(self, instance: DagsterInstance):
+        self._instance = instance
+        self._resolvers: Dict[Tuple[str, str], CachingDataTimeResolver] = {}
+
+    def get_data_time_resolver(
+        self, external_repository: ExternalRepository
+    ) -> CachingDataTimeResolver:
+        repository_key = (external_repository.handle.location_name, external_repository.name)
+        if repository_key not in self._resolvers:
+            asset_graph = ExternalAssetGraph.from_external_repository(external_repository)
+            instance_queryer = CachingInstanceQueryer(
+                instance=self._instance, asset_graph=asset_graph
+            )
+            instance_queryer.prefetch_asset_records(
+                [
+                    node.asset_key
+                    for node in external_repository.get_external_asset_nodes()
+                    if node.freshness_policy
+                ]
+            )
+            self._resolvers[repository_key] = CachingDataTimeResolver(
+                instance_queryer=instance_queryer
+            )
+        return self._resolvers[repository_key]
+
+
 class CrossRepoAssetDependedByLoader:
     """A batch loader that computes cross-repository asset dependencies. Locates source assets
     within all workspace repositories, and determines if they are derived (defined) assets in
@@ -0,0 +1,232 @@
+import threading
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import dagster._check as check
+from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
+from dagster._core.host_representation import ExternalRepository
+from dagster._core.workspace.context import BaseWorkspaceRequestContext, IWorkspaceProcessContext
+from dagster._utils import Counter, traced_counter
+
+T = TypeVar("T")
+
+DEFAULT_MAX_ENTRIES_PER_SCOPE = 512
+
+# scope used for values derived from the snapshots of every code location in the workspace
+WORKSPACE_SCOPE = None
+
+
+class SnapshotCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    invalidations: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class SnapshotResponseCache:
+    """Process-scoped cache for GraphQL field values that are derived purely from code location
+    snapshots, e.g. asset graphs, subsetted job snapshots, op listings and config types.
+
+    Entries are keyed by (scope, snapshot version, field, args), where the scope is a code location
+    name (or the whole workspace) and the snapshot version identifies the loaded snapshot of that
+    scope. When a lookup sees a new snapshot version for a scope, e.g. because the code location
+    was reloaded, every entry cached for the old version is dropped.
+    """
+
+    def __init__(self, max_entries_per_scope: int = DEFAULT_MAX_ENTRIES_PER_SCOPE):
+        self._max_entries_per_scope = check.int_param(
+            max_entries_per_scope, "max_entries_per_scope"
+        )
+        self._lock = threading.Lock()
+        self._versions: Dict[Optional[str], Hashable] = {}
+        self._entries: Dict[Optional[str], "OrderedDict[Tuple[str, Hashable], Any]"] = {}
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def get_or_compute(
+        self,
+        scope: Optional[str],
+        version: Hashable,
+        field: str,
+        args: Hashable,
+        compute_fn: Callable[[], T],
+    ) -> T:
+        key = (field, args)
+        with self._lock:
+            entries = self._get_entries_for_version(scope, version)
+            if key in entries:
+                entries.move_to_end(key)
+                self._record(hit=True)
+                return entries[key]
+            self._record(hit=False)
+
+        # compute outside of the lock, concurrent misses for the same key may both compute
+        value = compute_fn()
+
+        with self._lock:
+            # the scope may have been reloaded while computing, in which case the value is stale
+            if self._versions.get(scope) == version:
+                entries = self._entries[scope]
+                entries[key] = value
+                if len(entries) > self._max_entries_per_scope:
+                    entries.popitem(last=False)
+
+        return value
+
+    def invalidate(self, scope: Optional[str]) -> None:
+        with self._lock:
+            self._invalidate(scope)
+
+    def clear(self) -> None:
+        with self._lock:
+            for scope in list(self._entries.keys()):
+                self._invalidate(scope)
+
+    def stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                invalidations=self._invalidations,
+                size=sum(len(entries) for entries in self._entries.values()),
+            )
+
+    def _get_entries_for_version(
+        self, scope: Optional[str], version: Hashable
+    ) -> "OrderedDict[Tuple[str, Hashable], Any]":
+        if scope in self._versions and self._versions[scope] != version:
+            self._invalidate(scope)
+        if scope not in self._versions:
+            self._versions[scope] = version
+            self._entries[scope] = OrderedDict()
+        return self._entries[scope]
+
+    def _invalidate(self, scope: Optional[str]) -> None:
+        if scope in self._versions:
+            del self._versions[scope]
+            del self._entries[scope]
+            self._invalidations += 1
+
+    def _record(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+        # surface per-request counts alongside the other traced calls
+        counter = traced_counter.get()
+        if counter and isinstance(counter, Counter):
+            counter.increment("SnapshotResponseCache.hit" if hit else "SnapshotResponseCache.miss")
+
+
+_caches_lock = threading.Lock()
+_caches: "weakref.WeakKeyDictionary[IWorkspaceProcessContext, SnapshotResponseCache]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_snapshot_cache(process_context: IWorkspaceProcessContext) -> SnapshotResponseCache:
+    """Returns the snapshot response cache for a workspace process context, which lives as long as
+    the process context does and is therefore shared by every request it serves.
+    """
+    with _caches_lock:
+        if process_context not in _caches:
+            _caches[process_context] = SnapshotResponseCache()
+        return _caches[process_context]
+
+
+def make_cache_args(value: Any) -> Hashable:
+    """Converts resolver arguments, which may contain lists, sets and dicts, into a hashable key."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, make_cache_args(val)) for key, val in value.items()))
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(make_cache_args(item) for item in value)
+    elif isinstance(value, (list, tuple)):
+        return tuple(make_cache_args(item) for item in value)
+    else:
+        return value
+
+
+def _get_location_version(
+    context: BaseWorkspaceRequestContext, location_name: str
+) -> Optional[Hashable]:
+    entry = context.get_location_entry(location_name)
+    if entry is None or entry.code_location is None:
+        return None
+    return entry.update_timestamp
+
+
+def get_cached_location_value(
+    context: BaseWorkspaceRequestContext,
+    location_name: str,
+    field: str,
+    args: Any,
+    compute_fn: Callable[[], T],
+) -> T:
+    """Returns the value of `compute_fn`, cached across requests until the given code location is
+    reloaded. `compute_fn` must only depend on the code location snapshot and `args`.
+    """
+    check.inst_param(context, "context", BaseWorkspaceRequestContext)
+    version = _get_location_version(context, location_name)
+    if version is None:
+        return compute_fn()
+
+    return get_snapshot_cache(context.process_context).get_or_compute(
+        location_name, version, field, make_cache_args(args), compute_fn
+    )
+
+
+def get_cached_workspace_value(
+    context: BaseWorkspaceRequestContext,
+    field: str,
+    args: Any,
+    compute_fn: Callable[[], T],
+) -> T:
+    """Returns the value of `compute_fn`, cached across requests until any code location in the
+    workspace is added, removed or reloaded. `compute_fn` must only depend on the code location
+    snapshots and `args`.
+    """
+    check.inst_param(context, "context", BaseWorkspaceRequestContext)
+    version = tuple(
+        sorted(
+            (location_name, entry.update_timestamp)
+            for location_name, entry in context.get_workspace_snapshot().items()
+        )
+    )
+    return get_snapshot_cache(context.process_context).get_or_compute(
+        WORKSPACE_SCOPE, version, field, make_cache_args(args), compute_fn
+    )
+
+
+def get_repository_asset_graph(
+    context: BaseWorkspaceRequestContext, external_repository: ExternalRepository
+) -> ExternalAssetGraph:
+    return get_cached_location_value(
+        context,
+        external_repository.handle.location_name,
+        "repository_asset_graph",
+        external_repository.name,
+        lambda: ExternalAssetGraph.from_external_repository(external_repository),
+    )
+
+
+def get_workspace_asset_graph(context: BaseWorkspaceRequestContext) -> ExternalAssetGraph:
+    return get_cached_workspace_value(
+        context, "workspace_asset_graph", None, lambda: ExternalAssetGraph.from_workspace(context)
+    )
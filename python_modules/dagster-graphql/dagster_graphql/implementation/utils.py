@@ -1,10 +1,15 @@
+import asyncio
+import functools
+import inspect
 import sys
+from concurrent.futures import Executor
 from contextlib import contextmanager
 from contextvars import ContextVar
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Callable,
     Dict,
     Iterable,
@@ -35,8 +40,10 @@
 
 P = ParamSpec("P")
 T = TypeVar("T")
+U = TypeVar("U")
 
 GrapheneResolverFn: TypeAlias = Callable[..., object]
+MaybeAwaitable = Union[T, Awaitable[T]]
 T_Callable = TypeVar("T_Callable", bound=Callable)
 
 
@@ -122,16 +129,75 @@ def capture_error(
 ) -> Callable[P, Union[T, "GrapheneError", "GraphenePythonError"]]:
     def _fn(*args: P.args, **kwargs: P.kwargs) -> T:
         try:
-            return fn(*args, **kwargs)
+            result = fn(*args, **kwargs)
         except UserFacingGraphQLError as de_exception:
             return de_exception.error
         except Exception as exc:
             ErrorCapture.observer.get()(exc)
             return ErrorCapture.on_exception(sys.exc_info())  # type: ignore
 
+        # resolvers that read from storage return an awaitable when the request is executing on
+        # the event loop, in which case errors are raised when the result is awaited
+        if inspect.isawaitable(result):
+            return _capture_awaitable_error(result)  # type: ignore
+        return result
+
     return _fn
 
 
+async def _capture_awaitable_error(result: Awaitable[T]) -> Any:
+    try:
+        return await result
+    except UserFacingGraphQLError as de_exception:
+        return de_exception.error
+    except Exception as exc:
+        ErrorCapture.observer.get()(exc)
+        return ErrorCapture.on_exception(sys.exc_info())  # type: ignore
+
+
+# context var holding the executor that blocking storage reads are submitted to while a request is
+# executing on the event loop. When unset, storage reads run inline in the resolver.
+_storage_executor: ContextVar[Optional[Executor]] = ContextVar("storage_executor", default=None)
+
+
+@contextmanager
+def storage_executor_scope(executor: Executor) -> Iterator[None]:
+    """Within this scope, storage reads made through `run_storage_call` are submitted to the given
+    executor and awaited, rather than blocking the event loop that the request is executing on.
+    """
+    token = _storage_executor.set(executor)
+    try:
+        yield
+    finally:
+        _storage_executor.reset(token)
+
+
+def run_storage_call(fn: Callable[..., T], *args: Any, **kwargs: Any) -> MaybeAwaitable[T]:
+    """Makes a blocking storage call. Returns the result directly when no storage executor is
+    active, or an awaitable of the result when the request is executing on the event loop with a
+    storage executor (see `storage_executor_scope`).
+    """
+    executor = _storage_executor.get()
+    if executor is None:
+        return fn(*args, **kwargs)
+
+    return asyncio.get_running_loop().run_in_executor(
+        executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
+def map_storage_result(result: MaybeAwaitable[T], fn: Callable[[T], U]) -> MaybeAwaitable[U]:
+    """Applies fn to the result of `run_storage_call`, awaiting it first if necessary."""
+    if inspect.isawaitable(result):
+
+        async def _map() -> U:
+            return fn(await result)  # type: ignore
+
+        return _map()
+
+    return fn(cast(T, result))
+
+
 class UserFacingGraphQLError(Exception):
     # The `error` arg here should be a Graphene type implementing the interface `GrapheneError`, but
     # this is not trackable by the Python type system.
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union, cast
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple, Union, cast
 
 import graphene
 from dagster import (
@@ -12,7 +12,11 @@
     StaleStatus,
 )
 from dagster._core.definitions.external_asset_graph import ExternalAssetGraph
-from dagster._core.definitions.partition import CachingDynamicPartitionsLoader, PartitionsDefinition
+from dagster._core.definitions.partition import (
+    CachingDynamicPartitionsLoader,
+    PartitionsDefinition,
+    PartitionsSubset,
+)
 from dagster._core.definitions.partition_mapping import PartitionMapping
 from dagster._core.definitions.sensor_definition import (
     SensorType,
@@ -62,10 +66,12 @@
     get_partition_subsets,
 )
 from ..implementation.loader import (
+    BatchDataTimeResolverLoader,
     BatchMaterializationLoader,
     CrossRepoAssetDependedByLoader,
     StaleStatusLoader,
 )
+from ..implementation.snapshot_cache import get_repository_asset_graph
 from ..schema.asset_checks import (
     AssetChecksOrErrorUnion,
     GrapheneAssetChecksOrError,
@@ -217,6 +223,10 @@ class GrapheneAssetNode(graphene.ObjectType):
     _latest_materialization_loader: Optional[BatchMaterializationLoader]
     _stale_status_loader: Optional[StaleStatusLoader]
     _asset_checks_loader: AssetChecksLoader
+    _data_time_resolver_loader: Optional[BatchDataTimeResolverLoader]
+    _partition_subsets: Optional[
+        Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]
+    ]
 
     # NOTE: properties/resolvers are listed alphabetically
     assetKey = graphene.NonNull(GrapheneAssetKey)
@@ -320,6 +330,7 @@ def __init__(
         depended_by_loader: Optional[CrossRepoAssetDependedByLoader] = None,
         stale_status_loader: Optional[StaleStatusLoader] = None,
         dynamic_partitions_loader: Optional[CachingDynamicPartitionsLoader] = None,
+        data_time_resolver_loader: Optional[BatchDataTimeResolverLoader] = None,
     ):
         from ..implementation.fetch_assets import get_unique_asset_id
 
@@ -351,8 +362,12 @@ def __init__(
         self._asset_checks_loader = check.inst_param(
             asset_checks_loader, "asset_checks_loader", AssetChecksLoader
         )
+        self._data_time_resolver_loader = check.opt_inst_param(
+            data_time_resolver_loader, "data_time_resolver_loader", BatchDataTimeResolverLoader
+        )
         self._external_job = None  # lazily loaded
         self._node_definition_snap = None  # lazily loaded
+        self._partition_subsets = None  # lazily loaded
 
         super().__init__(
             id=get_unique_asset_id(
@@ -410,6 +425,45 @@ def get_node_definition_snap(
         # weird mypy bug causes mistyped _node_definition_snap
         return check.not_none(self._node_definition_snap)
 
+    def get_data_time_resolver(self, graphene_info: ResolveInfo) -> CachingDataTimeResolver:
+        if self._data_time_resolver_loader:
+            return self._data_time_resolver_loader.get_data_time_resolver(self._external_repository)
+        return CachingDataTimeResolver(
+            instance_queryer=CachingInstanceQueryer(
+                instance=graphene_info.context.instance,
+                asset_graph=get_repository_asset_graph(
+                    graphene_info.context, self._external_repository
+                ),
+            )
+        )
+
+    def get_partition_subsets(
+        self, graphene_info: ResolveInfo
+    ) -> Tuple[Optional[PartitionsSubset], Optional[PartitionsSubset], Optional[PartitionsSubset]]:
+        # partitionStats and assetPartitionStatuses are derived from the same subsets, so compute
+        # them at most once per node
+        if self._partition_subsets is None:
+            if not self._dynamic_partitions_loader:
+                check.failed("dynamic_partitions_loader must be provided to get partition keys")
+
+            asset_key = self._external_asset_node.asset_key
+            self._partition_subsets = get_partition_subsets(
+                graphene_info.context.instance,
+                asset_key,
+                self._dynamic_partitions_loader,
+                (
+                    self._external_asset_node.partitions_def_data.get_partitions_definition()
+                    if self._external_asset_node.partitions_def_data
+                    else None
+                ),
+                asset_record=(
+                    self._latest_materialization_loader.get_asset_record(asset_key)
+                    if self._latest_materialization_loader
+                    else None
+                ),
+            )
+        return self._partition_subsets
+
     def get_partition_keys(
         self,
         partitions_def_data: Optional[ExternalPartitionsDefinitionData] = None,
@@ -517,15 +571,10 @@ def resolve_assetMaterializationUsedData(
             return []
 
         instance = graphene_info.context.instance
-        asset_graph = ExternalAssetGraph.from_external_repository(self._external_repository)
+        asset_graph = get_repository_asset_graph(graphene_info.context, self._external_repository)
         asset_key = self._external_asset_node.asset_key
 
-        # in the future, we can share this same CachingInstanceQueryer across all
-        # GrapheneMaterializationEvent which share an external repository for improved performance
-        instance_queryer = CachingInstanceQueryer(
-            instance=graphene_info.context.instance, asset_graph=asset_graph
-        )
-        data_time_resolver = CachingDataTimeResolver(instance_queryer=instance_queryer)
+        data_time_resolver = self.get_data_time_resolver(graphene_info)
         event_records = instance.get_event_records(
             EventRecordsFilter(
                 event_type=DagsterEventType.ASSET_MATERIALIZATION,
@@ -827,17 +876,9 @@ def resolve_freshnessInfo(
         self, graphene_info: ResolveInfo
     ) -> Optional[GrapheneAssetFreshnessInfo]:
         if self._external_asset_node.freshness_policy:
-            asset_graph = ExternalAssetGraph.from_external_repository(self._external_repository)
             return get_freshness_info(
                 asset_key=self._external_asset_node.asset_key,
-                # in the future, we can share this same CachingInstanceQueryer across all
-                # GrapheneAssetNodes which share an external repository for improved performance
-                data_time_resolver=CachingDataTimeResolver(
-                    instance_queryer=CachingInstanceQueryer(
-                        instance=graphene_info.context.instance,
-                        asset_graph=asset_graph,
-                    ),
-                ),
+                data_time_resolver=self.get_data_time_resolver(graphene_info),
             )
         return None
 
@@ -995,11 +1036,6 @@ def resolve_assetPartitionStatuses(
         "GrapheneDefaultPartitionStatuses",
         "GrapheneMultiPartitionStatuses",
     ]:
-        asset_key = self._external_asset_node.asset_key
-
-        if not self._dynamic_partitions_loader:
-            check.failed("dynamic_partitions_loader must be provided to get partition keys")
-
         partitions_def = (
             self._external_asset_node.partitions_def_data.get_partitions_definition()
             if self._external_asset_node.partitions_def_data
@@ -1010,15 +1046,10 @@ def resolve_assetPartitionStatuses(
             materialized_partition_subset,
             failed_partition_subset,
             in_progress_subset,
-        ) = get_partition_subsets(
-            graphene_info.context.instance,
-            asset_key,
-            self._dynamic_partitions_loader,
-            partitions_def,
-        )
+        ) = self.get_partition_subsets(graphene_info)
 
         return build_partition_statuses(
-            self._dynamic_partitions_loader,
+            check.not_none(self._dynamic_partitions_loader),
             materialized_partition_subset,
             failed_partition_subset,
             in_progress_subset,
@@ -1030,25 +1061,11 @@ def resolve_partitionStats(
     ) -> Optional[GraphenePartitionStats]:
         partitions_def_data = self._external_asset_node.partitions_def_data
         if partitions_def_data:
-            asset_key = self._external_asset_node.asset_key
-
-            if not self._dynamic_partitions_loader:
-                check.failed("dynamic_partitions_loader must be provided to get partition keys")
-
             (
                 materialized_partition_subset,
                 failed_partition_subset,
                 in_progress_subset,
-            ) = get_partition_subsets(
-                graphene_info.context.instance,
-                asset_key,
-                self._dynamic_partitions_loader,
-                (
-                    self._external_asset_node.partitions_def_data.get_partitions_definition()
-                    if self._external_asset_node.partitions_def_data
-                    else None
-                ),
-            )
+            ) = self.get_partition_subsets(graphene_info)
 
             if (
                 materialized_partition_subset is None
@@ -321,11 +321,11 @@ def resolve_jobs(self, _graphene_info: ResolveInfo):
             )
         ]
 
-    def resolve_usedSolid(self, _graphene_info: ResolveInfo, name):
-        return get_solid(self._repository, name)
+    def resolve_usedSolid(self, graphene_info: ResolveInfo, name):
+        return get_solid(graphene_info, self._repository, name)
 
-    def resolve_usedSolids(self, _graphene_info: ResolveInfo):
-        return get_solids(self._repository)
+    def resolve_usedSolids(self, graphene_info: ResolveInfo):
+        return get_solids(graphene_info, self._repository)
 
     def resolve_partitionSets(self, _graphene_info: ResolveInfo):
         return (
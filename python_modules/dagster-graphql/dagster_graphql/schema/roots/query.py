@@ -82,15 +82,21 @@
 from ...implementation.fetch_solids import get_graph_or_error
 from ...implementation.fetch_ticks import get_instigation_ticks
 from ...implementation.loader import (
+    BatchDataTimeResolverLoader,
     BatchMaterializationLoader,
     CrossRepoAssetDependedByLoader,
     StaleStatusLoader,
 )
 from ...implementation.run_config_schema import resolve_run_config_schema_or_error
+from ...implementation.snapshot_cache import (
+    get_repository_asset_graph,
+    get_workspace_asset_graph,
+)
 from ...implementation.utils import (
     capture_error,
     graph_selector_from_graphql,
     pipeline_selector_from_graphql,
+    run_storage_call,
 )
 from ..asset_checks import GrapheneAssetCheckExecution
 from ..asset_graph import (
@@ -929,12 +935,15 @@ def resolve_assetNodes(
         )
 
         depended_by_loader = CrossRepoAssetDependedByLoader(context=graphene_info.context)
+        data_time_resolver_loader = BatchDataTimeResolverLoader(
+            instance=graphene_info.context.instance
+        )
 
         def load_asset_graph() -> ExternalAssetGraph:
             if repo is not None:
-                return ExternalAssetGraph.from_external_repository(repo)
+                return get_repository_asset_graph(graphene_info.context, repo)
             else:
-                return ExternalAssetGraph.from_workspace(graphene_info.context)
+                return get_workspace_asset_graph(graphene_info.context)
 
         stale_status_loader = StaleStatusLoader(
             instance=graphene_info.context.instance,
@@ -951,6 +960,7 @@ def load_asset_graph() -> ExternalAssetGraph:
                 depended_by_loader=depended_by_loader,
                 stale_status_loader=stale_status_loader,
                 dynamic_partitions_loader=dynamic_partitions_loader,
+                data_time_resolver_loader=data_time_resolver_loader,
             )
             for node in results
         ]
@@ -1034,7 +1044,7 @@ def resolve_assetsLatestInfo(
             if node.assetKey in asset_keys
         }
 
-        return get_assets_latest_info(graphene_info, step_keys_by_asset)
+        return run_storage_call(get_assets_latest_info, graphene_info, step_keys_by_asset)
 
     @capture_error
     def resolve_logsForRun(
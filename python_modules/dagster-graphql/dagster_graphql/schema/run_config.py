@@ -2,11 +2,12 @@
 
 import dagster._check as check
 import graphene
-from dagster._core.host_representation import RepresentedJob
+from dagster._core.host_representation import ExternalJob, RepresentedJob
 from dagster._core.host_representation.external_data import DEFAULT_MODE_NAME
 from dagster._core.snap.snap_to_yaml import default_values_yaml_from_type_snap
 
 from ..implementation.run_config_schema import resolve_is_run_config_valid
+from ..implementation.snapshot_cache import get_cached_location_value
 from ..implementation.utils import capture_error
 from .config_types import GrapheneConfigType, to_config_type
 from .errors import (
@@ -68,15 +69,29 @@ def __init__(self, represented_job: RepresentedJob, mode: str):
         self._represented_job = check.inst_param(represented_job, "represented_job", RepresentedJob)
         self._mode = check.str_param(mode, "mode")
 
-    def resolve_allConfigTypes(self, _graphene_info: ResolveInfo):
-        return sorted(
-            list(
-                map(
-                    lambda key: to_config_type(self._represented_job.config_schema_snapshot, key),
-                    self._represented_job.config_schema_snapshot.all_config_keys,
-                )
-            ),
-            key=lambda ct: ct.key,
+    def resolve_allConfigTypes(self, graphene_info: ResolveInfo):
+        def _get_all_config_types():
+            return sorted(
+                list(
+                    map(
+                        lambda key: to_config_type(
+                            self._represented_job.config_schema_snapshot, key
+                        ),
+                        self._represented_job.config_schema_snapshot.all_config_keys,
+                    )
+                ),
+                key=lambda ct: ct.key,
+            )
+
+        if not isinstance(self._represented_job, ExternalJob):
+            return _get_all_config_types()
+
+        return get_cached_location_value(
+            graphene_info.context,
+            self._represented_job.handle.location_name,
+            "all_config_types",
+            self._represented_job.computed_job_snapshot_id,
+            _get_all_config_types,
         )
 
     def resolve_rootConfigType(self, _graphene_info: ResolveInfo):
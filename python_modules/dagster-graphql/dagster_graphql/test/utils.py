@@ -1,6 +1,6 @@
 import asyncio
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
 
 import dagster._check as check
 from dagster._core.host_representation.external import ExternalRepository
@@ -8,6 +8,8 @@
 from dagster._core.test_utils import wait_for_runs_to_finish
 from dagster._core.workspace.context import WorkspaceProcessContext, WorkspaceRequestContext
 from dagster._core.workspace.load_target import PythonFileTarget
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 from typing_extensions import Protocol, TypeAlias, TypedDict
 
 from dagster_graphql.schema import create_schema
@@ -105,6 +107,25 @@ def execute_dagster_graphql_and_finish_runs(
     return result
 
 
+@contextmanager
+def capture_sql_queries() -> Iterator[List[str]]:
+    """Yields a list that is populated with the SQL statement of every query executed against any
+    SQL storage in this process while the context manager is open. Useful for asserting that a
+    GraphQL query issues a bounded number of storage queries, regardless of how many objects it
+    resolves.
+    """
+    statements: List[str] = []
+
+    def _before_cursor_execute(_conn, _cursor, statement, _parameters, _context, _executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+
+
 @contextmanager
 def define_out_of_process_context(
     python_file: str,
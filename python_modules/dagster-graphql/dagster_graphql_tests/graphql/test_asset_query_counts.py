@@ -0,0 +1,133 @@
+from typing import List, Tuple
+
+from dagster import (
+    AssetCheckResult,
+    AssetChecksDefinition,
+    AssetsDefinition,
+    Definitions,
+    FreshnessPolicy,
+    StaticPartitionsDefinition,
+    asset,
+    asset_check,
+    materialize,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster_graphql.test.utils import (
+    capture_sql_queries,
+    define_out_of_process_context,
+    execute_dagster_graphql,
+)
+
+ASSET_NODES_QUERY = """
+query AssetNodesQuery {
+    assetNodes {
+        id
+        assetKey {
+            path
+        }
+        assetMaterializations(limit: 1) {
+            runId
+        }
+        freshnessInfo {
+            currentMinutesLate
+        }
+        partitionStats {
+            numMaterialized
+        }
+        assetPartitionStatuses {
+            ... on DefaultPartitionStatuses {
+                materializedPartitions
+            }
+        }
+        assetChecksOrError {
+            ... on AssetChecks {
+                checks {
+                    name
+                    executionForLatestMaterialization {
+                        status
+                    }
+                }
+            }
+        }
+    }
+}
+"""
+
+partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+
+def _build_assets(num_assets: int) -> Tuple[List[AssetsDefinition], List[AssetChecksDefinition]]:
+    @asset(partitions_def=partitions_def)
+    def partitioned_root():
+        return 1
+
+    assets = [partitioned_root]
+    checks = []
+    for i in range(num_assets):
+
+        @asset(
+            name=f"asset_{i}",
+            deps=[partitioned_root],
+            freshness_policy=FreshnessPolicy(maximum_lag_minutes=60),
+        )
+        def _asset():
+            return 1
+
+        @asset_check(asset=_asset, name=f"check_{i}")
+        def _check():
+            return AssetCheckResult(passed=False)
+
+        assets.append(_asset)
+        checks.append(_check)
+
+    return assets, checks
+
+
+def get_small_defs():
+    assets, checks = _build_assets(2)
+    return Definitions(assets=assets, asset_checks=checks)
+
+
+def get_large_defs():
+    assets, checks = _build_assets(20)
+    return Definitions(assets=assets, asset_checks=checks)
+
+
+def _count_asset_nodes_queries(defs_fn_name: str, num_assets: int) -> int:
+    with instance_for_test() as instance:
+        assets, checks = _build_assets(num_assets)
+        for partition_key in partitions_def.get_partition_keys():
+            assert materialize([assets[0]], instance=instance, partition_key=partition_key).success
+        unpartitioned_defs = Definitions(
+            assets=[assets[0].to_source_asset(), *assets[1:]], asset_checks=checks
+        )
+        unpartitioned_defs.get_implicit_global_asset_job_def().execute_in_process(
+            instance=instance, raise_on_error=False
+        )
+
+        with define_out_of_process_context(__file__, defs_fn_name, instance) as context:
+            # warm up the asset status cache, which is written to on first read
+            execute_dagster_graphql(context, ASSET_NODES_QUERY)
+
+            with capture_sql_queries() as queries:
+                result = execute_dagster_graphql(context, ASSET_NODES_QUERY)
+
+            assert result.data
+            asset_nodes = result.data["assetNodes"]
+            assert len(asset_nodes) == num_assets + 1
+            for node in asset_nodes:
+                if node["assetKey"]["path"] == ["partitioned_root"]:
+                    assert node["partitionStats"]["numMaterialized"] == 3
+                else:
+                    assert node["assetMaterializations"]
+                    assert node["freshnessInfo"]["currentMinutesLate"] == 0
+                    (asset_check,) = node["assetChecksOrError"]["checks"]
+                    assert asset_check["executionForLatestMaterialization"]["status"] == "FAILED"
+
+            return len(queries)
+
+
+def test_asset_nodes_query_count_is_independent_of_asset_count():
+    small_count = _count_asset_nodes_queries("get_small_defs", 2)
+    large_count = _count_asset_nodes_queries("get_large_defs", 20)
+    assert large_count == small_count, (small_count, large_count)
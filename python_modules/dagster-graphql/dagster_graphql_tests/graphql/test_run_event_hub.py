@@ -0,0 +1,110 @@
+import asyncio
+
+from dagster import job, op
+from dagster._core.event_api import EventLogCursor
+from dagster._core.test_utils import instance_for_test
+from dagster_graphql.implementation.execution import run_event_hub
+from dagster_graphql.implementation.execution.run_event_hub import (
+    RunEventHub,
+    get_run_event_hub,
+)
+
+
+@op
+def noop_op():
+    pass
+
+
+@job
+def noop_job():
+    noop_op()
+
+
+def _storage_ids(instance, run_id):
+    return [record.storage_id for record in instance.get_records_for_run(run_id).records]
+
+
+async def _next_live_message(subscription):
+    return await asyncio.wait_for(subscription.next_live_message(), timeout=30)
+
+
+def test_subscribers_share_watch_and_live_events():
+    with instance_for_test() as instance:
+        result = noop_job.execute_in_process(instance=instance)
+        run = result.dagster_run
+        past_ids = _storage_ids(instance, run.run_id)
+
+        async def _test():
+            hub = get_run_event_hub(instance, run.run_id, run.job_name)
+            assert get_run_event_hub(instance, run.run_id, run.job_name) is hub
+
+            first = await hub.subscribe(None)
+            second = await hub.subscribe(None)
+            first_batch = await first.next_past_batch(chunk_size=10000)
+            second_batch = await second.next_past_batch(chunk_size=10000)
+
+            assert not first_batch.has_more_past_events
+            assert [message.storage_id for message in first_batch.messages] == past_ids
+            assert [message.storage_id for message in second_batch.messages] == past_ids
+            assert hub.num_subscribers == 2
+
+            instance.report_engine_event("live event", run)
+            first_live = await _next_live_message(first)
+            second_live = await _next_live_message(second)
+
+            # each live event is converted once and shared between subscribers
+            assert first_live is second_live
+            assert first_live.message.message == "live event"
+
+            # a late subscriber is served the live event from the buffer
+            late = await hub.subscribe(first_batch.cursor)
+            late_batch = await late.next_past_batch(chunk_size=10000)
+            assert [message.storage_id for message in late_batch.messages] == [
+                first_live.storage_id
+            ]
+
+            first.close()
+            second.close()
+            assert get_run_event_hub(instance, run.run_id, run.job_name) is hub
+            late.close()
+
+            # the hub stops watching once its last subscriber is gone
+            assert not run_event_hub._run_event_hubs  # noqa: SLF001
+
+        asyncio.run(_test())
+
+
+def test_catch_up_from_storage_and_buffer():
+    with instance_for_test() as instance:
+        result = noop_job.execute_in_process(instance=instance)
+        run = result.dagster_run
+
+        async def _test():
+            hub = RunEventHub(instance, run.run_id, run.job_name, buffer_size=2)
+            watcher = await hub.subscribe(None)
+            await asyncio.sleep(0.1)
+
+            for i in range(5):
+                instance.report_engine_event(f"live event {i}", run)
+
+            live_messages = [await _next_live_message(watcher) for _ in range(5)]
+            all_ids = _storage_ids(instance, run.run_id)
+            assert [message.storage_id for message in live_messages] == all_ids[-5:]
+
+            # only the last two live events are in the buffer, the rest is read from storage
+            catch_up = await hub.subscribe(str(EventLogCursor.from_storage_id(all_ids[1])))
+            batches = []
+            while not batches or batches[-1].has_more_past_events:
+                batches.append(await catch_up.next_past_batch(chunk_size=3))
+
+            assert all(len(batch.messages) <= 3 for batch in batches)
+            assert [
+                message.storage_id for batch in batches for message in batch.messages
+            ] == all_ids[2:]
+            assert batches[-1].messages[-1] is live_messages[-1]
+            assert batches[-1].cursor == live_messages[-1].cursor
+
+            catch_up.close()
+            watcher.close()
+
+        asyncio.run(_test())
@@ -0,0 +1,146 @@
+from dagster import Definitions, asset, job, op
+from dagster._core.test_utils import instance_for_test
+from dagster_graphql.implementation.snapshot_cache import SnapshotResponseCache, get_snapshot_cache
+from dagster_graphql.test.utils import (
+    define_out_of_process_workspace,
+    execute_dagster_graphql,
+    main_repo_location_name,
+)
+
+USED_OPS_AND_CONFIG_TYPES_QUERY = """
+query UsedOpsAndConfigTypesQuery($repositorySelector: RepositorySelector!, $selector: PipelineSelector!) {
+    repositoryOrError(repositorySelector: $repositorySelector) {
+        ... on Repository {
+            usedSolids {
+                definition {
+                    name
+                }
+            }
+        }
+    }
+    runConfigSchemaOrError(selector: $selector) {
+        ... on RunConfigSchema {
+            allConfigTypes {
+                key
+            }
+        }
+    }
+    assetNodes {
+        assetKey {
+            path
+        }
+        dependencyKeys {
+            path
+        }
+    }
+}
+"""
+
+
+@op(config_schema={"foo": str})
+def my_op():
+    pass
+
+
+@job
+def my_job():
+    my_op()
+
+
+@asset
+def upstream():
+    pass
+
+
+@asset(deps=[upstream])
+def downstream():
+    pass
+
+
+def get_defs():
+    return Definitions(assets=[upstream, downstream], jobs=[my_job])
+
+
+def test_snapshot_response_cache():
+    cache = SnapshotResponseCache(max_entries_per_scope=2)
+    calls = []
+
+    def _compute(value):
+        def _fn():
+            calls.append(value)
+            return value
+
+        return _fn
+
+    assert cache.get_or_compute("loc", 1, "field", ("a",), _compute("a")) == "a"
+    assert cache.get_or_compute("loc", 1, "field", ("a",), _compute("unused")) == "a"
+    assert cache.get_or_compute("other_loc", 1, "field", ("a",), _compute("b")) == "b"
+    assert calls == ["a", "b"]
+    assert cache.stats().hits == 1
+    assert cache.stats().misses == 2
+    assert cache.stats().size == 2
+
+    # a new snapshot version for a scope drops all of its entries, but not those of other scopes
+    assert cache.get_or_compute("loc", 2, "field", ("a",), _compute("c")) == "c"
+    assert cache.get_or_compute("other_loc", 1, "field", ("a",), _compute("unused")) == "b"
+    assert calls == ["a", "b", "c"]
+    assert cache.stats().invalidations == 1
+
+    # entries are evicted least recently used first
+    cache.get_or_compute("loc", 2, "field", ("b",), _compute("d"))
+    cache.get_or_compute("loc", 2, "field", ("a",), _compute("unused"))
+    cache.get_or_compute("loc", 2, "field", ("c",), _compute("e"))
+    cache.get_or_compute("loc", 2, "field", ("a",), _compute("unused"))
+    cache.get_or_compute("loc", 2, "field", ("b",), _compute("f"))
+    assert calls == ["a", "b", "c", "d", "e", "f"]
+
+    stats = cache.stats()
+    assert stats.hit_rate == stats.hits / (stats.hits + stats.misses)
+
+    cache.clear()
+    assert cache.stats().size == 0
+
+
+def test_snapshot_cache_shared_across_requests():
+    with instance_for_test() as instance:
+        with define_out_of_process_workspace(__file__, "get_defs", instance) as process_context:
+            variables = {
+                "repositorySelector": {
+                    "repositoryLocationName": main_repo_location_name(),
+                    "repositoryName": "__repository__",
+                },
+                "selector": {
+                    "repositoryLocationName": main_repo_location_name(),
+                    "repositoryName": "__repository__",
+                    "pipelineName": "my_job",
+                },
+            }
+
+            def _execute():
+                result = execute_dagster_graphql(
+                    process_context.create_request_context(),
+                    USED_OPS_AND_CONFIG_TYPES_QUERY,
+                    variables=variables,
+                )
+                assert not result.errors
+                assert result.data
+                return result.data
+
+            cache = get_snapshot_cache(process_context)
+
+            first = _execute()
+            first_stats = cache.stats()
+            assert first_stats.misses > 0
+            assert first_stats.size > 0
+
+            assert _execute() == first
+            second_stats = cache.stats()
+            assert second_stats.misses == first_stats.misses
+            assert second_stats.hits > first_stats.hits
+
+            # reloading the code location invalidates everything derived from its snapshot
+            process_context.reload_code_location(main_repo_location_name())
+            assert _execute() == first
+            reloaded_stats = cache.stats()
+            assert reloaded_stats.invalidations > second_stats.invalidations
+            assert reloaded_stats.misses > second_stats.misses
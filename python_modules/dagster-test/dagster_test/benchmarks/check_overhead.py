@@ -0,0 +1,154 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+from typing import Callable, Dict, Sequence, Tuple
+
+import dagster._check as check
+from dagster import AssetKey, AssetMaterialization, In, MetadataValue, Out, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
+from dagster._core.snap import JobSnapshot
+from dagster._serdes.serdes import JsonSerializableValue, pack_value, unpack_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the cost of the argument checks run by the constructors of serializable objects, by
+reconstructing packed objects with and without reduced checks (see `dagster._check.reduced_checks`),
+which skip the type checks on the members of collections. Each workload is reconstructed
+`--num-runs` times: `--num-events` asset materialization events with `--num-metadata-entries`
+metadata entries, the snapshot of a job with `--num-ops` ops, and a backfill of
+`--num-partitions` partitions.
+"""
+
+parser = argparse.ArgumentParser(prog="check_overhead", description=DESC)
+parser.add_argument("--num-runs", type=int, default=5, help="Number of runs per workload.")
+parser.add_argument("--num-events", type=int, default=2000, help="Number of events to unpack.")
+parser.add_argument(
+    "--num-metadata-entries", type=int, default=20, help="Metadata entries per materialization."
+)
+parser.add_argument("--num-ops", type=int, default=500, help="Number of ops in the job snapshot.")
+parser.add_argument(
+    "--num-partitions", type=int, default=100000, help="Number of partitions in the backfill."
+)
+
+RUN_ID = "benchmark_run"
+JOB_NAME = "benchmark_job"
+
+
+def _materialization_event(i: int, num_metadata_entries: int) -> EventLogEntry:
+    materialization = AssetMaterialization(
+        asset_key=AssetKey(["benchmark", f"asset_{i % 50}"]),
+        partition=str(i),
+        metadata={
+            f"metric_{j}": MetadataValue.float(i * j / 7) for j in range(num_metadata_entries)
+        },
+    )
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        step_key="benchmark_step",
+        job_name=JOB_NAME,
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            JOB_NAME,
+            event_specific_data=StepMaterializationData(materialization),
+        ),
+    )
+
+
+def _job_snapshot(num_ops: int) -> JobSnapshot:
+    ops = [
+        op(
+            name=f"op_{i}",
+            ins={"upstream": In(int, description=f"input of op {i}")},
+            out={"result": Out(int), "extra": Out(str, is_required=False)},
+            config_schema={"factor": int, "label": str},
+        )(lambda _context, upstream: upstream)
+        for i in range(num_ops)
+    ]
+
+    @op(out=Out(int))
+    def source():
+        return 1
+
+    @job(name=JOB_NAME)
+    def wide_job():
+        upstream = source()
+        for op_def in ops:
+            op_def(upstream=upstream)
+
+    return JobSnapshot.from_job_def(wide_job)
+
+
+def _backfill(num_partitions: int) -> PartitionBackfill:
+    return PartitionBackfill(
+        backfill_id="benchmark_backfill",
+        status=BulkActionStatus.REQUESTED,
+        from_failure=False,
+        tags={f"benchmark/tag_{i}": str(i) for i in range(20)},
+        backfill_timestamp=time.time(),
+        partition_names=[f"partition_{i}" for i in range(num_partitions)],
+        reexecution_steps=[f"step_{i}" for i in range(100)],
+    )
+
+
+def _time_unpack(packed: JsonSerializableValue, num_runs: int) -> Tuple[float, float]:
+    durations: Dict[bool, list] = {False: [], True: []}
+    for _ in range(num_runs):
+        for reduced in (False, True):
+            with check.reduced_checks(reduced):
+                start = time.perf_counter()
+                unpack_value(packed)
+                durations[reduced].append(time.perf_counter() - start)
+    return min(durations[False]), min(durations[True])
+
+
+def main(
+    num_runs: int, num_events: int, num_metadata_entries: int, num_ops: int, num_partitions: int
+) -> None:
+    session = ProfilingSession(
+        name="Check overhead",
+        experiment_settings={
+            "num_runs": num_runs,
+            "num_events": num_events,
+            "num_metadata_entries": num_metadata_entries,
+            "num_ops": num_ops,
+            "num_partitions": num_partitions,
+        },
+    ).start()
+    session.log_start_message()
+
+    workloads: Sequence[Tuple[str, Callable[[], object]]] = [
+        (
+            f"{num_events} events",
+            lambda: [_materialization_event(i, num_metadata_entries) for i in range(num_events)],
+        ),
+        (f"{num_ops} op job snapshot", lambda: _job_snapshot(num_ops)),
+        (f"{num_partitions} partition backfill", lambda: _backfill(num_partitions)),
+    ]
+
+    results = {}
+    for name, build in workloads:
+        packed = pack_value(build())
+        with session.logged_execution_time(f"{name}: {num_runs} runs"):
+            results[name] = _time_unpack(packed, num_runs)
+
+    session.log_result_summary()
+
+    print()
+    print(f"{'workload':<30} {'full ms':>10} {'reduced ms':>11} {'saving':>8}")
+    for name, (full, reduced) in results.items():
+        print(f"{name:<30} {full * 1000:>10.1f} {reduced * 1000:>11.1f} {1 - reduced / full:>8.0%}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(
+        args.num_runs, args.num_events, args.num_metadata_entries, args.num_ops, args.num_partitions
+    )
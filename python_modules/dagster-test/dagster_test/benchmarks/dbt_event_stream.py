@@ -0,0 +1,211 @@
+# ruff: noqa: T201
+
+import argparse
+import contextlib
+import subprocess
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping
+
+import orjson
+from dagster_dbt import DagsterDbtTranslator
+from dagster_dbt.core.resources_v2 import DbtCliInvocation
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how fast the events of a `dbt run` are streamed from the dbt CLI process and converted to
+Dagster asset events. A JSON log in the format recorded from `dbt run --log-format json` is
+generated for `--num-models` models and replayed through the stdout of a `cat` process. Each
+round streams the raw events with `stream_raw_events`, and the asset events with `stream`. The
+echoed dbt logs are written to a file, as they are when compute logs are captured.
+"""
+
+parser = argparse.ArgumentParser(prog="dbt_event_stream", description=DESC)
+parser.add_argument("--num-models", type=int, default=3000, help="Number of models in the run.")
+parser.add_argument("--num-rounds", type=int, default=3, help="Number of times to stream the log.")
+
+INVOCATION_ID = str(uuid.uuid4())
+START_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp(seconds: float) -> str:
+    return (START_TIME + timedelta(seconds=seconds)).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _info(name: str, level: str, msg: str, seconds: float) -> Dict[str, Any]:
+    return {
+        "category": "",
+        "code": "Q033",
+        "extra": {},
+        "invocation_id": INVOCATION_ID,
+        "level": level,
+        "msg": msg,
+        "name": name,
+        "pid": 4242,
+        "thread": "Thread-1 (worker)",
+        "ts": _timestamp(seconds),
+    }
+
+
+def _node_info(i: int, status: str, started_at: float, finished_at: float) -> Dict[str, Any]:
+    return {
+        "materialized": "table",
+        "meta": {},
+        "node_finished_at": _timestamp(finished_at) if finished_at else "",
+        "node_name": f"model_{i}",
+        "node_path": f"staging/model_{i}.sql",
+        "node_relation": {
+            "alias": f"model_{i}",
+            "database": "analytics",
+            "relation_name": f'"analytics"."main"."model_{i}"',
+            "schema": "main",
+        },
+        "node_started_at": _timestamp(started_at),
+        "node_status": status,
+        "resource_type": "model",
+        "unique_id": f"model.benchmark.model_{i}",
+    }
+
+
+def _model_log_lines(i: int, num_models: int) -> Iterator[Dict[str, Any]]:
+    # the events logged by dbt for each model of a `dbt run`
+    started_at, finished_at = i * 0.5, i * 0.5 + 0.4
+    yield {
+        "data": {"node_info": _node_info(i, "started", started_at, 0)},
+        "info": _info("NodeStart", "debug", f"Began running node model.benchmark.model_{i}", i),
+    }
+    yield {
+        "data": {
+            "description": f"sql table model main.model_{i}",
+            "index": i + 1,
+            "node_info": _node_info(i, "started", started_at, 0),
+            "total": num_models,
+        },
+        "info": _info(
+            "LogStartLine",
+            "info",
+            f"{i + 1} of {num_models} START sql table model main.model_{i} ....... [RUN]",
+            started_at,
+        ),
+    }
+    yield {
+        "data": {
+            "node_info": _node_info(i, "compiling", started_at, 0),
+            "sql": f"create table main.model_{i} as (select {i} as id)",
+        },
+        "info": _info(
+            "SQLQuery",
+            "debug",
+            f'On model.benchmark.model_{i}: create table "main"."model_{i}" as (select {i})',
+            started_at,
+        ),
+    }
+    yield {
+        "data": {
+            "description": f"sql table model main.model_{i}",
+            "execution_time": 0.4,
+            "index": i + 1,
+            "node_info": _node_info(i, "success", started_at, finished_at),
+            "status": "OK",
+            "total": num_models,
+        },
+        "info": _info(
+            "LogModelResult",
+            "info",
+            f"{i + 1} of {num_models} OK created sql table model main.model_{i} .. [OK in 0.40s]",
+            finished_at,
+        ),
+    }
+    yield {
+        "data": {
+            "node_info": _node_info(i, "success", started_at, finished_at),
+            "run_result": {"status": "success", "thread": "Thread-1 (worker)"},
+        },
+        "info": _info("NodeFinished", "debug", f"Finished running node model_{i}", finished_at),
+    }
+
+
+def _write_log(path: Path, num_models: int) -> int:
+    num_lines = 0
+    with path.open("wb") as f:
+        f.write(b"Running with dbt=1.7.4\n")
+        for i in range(num_models):
+            for line in _model_log_lines(i, num_models):
+                f.write(orjson.dumps(line) + b"\n")
+                num_lines += 1
+    return num_lines
+
+
+def _manifest(num_models: int) -> Mapping[str, Any]:
+    nodes = {
+        f"model.benchmark.model_{i}": {
+            "config": {"materialized": "table"},
+            "meta": {},
+            "name": f"model_{i}",
+            "resource_type": "model",
+            "unique_id": f"model.benchmark.model_{i}",
+        }
+        for i in range(num_models)
+    }
+    return {"nodes": nodes, "sources": {}, "parent_map": {}, "child_map": {}}
+
+
+def _invocation(log_path: Path, manifest: Mapping[str, Any], project_dir: str):
+    return DbtCliInvocation(
+        process=subprocess.Popen(["cat", str(log_path)], stdout=subprocess.PIPE),
+        manifest=manifest,
+        dagster_dbt_translator=DagsterDbtTranslator(),
+        project_dir=Path(project_dir),
+        target_path=Path(project_dir, "target"),
+        raise_on_error=True,
+    )
+
+
+def main(num_models: int, num_rounds: int) -> None:
+    session = ProfilingSession(
+        name="dbt event stream",
+        experiment_settings={"num_models": num_models, "num_rounds": num_rounds},
+    ).start()
+    session.log_start_message()
+
+    manifest = _manifest(num_models)
+    raw_event_times = []
+    asset_event_times = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        log_path = Path(temp_dir, "dbt.log")
+        echo_path = Path(temp_dir, "stdout.log")
+        num_lines = _write_log(log_path, num_models)
+
+        for i in range(num_rounds):
+            with session.logged_execution_time(f"Round {i}: stream raw events"):
+                start = time.perf_counter()
+                with echo_path.open("w") as echo, contextlib.redirect_stdout(echo):
+                    num_raw_events = sum(
+                        1 for _ in _invocation(log_path, manifest, temp_dir).stream_raw_events()
+                    )
+                raw_event_times.append(time.perf_counter() - start)
+            assert num_raw_events == num_lines, (num_raw_events, num_lines)
+
+            with session.logged_execution_time(f"Round {i}: stream asset events"):
+                start = time.perf_counter()
+                with echo_path.open("w") as echo, contextlib.redirect_stdout(echo):
+                    num_asset_events = sum(
+                        1 for _ in _invocation(log_path, manifest, temp_dir).stream()
+                    )
+                asset_event_times.append(time.perf_counter() - start)
+
+    session.log_result_summary()
+
+    print()
+    print(f"{num_lines} dbt events, {num_asset_events} asset events per round")
+    print(f"raw events/s:   {num_lines / min(raw_event_times):>10.0f}")
+    print(f"asset events/s: {num_asset_events / min(asset_event_times):>10.0f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_models, args.num_rounds)
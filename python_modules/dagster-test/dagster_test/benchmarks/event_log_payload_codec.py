@@ -0,0 +1,166 @@
+# ruff: noqa: T201
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Optional
+
+from dagster import AssetKey, AssetMaterialization, MetadataValue
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import ConsolidatedSqliteEventLogStorage
+from dagster._core.storage.event_log.codec import EVENT_PAYLOAD_CODECS, ZSTD_CODEC
+from dagster._utils.error import SerializableErrorInfo
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare write throughput, read throughput and on-disk size of the event log with each event payload
+codec. Each run stores `--num-events` events to a fresh consolidated SQLite event log: a mix of asset
+materializations with `--num-metadata-entries` metadata entries and engine events carrying a stack
+trace. The events are then read back with `get_records_for_run` in chunks of `--read-chunk-size`.
+"""
+
+parser = argparse.ArgumentParser(prog="event_log_payload_codec", description=DESC)
+parser.add_argument("--num-events", type=int, default=5000, help="Number of events to store.")
+parser.add_argument(
+    "--num-metadata-entries", type=int, default=20, help="Metadata entries per materialization."
+)
+parser.add_argument(
+    "--read-chunk-size", type=int, default=1000, help="Number of events read at a time."
+)
+
+RUN_ID = "benchmark_run"
+JOB_NAME = "benchmark_job"
+
+
+def _materialization_event(i: int, num_metadata_entries: int) -> EventLogEntry:
+    materialization = AssetMaterialization(
+        asset_key=AssetKey(["benchmark", f"asset_{i % 50}"]),
+        metadata={
+            **{f"metric_{j}": MetadataValue.float(i * j / 7) for j in range(num_metadata_entries)},
+            "schema": MetadataValue.md(
+                "\n".join(
+                    f"| column_{j} | float64 | nullable |" for j in range(num_metadata_entries)
+                )
+            ),
+        },
+    )
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message="",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        step_key="benchmark_step",
+        job_name=JOB_NAME,
+        dagster_event=DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            JOB_NAME,
+            event_specific_data=StepMaterializationData(materialization),
+        ),
+    )
+
+
+def _engine_event_with_stack_trace(i: int) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=SerializableErrorInfo(
+            message=f"Exception: something went wrong in attempt {i}",
+            stack=[
+                f'  File "/opt/dagster/app/module_{j}.py", line {10 * j}, in function_{j}\n'
+                f"    result = function_{j + 1}(context, value)\n"
+                for j in range(30)
+            ],
+            cls_name="Exception",
+        ),
+        level="error",
+        user_message=f"Step failed on attempt {i}",
+        run_id=RUN_ID,
+        timestamp=time.time(),
+        step_key="benchmark_step",
+        job_name=JOB_NAME,
+    )
+
+
+def _events(num_events: int, num_metadata_entries: int):
+    for i in range(num_events):
+        if i % 4 == 0:
+            yield _engine_event_with_stack_trace(i)
+        else:
+            yield _materialization_event(i, num_metadata_entries)
+
+
+def _benchmark_codec(
+    session: ProfilingSession,
+    codec: Optional[str],
+    num_events: int,
+    num_metadata_entries: int,
+    read_chunk_size: int,
+):
+    name = codec or "none"
+    events = list(_events(num_events, num_metadata_entries))
+    with tempfile.TemporaryDirectory() as base_dir:
+        storage = ConsolidatedSqliteEventLogStorage(base_dir, event_payload_codec=codec)
+        try:
+            with session.logged_execution_time(f"{name}: write {num_events} events"):
+                start = time.perf_counter()
+                for event in events:
+                    storage.store_event(event)
+                write_time = time.perf_counter() - start
+
+            with session.logged_execution_time(f"{name}: read {num_events} events"):
+                start = time.perf_counter()
+                cursor = None
+                has_more = True
+                while has_more:
+                    connection = storage.get_records_for_run(
+                        RUN_ID, cursor=cursor, limit=read_chunk_size
+                    )
+                    cursor = connection.cursor
+                    has_more = connection.has_more
+                read_time = time.perf_counter() - start
+
+            size_mb = os.path.getsize(storage.get_db_path()) / (1024 * 1024)
+        finally:
+            storage.dispose()
+
+    return num_events / write_time, num_events / read_time, size_mb
+
+
+def main(num_events: int, num_metadata_entries: int, read_chunk_size: int) -> None:
+    codecs = [None, *EVENT_PAYLOAD_CODECS]
+    try:
+        import zstandard  # noqa: F401
+    except ImportError:
+        print("zstandard is not installed, skipping the zstd codec")
+        codecs.remove(ZSTD_CODEC)
+
+    session = ProfilingSession(
+        name="Event log payload codecs",
+        experiment_settings={
+            "num_events": num_events,
+            "num_metadata_entries": num_metadata_entries,
+            "read_chunk_size": read_chunk_size,
+        },
+    ).start()
+    session.log_start_message()
+
+    results = {
+        codec or "none": _benchmark_codec(
+            session, codec, num_events, num_metadata_entries, read_chunk_size
+        )
+        for codec in codecs
+    }
+
+    session.log_result_summary()
+
+    print()
+    print(f"{'codec':<6} {'writes/s':>10} {'reads/s':>10} {'size MB':>9}")
+    for name, (writes_per_second, reads_per_second, size_mb) in results.items():
+        print(f"{name:<6} {writes_per_second:>10.0f} {reads_per_second:>10.0f} {size_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_events, args.num_metadata_entries, args.read_chunk_size)
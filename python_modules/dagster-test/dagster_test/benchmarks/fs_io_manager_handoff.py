@@ -0,0 +1,109 @@
+# ruff: noqa: T201
+
+import argparse
+import multiprocessing
+import resource
+import tempfile
+import time
+from typing import Tuple
+
+from dagster import build_input_context, build_output_context
+from dagster._core.storage.fs_io_manager import (
+    ColumnarObjectFilesystemIOManager,
+    PickledObjectFilesystemIOManager,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare step-to-step handoff of a large pandas DataFrame through the pickling filesystem IO manager
+and the columnar (Arrow IPC, memory-mapped) filesystem IO manager.
+
+For each IO manager, a fresh subprocess builds a DataFrame of roughly `--size-mb` megabytes of
+float64 columns, writes it with `handle_output`, and a second fresh subprocess loads it with
+`load_input` and sums one column (touching the data, as a downstream step would). Wall time and
+peak RSS above the post-import baseline are reported for each of the write and read sides.
+"""
+
+parser = argparse.ArgumentParser(prog="fs_io_manager_handoff", description=DESC)
+parser.add_argument("--size-mb", type=int, default=1024, help="Approximate size of the frame.")
+parser.add_argument("--num-columns", type=int, default=16, help="Number of float64 columns.")
+
+IO_MANAGERS = {
+    "pickle": PickledObjectFilesystemIOManager,
+    "columnar": ColumnarObjectFilesystemIOManager,
+}
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _write(io_manager_name: str, base_dir: str, size_mb: int, num_columns: int) -> Tuple:
+    import numpy as np
+    import pandas as pd
+
+    num_rows = size_mb * 1024 * 1024 // (8 * num_columns)
+    df = pd.DataFrame(
+        {f"col_{i}": np.random.random(num_rows) for i in range(num_columns)}, copy=False
+    )
+    baseline_rss = _max_rss_mb()
+
+    io_manager = IO_MANAGERS[io_manager_name](base_dir=base_dir)
+    start = time.perf_counter()
+    io_manager.handle_output(build_output_context(step_key="producer", name="result"), df)
+    return time.perf_counter() - start, _max_rss_mb() - baseline_rss
+
+
+def _read(io_manager_name: str, base_dir: str) -> Tuple:
+    import pandas  # noqa: F401
+
+    baseline_rss = _max_rss_mb()
+
+    io_manager = IO_MANAGERS[io_manager_name](base_dir=base_dir)
+    start = time.perf_counter()
+    df = io_manager.load_input(
+        build_input_context(
+            upstream_output=build_output_context(step_key="producer", name="result")
+        )
+    )
+    df["col_0"].sum()
+    return time.perf_counter() - start, _max_rss_mb() - baseline_rss
+
+
+def main(size_mb: int, num_columns: int) -> None:
+    session = ProfilingSession(
+        name="Filesystem IO manager handoff",
+        experiment_settings={"size_mb": size_mb, "num_columns": num_columns},
+    ).start()
+    session.log_start_message()
+
+    mp_context = multiprocessing.get_context("spawn")
+    results = {}
+    for io_manager_name in IO_MANAGERS:
+        with tempfile.TemporaryDirectory() as base_dir:
+            with mp_context.Pool(1) as pool:
+                with session.logged_execution_time(f"{io_manager_name}: write (incl. setup)"):
+                    write_time, write_rss = pool.apply(
+                        _write, (io_manager_name, base_dir, size_mb, num_columns)
+                    )
+            with mp_context.Pool(1) as pool:
+                with session.logged_execution_time(f"{io_manager_name}: read (incl. setup)"):
+                    read_time, read_rss = pool.apply(_read, (io_manager_name, base_dir))
+        results[io_manager_name] = (write_time, write_rss, read_time, read_rss)
+
+    session.log_result_summary()
+
+    print()
+    print(f"{'io manager':<10} {'write s':>9} {'write MB':>9} {'read s':>9} {'read MB':>9}")
+    for io_manager_name, (write_time, write_rss, read_time, read_rss) in results.items():
+        print(
+            f"{io_manager_name:<10} {write_time:>9.3f} {write_rss:>9.0f} {read_time:>9.3f}"
+            f" {read_rss:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.size_mb, args.num_columns)
@@ -0,0 +1,90 @@
+# ruff: noqa: T201
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import List, Mapping, Sequence, Tuple
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the time taken to import dagster. Each of a set of import statements is run
+`--num-runs` times, each in a fresh Python process, and the wall time of the import is recorded. The
+statements range from `import dagster` alone, which should only load the lazily resolved public API
+surface, to imports of the definitions used by a typical code location. The heavy third-party
+dependencies (sqlalchemy, grpc, alembic, ...) loaded by each statement are reported as well, since
+they should only be imported once storage or gRPC is used.
+"""
+
+parser = argparse.ArgumentParser(prog="import_time", description=DESC)
+parser.add_argument("--num-runs", type=int, default=10, help="Number of runs per statement.")
+
+IMPORT_STATEMENTS: Sequence[str] = [
+    "import dagster",
+    "import dagster._check",
+    "from dagster import AssetKey",
+    "from dagster import Definitions, asset, job, op",
+    "from dagster import DagsterInstance",
+]
+
+HEAVY_MODULES: Sequence[str] = ["alembic", "grpc", "sqlalchemy", "structlog", "pendulum"]
+
+_MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+exec({statement!r})
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "elapsed": elapsed,
+    "heavy_modules": [name for name in {heavy_modules!r} if name in sys.modules],
+}}))
+"""
+
+
+def _measure_import(statement: str) -> Tuple[float, List[str]]:
+    script = _MEASURE_SCRIPT.format(statement=statement, heavy_modules=list(HEAVY_MODULES))
+    result = subprocess.run(
+        [sys.executable, "-c", script], check=True, capture_output=True, text=True
+    )
+    measurement = json.loads(result.stdout.strip().splitlines()[-1])
+    return measurement["elapsed"], measurement["heavy_modules"]
+
+
+def main(num_runs: int) -> None:
+    session = ProfilingSession(
+        name="import time",
+        experiment_settings={"num_runs": num_runs},
+    ).start()
+    session.log_start_message()
+
+    results: Mapping[str, Tuple[List[float], List[str]]] = {}
+    for statement in IMPORT_STATEMENTS:
+        with session.logged_execution_time(f"{statement}: {num_runs} runs"):
+            # the first run warms the bytecode cache, and is not recorded
+            _measure_import(statement)
+            durations = []
+            heavy_modules: List[str] = []
+            for _ in range(num_runs):
+                elapsed, heavy_modules = _measure_import(statement)
+                durations.append(elapsed)
+        results[statement] = (durations, heavy_modules)
+
+    session.log_result_summary()
+
+    print()
+    print(f"{'statement':<50} {'mean ms':>10} {'p50 ms':>10} {'max ms':>10}  heavy modules")
+    for statement, (durations, heavy_modules) in results.items():
+        print(
+            f"{statement:<50}"
+            f" {statistics.mean(durations) * 1000:>10.1f}"
+            f" {statistics.median(durations) * 1000:>10.1f}"
+            f" {max(durations) * 1000:>10.1f}"
+            f"  {', '.join(heavy_modules) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs)
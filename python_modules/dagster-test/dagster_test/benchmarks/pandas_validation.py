@@ -0,0 +1,105 @@
+# ruff: noqa: T201
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from dagster_pandas import PandasColumn
+from dagster_pandas.validation import DataFrameValidator
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how fast dagster-pandas validates the column constraints of a dataframe. A dataframe with
+`--num-rows` rows and ten columns of different dtypes is validated against the constraints of the
+`PandasColumn` constructors, by validating each constraint separately with `PandasColumn.validate`,
+and with a `DataFrameValidator`, which shares the masks of missing values and the hashing of
+object columns between the constraints of a column. The validator is also run with
+`--sample-size`.
+"""
+
+parser = argparse.ArgumentParser(prog="pandas_validation", description=DESC)
+parser.add_argument("--num-rows", type=int, default=5_000_000, help="Number of rows.")
+parser.add_argument("--num-rounds", type=int, default=3, help="Number of validations of each kind.")
+parser.add_argument(
+    "--sample-size", type=int, default=100_000, help="Sample size of the sampled validation."
+)
+
+
+def _dataframe(num_rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            **{f"int_{i}": np.arange(num_rows) for i in range(3)},
+            **{f"float_{i}": rng.random(num_rows) for i in range(3)},
+            "category": rng.choice(["a", "b", "c"], num_rows).astype(object),
+            "string": rng.choice(["x", "y"], num_rows).astype(object),
+            "datetime": pd.date_range("2020-01-01", periods=num_rows, freq="s"),
+            "boolean": rng.random(num_rows) > 0.5,
+        }
+    )
+
+
+def _pandas_columns():
+    return [
+        *(
+            PandasColumn.integer_column(f"int_{i}", min_value=0, non_nullable=True, unique=i == 0)
+            for i in range(3)
+        ),
+        *(PandasColumn.float_column(f"float_{i}", ignore_missing_vals=True) for i in range(3)),
+        PandasColumn.categorical_column("category", {"a", "b", "c"}, non_nullable=True),
+        PandasColumn.string_column("string", non_nullable=True),
+        PandasColumn.datetime_column("datetime", non_nullable=True),
+        PandasColumn.boolean_column("boolean", non_nullable=True),
+    ]
+
+
+def main(num_rows: int, num_rounds: int, sample_size: int) -> None:
+    session = ProfilingSession(
+        name="pandas validation",
+        experiment_settings={
+            "num_rows": num_rows,
+            "num_rounds": num_rounds,
+            "sample_size": sample_size,
+        },
+    ).start()
+    session.log_start_message()
+
+    dataframe = _dataframe(num_rows)
+    pandas_columns = _pandas_columns()
+    validator = DataFrameValidator(pandas_columns=pandas_columns)
+    sampled_validator = DataFrameValidator(
+        pandas_columns=pandas_columns, sample_size=sample_size, random_state=0
+    )
+
+    times = {"per constraint": [], "validator": [], "sampled validator": []}
+    for i in range(num_rounds):
+        with session.logged_execution_time(f"Round {i}: per constraint"):
+            start = time.perf_counter()
+            for pandas_column in pandas_columns:
+                pandas_column.validate(dataframe)
+            times["per constraint"].append(time.perf_counter() - start)
+
+        with session.logged_execution_time(f"Round {i}: validator"):
+            start = time.perf_counter()
+            validator.validate(dataframe)
+            times["validator"].append(time.perf_counter() - start)
+
+        with session.logged_execution_time(f"Round {i}: sampled validator"):
+            start = time.perf_counter()
+            sampled_validator.validate(dataframe)
+            times["sampled validator"].append(time.perf_counter() - start)
+
+    session.log_result_summary()
+
+    print()
+    for name, round_times in times.items():
+        print(
+            f"{name + ':':<20} {min(round_times):>8.3f}s, {num_rows / min(round_times):>12.0f} rows/s"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_rows, args.num_rounds, args.sample_size)
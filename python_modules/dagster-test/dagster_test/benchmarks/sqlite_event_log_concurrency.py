@@ -0,0 +1,147 @@
+# ruff: noqa: T201
+
+import argparse
+import multiprocessing
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from dagster import AssetMaterialization
+from dagster._core.events import DagsterEvent, DagsterEventType, StepMaterializationData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import SqliteEventLogStorage
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the throughput of the SQLite event log storage when the steps of a run store events
+concurrently, as they do with the multiprocess executor. Each of `--num-steps` steps stores
+`--num-events` events to the shard of the run, every tenth of which is an asset materialization
+that is mirrored to the index shard, while a reader polls the events of the run, as the
+webserver does. Steps run as threads of a single process sharing one storage (`--mode threads`),
+or as separate processes (`--mode processes`).
+"""
+
+parser = argparse.ArgumentParser(prog="sqlite_event_log_concurrency", description=DESC)
+parser.add_argument("--num-steps", type=int, default=8, help="Number of concurrent steps.")
+parser.add_argument("--num-events", type=int, default=500, help="Number of events per step.")
+parser.add_argument("--num-rounds", type=int, default=3, help="Number of runs to store.")
+parser.add_argument("--mode", choices=["threads", "processes"], default="threads")
+
+RUN_ID = "benchmark_run"
+
+
+def _event(step: int, i: int, run_id: str) -> EventLogEntry:
+    dagster_event = None
+    if i % 10 == 0:
+        dagster_event = DagsterEvent(
+            DagsterEventType.ASSET_MATERIALIZATION.value,
+            "benchmark_job",
+            event_specific_data=StepMaterializationData(
+                AssetMaterialization(asset_key=f"asset_{step}")
+            ),
+        )
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=f"step {step} event {i}",
+        run_id=run_id,
+        timestamp=time.time(),
+        step_key=f"step_{step}",
+        dagster_event=dagster_event,
+    )
+
+
+def _store_step_events(
+    storage: SqliteEventLogStorage, step: int, num_events: int, run_id: str
+) -> float:
+    start = time.perf_counter()
+    for i in range(num_events):
+        storage.store_event(_event(step, i, run_id))
+    return time.perf_counter() - start
+
+
+def _store_step_events_in_process(base_dir: str, step: int, num_events: int, run_id: str) -> None:
+    _store_step_events(SqliteEventLogStorage(base_dir), step, num_events, run_id)
+
+
+def _poll(storage: SqliteEventLogStorage, run_id: str, done: threading.Event) -> int:
+    num_polls = 0
+    while not done.is_set():
+        storage.get_records_for_run(run_id, limit=100)
+        num_polls += 1
+    return num_polls
+
+
+def _store_run(
+    storage: SqliteEventLogStorage, num_steps: int, num_events: int, mode: str, run_id: str
+) -> int:
+    done = threading.Event()
+    with ThreadPoolExecutor(max_workers=num_steps + 1) as executor:
+        poll_future = executor.submit(_poll, storage, run_id, done)
+        if mode == "threads":
+            futures = [
+                executor.submit(_store_step_events, storage, step, num_events, run_id)
+                for step in range(num_steps)
+            ]
+            for future in futures:
+                future.result()
+        else:
+            ctx = multiprocessing.get_context("spawn")
+            processes = [
+                ctx.Process(
+                    target=_store_step_events_in_process,
+                    args=(storage._base_dir, step, num_events, run_id),  # noqa: SLF001
+                )
+                for step in range(num_steps)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+                assert process.exitcode == 0
+        done.set()
+        return poll_future.result()
+
+
+def main(num_steps: int, num_events: int, num_rounds: int, mode: str) -> None:
+    session = ProfilingSession(
+        name="sqlite event log concurrency",
+        experiment_settings={
+            "num_steps": num_steps,
+            "num_events": num_events,
+            "num_rounds": num_rounds,
+            "mode": mode,
+        },
+    ).start()
+    session.log_start_message()
+
+    times: List[float] = []
+    polls: List[int] = []
+    with tempfile.TemporaryDirectory() as base_dir:
+        storage = SqliteEventLogStorage(base_dir)
+        for i in range(num_rounds):
+            run_id = f"{RUN_ID}_{i}"
+            with session.logged_execution_time(f"Round {i}: store run"):
+                start = time.perf_counter()
+                polls.append(_store_run(storage, num_steps, num_events, mode, run_id))
+                times.append(time.perf_counter() - start)
+            num_stored = len(storage.get_logs_for_run(run_id))
+            assert num_stored == num_steps * num_events, num_stored
+        storage.dispose()
+
+    session.log_result_summary()
+
+    num_total = num_steps * num_events
+    best = min(range(num_rounds), key=lambda i: times[i])
+    print()
+    print(f"{num_total} events per run from {num_steps} steps ({mode})")
+    print(f"events/s:  {num_total / times[best]:>10.0f}")
+    print(f"polls/s:   {polls[best] / times[best]:>10.0f}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.num_events, args.num_rounds, args.mode)
@@ -0,0 +1,120 @@
+# ruff: noqa: T201
+
+import argparse
+import statistics
+import time
+from typing import Callable, List
+
+from dagster import In, JobDefinition, Nothing, job, op
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.snap import create_job_snapshot_id, step_subset_snapshot_from_execution_plan
+from dagster._serdes import deserialize_value, serialize_value
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the time taken by a step worker to get the execution plan for the step it executes, for a
+job with `--num-ops` ops, each depending on up to `--num-upstream` earlier ops (like the models of a
+large dbt project). Step workers used to build the plan for the whole job, and now rebuild it from
+a snapshot of the steps they execute and their upstream steps, sent by the orchestrator (see
+`step_subset_snapshot_from_execution_plan`). Both are timed `--num-runs` times for the last step of
+the job, along with the cost to the orchestrator of creating the snapshot and its serialized size.
+"""
+
+parser = argparse.ArgumentParser(prog="step_worker_plan", description=DESC)
+parser.add_argument("--num-runs", type=int, default=5, help="Number of runs per measurement.")
+parser.add_argument("--num-ops", type=int, default=5000, help="Number of ops in the job.")
+parser.add_argument(
+    "--num-upstream", type=int, default=3, help="Maximum number of upstream ops per op."
+)
+
+
+def _build_job(num_ops: int, num_upstream: int) -> JobDefinition:
+    ops = [
+        op(name=f"op_{i}", ins={f"in_{j}": In(Nothing) for j in range(min(i, num_upstream))})(
+            lambda: None
+        )
+        for i in range(num_ops)
+    ]
+
+    @job(name="step_worker_plan_job")
+    def large_job():
+        results = []
+        for i, op_def in enumerate(ops):
+            # depend on the previous op and on ops spread across the earlier part of the job
+            upstream = [
+                results[i - 1 - (j * i) // num_upstream] for j in range(min(i, num_upstream))
+            ]
+            results.append(op_def(**{f"in_{j}": result for j, result in enumerate(upstream)}))
+
+    return large_job
+
+
+def _time(fn: Callable[[], object], num_runs: int) -> List[float]:
+    durations = []
+    for _ in range(num_runs):
+        start = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def main(num_runs: int, num_ops: int, num_upstream: int) -> None:
+    session = ProfilingSession(
+        name="Step worker plan",
+        experiment_settings={
+            "num_runs": num_runs,
+            "num_ops": num_ops,
+            "num_upstream": num_upstream,
+        },
+    ).start()
+    session.log_start_message()
+
+    large_job = _build_job(num_ops, num_upstream)
+    job_snapshot_id = create_job_snapshot_id(large_job.get_job_snapshot())
+    step_key = f"op_{num_ops - 1}"
+
+    with session.logged_execution_time("Build orchestrator plan"):
+        execution_plan = create_execution_plan(large_job)
+
+    def _create_snapshot() -> str:
+        return serialize_value(
+            step_subset_snapshot_from_execution_plan(execution_plan, job_snapshot_id, [step_key])
+        )
+
+    serialized_snapshot = _create_snapshot()
+
+    def _rebuild_from_snapshot() -> ExecutionPlan:
+        return ExecutionPlan.rebuild_from_snapshot(
+            large_job.name, deserialize_value(serialized_snapshot)
+        )
+
+    results = {}
+    for name, fn in [
+        (
+            "build plan for the whole job",
+            lambda: create_execution_plan(large_job, step_keys_to_execute=[step_key]),
+        ),
+        ("create step snapshot", _create_snapshot),
+        ("rebuild from step snapshot", _rebuild_from_snapshot),
+    ]:
+        with session.logged_execution_time(f"{name}: {num_runs} runs"):
+            results[name] = _time(fn, num_runs)
+
+    session.log_result_summary()
+
+    print()
+    print(f"{'measurement':<30} {'mean ms':>10} {'min ms':>10}")
+    for name, durations in results.items():
+        print(
+            f"{name:<30}"
+            f" {statistics.mean(durations) * 1000:>10.1f}"
+            f" {min(durations) * 1000:>10.1f}"
+        )
+    print(f"\nserialized step snapshot: {len(serialized_snapshot) / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_runs, args.num_ops, args.num_upstream)
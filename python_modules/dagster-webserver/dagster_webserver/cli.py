@@ -180,6 +180,17 @@ def create_dagster_webserver_cli():
     default=2000,
     show_default=True,
 )
+@click.option(
+    "--async-storage-threads",
+    help=(
+        "[Experimental] Execute GraphQL requests on the event loop, submitting run and event log"
+        " storage reads to a bounded pool of this many threads instead of running each request"
+        " in its own worker thread."
+    ),
+    type=click.INT,
+    required=False,
+    envvar="DAGSTER_WEBSERVER_ASYNC_STORAGE_THREADS",
+)
 @click.version_option(version=__version__, prog_name="dagster-webserver")
 def dagster_webserver(
     host: str,
@@ -195,6 +206,7 @@ def dagster_webserver(
     code_server_log_level: str,
     instance_ref: Optional[str],
     live_data_poll_rate: int,
+    async_storage_threads: Optional[int],
     **kwargs: ClickArgValue,
 ):
     if suppress_warnings:
@@ -231,6 +243,7 @@ def dagster_webserver(
                 path_prefix,
                 uvicorn_log_level,
                 live_data_poll_rate,
+                async_storage_threads,
             )
 
 
@@ -253,6 +266,7 @@ def host_dagster_ui_with_workspace_process_context(
     path_prefix: str,
     log_level: str,
     live_data_poll_rate: Optional[int] = None,
+    async_storage_threads: Optional[int] = None,
 ):
     check.inst_param(
         workspace_process_context, "workspace_process_context", IWorkspaceProcessContext
@@ -261,11 +275,16 @@ def host_dagster_ui_with_workspace_process_context(
     check.opt_int_param(port, "port")
     check.str_param(path_prefix, "path_prefix")
     check.opt_int_param(live_data_poll_rate, "live_data_poll_rate")
+    check.opt_int_param(async_storage_threads, "async_storage_threads")
 
     logger = logging.getLogger(WEBSERVER_LOGGER_NAME)
 
     app = create_app_from_workspace_process_context(
-        workspace_process_context, path_prefix, live_data_poll_rate, lifespan=_lifespan
+        workspace_process_context,
+        path_prefix,
+        live_data_poll_rate,
+        async_storage_threads=async_storage_threads,
+        lifespan=_lifespan,
     )
 
     if not port:
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from asyncio import Task, get_event_loop, run
+from concurrent.futures import Executor
 from enum import Enum
 from typing import (
     TYPE_CHECKING,
@@ -18,7 +19,7 @@
 from dagster._serdes import pack_value
 from dagster._seven import json
 from dagster._utils.error import serializable_error_info_from_exc_info
-from dagster_graphql.implementation.utils import ErrorCapture
+from dagster_graphql.implementation.utils import ErrorCapture, storage_executor_scope
 from graphene import Schema
 from graphql import GraphQLError, GraphQLFormattedError
 from graphql.execution import ExecutionResult
@@ -54,8 +55,9 @@ class GraphQLWS(str, Enum):
 
 
 class GraphQLServer(ABC):
-    def __init__(self, app_path_prefix: str = ""):
+    def __init__(self, app_path_prefix: str = "", storage_executor: Optional[Executor] = None):
         self._app_path_prefix = app_path_prefix
+        self._storage_executor = storage_executor
 
         self._graphql_schema = self.build_graphql_schema()
         self._graphql_middleware = self.build_graphql_middleware()
@@ -241,6 +243,19 @@ async def execute_graphql_request(
 
         request_context = self.make_request_context(request)
 
+        if self._storage_executor is not None:
+            # execute on the event loop, with resolvers that read from storage submitting those
+            # reads to the bounded storage executor and awaiting them, rather than occupying a
+            # worker thread for the whole request
+            with storage_executor_scope(self._storage_executor):
+                return await self._graphql_schema.execute_async(
+                    query,
+                    variables=variables,
+                    operation_name=operation_name,
+                    context=request_context,
+                    middleware=self._graphql_middleware,
+                )
+
         def _graphql_request():
             return run(
                 self._graphql_schema.execute_async(
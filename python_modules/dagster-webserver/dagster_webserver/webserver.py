@@ -1,6 +1,7 @@
 import gzip
 import io
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from os import path, walk
 from typing import Generic, List, Optional, TypeVar
 
@@ -53,11 +54,22 @@ def __init__(
         app_path_prefix: str = "",
         live_data_poll_rate: Optional[int] = None,
         uses_app_path_prefix: bool = True,
+        storage_executor_max_workers: Optional[int] = None,
     ):
         self._process_context = process_context
         self._live_data_poll_rate = live_data_poll_rate
         self._uses_app_path_prefix = uses_app_path_prefix
-        super().__init__(app_path_prefix)
+        super().__init__(
+            app_path_prefix,
+            storage_executor=(
+                ThreadPoolExecutor(
+                    max_workers=storage_executor_max_workers,
+                    thread_name_prefix="dagster_webserver_storage",
+                )
+                if storage_executor_max_workers
+                else None
+            ),
+        )
 
     def build_graphql_schema(self) -> Schema:
         return create_schema()
@@ -7,6 +7,7 @@
     job,
     op,
 )
+from dagster._cli.workspace.cli_target import get_workspace_process_context_from_kwargs
 from dagster._core.events import DagsterEventType
 from dagster._serdes import unpack_value
 from dagster._seven import json
@@ -14,6 +15,7 @@
 from dagster_graphql.version import __version__ as dagster_graphql_version
 from dagster_webserver.graphql import GraphQLWS
 from dagster_webserver.version import __version__ as dagster_webserver_version
+from dagster_webserver.webserver import DagsterWebserver
 from starlette.testclient import TestClient
 
 EVENT_LOG_SUBSCRIPTION = """
@@ -291,6 +293,72 @@ def test_async(test_client: TestClient):
     assert result["data"]["test"]["two"] == "slept concurrently", result
 
 
+ASYNC_STORAGE_QUERY = """
+query AsyncStorageQuery($runId: ID!, $runIdString: String!) {
+    runsOrError(filter: {runIds: [$runIdString]}) {
+        ... on Runs {
+            results {
+                runId
+                status
+            }
+        }
+    }
+    runOrError(runId: $runId) {
+        __typename
+    }
+    logsForRun(runId: $runId) {
+        ... on EventConnection {
+            events {
+                __typename
+            }
+        }
+    }
+}
+"""
+
+
+def test_async_storage_reads(instance):
+    run_id = _add_run(instance)
+    process_context = get_workspace_process_context_from_kwargs(
+        instance=instance,
+        version=dagster_version,
+        read_only=False,
+        kwargs={"empty_workspace": True},
+    )
+    app = DagsterWebserver(process_context, storage_executor_max_workers=2).create_asgi_app(
+        debug=True
+    )
+    test_client = TestClient(app)
+
+    response = test_client.post(
+        "/graphql",
+        json={"query": ASYNC_STORAGE_QUERY, "variables": {"runId": run_id, "runIdString": run_id}},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["runsOrError"]["results"] == [{"runId": run_id, "status": "SUCCESS"}]
+    assert data["runOrError"]["__typename"] == "Run"
+    assert data["logsForRun"]["events"]
+
+    response = test_client.post(
+        "/graphql",
+        json={
+            "query": ASYNC_STORAGE_QUERY,
+            "variables": {"runId": "missing", "runIdString": "missing"},
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["runOrError"]["__typename"] == "RunNotFoundError"
+
+    # resolvers that don't read storage still work when executing on the event loop
+    response = test_client.post(
+        "/graphql",
+        params={"query": "{test{one: asyncString, two: asyncString}}"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["data"]["test"]["one"] == "slept"
+
+
 def test_download_captured_logs_not_found(test_client: TestClient):
     response = test_client.get("/logs/does-not-exist/stdout")
     assert response.status_code == 404
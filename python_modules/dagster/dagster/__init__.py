@@ -67,535 +67,14 @@
 # We could get around this by always remembering to use the `from .foo import X as X` form in
 # containers, but it is simpler to just import directly from the defining module.
 
-# ########################
-# ##### DYNAMIC IMPORTS
-# ########################
-
-from dagster._builtins import (
-    Any as Any,
-    Bool as Bool,
-    Float as Float,
-    Int as Int,
-    Nothing as Nothing,
-    String as String,
-)
-from dagster._config.config_schema import ConfigSchema as ConfigSchema
-from dagster._config.config_type import (
-    Array as Array,
-    Enum as Enum,
-    EnumValue as EnumValue,
-    Noneable as Noneable,
-    ScalarUnion as ScalarUnion,
-)
-from dagster._config.field import Field as Field
-from dagster._config.field_utils import (
-    EnvVar as EnvVar,
-    Map as Map,
-    Permissive as Permissive,
-    Selector as Selector,
-    Shape as Shape,
-)
-from dagster._config.pythonic_config import (
-    Config as Config,
-    ConfigurableIOManager as ConfigurableIOManager,
-    ConfigurableIOManagerFactory as ConfigurableIOManagerFactory,
-    ConfigurableLegacyIOManagerAdapter as ConfigurableLegacyIOManagerAdapter,
-    ConfigurableResource as ConfigurableResource,
-    IAttachDifferentObjectToOpContext as IAttachDifferentObjectToOpContext,
-    PermissiveConfig as PermissiveConfig,
-    ResourceDependency as ResourceDependency,
-)
-from dagster._config.source import (
-    BoolSource as BoolSource,
-    IntSource as IntSource,
-    StringSource as StringSource,
-)
-from dagster._core.definitions import AssetCheckResult as AssetCheckResult
-from dagster._core.definitions.asset_check_spec import (
-    AssetCheckKey as AssetCheckKey,
-    AssetCheckSeverity as AssetCheckSeverity,
-    AssetCheckSpec as AssetCheckSpec,
-)
-from dagster._core.definitions.asset_checks import AssetChecksDefinition as AssetChecksDefinition
-from dagster._core.definitions.asset_dep import AssetDep as AssetDep
-from dagster._core.definitions.asset_in import AssetIn as AssetIn
-from dagster._core.definitions.asset_out import AssetOut as AssetOut
-from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
-from dagster._core.definitions.asset_sensor_definition import (
-    AssetSensorDefinition as AssetSensorDefinition,
-)
-from dagster._core.definitions.asset_spec import AssetSpec as AssetSpec
-from dagster._core.definitions.assets import AssetsDefinition as AssetsDefinition
-from dagster._core.definitions.auto_materialize_policy import (
-    AutoMaterializePolicy as AutoMaterializePolicy,
-)
-from dagster._core.definitions.auto_materialize_rule import (
-    AutoMaterializeAssetPartitionsFilter as AutoMaterializeAssetPartitionsFilter,
-    AutoMaterializeRule as AutoMaterializeRule,
-)
-from dagster._core.definitions.backfill_policy import BackfillPolicy as BackfillPolicy
-from dagster._core.definitions.composition import PendingNodeInvocation as PendingNodeInvocation
-from dagster._core.definitions.config import ConfigMapping as ConfigMapping
-from dagster._core.definitions.configurable import configured as configured
-from dagster._core.definitions.data_version import (
-    DataProvenance as DataProvenance,
-    DataVersion as DataVersion,
-    DataVersionsByPartition as DataVersionsByPartition,
-)
-from dagster._core.definitions.decorators.asset_check_decorator import (
-    asset_check as asset_check,
-)
-from dagster._core.definitions.decorators.asset_decorator import (
-    asset as asset,
-    graph_asset as graph_asset,
-    graph_multi_asset as graph_multi_asset,
-    multi_asset as multi_asset,
-)
-from dagster._core.definitions.decorators.config_mapping_decorator import (
-    config_mapping as config_mapping,
-)
-from dagster._core.definitions.decorators.graph_decorator import graph as graph
-from dagster._core.definitions.decorators.hook_decorator import (
-    failure_hook as failure_hook,
-    success_hook as success_hook,
-)
-from dagster._core.definitions.decorators.job_decorator import job as job
-from dagster._core.definitions.decorators.op_decorator import op as op
-from dagster._core.definitions.decorators.repository_decorator import repository as repository
-from dagster._core.definitions.decorators.schedule_decorator import schedule as schedule
-from dagster._core.definitions.decorators.sensor_decorator import (
-    asset_sensor as asset_sensor,
-    multi_asset_sensor as multi_asset_sensor,
-    sensor as sensor,
-)
-from dagster._core.definitions.decorators.source_asset_decorator import (
-    observable_source_asset as observable_source_asset,
-)
-from dagster._core.definitions.definitions_class import (
-    BindResourcesToJobs as BindResourcesToJobs,
-    Definitions as Definitions,
-    create_repository_using_definitions_args as create_repository_using_definitions_args,
-)
-from dagster._core.definitions.dependency import (
-    DependencyDefinition as DependencyDefinition,
-    MultiDependencyDefinition as MultiDependencyDefinition,
-    NodeInvocation as NodeInvocation,
-)
-from dagster._core.definitions.events import (
-    AssetKey as AssetKey,
-    AssetMaterialization as AssetMaterialization,
-    AssetObservation as AssetObservation,
-    DynamicOutput as DynamicOutput,
-    ExpectationResult as ExpectationResult,
-    Failure as Failure,
-    Output as Output,
-    RetryRequested as RetryRequested,
-    TypeCheck as TypeCheck,
-)
-from dagster._core.definitions.executor_definition import (
-    ExecutorDefinition as ExecutorDefinition,
-    ExecutorRequirement as ExecutorRequirement,
-    executor as executor,
-    in_process_executor as in_process_executor,
-    multi_or_in_process_executor as multi_or_in_process_executor,
-    multiple_process_executor_requirements as multiple_process_executor_requirements,
-    multiprocess_executor as multiprocess_executor,
-)
-from dagster._core.definitions.external_asset import (
-    external_asset_from_spec as external_asset_from_spec,
-    external_assets_from_specs as external_assets_from_specs,
-)
-from dagster._core.definitions.freshness_policy import FreshnessPolicy as FreshnessPolicy
-from dagster._core.definitions.freshness_policy_sensor_definition import (
-    FreshnessPolicySensorContext as FreshnessPolicySensorContext,
-    FreshnessPolicySensorDefinition as FreshnessPolicySensorDefinition,
-    build_freshness_policy_sensor_context as build_freshness_policy_sensor_context,
-    freshness_policy_sensor as freshness_policy_sensor,
-)
-from dagster._core.definitions.graph_definition import GraphDefinition as GraphDefinition
-from dagster._core.definitions.hook_definition import HookDefinition as HookDefinition
-from dagster._core.definitions.input import (
-    GraphIn as GraphIn,
-    In as In,
-    InputMapping as InputMapping,
-)
-from dagster._core.definitions.job_definition import JobDefinition as JobDefinition
-from dagster._core.definitions.load_asset_checks_from_modules import (
-    load_asset_checks_from_current_module as load_asset_checks_from_current_module,
-    load_asset_checks_from_modules as load_asset_checks_from_modules,
-    load_asset_checks_from_package_module as load_asset_checks_from_package_module,
-    load_asset_checks_from_package_name as load_asset_checks_from_package_name,
-)
-from dagster._core.definitions.load_assets_from_modules import (
-    load_assets_from_current_module as load_assets_from_current_module,
-    load_assets_from_modules as load_assets_from_modules,
-    load_assets_from_package_module as load_assets_from_package_module,
-    load_assets_from_package_name as load_assets_from_package_name,
-)
-from dagster._core.definitions.logger_definition import (
-    LoggerDefinition as LoggerDefinition,
-    build_init_logger_context as build_init_logger_context,
-    logger as logger,
-)
-from dagster._core.definitions.materialize import (
-    materialize as materialize,
-    materialize_to_memory as materialize_to_memory,
-)
-from dagster._core.definitions.metadata import (
-    BoolMetadataValue as BoolMetadataValue,
-    DagsterAssetMetadataValue as DagsterAssetMetadataValue,
-    DagsterJobMetadataValue as DagsterJobMetadataValue,
-    DagsterRunMetadataValue as DagsterRunMetadataValue,
-    FloatMetadataValue as FloatMetadataValue,
-    IntMetadataValue as IntMetadataValue,
-    JsonMetadataValue as JsonMetadataValue,
-    MarkdownMetadataValue as MarkdownMetadataValue,
-    MetadataEntry as MetadataEntry,
-    MetadataValue as MetadataValue,
-    NotebookMetadataValue as NotebookMetadataValue,
-    NullMetadataValue as NullMetadataValue,
-    PathMetadataValue as PathMetadataValue,
-    PythonArtifactMetadataValue as PythonArtifactMetadataValue,
-    TableMetadataValue as TableMetadataValue,
-    TableSchemaMetadataValue as TableSchemaMetadataValue,
-    TextMetadataValue as TextMetadataValue,
-    UrlMetadataValue as UrlMetadataValue,
-)
-from dagster._core.definitions.metadata.table import (
-    TableColumn as TableColumn,
-    TableColumnConstraints as TableColumnConstraints,
-    TableConstraints as TableConstraints,
-    TableRecord as TableRecord,
-    TableSchema as TableSchema,
-)
-from dagster._core.definitions.multi_asset_sensor_definition import (
-    MultiAssetSensorDefinition as MultiAssetSensorDefinition,
-    MultiAssetSensorEvaluationContext as MultiAssetSensorEvaluationContext,
-    build_multi_asset_sensor_context as build_multi_asset_sensor_context,
-)
-from dagster._core.definitions.multi_dimensional_partitions import (
-    MultiPartitionKey as MultiPartitionKey,
-    MultiPartitionsDefinition as MultiPartitionsDefinition,
-)
-from dagster._core.definitions.op_definition import OpDefinition as OpDefinition
-from dagster._core.definitions.output import (
-    DynamicOut as DynamicOut,
-    GraphOut as GraphOut,
-    Out as Out,
-    OutputMapping as OutputMapping,
-)
-from dagster._core.definitions.partition import (
-    DynamicPartitionsDefinition as DynamicPartitionsDefinition,
-    Partition as Partition,
-    PartitionedConfig as PartitionedConfig,
-    PartitionsDefinition as PartitionsDefinition,
-    StaticPartitionsDefinition as StaticPartitionsDefinition,
-    dynamic_partitioned_config as dynamic_partitioned_config,
-    partitioned_config as partitioned_config,
-    static_partitioned_config as static_partitioned_config,
-)
-from dagster._core.definitions.partition_key_range import PartitionKeyRange as PartitionKeyRange
-from dagster._core.definitions.partition_mapping import (
-    AllPartitionMapping as AllPartitionMapping,
-    DimensionPartitionMapping as DimensionPartitionMapping,
-    IdentityPartitionMapping as IdentityPartitionMapping,
-    LastPartitionMapping as LastPartitionMapping,
-    MultiPartitionMapping as MultiPartitionMapping,
-    MultiToSingleDimensionPartitionMapping as MultiToSingleDimensionPartitionMapping,
-    PartitionMapping as PartitionMapping,
-    SpecificPartitionsPartitionMapping as SpecificPartitionsPartitionMapping,
-    StaticPartitionMapping as StaticPartitionMapping,
-)
-from dagster._core.definitions.partitioned_schedule import (
-    build_schedule_from_partitioned_job as build_schedule_from_partitioned_job,
-)
-from dagster._core.definitions.policy import (
-    Backoff as Backoff,
-    Jitter as Jitter,
-    RetryPolicy as RetryPolicy,
-)
-from dagster._core.definitions.reconstruct import (
-    build_reconstructable_job as build_reconstructable_job,
-    reconstructable as reconstructable,
-)
-from dagster._core.definitions.repository_definition import (
-    RepositoryData as RepositoryData,
-    RepositoryDefinition as RepositoryDefinition,
-)
-from dagster._core.definitions.resource_annotation import (
-    ResourceParam as ResourceParam,
-)
-from dagster._core.definitions.resource_definition import (
-    ResourceDefinition as ResourceDefinition,
-    make_values_resource as make_values_resource,
-    resource as resource,
-)
-from dagster._core.definitions.result import MaterializeResult as MaterializeResult
-from dagster._core.definitions.run_config import RunConfig as RunConfig
-from dagster._core.definitions.run_request import (
-    AddDynamicPartitionsRequest as AddDynamicPartitionsRequest,
-    DeleteDynamicPartitionsRequest as DeleteDynamicPartitionsRequest,
-    RunRequest as RunRequest,
-    SensorResult as SensorResult,
-    SkipReason as SkipReason,
-)
-from dagster._core.definitions.run_status_sensor_definition import (
-    RunFailureSensorContext as RunFailureSensorContext,
-    RunStatusSensorContext as RunStatusSensorContext,
-    RunStatusSensorDefinition as RunStatusSensorDefinition,
-    build_run_status_sensor_context as build_run_status_sensor_context,
-    run_failure_sensor as run_failure_sensor,
-    run_status_sensor as run_status_sensor,
-)
-from dagster._core.definitions.schedule_definition import (
-    DefaultScheduleStatus as DefaultScheduleStatus,
-    ScheduleDefinition as ScheduleDefinition,
-    ScheduleEvaluationContext as ScheduleEvaluationContext,
-    build_schedule_context as build_schedule_context,
-)
-from dagster._core.definitions.selector import (
-    CodeLocationSelector as CodeLocationSelector,
-    JobSelector as JobSelector,
-    RepositorySelector as RepositorySelector,
-)
-from dagster._core.definitions.sensor_definition import (
-    DefaultSensorStatus as DefaultSensorStatus,
-    SensorDefinition as SensorDefinition,
-    SensorEvaluationContext as SensorEvaluationContext,
-    build_sensor_context as build_sensor_context,
-)
-from dagster._core.definitions.source_asset import SourceAsset as SourceAsset
-from dagster._core.definitions.step_launcher import (
-    StepLauncher as StepLauncher,
-    StepRunRef as StepRunRef,
-)
-from dagster._core.definitions.time_window_partition_mapping import (
-    TimeWindowPartitionMapping as TimeWindowPartitionMapping,
-)
-from dagster._core.definitions.time_window_partitions import (
-    DailyPartitionsDefinition as DailyPartitionsDefinition,
-    HourlyPartitionsDefinition as HourlyPartitionsDefinition,
-    MonthlyPartitionsDefinition as MonthlyPartitionsDefinition,
-    TimeWindow as TimeWindow,
-    TimeWindowPartitionsDefinition as TimeWindowPartitionsDefinition,
-    WeeklyPartitionsDefinition as WeeklyPartitionsDefinition,
-    daily_partitioned_config as daily_partitioned_config,
-    hourly_partitioned_config as hourly_partitioned_config,
-    monthly_partitioned_config as monthly_partitioned_config,
-    weekly_partitioned_config as weekly_partitioned_config,
-)
-from dagster._core.definitions.unresolved_asset_job_definition import (
-    define_asset_job as define_asset_job,
-)
-from dagster._core.definitions.utils import (
-    config_from_files as config_from_files,
-    config_from_pkg_resources as config_from_pkg_resources,
-    config_from_yaml_strings as config_from_yaml_strings,
-)
-from dagster._core.definitions.version_strategy import (
-    OpVersionContext as OpVersionContext,
-    ResourceVersionContext as ResourceVersionContext,
-    SourceHashVersionStrategy as SourceHashVersionStrategy,
-    VersionStrategy as VersionStrategy,
-)
-from dagster._core.errors import (
-    DagsterConfigMappingFunctionError as DagsterConfigMappingFunctionError,
-    DagsterError as DagsterError,
-    DagsterEventLogInvalidForRun as DagsterEventLogInvalidForRun,
-    DagsterExecutionInterruptedError as DagsterExecutionInterruptedError,
-    DagsterExecutionStepExecutionError as DagsterExecutionStepExecutionError,
-    DagsterExecutionStepNotFoundError as DagsterExecutionStepNotFoundError,
-    DagsterInvalidConfigDefinitionError as DagsterInvalidConfigDefinitionError,
-    DagsterInvalidConfigError as DagsterInvalidConfigError,
-    DagsterInvalidDefinitionError as DagsterInvalidDefinitionError,
-    DagsterInvalidInvocationError as DagsterInvalidInvocationError,
-    DagsterInvalidSubsetError as DagsterInvalidSubsetError,
-    DagsterInvariantViolationError as DagsterInvariantViolationError,
-    DagsterResourceFunctionError as DagsterResourceFunctionError,
-    DagsterRunNotFoundError as DagsterRunNotFoundError,
-    DagsterStepOutputNotFoundError as DagsterStepOutputNotFoundError,
-    DagsterSubprocessError as DagsterSubprocessError,
-    DagsterTypeCheckDidNotPass as DagsterTypeCheckDidNotPass,
-    DagsterTypeCheckError as DagsterTypeCheckError,
-    DagsterUnknownPartitionError as DagsterUnknownPartitionError,
-    DagsterUnknownResourceError as DagsterUnknownResourceError,
-    DagsterUnmetExecutorRequirementsError as DagsterUnmetExecutorRequirementsError,
-    DagsterUserCodeExecutionError as DagsterUserCodeExecutionError,
-    raise_execution_interrupts as raise_execution_interrupts,
-)
-from dagster._core.event_api import (
-    AssetRecordsFilter as AssetRecordsFilter,
-    EventLogRecord as EventLogRecord,
-    EventRecordsFilter as EventRecordsFilter,
-    EventRecordsResult as EventRecordsResult,
-    RunShardedEventsCursor as RunShardedEventsCursor,
-    RunStatusChangeRecordsFilter as RunStatusChangeRecordsFilter,
-)
-from dagster._core.events import (
-    DagsterEvent as DagsterEvent,
-    DagsterEventType as DagsterEventType,
-)
-from dagster._core.events.log import EventLogEntry as EventLogEntry
-from dagster._core.execution.api import (
-    ReexecutionOptions as ReexecutionOptions,
-    execute_job as execute_job,
-)
-from dagster._core.execution.build_resources import build_resources as build_resources
-from dagster._core.execution.context.compute import (
-    AssetExecutionContext as AssetExecutionContext,
-    OpExecutionContext as OpExecutionContext,
-)
-from dagster._core.execution.context.hook import (
-    HookContext as HookContext,
-    build_hook_context as build_hook_context,
-)
-from dagster._core.execution.context.init import (
-    InitResourceContext as InitResourceContext,
-    build_init_resource_context as build_init_resource_context,
-)
-from dagster._core.execution.context.input import (
-    InputContext as InputContext,
-    build_input_context as build_input_context,
-)
-from dagster._core.execution.context.invocation import (
-    build_asset_context as build_asset_context,
-    build_op_context as build_op_context,
-)
-from dagster._core.execution.context.logger import InitLoggerContext as InitLoggerContext
-from dagster._core.execution.context.output import (
-    OutputContext as OutputContext,
-    build_output_context as build_output_context,
-)
-from dagster._core.execution.context.system import (
-    DagsterTypeLoaderContext as DagsterTypeLoaderContext,
-    StepExecutionContext as StepExecutionContext,
-    TypeCheckContext as TypeCheckContext,
-)
-from dagster._core.execution.execute_in_process_result import (
-    ExecuteInProcessResult as ExecuteInProcessResult,
-)
-from dagster._core.execution.job_execution_result import JobExecutionResult as JobExecutionResult
-from dagster._core.execution.plan.external_step import (
-    external_instance_from_step_run_ref as external_instance_from_step_run_ref,
-    run_step_from_ref as run_step_from_ref,
-    step_context_to_step_run_ref as step_context_to_step_run_ref,
-    step_run_ref_to_step_context as step_run_ref_to_step_context,
-)
-from dagster._core.execution.validate_run_config import validate_run_config as validate_run_config
-from dagster._core.execution.with_resources import with_resources as with_resources
-from dagster._core.executor.base import Executor as Executor
-from dagster._core.executor.init import InitExecutorContext as InitExecutorContext
-from dagster._core.instance import DagsterInstance as DagsterInstance
-from dagster._core.instance_for_test import instance_for_test as instance_for_test
-from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
-from dagster._core.log_manager import DagsterLogManager as DagsterLogManager
-from dagster._core.pipes.client import (
-    PipesClient as PipesClient,
-    PipesContextInjector as PipesContextInjector,
-    PipesMessageReader as PipesMessageReader,
-)
-from dagster._core.pipes.context import (
-    PipesMessageHandler as PipesMessageHandler,
-    PipesSession as PipesSession,
-)
-from dagster._core.pipes.subprocess import PipesSubprocessClient as PipesSubprocessClient
-from dagster._core.pipes.utils import (
-    PipesBlobStoreMessageReader as PipesBlobStoreMessageReader,
-    PipesEnvContextInjector as PipesEnvContextInjector,
-    PipesFileContextInjector as PipesFileContextInjector,
-    PipesFileMessageReader as PipesFileMessageReader,
-    PipesLogReader as PipesLogReader,
-    PipesTempFileContextInjector as PipesTempFileContextInjector,
-    PipesTempFileMessageReader as PipesTempFileMessageReader,
-    open_pipes_session as open_pipes_session,
-)
-from dagster._core.run_coordinator.queued_run_coordinator import (
-    QueuedRunCoordinator as QueuedRunCoordinator,
-    SubmitRunContext as SubmitRunContext,
-)
-from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
-from dagster._core.storage.dagster_run import (
-    DagsterRun as DagsterRun,
-    DagsterRunStatus as DagsterRunStatus,
-    RunRecord as RunRecord,
-    RunsFilter as RunsFilter,
-)
-from dagster._core.storage.file_manager import (
-    FileHandle as FileHandle,
-    LocalFileHandle as LocalFileHandle,
-    local_file_manager as local_file_manager,
-)
-from dagster._core.storage.fs_io_manager import (
-    FilesystemIOManager as FilesystemIOManager,
-    custom_path_fs_io_manager as custom_path_fs_io_manager,
-    fs_io_manager as fs_io_manager,
-)
-from dagster._core.storage.input_manager import (
-    InputManager as InputManager,
-    InputManagerDefinition as InputManagerDefinition,
-    input_manager as input_manager,
-)
-from dagster._core.storage.io_manager import (
-    IOManager as IOManager,
-    IOManagerDefinition as IOManagerDefinition,
-    io_manager as io_manager,
-)
-from dagster._core.storage.mem_io_manager import (
-    InMemoryIOManager as InMemoryIOManager,
-    mem_io_manager as mem_io_manager,
-)
-from dagster._core.storage.memoizable_io_manager import MemoizableIOManager as MemoizableIOManager
-from dagster._core.storage.partition_status_cache import (
-    AssetPartitionStatus as AssetPartitionStatus,
-)
-from dagster._core.storage.tags import (
-    MAX_RUNTIME_SECONDS_TAG as MAX_RUNTIME_SECONDS_TAG,
-    MEMOIZED_RUN_TAG as MEMOIZED_RUN_TAG,
-)
-from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
-from dagster._core.types.config_schema import (
-    DagsterTypeLoader as DagsterTypeLoader,
-    dagster_type_loader as dagster_type_loader,
-)
-from dagster._core.types.dagster_type import (
-    DagsterType as DagsterType,
-    List as List,
-    Optional as Optional,
-    PythonObjectDagsterType as PythonObjectDagsterType,
-    make_python_type_usable_as_dagster_type as make_python_type_usable_as_dagster_type,
-)
-from dagster._core.types.decorator import usable_as_dagster_type as usable_as_dagster_type
-from dagster._core.types.python_dict import Dict as Dict
-from dagster._core.types.python_set import Set as Set
-from dagster._core.types.python_tuple import Tuple as Tuple
-from dagster._loggers import (
-    colored_console_logger as colored_console_logger,
-    default_loggers as default_loggers,
-    default_system_loggers as default_system_loggers,
-    json_console_logger as json_console_logger,
-)
-from dagster._serdes.serdes import (
-    deserialize_value as deserialize_value,
-    serialize_value as serialize_value,
-)
-from dagster._utils import (
-    file_relative_path as file_relative_path,
-)
-from dagster._utils.alert import (
-    make_email_on_run_failure_sensor as make_email_on_run_failure_sensor,
-)
-from dagster._utils.dagster_type import check_dagster_type as check_dagster_type
-from dagster._utils.log import get_dagster_logger as get_dagster_logger
-from dagster._utils.warnings import (
-    ConfigArgumentWarning as ConfigArgumentWarning,
-    ExperimentalWarning as ExperimentalWarning,
-)
-from dagster.version import __version__ as __version__
-
-# ruff: isort: split
+# (3) The public API is resolved lazily, on first attribute access, so that `import dagster` (which
+# precedes the import of any `dagster._*` module) does not import every module in the package. Each
+# symbol is declared twice: the import in the TYPE_CHECKING block below satisfies linters and type
+# checkers, and the entry in `_PUBLIC_API` is used to resolve the symbol at runtime. The two are
+# checked against each other in dagster_tests/general_tests/test_import.py.
 
 # ########################
-# ##### DYNAMIC IMPORTS
+# ##### PUBLIC API
 # ########################
 
 import importlib
@@ -610,7 +89,1178 @@
 
 from typing_extensions import Final
 
-from dagster._utils.warnings import deprecation_warning
+from dagster.version import __version__ as __version__
+
+if TYPE_CHECKING:
+    from dagster._builtins import (
+        Any as Any,
+        Bool as Bool,
+        Float as Float,
+        Int as Int,
+        Nothing as Nothing,
+        String as String,
+    )
+    from dagster._config.config_schema import ConfigSchema as ConfigSchema
+    from dagster._config.config_type import (
+        Array as Array,
+        Enum as Enum,
+        EnumValue as EnumValue,
+        Noneable as Noneable,
+        ScalarUnion as ScalarUnion,
+    )
+    from dagster._config.field import Field as Field
+    from dagster._config.field_utils import (
+        EnvVar as EnvVar,
+        Map as Map,
+        Permissive as Permissive,
+        Selector as Selector,
+        Shape as Shape,
+    )
+    from dagster._config.pythonic_config import (
+        Config as Config,
+        ConfigurableIOManager as ConfigurableIOManager,
+        ConfigurableIOManagerFactory as ConfigurableIOManagerFactory,
+        ConfigurableLegacyIOManagerAdapter as ConfigurableLegacyIOManagerAdapter,
+        ConfigurableResource as ConfigurableResource,
+        IAttachDifferentObjectToOpContext as IAttachDifferentObjectToOpContext,
+        PermissiveConfig as PermissiveConfig,
+        ResourceDependency as ResourceDependency,
+    )
+    from dagster._config.source import (
+        BoolSource as BoolSource,
+        IntSource as IntSource,
+        StringSource as StringSource,
+    )
+    from dagster._core.definitions import AssetCheckResult as AssetCheckResult
+    from dagster._core.definitions.asset_check_spec import (
+        AssetCheckKey as AssetCheckKey,
+        AssetCheckSeverity as AssetCheckSeverity,
+        AssetCheckSpec as AssetCheckSpec,
+    )
+    from dagster._core.definitions.asset_checks import (
+        AssetChecksDefinition as AssetChecksDefinition,
+    )
+    from dagster._core.definitions.asset_dep import AssetDep as AssetDep
+    from dagster._core.definitions.asset_in import AssetIn as AssetIn
+    from dagster._core.definitions.asset_out import AssetOut as AssetOut
+    from dagster._core.definitions.asset_selection import AssetSelection as AssetSelection
+    from dagster._core.definitions.asset_sensor_definition import (
+        AssetSensorDefinition as AssetSensorDefinition,
+    )
+    from dagster._core.definitions.asset_spec import AssetSpec as AssetSpec
+    from dagster._core.definitions.assets import AssetsDefinition as AssetsDefinition
+    from dagster._core.definitions.auto_materialize_policy import (
+        AutoMaterializePolicy as AutoMaterializePolicy,
+    )
+    from dagster._core.definitions.auto_materialize_rule import (
+        AutoMaterializeAssetPartitionsFilter as AutoMaterializeAssetPartitionsFilter,
+        AutoMaterializeRule as AutoMaterializeRule,
+    )
+    from dagster._core.definitions.backfill_policy import BackfillPolicy as BackfillPolicy
+    from dagster._core.definitions.composition import PendingNodeInvocation as PendingNodeInvocation
+    from dagster._core.definitions.config import ConfigMapping as ConfigMapping
+    from dagster._core.definitions.configurable import configured as configured
+    from dagster._core.definitions.data_version import (
+        DataProvenance as DataProvenance,
+        DataVersion as DataVersion,
+        DataVersionsByPartition as DataVersionsByPartition,
+    )
+    from dagster._core.definitions.decorators.asset_check_decorator import (
+        asset_check as asset_check,
+    )
+    from dagster._core.definitions.decorators.asset_decorator import (
+        asset as asset,
+        graph_asset as graph_asset,
+        graph_multi_asset as graph_multi_asset,
+        multi_asset as multi_asset,
+    )
+    from dagster._core.definitions.decorators.config_mapping_decorator import (
+        config_mapping as config_mapping,
+    )
+    from dagster._core.definitions.decorators.graph_decorator import graph as graph
+    from dagster._core.definitions.decorators.hook_decorator import (
+        failure_hook as failure_hook,
+        success_hook as success_hook,
+    )
+    from dagster._core.definitions.decorators.job_decorator import job as job
+    from dagster._core.definitions.decorators.op_decorator import op as op
+    from dagster._core.definitions.decorators.repository_decorator import repository as repository
+    from dagster._core.definitions.decorators.schedule_decorator import schedule as schedule
+    from dagster._core.definitions.decorators.sensor_decorator import (
+        asset_sensor as asset_sensor,
+        multi_asset_sensor as multi_asset_sensor,
+        sensor as sensor,
+    )
+    from dagster._core.definitions.decorators.source_asset_decorator import (
+        observable_source_asset as observable_source_asset,
+    )
+    from dagster._core.definitions.definitions_class import (
+        BindResourcesToJobs as BindResourcesToJobs,
+        Definitions as Definitions,
+        create_repository_using_definitions_args as create_repository_using_definitions_args,
+    )
+    from dagster._core.definitions.dependency import (
+        DependencyDefinition as DependencyDefinition,
+        MultiDependencyDefinition as MultiDependencyDefinition,
+        NodeInvocation as NodeInvocation,
+    )
+    from dagster._core.definitions.events import (
+        AssetKey as AssetKey,
+        AssetMaterialization as AssetMaterialization,
+        AssetObservation as AssetObservation,
+        DynamicOutput as DynamicOutput,
+        ExpectationResult as ExpectationResult,
+        Failure as Failure,
+        Output as Output,
+        RetryRequested as RetryRequested,
+        TypeCheck as TypeCheck,
+    )
+    from dagster._core.definitions.executor_definition import (
+        ExecutorDefinition as ExecutorDefinition,
+        ExecutorRequirement as ExecutorRequirement,
+        executor as executor,
+        in_process_executor as in_process_executor,
+        multi_or_in_process_executor as multi_or_in_process_executor,
+        multiple_process_executor_requirements as multiple_process_executor_requirements,
+        multiprocess_executor as multiprocess_executor,
+    )
+    from dagster._core.definitions.external_asset import (
+        external_asset_from_spec as external_asset_from_spec,
+        external_assets_from_specs as external_assets_from_specs,
+    )
+    from dagster._core.definitions.freshness_policy import FreshnessPolicy as FreshnessPolicy
+    from dagster._core.definitions.freshness_policy_sensor_definition import (
+        FreshnessPolicySensorContext as FreshnessPolicySensorContext,
+        FreshnessPolicySensorDefinition as FreshnessPolicySensorDefinition,
+        build_freshness_policy_sensor_context as build_freshness_policy_sensor_context,
+        freshness_policy_sensor as freshness_policy_sensor,
+    )
+    from dagster._core.definitions.graph_definition import GraphDefinition as GraphDefinition
+    from dagster._core.definitions.hook_definition import HookDefinition as HookDefinition
+    from dagster._core.definitions.input import (
+        GraphIn as GraphIn,
+        In as In,
+        InputMapping as InputMapping,
+    )
+    from dagster._core.definitions.job_definition import JobDefinition as JobDefinition
+    from dagster._core.definitions.load_asset_checks_from_modules import (
+        load_asset_checks_from_current_module as load_asset_checks_from_current_module,
+        load_asset_checks_from_modules as load_asset_checks_from_modules,
+        load_asset_checks_from_package_module as load_asset_checks_from_package_module,
+        load_asset_checks_from_package_name as load_asset_checks_from_package_name,
+    )
+    from dagster._core.definitions.load_assets_from_modules import (
+        load_assets_from_current_module as load_assets_from_current_module,
+        load_assets_from_modules as load_assets_from_modules,
+        load_assets_from_package_module as load_assets_from_package_module,
+        load_assets_from_package_name as load_assets_from_package_name,
+    )
+    from dagster._core.definitions.logger_definition import (
+        LoggerDefinition as LoggerDefinition,
+        build_init_logger_context as build_init_logger_context,
+        logger as logger,
+    )
+    from dagster._core.definitions.materialize import (
+        materialize as materialize,
+        materialize_to_memory as materialize_to_memory,
+    )
+    from dagster._core.definitions.metadata import (
+        BoolMetadataValue as BoolMetadataValue,
+        DagsterAssetMetadataValue as DagsterAssetMetadataValue,
+        DagsterJobMetadataValue as DagsterJobMetadataValue,
+        DagsterRunMetadataValue as DagsterRunMetadataValue,
+        FloatMetadataValue as FloatMetadataValue,
+        IntMetadataValue as IntMetadataValue,
+        JsonMetadataValue as JsonMetadataValue,
+        MarkdownMetadataValue as MarkdownMetadataValue,
+        MetadataEntry as MetadataEntry,
+        MetadataValue as MetadataValue,
+        NotebookMetadataValue as NotebookMetadataValue,
+        NullMetadataValue as NullMetadataValue,
+        PathMetadataValue as PathMetadataValue,
+        PythonArtifactMetadataValue as PythonArtifactMetadataValue,
+        TableMetadataValue as TableMetadataValue,
+        TableSchemaMetadataValue as TableSchemaMetadataValue,
+        TextMetadataValue as TextMetadataValue,
+        UrlMetadataValue as UrlMetadataValue,
+    )
+    from dagster._core.definitions.metadata.table import (
+        TableColumn as TableColumn,
+        TableColumnConstraints as TableColumnConstraints,
+        TableConstraints as TableConstraints,
+        TableRecord as TableRecord,
+        TableSchema as TableSchema,
+    )
+    from dagster._core.definitions.multi_asset_sensor_definition import (
+        MultiAssetSensorDefinition as MultiAssetSensorDefinition,
+        MultiAssetSensorEvaluationContext as MultiAssetSensorEvaluationContext,
+        build_multi_asset_sensor_context as build_multi_asset_sensor_context,
+    )
+    from dagster._core.definitions.multi_dimensional_partitions import (
+        MultiPartitionKey as MultiPartitionKey,
+        MultiPartitionsDefinition as MultiPartitionsDefinition,
+    )
+    from dagster._core.definitions.op_definition import OpDefinition as OpDefinition
+    from dagster._core.definitions.output import (
+        DynamicOut as DynamicOut,
+        GraphOut as GraphOut,
+        Out as Out,
+        OutputMapping as OutputMapping,
+    )
+    from dagster._core.definitions.partition import (
+        DynamicPartitionsDefinition as DynamicPartitionsDefinition,
+        Partition as Partition,
+        PartitionedConfig as PartitionedConfig,
+        PartitionsDefinition as PartitionsDefinition,
+        StaticPartitionsDefinition as StaticPartitionsDefinition,
+        dynamic_partitioned_config as dynamic_partitioned_config,
+        partitioned_config as partitioned_config,
+        static_partitioned_config as static_partitioned_config,
+    )
+    from dagster._core.definitions.partition_key_range import PartitionKeyRange as PartitionKeyRange
+    from dagster._core.definitions.partition_mapping import (
+        AllPartitionMapping as AllPartitionMapping,
+        DimensionPartitionMapping as DimensionPartitionMapping,
+        IdentityPartitionMapping as IdentityPartitionMapping,
+        LastPartitionMapping as LastPartitionMapping,
+        MultiPartitionMapping as MultiPartitionMapping,
+        MultiToSingleDimensionPartitionMapping as MultiToSingleDimensionPartitionMapping,
+        PartitionMapping as PartitionMapping,
+        SpecificPartitionsPartitionMapping as SpecificPartitionsPartitionMapping,
+        StaticPartitionMapping as StaticPartitionMapping,
+    )
+    from dagster._core.definitions.partitioned_schedule import (
+        build_schedule_from_partitioned_job as build_schedule_from_partitioned_job,
+    )
+    from dagster._core.definitions.policy import (
+        Backoff as Backoff,
+        Jitter as Jitter,
+        RetryPolicy as RetryPolicy,
+    )
+    from dagster._core.definitions.reconstruct import (
+        build_reconstructable_job as build_reconstructable_job,
+        reconstructable as reconstructable,
+    )
+    from dagster._core.definitions.repository_definition import (
+        RepositoryData as RepositoryData,
+        RepositoryDefinition as RepositoryDefinition,
+    )
+    from dagster._core.definitions.resource_annotation import (
+        ResourceParam as ResourceParam,
+    )
+    from dagster._core.definitions.resource_definition import (
+        ResourceDefinition as ResourceDefinition,
+        make_values_resource as make_values_resource,
+        resource as resource,
+    )
+    from dagster._core.definitions.result import MaterializeResult as MaterializeResult
+    from dagster._core.definitions.run_config import RunConfig as RunConfig
+    from dagster._core.definitions.run_request import (
+        AddDynamicPartitionsRequest as AddDynamicPartitionsRequest,
+        DeleteDynamicPartitionsRequest as DeleteDynamicPartitionsRequest,
+        RunRequest as RunRequest,
+        SensorResult as SensorResult,
+        SkipReason as SkipReason,
+    )
+    from dagster._core.definitions.run_status_sensor_definition import (
+        RunFailureSensorContext as RunFailureSensorContext,
+        RunStatusSensorContext as RunStatusSensorContext,
+        RunStatusSensorDefinition as RunStatusSensorDefinition,
+        build_run_status_sensor_context as build_run_status_sensor_context,
+        run_failure_sensor as run_failure_sensor,
+        run_status_sensor as run_status_sensor,
+    )
+    from dagster._core.definitions.schedule_definition import (
+        DefaultScheduleStatus as DefaultScheduleStatus,
+        ScheduleDefinition as ScheduleDefinition,
+        ScheduleEvaluationContext as ScheduleEvaluationContext,
+        build_schedule_context as build_schedule_context,
+    )
+    from dagster._core.definitions.selector import (
+        CodeLocationSelector as CodeLocationSelector,
+        JobSelector as JobSelector,
+        RepositorySelector as RepositorySelector,
+    )
+    from dagster._core.definitions.sensor_definition import (
+        DefaultSensorStatus as DefaultSensorStatus,
+        SensorDefinition as SensorDefinition,
+        SensorEvaluationContext as SensorEvaluationContext,
+        build_sensor_context as build_sensor_context,
+    )
+    from dagster._core.definitions.source_asset import SourceAsset as SourceAsset
+    from dagster._core.definitions.step_launcher import (
+        StepLauncher as StepLauncher,
+        StepRunRef as StepRunRef,
+    )
+    from dagster._core.definitions.time_window_partition_mapping import (
+        TimeWindowPartitionMapping as TimeWindowPartitionMapping,
+    )
+    from dagster._core.definitions.time_window_partitions import (
+        DailyPartitionsDefinition as DailyPartitionsDefinition,
+        HourlyPartitionsDefinition as HourlyPartitionsDefinition,
+        MonthlyPartitionsDefinition as MonthlyPartitionsDefinition,
+        TimeWindow as TimeWindow,
+        TimeWindowPartitionsDefinition as TimeWindowPartitionsDefinition,
+        WeeklyPartitionsDefinition as WeeklyPartitionsDefinition,
+        daily_partitioned_config as daily_partitioned_config,
+        hourly_partitioned_config as hourly_partitioned_config,
+        monthly_partitioned_config as monthly_partitioned_config,
+        weekly_partitioned_config as weekly_partitioned_config,
+    )
+    from dagster._core.definitions.unresolved_asset_job_definition import (
+        define_asset_job as define_asset_job,
+    )
+    from dagster._core.definitions.utils import (
+        config_from_files as config_from_files,
+        config_from_pkg_resources as config_from_pkg_resources,
+        config_from_yaml_strings as config_from_yaml_strings,
+    )
+    from dagster._core.definitions.version_strategy import (
+        OpVersionContext as OpVersionContext,
+        ResourceVersionContext as ResourceVersionContext,
+        SourceHashVersionStrategy as SourceHashVersionStrategy,
+        VersionStrategy as VersionStrategy,
+    )
+    from dagster._core.errors import (
+        DagsterConfigMappingFunctionError as DagsterConfigMappingFunctionError,
+        DagsterError as DagsterError,
+        DagsterEventLogInvalidForRun as DagsterEventLogInvalidForRun,
+        DagsterExecutionInterruptedError as DagsterExecutionInterruptedError,
+        DagsterExecutionStepExecutionError as DagsterExecutionStepExecutionError,
+        DagsterExecutionStepNotFoundError as DagsterExecutionStepNotFoundError,
+        DagsterInvalidConfigDefinitionError as DagsterInvalidConfigDefinitionError,
+        DagsterInvalidConfigError as DagsterInvalidConfigError,
+        DagsterInvalidDefinitionError as DagsterInvalidDefinitionError,
+        DagsterInvalidInvocationError as DagsterInvalidInvocationError,
+        DagsterInvalidSubsetError as DagsterInvalidSubsetError,
+        DagsterInvariantViolationError as DagsterInvariantViolationError,
+        DagsterResourceFunctionError as DagsterResourceFunctionError,
+        DagsterRunNotFoundError as DagsterRunNotFoundError,
+        DagsterStepOutputNotFoundError as DagsterStepOutputNotFoundError,
+        DagsterSubprocessError as DagsterSubprocessError,
+        DagsterTypeCheckDidNotPass as DagsterTypeCheckDidNotPass,
+        DagsterTypeCheckError as DagsterTypeCheckError,
+        DagsterUnknownPartitionError as DagsterUnknownPartitionError,
+        DagsterUnknownResourceError as DagsterUnknownResourceError,
+        DagsterUnmetExecutorRequirementsError as DagsterUnmetExecutorRequirementsError,
+        DagsterUserCodeExecutionError as DagsterUserCodeExecutionError,
+        raise_execution_interrupts as raise_execution_interrupts,
+    )
+    from dagster._core.event_api import (
+        AssetRecordsFilter as AssetRecordsFilter,
+        EventLogRecord as EventLogRecord,
+        EventRecordsFilter as EventRecordsFilter,
+        EventRecordsResult as EventRecordsResult,
+        RunShardedEventsCursor as RunShardedEventsCursor,
+        RunStatusChangeRecordsFilter as RunStatusChangeRecordsFilter,
+    )
+    from dagster._core.events import (
+        DagsterEvent as DagsterEvent,
+        DagsterEventType as DagsterEventType,
+    )
+    from dagster._core.events.log import EventLogEntry as EventLogEntry
+    from dagster._core.execution.api import (
+        ReexecutionOptions as ReexecutionOptions,
+        execute_job as execute_job,
+    )
+    from dagster._core.execution.build_resources import build_resources as build_resources
+    from dagster._core.execution.context.compute import (
+        AssetExecutionContext as AssetExecutionContext,
+        OpExecutionContext as OpExecutionContext,
+    )
+    from dagster._core.execution.context.hook import (
+        HookContext as HookContext,
+        build_hook_context as build_hook_context,
+    )
+    from dagster._core.execution.context.init import (
+        InitResourceContext as InitResourceContext,
+        build_init_resource_context as build_init_resource_context,
+    )
+    from dagster._core.execution.context.input import (
+        InputContext as InputContext,
+        build_input_context as build_input_context,
+    )
+    from dagster._core.execution.context.invocation import (
+        build_asset_context as build_asset_context,
+        build_op_context as build_op_context,
+    )
+    from dagster._core.execution.context.logger import InitLoggerContext as InitLoggerContext
+    from dagster._core.execution.context.output import (
+        OutputContext as OutputContext,
+        build_output_context as build_output_context,
+    )
+    from dagster._core.execution.context.system import (
+        DagsterTypeLoaderContext as DagsterTypeLoaderContext,
+        StepExecutionContext as StepExecutionContext,
+        TypeCheckContext as TypeCheckContext,
+    )
+    from dagster._core.execution.execute_in_process_result import (
+        ExecuteInProcessResult as ExecuteInProcessResult,
+    )
+    from dagster._core.execution.job_execution_result import (
+        JobExecutionResult as JobExecutionResult,
+    )
+    from dagster._core.execution.plan.external_step import (
+        external_instance_from_step_run_ref as external_instance_from_step_run_ref,
+        run_step_from_ref as run_step_from_ref,
+        step_context_to_step_run_ref as step_context_to_step_run_ref,
+        step_run_ref_to_step_context as step_run_ref_to_step_context,
+    )
+    from dagster._core.execution.validate_run_config import (
+        validate_run_config as validate_run_config,
+    )
+    from dagster._core.execution.with_resources import with_resources as with_resources
+    from dagster._core.executor.base import Executor as Executor
+    from dagster._core.executor.init import InitExecutorContext as InitExecutorContext
+    from dagster._core.instance import DagsterInstance as DagsterInstance
+    from dagster._core.instance_for_test import instance_for_test as instance_for_test
+    from dagster._core.launcher.default_run_launcher import DefaultRunLauncher as DefaultRunLauncher
+    from dagster._core.log_manager import DagsterLogManager as DagsterLogManager
+    from dagster._core.pipes.client import (
+        PipesClient as PipesClient,
+        PipesContextInjector as PipesContextInjector,
+        PipesMessageReader as PipesMessageReader,
+    )
+    from dagster._core.pipes.context import (
+        PipesMessageHandler as PipesMessageHandler,
+        PipesSession as PipesSession,
+    )
+    from dagster._core.pipes.subprocess import PipesSubprocessClient as PipesSubprocessClient
+    from dagster._core.pipes.utils import (
+        PipesBlobStoreMessageReader as PipesBlobStoreMessageReader,
+        PipesEnvContextInjector as PipesEnvContextInjector,
+        PipesFileContextInjector as PipesFileContextInjector,
+        PipesFileMessageReader as PipesFileMessageReader,
+        PipesLogReader as PipesLogReader,
+        PipesTempFileContextInjector as PipesTempFileContextInjector,
+        PipesTempFileMessageReader as PipesTempFileMessageReader,
+        open_pipes_session as open_pipes_session,
+    )
+    from dagster._core.run_coordinator.queued_run_coordinator import (
+        QueuedRunCoordinator as QueuedRunCoordinator,
+        SubmitRunContext as SubmitRunContext,
+    )
+    from dagster._core.storage.asset_value_loader import AssetValueLoader as AssetValueLoader
+    from dagster._core.storage.dagster_run import (
+        DagsterRun as DagsterRun,
+        DagsterRunStatus as DagsterRunStatus,
+        RunRecord as RunRecord,
+        RunsFilter as RunsFilter,
+    )
+    from dagster._core.storage.file_manager import (
+        FileHandle as FileHandle,
+        LocalFileHandle as LocalFileHandle,
+        local_file_manager as local_file_manager,
+    )
+    from dagster._core.storage.fs_io_manager import (
+        ColumnarFilesystemIOManager as ColumnarFilesystemIOManager,
+        FilesystemIOManager as FilesystemIOManager,
+        custom_path_fs_io_manager as custom_path_fs_io_manager,
+        fs_io_manager as fs_io_manager,
+    )
+    from dagster._core.storage.input_manager import (
+        InputManager as InputManager,
+        InputManagerDefinition as InputManagerDefinition,
+        input_manager as input_manager,
+    )
+    from dagster._core.storage.io_manager import (
+        IOManager as IOManager,
+        IOManagerDefinition as IOManagerDefinition,
+        io_manager as io_manager,
+    )
+    from dagster._core.storage.mem_io_manager import (
+        InMemoryIOManager as InMemoryIOManager,
+        mem_io_manager as mem_io_manager,
+    )
+    from dagster._core.storage.memoizable_io_manager import (
+        MemoizableIOManager as MemoizableIOManager,
+    )
+    from dagster._core.storage.partition_status_cache import (
+        AssetPartitionStatus as AssetPartitionStatus,
+    )
+    from dagster._core.storage.tags import (
+        MAX_RUNTIME_SECONDS_TAG as MAX_RUNTIME_SECONDS_TAG,
+        MEMOIZED_RUN_TAG as MEMOIZED_RUN_TAG,
+    )
+    from dagster._core.storage.upath_io_manager import UPathIOManager as UPathIOManager
+    from dagster._core.types.config_schema import (
+        DagsterTypeLoader as DagsterTypeLoader,
+        dagster_type_loader as dagster_type_loader,
+    )
+    from dagster._core.types.dagster_type import (
+        DagsterType as DagsterType,
+        List as List,
+        Optional as Optional,
+        PythonObjectDagsterType as PythonObjectDagsterType,
+        make_python_type_usable_as_dagster_type as make_python_type_usable_as_dagster_type,
+    )
+    from dagster._core.types.decorator import usable_as_dagster_type as usable_as_dagster_type
+    from dagster._core.types.python_dict import Dict as Dict
+    from dagster._core.types.python_set import Set as Set
+    from dagster._core.types.python_tuple import Tuple as Tuple
+    from dagster._loggers import (
+        colored_console_logger as colored_console_logger,
+        default_loggers as default_loggers,
+        default_system_loggers as default_system_loggers,
+        json_console_logger as json_console_logger,
+    )
+    from dagster._serdes.serdes import (
+        deserialize_value as deserialize_value,
+        serialize_value as serialize_value,
+    )
+    from dagster._utils import (
+        file_relative_path as file_relative_path,
+    )
+    from dagster._utils.alert import (
+        make_email_on_run_failure_sensor as make_email_on_run_failure_sensor,
+    )
+    from dagster._utils.dagster_type import check_dagster_type as check_dagster_type
+    from dagster._utils.log import get_dagster_logger as get_dagster_logger
+    from dagster._utils.warnings import (
+        ConfigArgumentWarning as ConfigArgumentWarning,
+        ExperimentalWarning as ExperimentalWarning,
+    )
+
+
+_PUBLIC_API: Final[Mapping[str, Sequence[str]]] = {
+    "dagster._builtins": [
+        "Any",
+        "Bool",
+        "Float",
+        "Int",
+        "Nothing",
+        "String",
+    ],
+    "dagster._config.config_schema": [
+        "ConfigSchema",
+    ],
+    "dagster._config.config_type": [
+        "Array",
+        "Enum",
+        "EnumValue",
+        "Noneable",
+        "ScalarUnion",
+    ],
+    "dagster._config.field": [
+        "Field",
+    ],
+    "dagster._config.field_utils": [
+        "EnvVar",
+        "Map",
+        "Permissive",
+        "Selector",
+        "Shape",
+    ],
+    "dagster._config.pythonic_config": [
+        "Config",
+        "ConfigurableIOManager",
+        "ConfigurableIOManagerFactory",
+        "ConfigurableLegacyIOManagerAdapter",
+        "ConfigurableResource",
+        "IAttachDifferentObjectToOpContext",
+        "PermissiveConfig",
+        "ResourceDependency",
+    ],
+    "dagster._config.source": [
+        "BoolSource",
+        "IntSource",
+        "StringSource",
+    ],
+    "dagster._core.definitions": [
+        "AssetCheckResult",
+    ],
+    "dagster._core.definitions.asset_check_spec": [
+        "AssetCheckKey",
+        "AssetCheckSeverity",
+        "AssetCheckSpec",
+    ],
+    "dagster._core.definitions.asset_checks": [
+        "AssetChecksDefinition",
+    ],
+    "dagster._core.definitions.asset_dep": [
+        "AssetDep",
+    ],
+    "dagster._core.definitions.asset_in": [
+        "AssetIn",
+    ],
+    "dagster._core.definitions.asset_out": [
+        "AssetOut",
+    ],
+    "dagster._core.definitions.asset_selection": [
+        "AssetSelection",
+    ],
+    "dagster._core.definitions.asset_sensor_definition": [
+        "AssetSensorDefinition",
+    ],
+    "dagster._core.definitions.asset_spec": [
+        "AssetSpec",
+    ],
+    "dagster._core.definitions.assets": [
+        "AssetsDefinition",
+    ],
+    "dagster._core.definitions.auto_materialize_policy": [
+        "AutoMaterializePolicy",
+    ],
+    "dagster._core.definitions.auto_materialize_rule": [
+        "AutoMaterializeAssetPartitionsFilter",
+        "AutoMaterializeRule",
+    ],
+    "dagster._core.definitions.backfill_policy": [
+        "BackfillPolicy",
+    ],
+    "dagster._core.definitions.composition": [
+        "PendingNodeInvocation",
+    ],
+    "dagster._core.definitions.config": [
+        "ConfigMapping",
+    ],
+    "dagster._core.definitions.configurable": [
+        "configured",
+    ],
+    "dagster._core.definitions.data_version": [
+        "DataProvenance",
+        "DataVersion",
+        "DataVersionsByPartition",
+    ],
+    "dagster._core.definitions.decorators.asset_check_decorator": [
+        "asset_check",
+    ],
+    "dagster._core.definitions.decorators.asset_decorator": [
+        "asset",
+        "graph_asset",
+        "graph_multi_asset",
+        "multi_asset",
+    ],
+    "dagster._core.definitions.decorators.config_mapping_decorator": [
+        "config_mapping",
+    ],
+    "dagster._core.definitions.decorators.graph_decorator": [
+        "graph",
+    ],
+    "dagster._core.definitions.decorators.hook_decorator": [
+        "failure_hook",
+        "success_hook",
+    ],
+    "dagster._core.definitions.decorators.job_decorator": [
+        "job",
+    ],
+    "dagster._core.definitions.decorators.op_decorator": [
+        "op",
+    ],
+    "dagster._core.definitions.decorators.repository_decorator": [
+        "repository",
+    ],
+    "dagster._core.definitions.decorators.schedule_decorator": [
+        "schedule",
+    ],
+    "dagster._core.definitions.decorators.sensor_decorator": [
+        "asset_sensor",
+        "multi_asset_sensor",
+        "sensor",
+    ],
+    "dagster._core.definitions.decorators.source_asset_decorator": [
+        "observable_source_asset",
+    ],
+    "dagster._core.definitions.definitions_class": [
+        "BindResourcesToJobs",
+        "Definitions",
+        "create_repository_using_definitions_args",
+    ],
+    "dagster._core.definitions.dependency": [
+        "DependencyDefinition",
+        "MultiDependencyDefinition",
+        "NodeInvocation",
+    ],
+    "dagster._core.definitions.events": [
+        "AssetKey",
+        "AssetMaterialization",
+        "AssetObservation",
+        "DynamicOutput",
+        "ExpectationResult",
+        "Failure",
+        "Output",
+        "RetryRequested",
+        "TypeCheck",
+    ],
+    "dagster._core.definitions.executor_definition": [
+        "ExecutorDefinition",
+        "ExecutorRequirement",
+        "executor",
+        "in_process_executor",
+        "multi_or_in_process_executor",
+        "multiple_process_executor_requirements",
+        "multiprocess_executor",
+    ],
+    "dagster._core.definitions.external_asset": [
+        "external_asset_from_spec",
+        "external_assets_from_specs",
+    ],
+    "dagster._core.definitions.freshness_policy": [
+        "FreshnessPolicy",
+    ],
+    "dagster._core.definitions.freshness_policy_sensor_definition": [
+        "FreshnessPolicySensorContext",
+        "FreshnessPolicySensorDefinition",
+        "build_freshness_policy_sensor_context",
+        "freshness_policy_sensor",
+    ],
+    "dagster._core.definitions.graph_definition": [
+        "GraphDefinition",
+    ],
+    "dagster._core.definitions.hook_definition": [
+        "HookDefinition",
+    ],
+    "dagster._core.definitions.input": [
+        "GraphIn",
+        "In",
+        "InputMapping",
+    ],
+    "dagster._core.definitions.job_definition": [
+        "JobDefinition",
+    ],
+    "dagster._core.definitions.load_asset_checks_from_modules": [
+        "load_asset_checks_from_current_module",
+        "load_asset_checks_from_modules",
+        "load_asset_checks_from_package_module",
+        "load_asset_checks_from_package_name",
+    ],
+    "dagster._core.definitions.load_assets_from_modules": [
+        "load_assets_from_current_module",
+        "load_assets_from_modules",
+        "load_assets_from_package_module",
+        "load_assets_from_package_name",
+    ],
+    "dagster._core.definitions.logger_definition": [
+        "LoggerDefinition",
+        "build_init_logger_context",
+        "logger",
+    ],
+    "dagster._core.definitions.materialize": [
+        "materialize",
+        "materialize_to_memory",
+    ],
+    "dagster._core.definitions.metadata": [
+        "BoolMetadataValue",
+        "DagsterAssetMetadataValue",
+        "DagsterJobMetadataValue",
+        "DagsterRunMetadataValue",
+        "FloatMetadataValue",
+        "IntMetadataValue",
+        "JsonMetadataValue",
+        "MarkdownMetadataValue",
+        "MetadataEntry",
+        "MetadataValue",
+        "NotebookMetadataValue",
+        "NullMetadataValue",
+        "PathMetadataValue",
+        "PythonArtifactMetadataValue",
+        "TableMetadataValue",
+        "TableSchemaMetadataValue",
+        "TextMetadataValue",
+        "UrlMetadataValue",
+    ],
+    "dagster._core.definitions.metadata.table": [
+        "TableColumn",
+        "TableColumnConstraints",
+        "TableConstraints",
+        "TableRecord",
+        "TableSchema",
+    ],
+    "dagster._core.definitions.multi_asset_sensor_definition": [
+        "MultiAssetSensorDefinition",
+        "MultiAssetSensorEvaluationContext",
+        "build_multi_asset_sensor_context",
+    ],
+    "dagster._core.definitions.multi_dimensional_partitions": [
+        "MultiPartitionKey",
+        "MultiPartitionsDefinition",
+    ],
+    "dagster._core.definitions.op_definition": [
+        "OpDefinition",
+    ],
+    "dagster._core.definitions.output": [
+        "DynamicOut",
+        "GraphOut",
+        "Out",
+        "OutputMapping",
+    ],
+    "dagster._core.definitions.partition": [
+        "DynamicPartitionsDefinition",
+        "Partition",
+        "PartitionedConfig",
+        "PartitionsDefinition",
+        "StaticPartitionsDefinition",
+        "dynamic_partitioned_config",
+        "partitioned_config",
+        "static_partitioned_config",
+    ],
+    "dagster._core.definitions.partition_key_range": [
+        "PartitionKeyRange",
+    ],
+    "dagster._core.definitions.partition_mapping": [
+        "AllPartitionMapping",
+        "DimensionPartitionMapping",
+        "IdentityPartitionMapping",
+        "LastPartitionMapping",
+        "MultiPartitionMapping",
+        "MultiToSingleDimensionPartitionMapping",
+        "PartitionMapping",
+        "SpecificPartitionsPartitionMapping",
+        "StaticPartitionMapping",
+    ],
+    "dagster._core.definitions.partitioned_schedule": [
+        "build_schedule_from_partitioned_job",
+    ],
+    "dagster._core.definitions.policy": [
+        "Backoff",
+        "Jitter",
+        "RetryPolicy",
+    ],
+    "dagster._core.definitions.reconstruct": [
+        "build_reconstructable_job",
+        "reconstructable",
+    ],
+    "dagster._core.definitions.repository_definition": [
+        "RepositoryData",
+        "RepositoryDefinition",
+    ],
+    "dagster._core.definitions.resource_annotation": [
+        "ResourceParam",
+    ],
+    "dagster._core.definitions.resource_definition": [
+        "ResourceDefinition",
+        "make_values_resource",
+        "resource",
+    ],
+    "dagster._core.definitions.result": [
+        "MaterializeResult",
+    ],
+    "dagster._core.definitions.run_config": [
+        "RunConfig",
+    ],
+    "dagster._core.definitions.run_request": [
+        "AddDynamicPartitionsRequest",
+        "DeleteDynamicPartitionsRequest",
+        "RunRequest",
+        "SensorResult",
+        "SkipReason",
+    ],
+    "dagster._core.definitions.run_status_sensor_definition": [
+        "RunFailureSensorContext",
+        "RunStatusSensorContext",
+        "RunStatusSensorDefinition",
+        "build_run_status_sensor_context",
+        "run_failure_sensor",
+        "run_status_sensor",
+    ],
+    "dagster._core.definitions.schedule_definition": [
+        "DefaultScheduleStatus",
+        "ScheduleDefinition",
+        "ScheduleEvaluationContext",
+        "build_schedule_context",
+    ],
+    "dagster._core.definitions.selector": [
+        "CodeLocationSelector",
+        "JobSelector",
+        "RepositorySelector",
+    ],
+    "dagster._core.definitions.sensor_definition": [
+        "DefaultSensorStatus",
+        "SensorDefinition",
+        "SensorEvaluationContext",
+        "build_sensor_context",
+    ],
+    "dagster._core.definitions.source_asset": [
+        "SourceAsset",
+    ],
+    "dagster._core.definitions.step_launcher": [
+        "StepLauncher",
+        "StepRunRef",
+    ],
+    "dagster._core.definitions.time_window_partition_mapping": [
+        "TimeWindowPartitionMapping",
+    ],
+    "dagster._core.definitions.time_window_partitions": [
+        "DailyPartitionsDefinition",
+        "HourlyPartitionsDefinition",
+        "MonthlyPartitionsDefinition",
+        "TimeWindow",
+        "TimeWindowPartitionsDefinition",
+        "WeeklyPartitionsDefinition",
+        "daily_partitioned_config",
+        "hourly_partitioned_config",
+        "monthly_partitioned_config",
+        "weekly_partitioned_config",
+    ],
+    "dagster._core.definitions.unresolved_asset_job_definition": [
+        "define_asset_job",
+    ],
+    "dagster._core.definitions.utils": [
+        "config_from_files",
+        "config_from_pkg_resources",
+        "config_from_yaml_strings",
+    ],
+    "dagster._core.definitions.version_strategy": [
+        "OpVersionContext",
+        "ResourceVersionContext",
+        "SourceHashVersionStrategy",
+        "VersionStrategy",
+    ],
+    "dagster._core.errors": [
+        "DagsterConfigMappingFunctionError",
+        "DagsterError",
+        "DagsterEventLogInvalidForRun",
+        "DagsterExecutionInterruptedError",
+        "DagsterExecutionStepExecutionError",
+        "DagsterExecutionStepNotFoundError",
+        "DagsterInvalidConfigDefinitionError",
+        "DagsterInvalidConfigError",
+        "DagsterInvalidDefinitionError",
+        "DagsterInvalidInvocationError",
+        "DagsterInvalidSubsetError",
+        "DagsterInvariantViolationError",
+        "DagsterResourceFunctionError",
+        "DagsterRunNotFoundError",
+        "DagsterStepOutputNotFoundError",
+        "DagsterSubprocessError",
+        "DagsterTypeCheckDidNotPass",
+        "DagsterTypeCheckError",
+        "DagsterUnknownPartitionError",
+        "DagsterUnknownResourceError",
+        "DagsterUnmetExecutorRequirementsError",
+        "DagsterUserCodeExecutionError",
+        "raise_execution_interrupts",
+    ],
+    "dagster._core.event_api": [
+        "AssetRecordsFilter",
+        "EventLogRecord",
+        "EventRecordsFilter",
+        "EventRecordsResult",
+        "RunShardedEventsCursor",
+        "RunStatusChangeRecordsFilter",
+    ],
+    "dagster._core.events": [
+        "DagsterEvent",
+        "DagsterEventType",
+    ],
+    "dagster._core.events.log": [
+        "EventLogEntry",
+    ],
+    "dagster._core.execution.api": [
+        "ReexecutionOptions",
+        "execute_job",
+    ],
+    "dagster._core.execution.build_resources": [
+        "build_resources",
+    ],
+    "dagster._core.execution.context.compute": [
+        "AssetExecutionContext",
+        "OpExecutionContext",
+    ],
+    "dagster._core.execution.context.hook": [
+        "HookContext",
+        "build_hook_context",
+    ],
+    "dagster._core.execution.context.init": [
+        "InitResourceContext",
+        "build_init_resource_context",
+    ],
+    "dagster._core.execution.context.input": [
+        "InputContext",
+        "build_input_context",
+    ],
+    "dagster._core.execution.context.invocation": [
+        "build_asset_context",
+        "build_op_context",
+    ],
+    "dagster._core.execution.context.logger": [
+        "InitLoggerContext",
+    ],
+    "dagster._core.execution.context.output": [
+        "OutputContext",
+        "build_output_context",
+    ],
+    "dagster._core.execution.context.system": [
+        "DagsterTypeLoaderContext",
+        "StepExecutionContext",
+        "TypeCheckContext",
+    ],
+    "dagster._core.execution.execute_in_process_result": [
+        "ExecuteInProcessResult",
+    ],
+    "dagster._core.execution.job_execution_result": [
+        "JobExecutionResult",
+    ],
+    "dagster._core.execution.plan.external_step": [
+        "external_instance_from_step_run_ref",
+        "run_step_from_ref",
+        "step_context_to_step_run_ref",
+        "step_run_ref_to_step_context",
+    ],
+    "dagster._core.execution.validate_run_config": [
+        "validate_run_config",
+    ],
+    "dagster._core.execution.with_resources": [
+        "with_resources",
+    ],
+    "dagster._core.executor.base": [
+        "Executor",
+    ],
+    "dagster._core.executor.init": [
+        "InitExecutorContext",
+    ],
+    "dagster._core.instance": [
+        "DagsterInstance",
+    ],
+    "dagster._core.instance_for_test": [
+        "instance_for_test",
+    ],
+    "dagster._core.launcher.default_run_launcher": [
+        "DefaultRunLauncher",
+    ],
+    "dagster._core.log_manager": [
+        "DagsterLogManager",
+    ],
+    "dagster._core.pipes.client": [
+        "PipesClient",
+        "PipesContextInjector",
+        "PipesMessageReader",
+    ],
+    "dagster._core.pipes.context": [
+        "PipesMessageHandler",
+        "PipesSession",
+    ],
+    "dagster._core.pipes.subprocess": [
+        "PipesSubprocessClient",
+    ],
+    "dagster._core.pipes.utils": [
+        "PipesBlobStoreMessageReader",
+        "PipesEnvContextInjector",
+        "PipesFileContextInjector",
+        "PipesFileMessageReader",
+        "PipesLogReader",
+        "PipesTempFileContextInjector",
+        "PipesTempFileMessageReader",
+        "open_pipes_session",
+    ],
+    "dagster._core.run_coordinator.queued_run_coordinator": [
+        "QueuedRunCoordinator",
+        "SubmitRunContext",
+    ],
+    "dagster._core.storage.asset_value_loader": [
+        "AssetValueLoader",
+    ],
+    "dagster._core.storage.dagster_run": [
+        "DagsterRun",
+        "DagsterRunStatus",
+        "RunRecord",
+        "RunsFilter",
+    ],
+    "dagster._core.storage.file_manager": [
+        "FileHandle",
+        "LocalFileHandle",
+        "local_file_manager",
+    ],
+    "dagster._core.storage.fs_io_manager": [
+        "ColumnarFilesystemIOManager",
+        "FilesystemIOManager",
+        "custom_path_fs_io_manager",
+        "fs_io_manager",
+    ],
+    "dagster._core.storage.input_manager": [
+        "InputManager",
+        "InputManagerDefinition",
+        "input_manager",
+    ],
+    "dagster._core.storage.io_manager": [
+        "IOManager",
+        "IOManagerDefinition",
+        "io_manager",
+    ],
+    "dagster._core.storage.mem_io_manager": [
+        "InMemoryIOManager",
+        "mem_io_manager",
+    ],
+    "dagster._core.storage.memoizable_io_manager": [
+        "MemoizableIOManager",
+    ],
+    "dagster._core.storage.partition_status_cache": [
+        "AssetPartitionStatus",
+    ],
+    "dagster._core.storage.tags": [
+        "MAX_RUNTIME_SECONDS_TAG",
+        "MEMOIZED_RUN_TAG",
+    ],
+    "dagster._core.storage.upath_io_manager": [
+        "UPathIOManager",
+    ],
+    "dagster._core.types.config_schema": [
+        "DagsterTypeLoader",
+        "dagster_type_loader",
+    ],
+    "dagster._core.types.dagster_type": [
+        "DagsterType",
+        "List",
+        "Optional",
+        "PythonObjectDagsterType",
+        "make_python_type_usable_as_dagster_type",
+    ],
+    "dagster._core.types.decorator": [
+        "usable_as_dagster_type",
+    ],
+    "dagster._core.types.python_dict": [
+        "Dict",
+    ],
+    "dagster._core.types.python_set": [
+        "Set",
+    ],
+    "dagster._core.types.python_tuple": [
+        "Tuple",
+    ],
+    "dagster._loggers": [
+        "colored_console_logger",
+        "default_loggers",
+        "default_system_loggers",
+        "json_console_logger",
+    ],
+    "dagster._serdes.serdes": [
+        "deserialize_value",
+        "serialize_value",
+    ],
+    "dagster._utils": [
+        "file_relative_path",
+    ],
+    "dagster._utils.alert": [
+        "make_email_on_run_failure_sensor",
+    ],
+    "dagster._utils.dagster_type": [
+        "check_dagster_type",
+    ],
+    "dagster._utils.log": [
+        "get_dagster_logger",
+    ],
+    "dagster._utils.warnings": [
+        "ConfigArgumentWarning",
+        "ExperimentalWarning",
+    ],
+}
+
+_PUBLIC_API_MODULE_BY_NAME: Final[Mapping[str, str]] = {
+    name: module for module, names in _PUBLIC_API.items() for name in names
+}
+
+
+def _load_public_api() -> None:
+    """Imports the full public API, as if it were not loaded lazily."""
+    for name in _PUBLIC_API_MODULE_BY_NAME:
+        getattr(sys.modules[__name__], name)
+
+
+# ruff: isort: split
+
+# ########################
+# ##### DYNAMIC IMPORTS
+# ########################
 
 # NOTE: Unfortunately we have to declare deprecated aliases twice-- the
 # TYPE_CHECKING declaration satisfies linters and type checkers, but the entry
@@ -640,6 +1290,14 @@
 
 
 def __getattr__(name: str) -> TypingAny:
+    if name in _PUBLIC_API_MODULE_BY_NAME:
+        value = getattr(importlib.import_module(_PUBLIC_API_MODULE_BY_NAME[name]), name)
+        # cache the symbol in the module namespace, so that it is only resolved once
+        globals()[name] = value
+        return value
+
+    from dagster._utils.warnings import deprecation_warning
+
     if name in _DEPRECATED:
         module, breaking_version, additional_warn_text = _DEPRECATED[name]
         value = getattr(importlib.import_module(module), name)
@@ -661,4 +1319,16 @@ def __getattr__(name: str) -> TypingAny:
 
 
 def __dir__() -> Sequence[str]:
-    return [*globals(), *_DEPRECATED.keys(), *_DEPRECATED_RENAMED.keys()]
+    return [
+        *globals(),
+        *_PUBLIC_API_MODULE_BY_NAME.keys(),
+        *_DEPRECATED.keys(),
+        *_DEPRECATED_RENAMED.keys(),
+    ]
+
+
+# The modules of `dagster._core` import each other cyclically, and only resolve when
+# `dagster._core.definitions` is imported first, so it is imported eagerly. This keeps every module of
+# the package importable on its own, e.g. `from dagster._core.events import DagsterEventType`. It is
+# imported last, since some of those modules import from the (lazily resolved) public API.
+importlib.import_module("dagster._core.definitions")
@@ -56,6 +56,7 @@ def sync_get_external_sensor_execution_data_grpc(
     log_key: Optional[Sequence[str]],
     last_sensor_start_time: Optional[float] = None,
     timeout: Optional[int] = None,
+    evaluation_batch_id: Optional[str] = None,
 ) -> SensorExecutionData:
     check.inst_param(repository_handle, "repository_handle", RepositoryHandle)
     check.str_param(sensor_name, "sensor_name")
@@ -63,6 +64,7 @@ def sync_get_external_sensor_execution_data_grpc(
     check.opt_float_param(last_sensor_start_time, "last_sensor_start_time")
     check.opt_str_param(last_run_key, "last_run_key")
     check.opt_str_param(cursor, "cursor")
+    check.opt_str_param(evaluation_batch_id, "evaluation_batch_id")
 
     origin = repository_handle.get_external_origin()
 
@@ -78,6 +80,7 @@ def sync_get_external_sensor_execution_data_grpc(
                 log_key=log_key,
                 timeout=timeout,
                 last_sensor_start_time=last_sensor_start_time,
+                evaluation_batch_id=evaluation_batch_id,
             ),
         ),
         (SensorExecutionData, ExternalSensorExecutionErrorData),
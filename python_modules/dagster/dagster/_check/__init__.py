@@ -1,5 +1,8 @@
 import collections.abc
 import inspect
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
 from os import PathLike, fspath
 from typing import (
     AbstractSet,
@@ -28,11 +31,12 @@
 U = TypeVar("U")
 V = TypeVar("V")
 
-# This module contains runtime type-checking code used throughout Dagster. It is divided into three
+# This module contains runtime type-checking code used throughout Dagster. It is divided into four
 # sections:
 #
 # - TYPE CHECKS: functions that check the type of a single value
 # - OTHER CHECKS: functions that check conditions other than the type of a single value
+# - CHECK MODE: controls for reducing the cost of checks on trusted values
 # - ERRORS/UTILITY: error generation code and other utility functions invoked by the check functions
 #
 # TYPE CHECKS is divided into subsections for each type (e.g. bool, list). Each subsection contains
@@ -1523,6 +1527,9 @@ def _check_tuple_items(
     of_type: Optional[TypeOrTupleOfTypes] = None,
     of_shape: Optional[Tuple[TypeOrTupleOfTypes, ...]] = None,
 ) -> Tuple[T, ...]:
+    if _reduced_checks.get():
+        return obj_tuple
+
     if of_shape is not None:
         len_tuple = len(obj_tuple)
         len_type = len(of_shape)
@@ -1634,6 +1641,37 @@ def not_implemented(desc: str) -> NoReturn:
     raise NotImplementedCheckError(f"Not implemented: {desc}")
 
 
+# ###################################################################################################
+# ##### CHECK MODE
+# ###################################################################################################
+
+# When reduced checks are enabled, collection checks (e.g. `sequence_param(..., of_type=...)`,
+# `mapping_param(..., key_type=..., value_type=...)`) still check the type of the collection itself
+# but skip checking the type of each of its members, which dominates the cost of checks on large
+# values. This is intended for values that are already known to be well-formed, e.g. values that
+# are being deserialized after having been checked on construction before they were serialized.
+REDUCED_CHECKS_ENV_VAR = "DAGSTER_REDUCED_CHECKS"
+
+_reduced_checks: ContextVar[bool] = ContextVar(
+    "reduced_checks",
+    default=os.getenv(REDUCED_CHECKS_ENV_VAR, "").lower() in ("1", "true"),
+)
+
+
+def reduced_checks_enabled() -> bool:
+    return _reduced_checks.get()
+
+
+@contextmanager
+def reduced_checks(enabled: bool = True) -> Iterator[None]:
+    """Within this context, skip the checks on the members of checked collections."""
+    token = _reduced_checks.set(enabled)
+    try:
+        yield
+    finally:
+        _reduced_checks.reset(token)
+
+
 # ###################################################################################################
 # ##### ERRORS / UTILITY
 # ###################################################################################################
@@ -1757,6 +1795,9 @@ def _param_invariant_exception(param_name: str, desc: Optional[str] = None) -> P
 def _check_iterable_items(
     obj_iter: T_Iterable, of_type: TypeOrTupleOfTypes, collection_name: str = "iterable"
 ) -> T_Iterable:
+    if _reduced_checks.get():
+        return obj_iter
+
     for obj in obj_iter:
         if not isinstance(obj, of_type):
             if isinstance(obj, type):
@@ -1786,6 +1827,9 @@ def _check_mapping_entries(
     mapping_type: Type = collections.abc.Mapping,
 ) -> W:
     """Enforces that the keys/values conform to the types specified by key_type, value_type."""
+    if _reduced_checks.get():
+        return obj
+
     for key, value in obj.items():
         if key_type and not key_check(key, key_type):
             raise CheckError(
@@ -1808,6 +1852,9 @@ def _check_two_dim_mapping_entries(
     value_type: Optional[TypeOrTupleOfTypes] = None,
     mapping_type: Type = collections.abc.Mapping,
 ) -> W:
+    if _reduced_checks.get():
+        return obj
+
     _check_mapping_entries(
         obj, key_type, mapping_type, mapping_type=mapping_type
     )  # check level one
@@ -20,6 +20,7 @@
 from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
 from dagster._core.execution.api import create_execution_plan, execute_plan_iterator
 from dagster._core.execution.context_creation_job import create_context_free_log_manager
+from dagster._core.execution.plan.plan import ExecutionPlan
 from dagster._core.execution.run_cancellation_thread import start_run_cancellation_thread
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.origin import (
@@ -409,13 +410,23 @@ def _execute_step_command_body(
             )
         )
 
-        execution_plan = create_execution_plan(
-            recon_job,
-            run_config=dagster_run.run_config,
-            step_keys_to_execute=args.step_keys_to_execute,
-            known_state=args.known_state,
-            repository_load_data=repository_load_data,
-        )
+        if args.execution_plan_snapshot is not None:
+            # rebuild only the part of the plan needed by the steps, which was sent by the
+            # orchestrator, rather than building the plan for the whole job
+            execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                dagster_run.job_name,
+                args.execution_plan_snapshot,
+                known_state=args.known_state,
+                repository_load_data=repository_load_data,
+            )
+        else:
+            execution_plan = create_execution_plan(
+                recon_job,
+                run_config=dagster_run.run_config,
+                step_keys_to_execute=args.step_keys_to_execute,
+                known_state=args.known_state,
+                repository_load_data=repository_load_data,
+            )
 
         yield from execute_plan_iterator(
             execution_plan,
@@ -604,6 +615,18 @@ def _execute_step_command_body(
     help="[INTERNAL] Retrieves current utilization metrics from GRPC server.",
     envvar="DAGSTER_ENABLE_SERVER_METRICS",
 )
+@click.option(
+    "--reuse-sensor-resources",
+    is_flag=True,
+    required=False,
+    default=False,
+    help=(
+        "Initialize the resources required by sensors once and reuse them across sensor"
+        " evaluations, tearing them down when the server shuts down, rather than initializing"
+        " them for each evaluation. Reused resources may be used by several evaluations at once."
+    ),
+    envvar="DAGSTER_REUSE_SENSOR_RESOURCES",
+)
 def grpc_command(
     port=None,
     socket=None,
@@ -622,6 +645,7 @@ def grpc_command(
     instance_ref=None,
     inject_env_vars_from_instance=False,
     enable_metrics=False,
+    reuse_sensor_resources=False,
     **kwargs,
 ):
     check.invariant(heartbeat_timeout > 0, "heartbeat_timeout must be greater than 0")
@@ -714,6 +738,7 @@ def grpc_command(
         instance_ref=deserialize_value(instance_ref, InstanceRef) if instance_ref else None,
         location_name=location_name,
         enable_metrics=enable_metrics,
+        reuse_sensor_resources=reuse_sensor_resources,
     )
 
     server = DagsterGrpcServer(
@@ -1,9 +1,14 @@
 import os
 
 import click
+import pendulum
 
 import dagster._check as check
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.event_log.archive import archive_old_run_events
+from dagster._core.storage.event_log.codec import EVENT_PAYLOAD_CODECS
+from dagster._core.storage.event_log.migration import reencode_event_payloads
+from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
 from dagster._core.storage.migration.bigint_migration import run_bigint_migration
 
 from .utils import get_instance_for_cli
@@ -89,6 +94,89 @@ def reindex_command():
         instance.reindex(click.echo)
 
 
+@instance_cli.command(
+    name="reencode-events",
+    help=(
+        "Re-encode the stored payload of historical events with an event payload codec. Defaults to"
+        " the codec configured for the event log storage. Can be interrupted and resumed."
+    ),
+)
+@click.option(
+    "--codec",
+    type=click.Choice([*EVENT_PAYLOAD_CODECS, "none"]),
+    help="Codec to re-encode events with, or `none` to store events uncompressed.",
+)
+@click.option("--batch-size", type=int, default=1000, help="Number of events to read at a time.")
+def reencode_events_command(codec, batch_size):
+    with get_instance_for_cli() as instance:
+        home = os.environ.get("DAGSTER_HOME")
+
+        if instance.is_ephemeral:
+            click.echo(
+                "$DAGSTER_HOME is not set; ephemeral instances do not need to be re-encoded."
+            )
+            return
+
+        event_log_storage = instance.event_log_storage
+        if not isinstance(event_log_storage, SqlEventLogStorage):
+            click.echo("Event payload codecs are only supported by SQL event log storages.")
+            return
+
+        click.echo(f"$DAGSTER_HOME: {home}\n")
+
+        if codec is None:
+            codec = event_log_storage.event_payload_codec
+        elif codec == "none":
+            codec = None
+
+        reencode_event_payloads(event_log_storage, codec, click.echo, batch_size=batch_size)
+
+
+@instance_cli.command(
+    name="archive-events",
+    help=(
+        "Move the events of finished runs older than a retention window to the event log archive"
+        " configured for the event log storage. Can be interrupted and resumed."
+    ),
+)
+@click.option(
+    "--older-than-days",
+    type=int,
+    required=True,
+    help="Archive runs that were last updated more than this many days ago.",
+)
+@click.option("--batch-size", type=int, default=100, help="Number of runs to read at a time.")
+@click.option("--limit", type=int, help="Maximum number of runs to archive.")
+def archive_events_command(older_than_days, batch_size, limit):
+    with get_instance_for_cli() as instance:
+        home = os.environ.get("DAGSTER_HOME")
+
+        if instance.is_ephemeral:
+            click.echo("$DAGSTER_HOME is not set; ephemeral instances cannot be archived.")
+            return
+
+        event_log_storage = instance.event_log_storage
+        if (
+            not isinstance(event_log_storage, SqlEventLogStorage)
+            or event_log_storage.event_log_archive is None
+        ):
+            click.echo(
+                "No event log archive is configured. Set `event_log_archive_uri` in the config of"
+                " the event log storage to archive events."
+            )
+            return
+
+        click.echo(f"$DAGSTER_HOME: {home}\n")
+
+        archive_old_run_events(
+            instance,
+            updated_before=pendulum.now("UTC").subtract(days=older_than_days),
+            batch_size=batch_size,
+            limit=limit,
+            print_fn=click.echo,
+        )
+
+
 @instance_cli.group(name="concurrency")
 def concurrency_cli():
     """Commands for working with the instance-wide op concurrency (Experimental)."""
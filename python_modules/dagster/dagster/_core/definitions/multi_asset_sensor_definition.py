@@ -281,6 +281,12 @@ def __init__(
         self._initial_unconsumed_events_by_id: Dict[int, EventLogRecord] = {}
         self._fetched_initial_unconsumed_events = False
 
+        # Materialization records after the cursor of every monitored asset, fetched in bulk and
+        # keyed by the per-asset limit they were fetched with. Cleared after each evaluation.
+        self._materialization_records_by_key_by_limit: Dict[
+            Optional[int], Mapping[AssetKey, Sequence[EventLogRecord]]
+        ] = {}
+
         normalized_last_tick_completion_time = normalize_renamed_param(
             last_tick_completion_time,
             "last_tick_completion_time",
@@ -309,20 +315,23 @@ def _cache_initial_unconsumed_events(self) -> None:
         if self._fetched_initial_unconsumed_events:
             return
 
-        for asset_key in self._monitored_asset_keys:
-            unconsumed_event_ids = list(
-                self._get_cursor(asset_key).trailing_unconsumed_partitioned_event_ids.values()
-            )
-            if unconsumed_event_ids:
-                event_records = self.instance.get_event_records(
-                    EventRecordsFilter(
-                        event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                        storage_ids=unconsumed_event_ids,
-                    )
-                )
-                self._initial_unconsumed_events_by_id.update(
-                    {event_record.storage_id: event_record for event_record in event_records}
+        unconsumed_event_ids = [
+            event_id
+            for asset_key in self._monitored_asset_keys
+            for event_id in self._get_cursor(
+                asset_key
+            ).trailing_unconsumed_partitioned_event_ids.values()
+        ]
+        if unconsumed_event_ids:
+            event_records = self.instance.get_event_records(
+                EventRecordsFilter(
+                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                    storage_ids=unconsumed_event_ids,
                 )
+            )
+            self._initial_unconsumed_events_by_id.update(
+                {event_record.storage_id: event_record for event_record in event_records}
+            )
 
         self._fetched_initial_unconsumed_events = True
 
@@ -379,6 +388,9 @@ def update_cursor_after_evaluation(self) -> None:
         """Updates the cursor after the sensor evaluation function has been called. This method
         should be called at most once per evaluation.
         """
+        # Records fetched during this evaluation may be stale by the next one
+        self._materialization_records_by_key_by_limit = {}
+
         new_cursor = self._cursor_advance_state_mutation.get_cursor_with_advances(
             self, self._unpacked_cursor
         )
@@ -390,6 +402,30 @@ def update_cursor_after_evaluation(self) -> None:
             self._cursor_advance_state_mutation = MultiAssetSensorCursorAdvances()
             self._fetched_initial_unconsumed_events = False
 
+    def _get_materialization_records_after_cursor(
+        self,
+        asset_keys: Sequence[AssetKey],
+        limit: Optional[int] = None,
+        asset_partitions: Optional[Sequence[str]] = None,
+    ) -> Mapping[AssetKey, Sequence["EventLogRecord"]]:
+        """Fetches the materialization records after the cursor of each of the given asset keys
+        in bulk, with the earliest event first.
+        """
+        from dagster._core.event_api import MultiAssetEventRecordsFilter
+        from dagster._core.events import DagsterEventType
+
+        return self.instance.get_event_records_by_asset_key(
+            MultiAssetEventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                after_storage_id_by_asset_key={
+                    asset_key: self._get_cursor(asset_key).latest_consumed_event_id
+                    for asset_key in asset_keys
+                },
+                asset_partitions=asset_partitions,
+            ),
+            limit=limit,
+        )
+
     @public
     def latest_materialization_records_by_key(
         self,
@@ -445,26 +481,19 @@ def materialization_records_for_key(
             asset_key (AssetKey): The asset to fetch materialization events for
             limit (Optional[int]): The number of events to fetch
         """
-        from dagster._core.events import DagsterEventType
-        from dagster._core.storage.event_log.base import EventRecordsFilter
-
         asset_key = check.inst_param(asset_key, "asset_key", AssetKey)
+        limit = check.opt_int_param(limit, "limit")
         if asset_key not in self._assets_by_key:
             raise DagsterInvalidInvocationError(f"Asset key {asset_key} not monitored by sensor.")
 
-        events = list(
-            self.instance.get_event_records(
-                EventRecordsFilter(
-                    event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                    asset_key=asset_key,
-                    after_cursor=self._get_cursor(asset_key).latest_consumed_event_id,
-                ),
-                ascending=True,
-                limit=limit,
-            )
-        )
+        # Sensors typically fetch the records of each of the monitored assets in turn, so the
+        # records of all of them are fetched at once on the first call.
+        if limit not in self._materialization_records_by_key_by_limit:
+            self._materialization_records_by_key_by_limit[
+                limit
+            ] = self._get_materialization_records_after_cursor(self._monitored_asset_keys, limit)
 
-        return events
+        return list(self._materialization_records_by_key_by_limit[limit].get(asset_key, []))
 
     def _get_cursor(self, asset_key: AssetKey) -> MultiAssetSensorAssetCursorComponent:
         """Returns the MultiAssetSensorAssetCursorComponent for the asset key.
@@ -511,9 +540,6 @@ def my_sensor(context):
                 # returns {"2022-07-05": EventLogRecord(...)}
 
         """
-        from dagster._core.events import DagsterEventType
-        from dagster._core.storage.event_log.base import EventLogRecord, EventRecordsFilter
-
         asset_key = check.inst_param(asset_key, "asset_key", AssetKey)
 
         if asset_key not in self._assets_by_key:
@@ -533,6 +559,32 @@ def my_sensor(context):
             else list(partitions_def.get_partition_keys(dynamic_partitions_store=self.instance))
         )
 
+        return self._latest_materialization_records_by_partition_for_keys(
+            [asset_key], partitions_to_fetch
+        )[asset_key]
+
+    def _latest_materialization_records_by_partition_for_keys(
+        self, asset_keys: Sequence[AssetKey], partitions_to_fetch: Sequence[str]
+    ) -> Mapping[AssetKey, Mapping[str, "EventLogRecord"]]:
+        """Returns the latest materialization by partition for each of the given asset keys,
+        fetching the materializations after the cursor of all of the asset keys at once.
+        """
+        materializations_by_key = self._get_materialization_records_after_cursor(
+            asset_keys, asset_partitions=partitions_to_fetch
+        )
+        return {
+            asset_key: self._get_latest_materialization_by_partition(
+                asset_key, partitions_to_fetch, materializations_by_key.get(asset_key, [])
+            )
+            for asset_key in asset_keys
+        }
+
+    def _get_latest_materialization_by_partition(
+        self,
+        asset_key: AssetKey,
+        partitions_to_fetch: Sequence[str],
+        partition_materializations: Sequence["EventLogRecord"],
+    ) -> Mapping[str, "EventLogRecord"]:
         # Retain ordering of materializations
         materialization_by_partition: Dict[str, EventLogRecord] = OrderedDict()
 
@@ -552,15 +604,6 @@ def my_sensor(context):
                 # Add partition and materialization to the end of the OrderedDict
                 materialization_by_partition[partition] = unconsumed_event
 
-        partition_materializations = self.instance.get_event_records(
-            EventRecordsFilter(
-                event_type=DagsterEventType.ASSET_MATERIALIZATION,
-                asset_key=asset_key,
-                asset_partitions=partitions_to_fetch,
-                after_cursor=self._get_cursor(asset_key).latest_consumed_event_id,
-            ),
-            ascending=True,
-        )
         for materialization in partition_materializations:
             partition = materialization.partition_key
 
@@ -604,10 +647,21 @@ def latest_materialization_records_by_partition_and_asset(
             str, Dict[AssetKey, "EventLogRecord"]
         ] = defaultdict(dict)
 
-        for asset_key in self._monitored_asset_keys:
-            materialization_by_partition = self.latest_materialization_records_by_partition(
-                asset_key
+        partitions_def = partitions_defs[0]
+        if not isinstance(partitions_def, PartitionsDefinition):
+            raise DagsterInvariantViolationError(
+                "Cannot get latest materialization by partition for assets with no partitions"
+            )
+
+        partitions_to_fetch = list(
+            partitions_def.get_partition_keys(dynamic_partitions_store=self.instance)
+        )
+        materialization_by_partition_by_key = (
+            self._latest_materialization_records_by_partition_for_keys(
+                self._monitored_asset_keys, partitions_to_fetch
             )
+        )
+        for asset_key, materialization_by_partition in materialization_by_partition_by_key.items():
             for partition, materialization in materialization_by_partition.items():
                 asset_and_materialization_tuple_by_partition[partition][asset_key] = materialization
 
@@ -1213,6 +1267,7 @@ def _check_cursor_not_set(sensor_result: SensorResult):
             return _fn
 
         self._raw_asset_materialization_fn = asset_materialization_fn
+        self._monitored_assets = monitored_assets
 
         super(MultiAssetSensorDefinition, self).__init__(
             name=check_valid_name(name),
@@ -1251,6 +1306,10 @@ def __call__(self, *args, **kwargs) -> AssetMaterializationFunctionReturn:
             context.update_cursor_after_evaluation()
         return result
 
+    @property
+    def monitored_assets(self) -> Union[Sequence[AssetKey], AssetSelection]:
+        return self._monitored_assets
+
     @property
     def sensor_type(self) -> SensorType:
         return SensorType.MULTI_ASSET
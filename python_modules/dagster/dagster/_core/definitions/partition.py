@@ -8,6 +8,7 @@
 )
 from enum import Enum
 from typing import (
+    TYPE_CHECKING,
     AbstractSet,
     Any,
     Callable,
@@ -50,6 +51,9 @@
 from .config import ConfigMapping
 from .utils import validate_tags
 
+if TYPE_CHECKING:
+    from dagster._core.storage.event_log.base import DynamicPartitionsVersion
+
 DEFAULT_DATE_FORMAT = "%Y-%m-%d"
 
 T_cov = TypeVar("T_cov", default=Any, covariant=True)
@@ -387,6 +391,12 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         return self._instance.has_dynamic_partition(partitions_def_name, partition_key)
 
+    @cached_method
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional["DynamicPartitionsVersion"]:
+        return self._instance.get_dynamic_partitions_version(partitions_def_name)
+
 
 @deprecated_param(
     param="partition_fn",
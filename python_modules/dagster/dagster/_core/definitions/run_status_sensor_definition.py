@@ -70,6 +70,8 @@
         JobSelector,
         RepositorySelector,
     )
+    from dagster._core.event_api import EventLogRecord
+    from dagster._core.storage.dagster_run import RunRecord
 
 RunStatusSensorEvaluationFunction: TypeAlias = Union[
     Callable[..., RawSensorEvaluationFunctionReturn],
@@ -111,6 +113,63 @@ def from_json(json_str: str) -> "RunStatusSensorCursor":
         return deserialize_value(json_str, RunStatusSensorCursor)
 
 
+class RunStatusChangeRecord(NamedTuple):
+    """A run status change event record, along with the record of the run that the event belongs to
+    (or None if the run could not be found).
+    """
+
+    event_record: "EventLogRecord"
+    run_record: Optional["RunRecord"]
+
+
+RunStatusChangeRecordsLoader: TypeAlias = Callable[
+    [DagsterInstance, DagsterEventType, RunStatusSensorCursor, int],
+    Sequence[RunStatusChangeRecord],
+]
+
+
+def fetch_run_status_change_records(
+    instance: DagsterInstance,
+    event_type: DagsterEventType,
+    cursor: RunStatusSensorCursor,
+    limit: int,
+) -> Sequence[RunStatusChangeRecord]:
+    """Fetches the run status change events of the given type after the cursor, in ascending order,
+    along with the records of the runs they belong to.
+    """
+    from dagster._core.event_api import RunShardedEventsCursor
+    from dagster._core.storage.event_log.base import EventRecordsFilter
+
+    # Note: this is a cross-run query which requires extra handling in sqlite, see details in
+    # SqliteEventLogStorage.
+    event_records = instance.get_event_records(
+        EventRecordsFilter(
+            after_cursor=RunShardedEventsCursor(
+                id=cursor.record_id,
+                run_updated_after=cast(datetime, pendulum.parse(cursor.update_timestamp)),
+            ),
+            event_type=event_type,
+        ),
+        ascending=True,
+        limit=limit,
+    )
+    if not event_records:
+        return []
+
+    run_ids = list({event_record.event_log_entry.run_id for event_record in event_records})
+    run_records_by_id = {
+        run_record.dagster_run.run_id: run_record
+        for run_record in instance.get_run_records(filters=RunsFilter(run_ids=run_ids))
+    }
+    return [
+        RunStatusChangeRecord(
+            event_record=event_record,
+            run_record=run_records_by_id.get(event_record.event_log_entry.run_id),
+        )
+        for event_record in event_records
+    ]
+
+
 class RunStatusSensorContext:
     """The ``context`` object available to a decorated function of ``run_status_sensor``."""
 
@@ -584,7 +643,6 @@ def __init__(
             JobSelector,
             RepositorySelector,
         )
-        from dagster._core.event_api import RunShardedEventsCursor
         from dagster._core.storage.event_log.base import EventRecordsFilter
 
         check.str_param(name, "name")
@@ -667,36 +725,28 @@ def _wrapped_fn(
                 yield SkipReason(f"Initiating {name}. Set cursor to {new_cursor}")
                 return
 
-            record_id, update_timestamp = RunStatusSensorCursor.from_json(context.cursor)
-
-            # Fetch events after the cursor id
+            # Fetch events after the cursor id, along with their runs
             # * we move the cursor forward to the latest visited event's id to avoid revisits
             # * when the daemon is down, bc we persist the cursor info, we can go back to where we
             #   left and backfill alerts for the qualified events (up to 5 at a time) during the downtime
-            # Note: this is a cross-run query which requires extra handling in sqlite, see details in SqliteEventLogStorage.
-            event_records = context.instance.get_event_records(
-                EventRecordsFilter(
-                    after_cursor=RunShardedEventsCursor(
-                        id=record_id,
-                        run_updated_after=cast(datetime, pendulum.parse(update_timestamp)),
-                    ),
-                    event_type=event_type,
-                ),
-                ascending=True,
-                limit=5,
+            # * when evaluated by a code server, the records may be shared with the other run status
+            #   sensors evaluated in the same sensor daemon iteration
+            load_run_status_change_records = (
+                context.run_status_change_records_loader or fetch_run_status_change_records
+            )
+            run_status_change_records = load_run_status_change_records(
+                context.instance,
+                event_type,
+                RunStatusSensorCursor.from_json(context.cursor),
+                5,
             )
 
-            for event_record in event_records:
+            for event_record, run_record in run_status_change_records:
                 event_log_entry = event_record.event_log_entry
                 storage_id = event_record.storage_id
 
-                # get run info
-                run_records = context.instance.get_run_records(
-                    filters=RunsFilter(run_ids=[event_log_entry.run_id])
-                )
-
                 # skip if we couldn't find the right run
-                if len(run_records) != 1:
+                if run_record is None:
                     # bc we couldn't find the run, we use the event timestamp as the approximate
                     # run update timestamp
                     approximate_update_timestamp = utc_datetime_from_timestamp(
@@ -710,8 +760,8 @@ def _wrapped_fn(
                     )
                     continue
 
-                dagster_run = run_records[0].dagster_run
-                update_timestamp = run_records[0].update_timestamp
+                dagster_run = run_record.dagster_run
+                update_timestamp = run_record.update_timestamp
 
                 job_match = False
 
@@ -176,6 +176,7 @@ def the_schedule(context: ScheduleEvaluationContext):
         "_resources",
         "_cm_scope_entered",
         "_repository_def",
+        "_instance_loader",
     ]
 
     def __init__(
@@ -187,11 +188,15 @@ def __init__(
         schedule_name: Optional[str] = None,
         resources: Optional[Mapping[str, "ResourceDefinition"]] = None,
         repository_def: Optional["RepositoryDefinition"] = None,
+        instance_loader: Optional[Callable[[InstanceRef], DagsterInstance]] = None,
     ):
         from dagster._core.definitions.repository_definition import RepositoryDefinition
 
         self._exit_stack = ExitStack()
         self._instance = None
+        # Loads the instance from the instance ref in place of DagsterInstance.from_ref, e.g. to
+        # reuse instances across evaluations. Instances it returns are not disposed by the context.
+        self._instance_loader = check.opt_callable_param(instance_loader, "instance_loader")
 
         self._instance_ref = check.opt_inst_param(instance_ref, "instance_ref", InstanceRef)
         self._scheduled_execution_time = check.opt_inst_param(
@@ -294,6 +299,7 @@ def merge_resources(self, resources_dict: Mapping[str, Any]) -> "ScheduleEvaluat
                 **wrap_resources_for_execution(resources_dict),
             },
             repository_def=self._repository_def,
+            instance_loader=self._instance_loader,
         )
 
     @public
@@ -307,9 +313,12 @@ def instance(self) -> "DagsterInstance":
                 "Attempted to initialize dagster instance, but no instance reference was provided."
             )
         if not self._instance:
-            self._instance = self._exit_stack.enter_context(
-                DagsterInstance.from_ref(self._instance_ref)
-            )
+            if self._instance_loader:
+                self._instance = self._instance_loader(self._instance_ref)
+            else:
+                self._instance = self._exit_stack.enter_context(
+                    DagsterInstance.from_ref(self._instance_ref)
+                )
         return cast(DagsterInstance, self._instance)
 
     @property
@@ -79,6 +79,9 @@
     from dagster import ResourceDefinition
     from dagster._core.definitions.definitions_class import Definitions
     from dagster._core.definitions.repository_definition import RepositoryDefinition
+    from dagster._core.definitions.run_status_sensor_definition import (
+        RunStatusChangeRecordsLoader,
+    )
 
 
 @whitelist_for_serdes
@@ -159,6 +162,8 @@ def __init__(
         resources: Optional[Mapping[str, "ResourceDefinition"]] = None,
         definitions: Optional["Definitions"] = None,
         last_sensor_start_time: Optional[float] = None,
+        instance_loader: Optional[Callable[[InstanceRef], DagsterInstance]] = None,
+        run_status_change_records_loader: Optional["RunStatusChangeRecordsLoader"] = None,
         # deprecated param
         last_completion_time: Optional[float] = None,
     ):
@@ -185,6 +190,14 @@ def __init__(
             error_on_none=False,
         )
         self._instance = check.opt_inst_param(instance, "instance", DagsterInstance)
+        # Loads the instance from the instance ref in place of DagsterInstance.from_ref, e.g. to
+        # reuse instances across evaluations. Instances it returns are not disposed by the context.
+        self._instance_loader = check.opt_callable_param(instance_loader, "instance_loader")
+        # Loads the status change events consumed by run status sensors, e.g. to share them across
+        # the run status sensors evaluated in the same sensor daemon iteration.
+        self._run_status_change_records_loader = check.opt_callable_param(
+            run_status_change_records_loader, "run_status_change_records_loader"
+        )
         self._sensor_name = sensor_name
 
         # Wait to set resources unless they're accessed
@@ -250,6 +263,8 @@ def merge_resources(self, resources_dict: Mapping[str, Any]) -> "SensorEvaluatio
                 **wrap_resources_for_execution(resources_dict),
             },
             last_sensor_start_time=self._last_sensor_start_time,
+            instance_loader=self._instance_loader,
+            run_status_change_records_loader=self._run_status_change_records_loader,
         )
 
     @public
@@ -317,15 +332,22 @@ def instance(self) -> DagsterInstance:
                     "Attempted to initialize dagster instance, but no instance reference was"
                     " provided."
                 )
-            self._instance = self._exit_stack.enter_context(
-                DagsterInstance.from_ref(self._instance_ref)
-            )
+            if self._instance_loader:
+                self._instance = self._instance_loader(self._instance_ref)
+            else:
+                self._instance = self._exit_stack.enter_context(
+                    DagsterInstance.from_ref(self._instance_ref)
+                )
         return cast(DagsterInstance, self._instance)
 
     @property
     def instance_ref(self) -> Optional[InstanceRef]:
         return self._instance_ref
 
+    @property
+    def run_status_change_records_loader(self) -> Optional["RunStatusChangeRecordsLoader"]:
+        return self._run_status_change_records_loader
+
     @public
     @property
     def last_tick_completion_time(self) -> Optional[float]:
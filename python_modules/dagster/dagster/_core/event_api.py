@@ -333,6 +333,59 @@ def to_event_records_filter(
         )
 
 
+class MultiAssetEventRecordsFilter(
+    NamedTuple(
+        "_MultiAssetEventRecordsFilter",
+        [
+            ("event_type", AssetEventType),
+            ("after_storage_id_by_asset_key", Mapping[AssetKey, Optional[int]]),
+            ("asset_partitions", Optional[Sequence[str]]),
+        ],
+    )
+):
+    """Defines a set of filter fields for fetching the asset event records of many asset keys at
+    once, each after its own cursor.
+
+    Args:
+        event_type (DagsterEventType): Filter argument for dagster event type
+        after_storage_id_by_asset_key (Mapping[AssetKey, Optional[int]]): The asset keys to fetch
+            event records for. For each asset key, only event records with storage_id greater than
+            the mapped value (if not None) are returned.
+        asset_partitions (Optional[List[str]]): Filter parameter such that only asset
+            events with a partition value matching one of the provided values are returned.
+    """
+
+    def __new__(
+        cls,
+        event_type: AssetEventType,
+        after_storage_id_by_asset_key: Mapping[AssetKey, Optional[int]],
+        asset_partitions: Optional[Sequence[str]] = None,
+    ):
+        return super(MultiAssetEventRecordsFilter, cls).__new__(
+            cls,
+            event_type=check.inst_param(event_type, "event_type", DagsterEventType),
+            after_storage_id_by_asset_key=check.mapping_param(
+                after_storage_id_by_asset_key, "after_storage_id_by_asset_key", key_type=AssetKey
+            ),
+            asset_partitions=check.opt_nullable_sequence_param(
+                asset_partitions, "asset_partitions", of_type=str
+            ),
+        )
+
+    @property
+    def asset_keys(self) -> Sequence[AssetKey]:
+        return list(self.after_storage_id_by_asset_key.keys())
+
+    def to_event_records_filter(self, asset_key: AssetKey) -> EventRecordsFilter:
+        """Returns the filter for the event records of one of the asset keys."""
+        return EventRecordsFilter(
+            event_type=self.event_type,
+            asset_key=asset_key,
+            asset_partitions=self.asset_partitions,
+            after_cursor=self.after_storage_id_by_asset_key[asset_key],
+        )
+
+
 @whitelist_for_serdes
 class RunStatusChangeRecordsFilter(
     NamedTuple(
@@ -1,14 +1,17 @@
 import io
 import os
 import random
+import selectors
 import string
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import uuid
 import warnings
 from contextlib import contextmanager
+from typing import IO, Dict, List, Optional
 
 from dagster._core.execution import poll_compute_logs, watch_orphans
 from dagster._serdes.ipc import interrupt_ipc_subprocess, open_ipc_subprocess
@@ -17,6 +20,21 @@
 
 WIN_PY36_COMPUTE_LOG_DISABLED_MSG = """\u001b[33mWARNING: Compute log capture is disabled for the current environment. Set the environment variable `PYTHONLEGACYWINDOWSSTDIO` to enable.\n\u001b[0m"""
 
+# mirror captured output by tailing the log file from a subprocess
+TAIL_CAPTURE_MODE = "tail"
+# mirror captured output from a single background thread per process, which drains a pipe
+THREAD_CAPTURE_MODE = "thread"
+
+COMPUTE_LOG_CAPTURE_MODES = (TAIL_CAPTURE_MODE, THREAD_CAPTURE_MODE)
+
+# buffer size of the log files written by the drain thread, which are flushed whenever the captured
+# streams go idle for LOG_FILE_FLUSH_INTERVAL seconds
+LOG_FILE_BUFFER_SIZE = 64 * 1024
+LOG_FILE_FLUSH_INTERVAL = 0.1
+# max time to wait for the drain thread to reach the end of a captured stream, which can be held
+# open by subprocesses that outlive the capture
+CAPTURE_CLOSE_TIMEOUT = 5
+
 
 def create_compute_log_file_key():
     return "".join(random.choice(string.ascii_lowercase) for x in range(8))
@@ -37,6 +55,180 @@ def mirror_stream_to_file(stream, filepath):
             yield pids
 
 
+@contextmanager
+def tee_stream_to_file(stream, filepath):
+    """Captures the output written to the file descriptor of a stream into a file, while still
+    writing it to the original destination of the stream. Unlike `mirror_stream_to_file`, no
+    subprocesses are started: the descriptor is redirected into a pipe that is drained by a single
+    background thread per process.
+
+    Output still in the pipe or in the file buffer is lost if the process is hard-killed.
+    """
+    from_fd = _fileno(stream)
+    if not from_fd or should_disable_io_stream_redirect():
+        yield
+        return
+
+    if IS_WINDOWS:
+        # pipes cannot be polled on windows
+        with mirror_stream_to_file(stream, filepath):
+            yield
+        return
+
+    ensure_file(filepath)
+    stream.flush()
+    read_fd, write_fd = os.pipe()
+    target = _TeeTarget(
+        read_fd, terminal_fd=os.dup(from_fd), file=open(filepath, "ab", LOG_FILE_BUFFER_SIZE)
+    )
+    _get_drain_thread().add_target(target)
+    try:
+        os.dup2(write_fd, from_fd)
+        os.close(write_fd)
+        yield
+    finally:
+        stream.flush()
+        # restoring the descriptor closes the last write end of the pipe held by this process
+        os.dup2(target.terminal_fd, from_fd)
+        if not target.closed.wait(CAPTURE_CLOSE_TIMEOUT):
+            _get_drain_thread().detach_target(target)
+            target.closed.wait()
+
+
+class _TeeTarget:
+    def __init__(self, read_fd: int, terminal_fd: int, file: IO[bytes]):
+        self.read_fd = read_fd
+        self.terminal_fd = terminal_fd
+        self.file = file
+        self.dirty = False
+        self.drained = False
+        self.closed = threading.Event()
+
+    def write(self, data: bytes) -> None:
+        view = memoryview(data)
+        while view:
+            try:
+                written = os.write(self.terminal_fd, view)
+            except OSError:
+                # the terminal went away, keep writing to the file
+                break
+            view = view[written:]
+        self.file.write(data)
+        self.dirty = True
+
+    def flush(self) -> None:
+        if self.dirty:
+            self.file.flush()
+            self.dirty = False
+
+    def close(self) -> None:
+        try:
+            self.file.close()
+        finally:
+            os.close(self.read_fd)
+            os.close(self.terminal_fd)
+            self.closed.set()
+
+
+class _DrainThread:
+    """Drains the pipes of all active stream captures of the process, writing their output to the
+    captured terminal and log file. Targets are added and detached through a wakeup pipe, so that
+    the selector is only ever touched from the drain thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: List[_TeeTarget] = []
+        self._detaching: List[_TeeTarget] = []
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        self._thread = threading.Thread(target=self._run, name="compute-log-capture", daemon=True)
+        self._thread.start()
+
+    def add_target(self, target: _TeeTarget) -> None:
+        os.set_blocking(target.read_fd, False)
+        with self._lock:
+            self._pending.append(target)
+        os.write(self._wakeup_write_fd, b"\0")
+
+    def detach_target(self, target: _TeeTarget) -> None:
+        with self._lock:
+            self._detaching.append(target)
+        os.write(self._wakeup_write_fd, b"\0")
+
+    def _run(self) -> None:
+        selector = selectors.DefaultSelector()
+        selector.register(self._wakeup_read_fd, selectors.EVENT_READ)
+        targets: Dict[int, _TeeTarget] = {}
+
+        while True:
+            has_dirty = any(target.dirty for target in targets.values())
+            events = selector.select(LOG_FILE_FLUSH_INTERVAL if has_dirty else None)
+            if not events:
+                for target in targets.values():
+                    target.flush()
+                continue
+
+            for key, _ in events:
+                if key.fd == self._wakeup_read_fd:
+                    self._handle_wakeup(selector, targets)
+                elif key.fd in targets and not self._read(targets[key.fd]):
+                    selector.unregister(key.fd)
+                    targets.pop(key.fd).close()
+
+    def _handle_wakeup(self, selector: selectors.BaseSelector, targets: Dict[int, _TeeTarget]):
+        try:
+            while os.read(self._wakeup_read_fd, 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+            detaching, self._detaching = self._detaching, []
+
+        for target in pending:
+            targets[target.read_fd] = target
+            selector.register(target.read_fd, selectors.EVENT_READ)
+
+        for target in detaching:
+            if targets.pop(target.read_fd, None) is target:
+                # drain whatever was already written, and stop reading the pipe
+                while self._read(target) and not target.drained:
+                    pass
+                selector.unregister(target.read_fd)
+                target.close()
+
+    def _read(self, target: _TeeTarget) -> bool:
+        # returns False once every write end of the pipe has been closed
+        try:
+            data = os.read(target.read_fd, LOG_FILE_BUFFER_SIZE)
+        except BlockingIOError:
+            target.drained = True
+            return True
+        if not data:
+            return False
+        target.drained = False
+        target.write(data)
+        return True
+
+
+_drain_thread: Optional[_DrainThread] = None
+_drain_thread_pid: Optional[int] = None
+_drain_thread_lock = threading.Lock()
+
+
+def _get_drain_thread() -> _DrainThread:
+    global _drain_thread, _drain_thread_pid  # noqa: PLW0603
+
+    with _drain_thread_lock:
+        # threads do not survive a fork, so forked processes start their own drain thread
+        if _drain_thread is None or _drain_thread_pid != os.getpid():
+            _drain_thread = _DrainThread()
+            _drain_thread_pid = os.getpid()
+        return _drain_thread
+
+
 def should_disable_io_stream_redirect():
     # See https://stackoverflow.com/a/52377087
     # https://www.python.org/dev/peps/pep-0528/
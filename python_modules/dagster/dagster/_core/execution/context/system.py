@@ -82,6 +82,7 @@
     from dagster._core.execution.plan.plan import ExecutionPlan
     from dagster._core.execution.plan.state import KnownExecutionState
     from dagster._core.instance import DagsterInstance
+    from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 
     from .hook import HookContext
 
@@ -269,6 +270,27 @@ def for_step(self, step: ExecutionStep) -> "IStepContext":
     def resume_from_failure(self) -> bool:
         return self._resume_from_failure
 
+    def get_step_subset_plan_snapshot(
+        self, step_keys_to_execute: Sequence[str]
+    ) -> Optional["ExecutionPlanSnapshot"]:
+        """Snapshot of the part of the plan needed to execute the given steps, which is sent to the
+        step workers executing them so that they do not need to build the plan for the whole job.
+
+        Not available for runs without a job snapshot, or for runs using memoization, since step
+        output versions are resolved against the whole plan.
+        """
+        from dagster._core.snap.execution_plan_snapshot import (
+            step_subset_snapshot_from_execution_plan,
+        )
+
+        job_snapshot_id = self.dagster_run.job_snapshot_id
+        if job_snapshot_id is None or self.job.get_definition().is_using_memoization(self.run_tags):
+            return None
+
+        return step_subset_snapshot_from_execution_plan(
+            self.execution_plan, job_snapshot_id, step_keys_to_execute
+        )
+
 
 class StepOrchestrationContext(PlanOrchestrationContext, IStepContext):
     """Context for the orchestration of a step.
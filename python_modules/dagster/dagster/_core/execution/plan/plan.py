@@ -1095,7 +1095,16 @@ def rebuild_step_input(
     def rebuild_from_snapshot(
         job_name: str,
         execution_plan_snapshot: "ExecutionPlanSnapshot",
+        known_state: Optional[KnownExecutionState] = None,
+        repository_load_data: Optional[RepositoryLoadData] = None,
     ) -> "ExecutionPlan":
+        """Rebuild the plan from its snapshot. The known state and repository load data stored in
+        the snapshot can be overridden, e.g. for snapshots of a subset of the plan that are sent to
+        step workers without them.
+        """
+        check.opt_inst_param(known_state, "known_state", KnownExecutionState)
+        check.opt_inst_param(repository_load_data, "repository_load_data", RepositoryLoadData)
+
         if not execution_plan_snapshot.can_reconstruct_plan:
             raise DagsterInvariantViolationError(
                 "Tried to reconstruct an old ExecutionPlanSnapshot that was created before"
@@ -1166,11 +1175,13 @@ def rebuild_from_snapshot(
             StepHandle.parse_from_key(key) for key in execution_plan_snapshot.step_keys_to_execute
         ]
 
+        known_state = known_state or execution_plan_snapshot.initial_known_state
+
         executable_map, resolvable_map = _compute_step_maps(
             step_dict,
             step_dict_by_key,
             step_handles_to_execute,
-            execution_plan_snapshot.initial_known_state,
+            known_state,
         )
 
         return ExecutionPlan(
@@ -1179,10 +1190,12 @@ def rebuild_from_snapshot(
             resolvable_map,
             step_handles_to_execute,
             # default to empty known execution state if initial was not persisted
-            execution_plan_snapshot.initial_known_state or KnownExecutionState(),
+            known_state or KnownExecutionState(),
             execution_plan_snapshot.artifacts_persisted,
             executor_name=execution_plan_snapshot.executor_name,
-            repository_load_data=execution_plan_snapshot.repository_load_data,
+            repository_load_data=(
+                repository_load_data or execution_plan_snapshot.repository_load_data
+            ),
         )
 
 
@@ -29,6 +29,7 @@
 from dagster._core.execution.retries import RetryMode
 from dagster._core.executor.base import Executor
 from dagster._core.instance import DagsterInstance
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -60,6 +61,7 @@ def __init__(
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
         repository_load_data: Optional[RepositoryLoadData],
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
     ):
         self.run_config = run_config
         self.dagster_run = dagster_run
@@ -70,6 +72,7 @@ def __init__(
         self.retry_mode = retry_mode
         self.known_state = known_state
         self.repository_load_data = repository_load_data
+        self.execution_plan_snapshot = execution_plan_snapshot
 
     def execute(self) -> Iterator[DagsterEvent]:
         recon_job = self.recon_pipeline
@@ -87,13 +90,23 @@ def execute(self) -> Iterator[DagsterEvent]:
                 },
                 step_key=self.step_key,
             )
-            execution_plan = create_execution_plan(
-                job=recon_job,
-                run_config=self.run_config,
-                step_keys_to_execute=[self.step_key],
-                known_state=self.known_state,
-                repository_load_data=self.repository_load_data,
-            )
+            if self.execution_plan_snapshot is not None:
+                # rebuild only the part of the plan needed by the step, rather than building the
+                # plan for the whole job
+                execution_plan = ExecutionPlan.rebuild_from_snapshot(
+                    self.dagster_run.job_name,
+                    self.execution_plan_snapshot,
+                    known_state=self.known_state,
+                    repository_load_data=self.repository_load_data,
+                )
+            else:
+                execution_plan = create_execution_plan(
+                    job=recon_job,
+                    run_config=self.run_config,
+                    step_keys_to_execute=[self.step_key],
+                    known_state=self.known_state,
+                    repository_load_data=self.repository_load_data,
+                )
             yield from execute_plan_iterator(
                 execution_plan,
                 recon_job,
@@ -239,6 +252,7 @@ def execute(
                             self.retries,
                             active_execution.get_known_state(),
                             execution_plan.repository_load_data,
+                            plan_context.get_step_subset_plan_snapshot([step.key]),
                         )
 
                 # process active iterators
@@ -337,6 +351,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    execution_plan_snapshot: Optional[ExecutionPlanSnapshot],
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -348,6 +363,7 @@ def execute_step_out_of_process(
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
+        execution_plan_snapshot=execution_plan_snapshot,
     )
 
     yield DagsterEvent.step_worker_starting(
@@ -89,8 +89,9 @@ def _pop_events(self, instance: DagsterInstance, run_id: str) -> Sequence[Dagste
         return dagster_events
 
     def _get_step_handler_context(
-        self, plan_context, steps, active_execution
+        self, plan_context, steps, active_execution, include_plan_snapshot: bool = False
     ) -> StepHandlerContext:
+        step_keys_to_execute = [step.key for step in steps]
         return StepHandlerContext(
             instance=plan_context.plan_data.instance,
             plan_context=plan_context,
@@ -98,12 +99,18 @@ def _get_step_handler_context(
             execute_step_args=ExecuteStepArgs(
                 job_origin=plan_context.reconstructable_job.get_python_origin(),
                 run_id=plan_context.dagster_run.run_id,
-                step_keys_to_execute=[step.key for step in steps],
+                step_keys_to_execute=step_keys_to_execute,
                 instance_ref=plan_context.plan_data.instance.get_ref(),
                 retry_mode=self.retries.for_inner_plan(),
                 known_state=active_execution.get_known_state(),
                 should_verify_step=self._should_verify_step,
                 print_serialized_events=False,
+                # only needed by the step workers, so only included when launching steps
+                execution_plan_snapshot=(
+                    plan_context.get_step_subset_plan_snapshot(step_keys_to_execute)
+                    if include_plan_snapshot
+                    else None
+                ),
             ),
             dagster_run=plan_context.dagster_run,
         )
@@ -188,7 +195,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                             list(
                                 self._step_handler.launch_step(
                                     self._get_step_handler_context(
-                                        plan_context, [step], active_execution
+                                        plan_context,
+                                        [step],
+                                        active_execution,
+                                        include_plan_snapshot=True,
                                     )
                                 )
                             )
@@ -319,7 +329,10 @@ def execute(self, plan_context: PlanOrchestrationContext, execution_plan: Execut
                         list(
                             self._step_handler.launch_step(
                                 self._get_step_handler_context(
-                                    plan_context, [step], active_execution
+                                    plan_context,
+                                    [step],
+                                    active_execution,
+                                    include_plan_snapshot=True,
                                 )
                             )
                         )
@@ -220,6 +220,7 @@ def get_external_sensor_execution_data(
         cursor: Optional[str],
         log_key: Optional[Sequence[str]],
         last_sensor_start_time: Optional[float],
+        evaluation_batch_id: Optional[str] = None,
     ) -> "SensorExecutionData":
         pass
 
@@ -530,6 +531,7 @@ def get_external_sensor_execution_data(
         cursor: Optional[str],
         log_key: Optional[Sequence[str]],
         last_sensor_start_time: Optional[float],
+        evaluation_batch_id: Optional[str] = None,
     ) -> "SensorExecutionData":
         result = get_external_sensor_execution(
             self._get_repo_def(repository_handle.repository_name),
@@ -540,6 +542,7 @@ def get_external_sensor_execution_data(
             cursor,
             log_key,
             last_sensor_start_time,
+            evaluation_batch_id=evaluation_batch_id,
         )
         if isinstance(result, ExternalSensorExecutionErrorData):
             raise DagsterUserCodeProcessError.from_error_info(result.error)
@@ -896,6 +899,7 @@ def get_external_sensor_execution_data(
         cursor: Optional[str],
         log_key: Optional[Sequence[str]],
         last_sensor_start_time: Optional[float],
+        evaluation_batch_id: Optional[str] = None,
     ) -> "SensorExecutionData":
         from dagster._api.snapshot_sensor import sync_get_external_sensor_execution_data_grpc
 
@@ -909,6 +913,7 @@ def get_external_sensor_execution_data(
             cursor,
             log_key,
             last_sensor_start_time,
+            evaluation_batch_id=evaluation_batch_id,
         )
 
     def get_external_partition_set_execution_param_data(
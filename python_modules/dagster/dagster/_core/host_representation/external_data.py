@@ -75,6 +75,7 @@
     TextMetadataValue,
     normalize_metadata,
 )
+from dagster._core.definitions.multi_asset_sensor_definition import MultiAssetSensorDefinition
 from dagster._core.definitions.multi_dimensional_partitions import MultiPartitionsDefinition
 from dagster._core.definitions.op_definition import OpDefinition
 from dagster._core.definitions.partition import DynamicPartitionsDefinition, ScheduleType
@@ -91,7 +92,7 @@
 )
 from dagster._core.definitions.time_window_partitions import TimeWindowPartitionsDefinition
 from dagster._core.definitions.utils import DEFAULT_GROUP_NAME
-from dagster._core.errors import DagsterInvalidDefinitionError
+from dagster._core.errors import DagsterInvalidDefinitionError, DagsterInvalidSubsetError
 from dagster._core.snap import JobSnapshot
 from dagster._core.snap.mode import ResourceDefSnap, build_resource_def_snap
 from dagster._core.storage.io_manager import IOManagerDefinition
@@ -2044,6 +2045,15 @@ def external_sensor_data_from_def(
     asset_keys = None
     if isinstance(sensor_def, AssetSensorDefinition):
         asset_keys = [sensor_def.asset_key]
+    elif isinstance(sensor_def, MultiAssetSensorDefinition):
+        if isinstance(sensor_def.monitored_assets, AssetSelection):
+            try:
+                asset_keys = list(sensor_def.monitored_assets.resolve(repository_def.asset_graph))
+            except DagsterInvalidSubsetError:
+                # surfaced when the sensor is evaluated
+                asset_keys = None
+        else:
+            asset_keys = list(sensor_def.monitored_assets)
 
     if sensor_def.asset_selection is not None:
         target_dict = {
@@ -116,6 +116,7 @@
     from dagster._core.event_api import (
         AssetRecordsFilter,
         EventHandlerFn,
+        MultiAssetEventRecordsFilter,
         RunStatusChangeRecordsFilter,
     )
     from dagster._core.events import (
@@ -160,6 +161,7 @@
     from dagster._core.storage.event_log import EventLogStorage
     from dagster._core.storage.event_log.base import (
         AssetRecord,
+        DynamicPartitionsVersion,
         EventLogConnection,
         EventLogRecord,
         EventRecordsFilter,
@@ -313,6 +315,14 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         ...
 
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional["DynamicPartitionsVersion"]:
+        """Returns a version that changes whenever the partition keys of the dynamic partitions
+        definition change, or None if versions are not available.
+        """
+        return None
+
 
 class DagsterInstance(DynamicPartitionsStore):
     """Core abstraction for managing Dagster's access to storage and other resources.
@@ -1788,6 +1798,12 @@ def get_run_ids(
     ) -> Sequence[str]:
         return self._run_storage.get_run_ids(filters, cursor=cursor, limit=limit)
 
+    @traced
+    def get_runs_for_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Sequence[DagsterRun]:
+        return self._run_storage.get_runs_for_run_keys(selector_id, run_keys)
+
     @traced
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         return self._run_storage.get_runs_count(filters)
@@ -1985,6 +2001,27 @@ def get_event_records(
 
         return self._event_storage.get_event_records(event_records_filter, limit, ascending)
 
+    @traced
+    def get_event_records_by_asset_key(
+        self,
+        records_filter: "MultiAssetEventRecordsFilter",
+        limit: Optional[int] = None,
+    ) -> Mapping[AssetKey, Sequence["EventLogRecord"]]:
+        """Return the event records matching the filter for each of its asset keys, fetched in
+        bulk from the event log storage.
+
+        Args:
+            records_filter (MultiAssetEventRecordsFilter): the filter by which to filter event
+                records, with a cursor for each asset key.
+            limit (Optional[int]): Number of results to get for each asset key. Defaults to
+                infinite.
+
+        Returns:
+            Mapping[AssetKey, Sequence[EventLogRecord]]: The event log records for each asset key,
+                in ascending order.
+        """
+        return self._event_storage.get_event_records_by_asset_key(records_filter, limit)
+
     @public
     @traced
     def fetch_materializations(
@@ -2254,6 +2291,13 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
         check.sequence_param(partition_key, "partition_key", of_type=str)
         self._event_storage.delete_dynamic_partition(partitions_def_name, partition_key)
 
+    @traced
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional["DynamicPartitionsVersion"]:
+        check.str_param(partitions_def_name, "partitions_def_name")
+        return self._event_storage.get_dynamic_partitions_version(partitions_def_name)
+
     @public
     @traced
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
@@ -284,6 +284,16 @@ def sensors_daemon_config() -> Field:
                     " tick."
                 ),
             ),
+            "trigger_on_asset_events": Field(
+                Bool,
+                is_required=False,
+                default_value=False,
+                description=(
+                    "Whether asset sensors and multi-asset sensors are only evaluated when the"
+                    " assets they monitor have been materialized since their last evaluation,"
+                    " rather than every time their minimum interval elapses."
+                ),
+            ),
         },
         is_required=False,
     )
@@ -52,6 +52,7 @@
     ExecutionStepSnap as ExecutionStepSnap,
     create_execution_plan_snapshot_id as create_execution_plan_snapshot_id,
     snapshot_from_execution_plan as snapshot_from_execution_plan,
+    step_subset_snapshot_from_execution_plan as step_subset_snapshot_from_execution_plan,
 )
 from .job_snapshot import (
     JobSnapshot as JobSnapshot,
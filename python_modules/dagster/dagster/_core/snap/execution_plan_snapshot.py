@@ -315,3 +315,42 @@ def snapshot_from_execution_plan(
         executor_name=execution_plan.executor_name,
         repository_load_data=execution_plan.repository_load_data,
     )
+
+
+def step_subset_snapshot_from_execution_plan(
+    execution_plan: ExecutionPlan, pipeline_snapshot_id: str, step_keys_to_execute: Sequence[str]
+) -> ExecutionPlanSnapshot:
+    """Snapshot only the given steps of the plan and the steps whose outputs they load, which is
+    enough to rebuild a plan that executes those steps. Unlike the snapshot of the full plan, its
+    size does not grow with the size of the job, so it can be sent to step workers, which can
+    rebuild their plan from it rather than building the plan for the whole job.
+
+    The known state and the repository load data are not included, since step workers are sent
+    them separately.
+    """
+    check.inst_param(execution_plan, "execution_plan", ExecutionPlan)
+    check.str_param(pipeline_snapshot_id, "pipeline_snapshot_id")
+    check.sequence_param(step_keys_to_execute, "step_keys_to_execute", of_type=str)
+
+    step_keys = set(step_keys_to_execute)
+    for step_key in step_keys_to_execute:
+        step = execution_plan.get_executable_step_by_key(step_key)
+        # upstream steps that were not resolved in the plan, e.g. dynamic steps that are not
+        # being re-executed, are not in the plan for the whole job either
+        step_keys.update(
+            key
+            for key in step.get_execution_dependency_keys()
+            if key in execution_plan.step_dict_by_key
+        )
+
+    return ExecutionPlanSnapshot(
+        steps=[
+            _snapshot_from_execution_step(execution_plan.get_step_by_key(step_key))
+            for step_key in sorted(step_keys)
+        ],
+        artifacts_persisted=execution_plan.artifacts_persisted,
+        job_snapshot_id=pipeline_snapshot_id,
+        step_keys_to_execute=step_keys_to_execute,
+        snapshot_version=CURRENT_SNAPSHOT_VERSION,
+        executor_name=execution_plan.executor_name,
+    )
@@ -0,0 +1,57 @@
+"""add asset_partition_latest table
+
+Revision ID: a1b2f0c7d8e9
+Revises: 46b412388816
+Create Date: 2024-01-08 10:12:31.402118
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "a1b2f0c7d8e9"
+down_revision = "46b412388816"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "asset_partition_latest"
+INDEX_NAME = "idx_asset_partition_latest"
+
+
+def upgrade():
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column("asset_key", db.Text, nullable=False),
+            db.Column("partition", db.Text, nullable=False),
+            db.Column("dagster_event_type", db.Text, nullable=False),
+            db.Column(
+                "event_id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                nullable=False,
+            ),
+        )
+
+    if not has_index(TABLE_NAME, INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            TABLE_NAME,
+            ["asset_key", "partition", "dagster_event_type"],
+            mysql_length={"asset_key": 64, "partition": 64, "dagster_event_type": 64},
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        if has_index(TABLE_NAME, INDEX_NAME):
+            op.drop_index(INDEX_NAME, TABLE_NAME)
+
+        op.drop_table(TABLE_NAME)
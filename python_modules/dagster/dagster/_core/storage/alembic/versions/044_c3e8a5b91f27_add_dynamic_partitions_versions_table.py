@@ -0,0 +1,47 @@
+"""add dynamic_partitions_versions table
+
+Revision ID: c3e8a5b91f27
+Revises: a1b2f0c7d8e9
+Create Date: 2024-01-11 16:40:05.733251
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_table
+from dagster._core.storage.sql import MySQLCompatabilityTypes, get_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "c3e8a5b91f27"
+down_revision = "a1b2f0c7d8e9"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "dynamic_partitions_versions"
+
+
+def upgrade():
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column(
+                "partitions_def_name",
+                MySQLCompatabilityTypes.UniqueText,
+                nullable=False,
+                unique=True,
+            ),
+            db.Column("append_count", db.BigInteger, nullable=False),
+            db.Column("delete_count", db.BigInteger, nullable=False),
+            db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        op.drop_table(TABLE_NAME)
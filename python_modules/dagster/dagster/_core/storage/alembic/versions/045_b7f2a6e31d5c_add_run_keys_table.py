@@ -0,0 +1,62 @@
+"""add run_keys table
+
+Revision ID: b7f2a6e31d5c
+Revises: c3e8a5b91f27
+Create Date: 2024-01-16 11:02:47.118340
+
+"""
+import sqlalchemy as db
+from alembic import op
+from dagster._core.storage.migration.utils import has_index, has_table
+from dagster._core.storage.sql import get_current_timestamp
+from sqlalchemy.dialects import sqlite
+
+# revision identifiers, used by Alembic.
+revision = "b7f2a6e31d5c"
+down_revision = "c3e8a5b91f27"
+branch_labels = None
+depends_on = None
+
+TABLE_NAME = "run_keys"
+INDEX_NAME = "idx_run_keys"
+
+
+def upgrade():
+    if not has_table("runs"):
+        return
+
+    if not has_table(TABLE_NAME):
+        op.create_table(
+            TABLE_NAME,
+            db.Column(
+                "id",
+                db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+                primary_key=True,
+                autoincrement=True,
+            ),
+            db.Column(
+                "run_id",
+                db.String(255),
+                db.ForeignKey("runs.run_id", ondelete="CASCADE"),
+                unique=True,
+            ),
+            db.Column("selector_id", db.String(255), nullable=False),
+            db.Column("run_key", db.Text, nullable=False),
+            db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+        )
+
+    if not has_index(TABLE_NAME, INDEX_NAME):
+        op.create_index(
+            INDEX_NAME,
+            TABLE_NAME,
+            ["selector_id", "run_key"],
+            mysql_length={"selector_id": 64, "run_key": 255},
+        )
+
+
+def downgrade():
+    if has_table(TABLE_NAME):
+        if has_index(TABLE_NAME, INDEX_NAME):
+            op.drop_index(INDEX_NAME, TABLE_NAME)
+
+        op.drop_table(TABLE_NAME)
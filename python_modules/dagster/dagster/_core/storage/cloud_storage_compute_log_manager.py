@@ -5,7 +5,7 @@
 from abc import abstractmethod
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import IO, Iterator, Optional, Sequence, Union
+from typing import IO, Dict, Iterator, MutableMapping, Optional, Sequence, Tuple, Union
 
 from typing_extensions import TypeAlias
 
@@ -32,12 +32,22 @@
 
 SUBSCRIPTION_POLLING_INTERVAL = 5
 
+# log chunks are named after the zero-padded byte offset of their first byte in the log file, so that
+# listing them in lexicographic order lists them in file order
+LOG_CHUNK_NAME_WIDTH = 20
+
 LogSubscription: TypeAlias = Union[CapturedLogSubscription, ComputeLogSubscription]
 
 
 class CloudStorageComputeLogManager(CapturedLogManager, ComputeLogManager[T_DagsterInstance]):
     """Abstract class that uses the local compute log manager to capture logs and stores them in
     remote cloud storage.
+
+    By default, partial logs are uploaded every `upload_interval` seconds by re-uploading the whole
+    local log file. Implementations that support chunked uploads instead upload only the bytes
+    written since the previous upload, as a chunk object named after its byte offset in the log
+    file. Chunks are read back without downloading the whole log, and are deleted once the complete
+    log file has been uploaded.
     """
 
     @property
@@ -81,6 +91,37 @@ def download_from_cloud_storage(
     ) -> None:
         """Downloads the logs for a given log key from cloud storage to local storage."""
 
+    @property
+    def chunked_uploads(self) -> bool:
+        """Returns whether partial logs are uploaded as chunks of the bytes written since the
+        previous upload, instead of re-uploading the whole log file.
+        """
+        return False
+
+    def upload_chunk_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ) -> None:
+        """Uploads a chunk of a partial log file to cloud storage."""
+        raise NotImplementedError()
+
+    def list_chunks_in_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType
+    ) -> Sequence[Tuple[str, int]]:
+        """Returns the (chunk name, size in bytes) of each chunk of a partial log file in cloud
+        storage.
+        """
+        raise NotImplementedError()
+
+    def download_chunk_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> bytes:
+        """Downloads a chunk of a partial log file from cloud storage."""
+        raise NotImplementedError()
+
+    def delete_chunks_from_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        """Deletes all chunks of a partial log file from cloud storage."""
+        raise NotImplementedError()
+
     @contextmanager
     def capture_logs(self, log_key: Sequence[str]) -> Iterator[CapturedLogContext]:
         with self._poll_for_local_upload(log_key):
@@ -99,6 +140,9 @@ def open_log_stream(
     def _on_capture_complete(self, log_key: Sequence[str]):
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR)
+        if self.chunked_uploads:
+            self.delete_chunks_from_cloud_storage(log_key, ComputeIOType.STDOUT)
+            self.delete_chunks_from_cloud_storage(log_key, ComputeIOType.STDERR)
 
     def is_capture_complete(self, log_key: Sequence[str]) -> bool:
         if self.local_manager.is_capture_complete(log_key):
@@ -120,6 +164,10 @@ def log_data_for_type(
                 log_key, IO_TYPE_EXTENSION[io_type]
             )
             return self.local_manager.read_path(local_path, offset=offset, max_bytes=max_bytes)
+        if self.chunked_uploads:
+            chunks = self.list_chunks_in_cloud_storage(log_key, io_type)
+            if chunks:
+                return self._read_chunks(log_key, io_type, chunks, offset, max_bytes)
         if self.cloud_storage_has_logs(log_key, io_type, partial=True):
             self.download_from_cloud_storage(log_key, io_type, partial=True)
             local_path = self.local_manager.get_captured_local_path(
@@ -129,6 +177,36 @@ def log_data_for_type(
 
         return None, offset
 
+    def _read_chunks(
+        self,
+        log_key: Sequence[str],
+        io_type: ComputeIOType,
+        chunks: Sequence[Tuple[str, int]],
+        offset: int,
+        max_bytes: Optional[int],
+    ) -> Tuple[bytes, int]:
+        # only download the chunks overlapping the requested byte range
+        end = None if max_bytes is None else offset + max_bytes
+        data = []
+        data_offset = None
+        for chunk_name, size in sorted(chunks):
+            chunk_offset = parse_log_chunk_name(chunk_name)
+            if chunk_offset + size <= offset:
+                continue
+            if end is not None and chunk_offset >= end:
+                break
+            if data_offset is None:
+                data_offset = chunk_offset
+            data.append(self.download_chunk_from_cloud_storage(log_key, io_type, chunk_name))
+
+        if data_offset is None:
+            return b"", offset
+
+        start = offset - data_offset
+        stop = None if end is None else end - data_offset
+        chunk_data = b"".join(data)[start:stop]
+        return chunk_data, offset + len(chunk_data)
+
     def get_log_data(
         self,
         log_key: Sequence[str],
@@ -165,6 +243,38 @@ def on_progress(self, log_key):
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDOUT, partial=True)
         self.upload_to_cloud_storage(log_key, ComputeIOType.STDERR, partial=True)
 
+    def upload_new_chunks(
+        self, log_key: Sequence[str], uploaded_offsets: MutableMapping[ComputeIOType, int]
+    ) -> None:
+        """Uploads the bytes written to the local log files since the previous upload as new chunks.
+        The offsets up to which each log file has been uploaded are tracked in `uploaded_offsets`,
+        and are recovered from the chunks in cloud storage when missing, so that an interrupted
+        upload is resumed instead of restarted.
+        """
+        if self.is_capture_complete(log_key):
+            return
+
+        for io_type in [ComputeIOType.STDOUT, ComputeIOType.STDERR]:
+            if io_type not in uploaded_offsets:
+                uploaded_offsets[io_type] = max(
+                    (
+                        parse_log_chunk_name(chunk_name) + size
+                        for chunk_name, size in self.list_chunks_in_cloud_storage(log_key, io_type)
+                    ),
+                    default=0,
+                )
+
+            local_path = self.local_manager.get_captured_local_path(
+                log_key, IO_TYPE_EXTENSION[io_type]
+            )
+            offset = uploaded_offsets[io_type]
+            data, new_offset = self.local_manager.read_path(local_path, offset=offset)
+            if data:
+                self.upload_chunk_to_cloud_storage(
+                    log_key, io_type, build_log_chunk_name(offset), data
+                )
+                uploaded_offsets[io_type] = new_offset
+
     def subscribe(
         self, log_key: Sequence[str], cursor: Optional[str] = None
     ) -> CapturedLogSubscription:
@@ -200,6 +310,10 @@ def _poll_for_local_upload(self, log_key: Sequence[str]) -> Iterator[None]:
         thread.start()
         yield
         thread_exit.set()
+        if self.chunked_uploads:
+            # wait for any in-flight chunk upload, so that no chunk is uploaded after the chunks are
+            # deleted on completion
+            thread.join()
 
     ###############################################
     #
@@ -405,8 +519,19 @@ def _upload_partial_logs(
     thread_exit: threading.Event,
     interval: int,
 ) -> None:
+    uploaded_offsets: Dict[ComputeIOType, int] = {}
     while True:
-        time.sleep(interval)
-        if thread_exit.is_set() or compute_log_manager.is_capture_complete(log_key):
+        if thread_exit.wait(interval) or compute_log_manager.is_capture_complete(log_key):
             return
-        compute_log_manager.on_progress(log_key)
+        if compute_log_manager.chunked_uploads:
+            compute_log_manager.upload_new_chunks(log_key, uploaded_offsets)
+        else:
+            compute_log_manager.on_progress(log_key)
+
+
+def build_log_chunk_name(offset: int) -> str:
+    return str(offset).zfill(LOG_CHUNK_NAME_WIDTH)
+
+
+def parse_log_chunk_name(chunk_name: str) -> int:
+    return int(chunk_name)
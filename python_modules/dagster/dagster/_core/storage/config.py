@@ -2,13 +2,73 @@
 
 from typing_extensions import TypedDict
 
-from dagster._config import Field, IntSource, Permissive, Selector, StringSource
+from dagster._config import Field, IntSource, Permissive, StringSource
 from dagster._config.config_schema import UserConfigSchema
 
 
+class SqlPoolConfig(TypedDict):
+    pool_size: int
+    max_overflow: int
+    pool_timeout: int
+    pool_recycle: int
+    pool_pre_ping: bool
+
+
+def sql_pool_config() -> Field:
+    return Field(
+        {
+            "pool_size": Field(
+                IntSource,
+                is_required=False,
+                default_value=5,
+                description="The number of connections held open by each storage.",
+            ),
+            "max_overflow": Field(
+                IntSource,
+                is_required=False,
+                default_value=10,
+                description=(
+                    "The number of connections that can be opened beyond pool_size when all"
+                    " pooled connections are in use. These are closed when they are returned."
+                ),
+            ),
+            "pool_timeout": Field(
+                IntSource,
+                is_required=False,
+                default_value=30,
+                description="The number of seconds to wait for a connection from a full pool.",
+            ),
+            "pool_recycle": Field(
+                IntSource,
+                is_required=False,
+                default_value=3600,
+                description=(
+                    "The number of seconds after which pooled connections are replaced, or -1 to"
+                    " never replace them."
+                ),
+            ),
+            "pool_pre_ping": Field(
+                bool,
+                is_required=False,
+                default_value=True,
+                description=(
+                    "Whether to test pooled connections before handing them out, replacing the"
+                    " ones closed by the database."
+                ),
+            ),
+        },
+        is_required=False,
+        description=(
+            "Hold connections to the database open in a pool, instead of opening a connection for"
+            " each query. Each of the run, event log and schedule storages has its own pool."
+        ),
+    )
+
+
 class MySqlStorageConfig(TypedDict):
     mysql_url: str
     mysql_db: "MySqlStorageConfigDb"
+    pool: SqlPoolConfig
 
 
 class MySqlStorageConfigDb(TypedDict):
@@ -20,23 +80,26 @@ class MySqlStorageConfigDb(TypedDict):
 
 
 def mysql_config() -> UserConfigSchema:
-    return Selector(
-        {
-            "mysql_url": StringSource,
-            "mysql_db": {
+    return {
+        "mysql_url": Field(StringSource, is_required=False),
+        "mysql_db": Field(
+            {
                 "username": StringSource,
                 "password": StringSource,
                 "hostname": StringSource,
                 "db_name": StringSource,
                 "port": Field(IntSource, is_required=False, default_value=3306),
             },
-        }
-    )
+            is_required=False,
+        ),
+        "pool": sql_pool_config(),
+    }
 
 
 class PostgresStorageConfig(TypedDict):
     postgres_url: str
     postgres_db: "PostgresStorageConfigDb"
+    pool: SqlPoolConfig
 
 
 class PostgresStorageConfigDb(TypedDict):
@@ -65,4 +128,5 @@ def pg_config() -> UserConfigSchema:
             is_required=False,
         ),
         "should_autocreate_tables": Field(bool, is_required=False, default_value=True),
+        "pool": sql_pool_config(),
     }
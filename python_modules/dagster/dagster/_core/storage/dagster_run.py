@@ -22,6 +22,7 @@
 from dagster._core.origin import JobPythonOrigin
 from dagster._core.storage.tags import PARENT_RUN_ID_TAG, ROOT_RUN_ID_TAG
 from dagster._core.utils import make_new_run_id
+from dagster._serdes import create_snapshot_id
 from dagster._serdes.serdes import (
     NamedTupleSerializer,
     whitelist_for_serdes,
@@ -424,6 +425,27 @@ def previous_run_id(self) -> Optional[str]:
         # Compat
         return self.parent_run_id
 
+    @property
+    def instigator_selector_id(self) -> Optional[str]:
+        """Optional[str]: The selector id of the schedule or sensor that launched this run, matching
+        the ``selector_id`` of the corresponding ``ExternalSchedule`` or ``ExternalSensor``. None if
+        the run was not launched by a schedule or sensor, or has no origin.
+        """
+        from dagster._core.definitions.selector import InstigatorSelector
+
+        instigator_name = self.tags.get(SENSOR_NAME_TAG) or self.tags.get(SCHEDULE_NAME_TAG)
+        if not instigator_name or not self.external_job_origin:
+            return None
+
+        repository_origin = self.external_job_origin.external_repository_origin
+        return create_snapshot_id(
+            InstigatorSelector(
+                location_name=repository_origin.code_location_origin.location_name,
+                repository_name=repository_origin.repository_name,
+                name=instigator_name,
+            )
+        )
+
     @staticmethod
     def tags_for_schedule(schedule) -> Mapping[str, str]:
         return {SCHEDULE_NAME_TAG: schedule.name}
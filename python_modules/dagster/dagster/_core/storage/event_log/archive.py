@@ -0,0 +1,232 @@
+"""Cold storage for the events of old runs.
+
+Archiving a run writes all of its events to a single Parquet file in the archive, and then deletes
+the events that are only ever read per-run from the event log table. Asset events, asset check
+events and run status events stay in the table, so that the asset and asset check index tables and
+cross-run event queries are unaffected. Per-run reads of an archived run are served from its file.
+
+Archives are addressed by a local path or by a URI supported by `pyarrow.fs` (e.g. `s3://bucket/path`
+or `gs://bucket/path`), and require `pyarrow` to be installed.
+"""
+
+import os
+import uuid
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Set, Tuple
+
+import dagster._check as check
+from dagster._config import Field, StringSource
+from dagster._core.event_api import EventLogRecord
+from dagster._core.events import (
+    ASSET_CHECK_EVENTS,
+    ASSET_EVENTS,
+    EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
+    DagsterEventType,
+)
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.codec import decode_event_payload
+from dagster._serdes import deserialize_value
+from dagster._utils import PrintFn
+
+if TYPE_CHECKING:
+    import pyarrow
+
+    from dagster._core.instance import DagsterInstance
+
+# events that are kept in the event log table when a run is archived
+RETAINED_EVENT_TYPES: Set[DagsterEventType] = {
+    *ASSET_EVENTS,
+    *ASSET_CHECK_EVENTS,
+    *EVENT_TYPE_TO_PIPELINE_RUN_STATUS.keys(),
+}
+
+ARCHIVE_FILE_EXTENSION = ".parquet"
+
+# schema metadata key holding the largest storage id of the archived events of a run
+MAX_STORAGE_ID_METADATA_KEY = b"dagster/max_storage_id"
+
+
+def event_log_archive_config_field() -> Field:
+    return Field(
+        StringSource,
+        is_required=False,
+        description=(
+            "Local directory or object storage URI (e.g. s3://bucket/prefix) to archive the events"
+            " of old runs to. Use `dagster instance archive-events` to archive runs."
+        ),
+    )
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.fs
+        import pyarrow.parquet
+    except ImportError:
+        check.failed("Archiving event logs requires the `pyarrow` package to be installed.")
+    return pyarrow
+
+
+class ParquetEventLogArchive:
+    """Stores the events of each archived run in a Parquet file named after the run id."""
+
+    def __init__(self, base_uri: str):
+        self._base_uri = check.str_param(base_uri, "base_uri")
+        self._filesystem: Any = None
+        self._base_path: Optional[str] = None
+
+    @property
+    def base_uri(self) -> str:
+        return self._base_uri
+
+    def _get_filesystem(self) -> Tuple[Any, str]:
+        if self._filesystem is None:
+            pa = _import_pyarrow()
+            if "://" in self._base_uri:
+                self._filesystem, self._base_path = pa.fs.FileSystem.from_uri(self._base_uri)
+            else:
+                self._filesystem = pa.fs.LocalFileSystem()
+                self._base_path = os.path.abspath(self._base_uri)
+            self._filesystem.create_dir(self._base_path, recursive=True)
+        return self._filesystem, check.not_none(self._base_path)
+
+    def _path_for_run(self, run_id: str) -> str:
+        _, base_path = self._get_filesystem()
+        return f"{base_path}/{run_id}{ARCHIVE_FILE_EXTENSION}"
+
+    def has_run(self, run_id: str) -> bool:
+        pa = _import_pyarrow()
+        filesystem, _ = self._get_filesystem()
+        return filesystem.get_file_info(self._path_for_run(run_id)).type == pa.fs.FileType.File
+
+    def write_run(self, run_id: str, rows: Sequence[Tuple[int, Optional[str], str]]) -> None:
+        """Writes the (storage id, dagster event type, serialized event) rows of a run, replacing
+        any existing archive of the run.
+        """
+        check.invariant(rows, "Cannot archive a run without events")
+        pa = _import_pyarrow()
+        filesystem, _ = self._get_filesystem()
+        table = pa.table(
+            {
+                "storage_id": pa.array([row[0] for row in rows], type=pa.int64()),
+                "dagster_event_type": pa.array([row[1] for row in rows], type=pa.string()),
+                "event": pa.array([row[2] for row in rows], type=pa.string()),
+            }
+        ).sort_by("storage_id")
+        table = table.replace_schema_metadata(
+            {MAX_STORAGE_ID_METADATA_KEY: str(max(row[0] for row in rows)).encode()}
+        )
+
+        # write to a temporary file first so that a partially written archive is never read
+        path = self._path_for_run(run_id)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        pa.parquet.write_table(table, tmp_path, filesystem=filesystem, compression="zstd")
+        filesystem.move(tmp_path, path)
+
+    def get_max_storage_id(self, run_id: str) -> int:
+        """Returns the largest storage id of the archived events of a run. Events of the run with a
+        larger storage id were stored after the run was archived.
+        """
+        pa = _import_pyarrow()
+        filesystem, _ = self._get_filesystem()
+        schema = pa.parquet.read_schema(self._path_for_run(run_id), filesystem=filesystem)
+        return int(schema.metadata[MAX_STORAGE_ID_METADATA_KEY])
+
+    def read_run(
+        self,
+        run_id: str,
+        after_storage_id: Optional[int] = None,
+        before_storage_id: Optional[int] = None,
+        event_types: Optional[Set[DagsterEventType]] = None,
+    ) -> Sequence[EventLogRecord]:
+        """Returns the archived records of a run in ascending storage id order."""
+        table = self._read_table(run_id, after_storage_id, before_storage_id, event_types)
+        return [
+            EventLogRecord(
+                storage_id=storage_id,
+                event_log_entry=deserialize_value(decode_event_payload(event), EventLogEntry),
+            )
+            for storage_id, event in zip(
+                table.column("storage_id").to_pylist(), table.column("event").to_pylist()
+            )
+        ]
+
+    def _read_table(
+        self,
+        run_id: str,
+        after_storage_id: Optional[int],
+        before_storage_id: Optional[int],
+        event_types: Optional[Set[DagsterEventType]],
+    ) -> "pyarrow.Table":
+        pa = _import_pyarrow()
+        filesystem, _ = self._get_filesystem()
+
+        filters = []
+        if after_storage_id is not None:
+            filters.append(("storage_id", ">", after_storage_id))
+        if before_storage_id is not None:
+            filters.append(("storage_id", "<", before_storage_id))
+        if event_types:
+            filters.append(
+                ("dagster_event_type", "in", [event_type.value for event_type in event_types])
+            )
+
+        return pa.parquet.read_table(
+            self._path_for_run(run_id),
+            columns=["storage_id", "event"],
+            filters=filters or None,
+            filesystem=filesystem,
+        ).sort_by("storage_id")
+
+    def delete_run(self, run_id: str) -> None:
+        if self.has_run(run_id):
+            filesystem, _ = self._get_filesystem()
+            filesystem.delete_file(self._path_for_run(run_id))
+
+
+def archive_old_run_events(
+    instance: "DagsterInstance",
+    updated_before: datetime,
+    batch_size: int = 100,
+    limit: Optional[int] = None,
+    print_fn: Optional[PrintFn] = None,
+) -> int:
+    """Archives the events of every finished run last updated before the given time, in batches of
+    runs. Runs that are already archived are skipped, so an interrupted archival can be resumed by
+    calling this again. Returns the number of runs whose events were archived.
+    """
+    from dagster._core.storage.dagster_run import FINISHED_STATUSES, RunsFilter
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    event_log_storage = check.inst(
+        instance.event_log_storage,
+        SqlEventLogStorage,
+        "Archiving events is only supported by SQL event log storages",
+    )
+    check.invariant(
+        event_log_storage.event_log_archive is not None,
+        "No event log archive is configured for the event log storage",
+    )
+
+    runs_filter = RunsFilter(statuses=FINISHED_STATUSES, updated_before=updated_before)
+    archived = 0
+    cursor = None
+    while limit is None or archived < limit:
+        run_ids = instance.get_run_ids(runs_filter, cursor=cursor, limit=batch_size)
+        if not run_ids:
+            break
+
+        for run_id in run_ids:
+            if limit is not None and archived >= limit:
+                break
+            deleted = event_log_storage.archive_run_events(run_id)
+            if deleted:
+                archived += 1
+                if print_fn:
+                    print_fn(f"Archived run {run_id}, deleted {deleted} events from the event log.")
+
+        cursor = run_ids[-1]
+
+    if print_fn:
+        print_fn(f"Archived {archived} runs.")
+    return archived
@@ -22,6 +22,7 @@
     EventLogRecord,
     EventRecordsFilter,
     EventRecordsResult,
+    MultiAssetEventRecordsFilter,
     RunStatusChangeRecordsFilter,
 )
 from dagster._core.events import DagsterEventType
@@ -106,6 +107,20 @@ class AssetRecord(NamedTuple):
     asset_entry: AssetEntry
 
 
+class DynamicPartitionsVersion(NamedTuple):
+    """The number of partition keys ever added to and deleted from a dynamic partitions
+    definition. Changes whenever its partition keys change. If only the append count changed, the
+    partition keys were only appended to.
+    """
+
+    append_count: int
+    delete_count: int
+
+    @property
+    def num_partitions(self) -> int:
+        return self.append_count - self.delete_count
+
+
 class EventLogStorage(ABC, MayHaveInstanceWeakref[T_DagsterInstance]):
     """Abstract base class for storing structured event logs from pipeline runs.
 
@@ -236,6 +251,27 @@ def get_event_records(
     ) -> Sequence[EventLogRecord]:
         pass
 
+    def get_event_records_by_asset_key(
+        self,
+        records_filter: MultiAssetEventRecordsFilter,
+        limit: Optional[int] = None,
+    ) -> Mapping[AssetKey, Sequence[EventLogRecord]]:
+        """Returns the event records matching the filter for each of its asset keys, in ascending
+        order, with at most `limit` records for each asset key.
+
+        By default, this fetches the event records one asset key at a time. Storages that can fetch
+        the event records of many asset keys in a single query should override this.
+        """
+        check.inst_param(records_filter, "records_filter", MultiAssetEventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+
+        return {
+            asset_key: self.get_event_records(
+                records_filter.to_event_records_filter(asset_key), limit=limit, ascending=True
+            )
+            for asset_key in records_filter.asset_keys
+        }
+
     def supports_event_consumer_queries(self) -> bool:
         return False
 
@@ -388,6 +424,14 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
         """Delete a partition for the specified dynamic partitions definition."""
         raise NotImplementedError()
 
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional[DynamicPartitionsVersion]:
+        """Get the version of the partition keys of a dynamic partitions definition, or None if the
+        storage does not track versions.
+        """
+        return None
+
     def alembic_version(self) -> Optional[AlembicVersion]:
         return None
 
@@ -0,0 +1,107 @@
+"""Codecs for the serialized event payloads stored in the `event` column of the event log table.
+
+Encoded payloads are stored as text, prefixed with the name and version of the codec that produced
+them, e.g. `zlib:1:<base64 data>`. Serialized events are JSON objects and always start with `{`,
+so rows written before a codec was configured (or with no codec) are read back unchanged.
+"""
+
+import base64
+import zlib
+from typing import Callable, Mapping, Optional, Tuple
+
+import dagster._check as check
+from dagster._config import Field, StringSource
+
+ZLIB_CODEC = "zlib"
+ZSTD_CODEC = "zstd"
+
+EVENT_PAYLOAD_CODECS = (ZLIB_CODEC, ZSTD_CODEC)
+
+CODEC_VERSION = "1"
+
+# payloads shorter than this are stored uncompressed, since the base64 encoding of their compressed
+# form is not meaningfully smaller
+MIN_ENCODED_PAYLOAD_LENGTH = 256
+
+
+def event_payload_codec_config_field() -> Field:
+    return Field(
+        StringSource,
+        is_required=False,
+        description=(
+            "Compress the serialized payload of newly stored events with the given codec, one of"
+            f" {', '.join(EVENT_PAYLOAD_CODECS)}. Events are readable regardless of the codec they"
+            " were written with. Use `dagster instance reencode-events` to re-encode existing"
+            " events."
+        ),
+    )
+
+
+def check_event_payload_codec(codec: Optional[str]) -> Optional[str]:
+    check.opt_str_param(codec, "codec")
+    check.invariant(
+        codec is None or codec in EVENT_PAYLOAD_CODECS,
+        f"Unknown event payload codec {codec}, expected one of {', '.join(EVENT_PAYLOAD_CODECS)}",
+    )
+    if codec == ZSTD_CODEC:
+        _import_zstandard()
+    return codec
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        check.failed(
+            "The zstd event payload codec requires the `zstandard` package to be installed."
+        )
+    return zstandard
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    return _import_zstandard().ZstdCompressor().compress(data)
+
+
+def _zstd_decompress(data: bytes) -> bytes:
+    return _import_zstandard().ZstdDecompressor().decompress(data)
+
+
+_CODECS: Mapping[str, Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    ZLIB_CODEC: (zlib.compress, zlib.decompress),
+    ZSTD_CODEC: (_zstd_compress, _zstd_decompress),
+}
+
+
+def encode_event_payload(payload: str, codec: Optional[str]) -> str:
+    """Encodes a serialized event with the given codec, or returns it unchanged if codec is None or
+    the payload is too small to benefit from compression.
+    """
+    if codec is None or len(payload) < MIN_ENCODED_PAYLOAD_LENGTH:
+        return payload
+
+    compress, _ = _CODECS[codec]
+    data = base64.b64encode(compress(payload.encode("utf-8"))).decode("ascii")
+    return f"{codec}:{CODEC_VERSION}:{data}"
+
+
+def decode_event_payload(value: str) -> str:
+    """Returns the serialized event for a stored payload, written with any codec or none."""
+    codec = get_event_payload_codec(value)
+    if codec is None:
+        # not encoded, or not a value that we know how to decode, left to the deserializer
+        return value
+
+    _, version, data = value.split(":", 2)
+    if version != CODEC_VERSION:
+        check.failed(f"Unknown event payload encoding {codec}:{version}")
+
+    _, decompress = _CODECS[codec]
+    return decompress(base64.b64decode(data)).decode("utf-8")
+
+
+def get_event_payload_codec(value: str) -> Optional[str]:
+    """Returns the codec a stored payload was written with, or None if it is not encoded."""
+    if not value or value[0] == "{":
+        return None
+    codec = value.split(":", 1)[0]
+    return codec if codec in _CODECS else None
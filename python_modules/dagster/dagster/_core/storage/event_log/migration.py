@@ -1,21 +1,33 @@
-from typing import NamedTuple
+import functools
+from typing import NamedTuple, Optional
 
 import sqlalchemy as db
 from tqdm import tqdm
 
 from dagster._core.assets import AssetDetails
 from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log.codec import (
+    check_event_payload_codec,
+    decode_event_payload,
+    encode_event_payload,
+    get_event_payload_codec,
+)
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._serdes.serdes import deserialize_value
 from dagster._utils import utc_datetime_from_timestamp
 
 SECONDARY_INDEX_ASSET_KEY = "asset_key_table"  # builds the asset key table from the event log
 ASSET_KEY_INDEX_COLS = "asset_key_index_columns"  # extracts index columns from the asset_keys table
+# builds the asset_partition_latest table from the event log
+ASSET_PARTITION_LATEST_INDEX = "asset_partition_latest"
 
 EVENT_LOG_DATA_MIGRATIONS = {
     SECONDARY_INDEX_ASSET_KEY: lambda: migrate_asset_key_data,
 }
-ASSET_DATA_MIGRATIONS = {ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns}
+ASSET_DATA_MIGRATIONS = {
+    ASSET_KEY_INDEX_COLS: lambda: migrate_asset_keys_index_columns,
+    ASSET_PARTITION_LATEST_INDEX: lambda: migrate_asset_partition_latest_data,
+}
 
 
 def migrate_event_log_data(instance=None):
@@ -128,7 +140,9 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
                 materialization_row = conn.execute(materialization_query).fetchone()
                 if materialization_row:
-                    event = deserialize_value(materialization_row[0], NamedTuple)
+                    event = deserialize_value(
+                        decode_event_payload(materialization_row[0]), NamedTuple
+                    )
 
             if not event:
                 # this must be a wiped asset
@@ -161,6 +175,111 @@ def migrate_asset_keys_index_columns(event_log_storage, print_fn=None):
                 )
 
 
+def migrate_asset_partition_latest_data(event_log_storage, print_fn=None):
+    """Utility method to build the asset_partition_latest table, holding the latest event id of each
+    asset event type for every asset partition, from the data in existing event log records.
+    """
+    from dagster._core.definitions.events import AssetKey
+    from dagster._core.errors import DagsterInvalidInvocationError
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+
+    from .schema import AssetKeyTable, AssetPartitionLatestTable
+
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return
+
+    if not event_log_storage.has_table(AssetPartitionLatestTable.name):
+        raise DagsterInvalidInvocationError(
+            "In order to build the asset partition index, you must run `dagster instance migrate`"
+            " to create the asset_partition_latest table."
+        )
+
+    with event_log_storage.index_connection() as conn:
+        if print_fn:
+            print_fn("Querying asset keys.")
+        asset_keys = [
+            AssetKey.from_db_string(asset_key_str)
+            for (asset_key_str,) in conn.execute(db_select([AssetKeyTable.c.asset_key])).fetchall()
+        ]
+
+    if print_fn:
+        print_fn(f"Found {len(asset_keys)} assets to index.")
+        asset_keys = tqdm(asset_keys)
+
+    for asset_key in asset_keys:
+        if asset_key:
+            event_log_storage.rebuild_asset_partition_latest(asset_key)
+
+
+def reencode_event_payloads(
+    event_log_storage, codec: Optional[str], print_fn=None, batch_size: int = 1000
+) -> int:
+    """Utility method to re-encode the payload of existing event log records with the given codec,
+    or to decode them if codec is None. Rows already stored with the target encoding are skipped, so
+    the migration can be interrupted and resumed. Returns the number of re-encoded rows.
+    """
+    from dagster._core.storage.event_log.sql_event_log import SqlEventLogStorage
+    from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
+
+    check_event_payload_codec(codec)
+    if not isinstance(event_log_storage, SqlEventLogStorage):
+        return 0
+
+    if isinstance(event_log_storage, SqliteEventLogStorage):
+        # events are stored in the shard for their run, and asset events also in the index shard
+        shards = [
+            functools.partial(event_log_storage.run_connection, run_id)
+            for run_id in event_log_storage.get_all_run_ids()
+        ] + [event_log_storage.index_connection]
+    else:
+        shards = [event_log_storage.index_connection]
+
+    if print_fn:
+        print_fn(f"Re-encoding event payloads with codec {codec or 'none'}.")
+        shards = tqdm(shards)
+
+    reencoded = 0
+    for connect in shards:
+        with connect() as conn:
+            reencoded += _reencode_event_payloads_for_connection(conn, codec, batch_size)
+
+    if print_fn:
+        print_fn(f"Re-encoded {reencoded} event payloads.")
+    return reencoded
+
+
+def _reencode_event_payloads_for_connection(conn, codec: Optional[str], batch_size: int) -> int:
+    from .schema import SqlEventLogStorageTable
+
+    reencoded = 0
+    cursor = 0
+    while True:
+        fetched = conn.execute(
+            db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+            .where(SqlEventLogStorageTable.c.id > cursor)
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+            .limit(batch_size)
+        ).fetchall()
+        if not fetched:
+            break
+
+        for record_id, value in fetched:
+            cursor = record_id
+            if codec is not None and get_event_payload_codec(value) == codec:
+                continue
+            encoded = encode_event_payload(decode_event_payload(value), codec)
+            if encoded == value:
+                continue
+            conn.execute(
+                SqlEventLogStorageTable.update()
+                .where(SqlEventLogStorageTable.c.id == record_id)
+                .values(event=encoded)
+            )
+            reencoded += 1
+
+    return reencoded
+
+
 def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
     from .schema import SqlEventLogStorageTable
 
@@ -175,7 +294,7 @@ def sql_asset_event_generator(conn, cursor=None, batch_size=1000):
 
         for record_id, event_json in fetched:
             cursor = record_id
-            event_record = deserialize_value(event_json, NamedTuple)
+            event_record = deserialize_value(decode_event_payload(event_json), NamedTuple)
             if not isinstance(event_record, EventLogEntry):
                 continue
             yield (record_id, event_record)
@@ -103,6 +103,46 @@
     db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
 )
 
+# Tracks the storage id of the latest asset event of each type for every partition of an asset, so
+# that partition status queries do not need to aggregate over all of the asset's events.
+AssetPartitionLatestTable = db.Table(
+    "asset_partition_latest",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("asset_key", db.Text, nullable=False),
+    db.Column("partition", db.Text, nullable=False),
+    db.Column("dagster_event_type", db.Text, nullable=False),
+    db.Column(
+        "event_id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        nullable=False,
+    ),
+)
+
+# Counts the partition keys ever added to and deleted from each dynamic partitions definition, so
+# that changes to its partition keys can be detected without reading them.
+DynamicPartitionsVersionsTable = db.Table(
+    "dynamic_partitions_versions",
+    SqlEventLogStorageMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column(
+        "partitions_def_name", MySQLCompatabilityTypes.UniqueText, nullable=False, unique=True
+    ),
+    db.Column("append_count", db.BigInteger, nullable=False),
+    db.Column("delete_count", db.BigInteger, nullable=False),
+    db.Column("update_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 ConcurrencyLimitsTable = db.Table(
     "concurrency_limits",
     SqlEventLogStorageMetadata,
@@ -253,6 +293,13 @@
     ),
     mysql_length={"asset_key": 64, "dagster_event_type": 64, "partition": 64},
 )
+db.Index(
+    "idx_asset_partition_latest",
+    AssetPartitionLatestTable.c.asset_key,
+    AssetPartitionLatestTable.c.partition,
+    AssetPartitionLatestTable.c.dagster_event_type,
+    mysql_length={"asset_key": 64, "partition": 64, "dagster_event_type": 64},
+)
 db.Index(
     "idx_dynamic_partitions",
     DynamicPartitionsTable.c.partitions_def_name,
@@ -44,6 +44,7 @@
 )
 from dagster._core.event_api import (
     EventRecordsResult,
+    MultiAssetEventRecordsFilter,
     RunShardedEventsCursor,
     RunStatusChangeRecordsFilter,
 )
@@ -55,11 +56,17 @@
     DagsterEventType,
 )
 from dagster._core.events.log import EventLogEntry
-from dagster._core.execution.stats import RunStepKeyStatsSnapshot, build_run_step_stats_from_events
+from dagster._core.execution.stats import (
+    RunStepKeyStatsSnapshot,
+    build_run_stats_from_events,
+    build_run_step_stats_from_events,
+)
 from dagster._core.storage.asset_check_execution_record import (
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
 )
+from dagster._core.storage.event_log.archive import RETAINED_EVENT_TYPES, ParquetEventLogArchive
+from dagster._core.storage.event_log.codec import decode_event_payload, encode_event_payload
 from dagster._core.storage.sql import SqlAlchemyQuery, SqlAlchemyRow
 from dagster._core.storage.sqlalchemy_compat import (
     db_case,
@@ -91,20 +98,28 @@
     AssetEntry,
     AssetRecord,
     AssetRecordsFilter,
+    DynamicPartitionsVersion,
     EventLogConnection,
     EventLogCursor,
     EventLogRecord,
     EventLogStorage,
     EventRecordsFilter,
 )
-from .migration import ASSET_DATA_MIGRATIONS, ASSET_KEY_INDEX_COLS, EVENT_LOG_DATA_MIGRATIONS
+from .migration import (
+    ASSET_DATA_MIGRATIONS,
+    ASSET_KEY_INDEX_COLS,
+    ASSET_PARTITION_LATEST_INDEX,
+    EVENT_LOG_DATA_MIGRATIONS,
+)
 from .schema import (
     AssetCheckExecutionsTable,
     AssetEventTagsTable,
     AssetKeyTable,
+    AssetPartitionLatestTable,
     ConcurrencyLimitsTable,
     ConcurrencySlotsTable,
     DynamicPartitionsTable,
+    DynamicPartitionsVersionsTable,
     PendingStepsTable,
     SecondaryIndexMigrationTable,
     SqlEventLogStorageTable,
@@ -116,6 +131,7 @@
 MAX_CONCURRENCY_SLOTS = 1000
 MIN_ASSET_ROWS = 25
 DEFAULT_MAX_LIMIT_EVENT_RECORDS = 10000
+ASSET_KEY_QUERY_BATCH_SIZE = 100
 
 
 def get_max_event_records_limit() -> int:
@@ -149,6 +165,11 @@ class SqlEventLogStorage(EventLogStorage):
     sharding, while maintaining the ability to do cross-run queries
     """
 
+    # codec used to encode the payload of newly stored events, see `codec.py`
+    _event_payload_codec: Optional[str] = None
+    # cold storage for the events of archived runs, see `archive.py`
+    _event_log_archive: Optional[ParquetEventLogArchive] = None
+
     @abstractmethod
     def run_connection(self, run_id: Optional[str]) -> ContextManager[Connection]:
         """Context manager yielding a connection to access the event logs for a specific run.
@@ -182,6 +203,27 @@ def upgrade(self) -> None:
     def has_table(self, table_name: str) -> bool:
         """This method checks if a table exists in the database."""
 
+    @property
+    def event_payload_codec(self) -> Optional[str]:
+        return self._event_payload_codec
+
+    @property
+    def event_log_archive(self) -> Optional[ParquetEventLogArchive]:
+        return self._event_log_archive
+
+    def is_run_archived(self, run_id: str) -> bool:
+        return self._event_log_archive is not None and self._event_log_archive.has_run(run_id)
+
+    def serialize_event(self, event: EventLogEntry) -> str:
+        """Serializes an event for the `event` column, encoded with the configured codec."""
+        return encode_event_payload(serialize_value(event), self.event_payload_codec)
+
+    def deserialize_event(self, value: str) -> EventLogEntry:
+        """Deserializes the value of the `event` column, regardless of the codec it was encoded
+        with.
+        """
+        return deserialize_value(decode_event_payload(value), EventLogEntry)
+
     def prepare_insert_event(self, event):
         """Helper method for preparing the event log SQL insertion statement.  Abstracted away to
         have a single place for the logical table representation of the event, while having a way
@@ -205,7 +247,7 @@ def prepare_insert_event(self, event):
         # https://stackoverflow.com/a/54386260/324449
         return SqlEventLogStorageTable.insert().values(
             run_id=event.run_id,
-            event=serialize_value(event),
+            event=self.serialize_event(event),
             dagster_event_type=dagster_event_type,
             # Postgres requires a datetime that is in UTC but has no timezone info set
             # in order to be stored correctly
@@ -259,6 +301,148 @@ def store_asset_event(self, event: EventLogEntry, event_id: int):
             except db_exc.IntegrityError:
                 conn.execute(update_statement)
 
+        self.store_asset_partition_latest(event, event_id)
+
+    def store_asset_partition_latest(self, event: EventLogEntry, event_id: int) -> None:
+        """Records the event as the latest event of its type for its asset partition, unless a later
+        event has already been recorded.
+        """
+        check.inst_param(event, "event", EventLogEntry)
+        dagster_event = event.dagster_event
+        if not (
+            dagster_event
+            and dagster_event.asset_key
+            and dagster_event.partition
+            and event_id is not None
+        ):
+            return
+
+        if not self.has_table(AssetPartitionLatestTable.name):
+            return
+
+        partition_latest_filter = db.and_(
+            AssetPartitionLatestTable.c.asset_key == dagster_event.asset_key.to_string(),
+            AssetPartitionLatestTable.c.partition == dagster_event.partition,
+            AssetPartitionLatestTable.c.dagster_event_type == dagster_event.event_type_value,
+        )
+        with self.index_connection() as conn:
+            result = conn.execute(
+                AssetPartitionLatestTable.update()
+                .where(
+                    db.and_(
+                        partition_latest_filter,
+                        AssetPartitionLatestTable.c.event_id < event_id,
+                    )
+                )
+                .values(event_id=event_id)
+            )
+            if result.rowcount:
+                return
+
+            # either this is the first event of its type for the partition, or a later event has
+            # already been recorded
+            existing = conn.execute(
+                db_select([AssetPartitionLatestTable.c.id]).where(partition_latest_filter).limit(1)
+            ).fetchone()
+            if not existing:
+                # rows are not unique per partition and event type, so that concurrent writers
+                # never fail here; readers take the largest event id of any duplicates
+                conn.execute(
+                    AssetPartitionLatestTable.insert().values(
+                        asset_key=dagster_event.asset_key.to_string(),
+                        partition=dagster_event.partition,
+                        dagster_event_type=dagster_event.event_type_value,
+                        event_id=event_id,
+                    )
+                )
+
+    def rebuild_asset_partition_latest(
+        self, asset_key: AssetKey, partitions: Optional[Sequence[str]] = None
+    ) -> None:
+        """Rebuilds the latest event ids by partition of the given asset from the event log, for
+        all partitions or only for the given partitions.
+        """
+        check.inst_param(asset_key, "asset_key", AssetKey)
+        check.opt_nullable_sequence_param(partitions, "partitions", of_type=str)
+
+        delete_query = AssetPartitionLatestTable.delete().where(
+            AssetPartitionLatestTable.c.asset_key == asset_key.to_string()
+        )
+        latest_event_ids_query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    SqlEventLogStorageTable.c.dagster_event_type,
+                    db.func.max(SqlEventLogStorageTable.c.id),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key == asset_key.to_string(),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [event_type.value for event_type in ASSET_EVENTS]
+                    ),
+                )
+            )
+            .group_by(
+                SqlEventLogStorageTable.c.asset_key,
+                SqlEventLogStorageTable.c.partition,
+                SqlEventLogStorageTable.c.dagster_event_type,
+            )
+        )
+        if partitions is not None:
+            delete_query = delete_query.where(AssetPartitionLatestTable.c.partition.in_(partitions))
+            latest_event_ids_query = latest_event_ids_query.where(
+                SqlEventLogStorageTable.c.partition.in_(partitions)
+            )
+
+        assets_details = self._get_assets_details([asset_key])
+        latest_event_ids_query = self._add_assets_wipe_filter_to_query(
+            latest_event_ids_query, assets_details, [asset_key]
+        )
+
+        with self.index_connection() as conn:
+            conn.execute(delete_query)
+            conn.execute(
+                AssetPartitionLatestTable.insert().from_select(
+                    ["asset_key", "partition", "dagster_event_type", "event_id"],
+                    latest_event_ids_query,
+                )
+            )
+
+    def _has_asset_partition_latest_index(self) -> bool:
+        return self.has_secondary_index(ASSET_PARTITION_LATEST_INDEX)
+
+    def _get_asset_partitions_with_latest_events_for_run(
+        self, run_id: str
+    ) -> Mapping[AssetKey, Sequence[str]]:
+        """Returns the asset partitions whose latest event of some type belongs to the given run."""
+        if not self.has_table(AssetPartitionLatestTable.name):
+            return {}
+
+        query = (
+            db_select(
+                [AssetPartitionLatestTable.c.asset_key, AssetPartitionLatestTable.c.partition]
+            )
+            .select_from(
+                AssetPartitionLatestTable.join(
+                    SqlEventLogStorageTable,
+                    SqlEventLogStorageTable.c.id == AssetPartitionLatestTable.c.event_id,
+                )
+            )
+            .where(SqlEventLogStorageTable.c.run_id == run_id)
+            .distinct()
+        )
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        partitions_by_asset_key: Dict[AssetKey, List[str]] = defaultdict(list)
+        for asset_key_str, partition in rows:
+            partitions_by_asset_key[AssetKey.from_db_string(asset_key_str)].append(partition)  # type: ignore
+        return partitions_by_asset_key
+
     def _get_asset_entry_values(
         self, event: EventLogEntry, event_id: int, has_asset_key_index_cols: bool
     ) -> Dict[str, Any]:
@@ -489,6 +673,11 @@ def get_records_for_run(
             else check.opt_set_param(of_type, "dagster_event_type", of_type=DagsterEventType)
         )
 
+        if self.is_run_archived(run_id):
+            return self._get_archived_records_for_run(
+                run_id, cursor, dagster_event_types, limit, ascending
+            )
+
         query = (
             db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
             .where(SqlEventLogStorageTable.c.run_id == run_id)
@@ -532,7 +721,7 @@ def get_records_for_run(
                 records.append(
                     EventLogRecord(
                         storage_id=record_id,
-                        event_log_entry=deserialize_value(json_str, EventLogEntry),
+                        event_log_entry=self.deserialize_event(json_str),
                     )
                 )
                 last_record_id = record_id
@@ -554,9 +743,132 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def _get_archived_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str],
+        dagster_event_types: Set[DagsterEventType],
+        limit: Optional[int],
+        ascending: bool,
+    ) -> EventLogConnection:
+        archive = check.not_none(self._event_log_archive)
+
+        offset = None
+        after_id = None
+        before_id = None
+        if cursor is not None:
+            cursor_obj = EventLogCursor.parse(cursor)
+            if cursor_obj.is_offset_cursor():
+                offset = cursor_obj.offset()
+            elif ascending:
+                after_id = cursor_obj.storage_id()
+            else:
+                before_id = cursor_obj.storage_id()
+
+        try:
+            records = list(archive.read_run(run_id, after_id, before_id, dagster_event_types))
+
+            # events stored after the run was archived are still read from the event log table
+            query = (
+                db_select([SqlEventLogStorageTable.c.id, SqlEventLogStorageTable.c.event])
+                .where(SqlEventLogStorageTable.c.run_id == run_id)
+                .where(SqlEventLogStorageTable.c.id > archive.get_max_storage_id(run_id))
+                .order_by(SqlEventLogStorageTable.c.id.asc())
+            )
+            if dagster_event_types:
+                query = query.where(
+                    SqlEventLogStorageTable.c.dagster_event_type.in_(
+                        [dagster_event_type.value for dagster_event_type in dagster_event_types]
+                    )
+                )
+            if after_id is not None:
+                query = query.where(SqlEventLogStorageTable.c.id > after_id)
+            if before_id is not None:
+                query = query.where(SqlEventLogStorageTable.c.id < before_id)
+            with self.run_connection(run_id) as conn:
+                results = conn.execute(query).fetchall()
+            records.extend(
+                EventLogRecord(storage_id=record_id, event_log_entry=self.deserialize_event(value))
+                for record_id, value in results
+            )
+        except (seven.JSONDecodeError, DeserializationError) as err:
+            raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+
+        if not ascending:
+            records.reverse()
+        if offset:
+            records = records[offset:]
+        has_more = bool(limit and len(records) > limit)
+        if limit:
+            records = records[:limit]
+
+        if records:
+            next_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+        elif cursor:
+            next_cursor = cursor
+        else:
+            next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+
+        return EventLogConnection(records=records, cursor=next_cursor, has_more=has_more)
+
+    def archive_run_events(self, run_id: str) -> int:
+        """Moves the events of a run to the configured event log archive. All of the events of the
+        run are written to the archive, and all but asset, asset check and run status events are
+        deleted from the event log table. Can safely be called again for an archived run, e.g. to
+        resume an interrupted archival. Returns the number of deleted rows.
+        """
+        check.str_param(run_id, "run_id")
+        archive = check.not_none(
+            self._event_log_archive, "No event log archive is configured for this storage"
+        )
+
+        if not archive.has_run(run_id):
+            with self.run_connection(run_id) as conn:
+                rows = conn.execute(
+                    db_select(
+                        [
+                            SqlEventLogStorageTable.c.id,
+                            SqlEventLogStorageTable.c.dagster_event_type,
+                            SqlEventLogStorageTable.c.event,
+                        ]
+                    ).where(SqlEventLogStorageTable.c.run_id == run_id)
+                ).fetchall()
+            if not rows:
+                return 0
+            archive.write_run(
+                run_id,
+                [
+                    (row_id, event_type, decode_event_payload(value))
+                    for row_id, event_type, value in rows
+                ],
+            )
+
+        with self.run_connection(run_id) as conn:
+            result = conn.execute(
+                SqlEventLogStorageTable.delete().where(
+                    db.and_(
+                        SqlEventLogStorageTable.c.run_id == run_id,
+                        SqlEventLogStorageTable.c.id <= archive.get_max_storage_id(run_id),
+                        db.or_(
+                            SqlEventLogStorageTable.c.dagster_event_type == None,  # noqa: E711
+                            SqlEventLogStorageTable.c.dagster_event_type.notin_(
+                                [event_type.value for event_type in RETAINED_EVENT_TYPES]
+                            ),
+                        ),
+                    )
+                )
+            )
+            return result.rowcount
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
+        if self.is_run_archived(run_id):
+            return build_run_stats_from_events(
+                run_id,
+                [record.event_log_entry for record in self.get_records_for_run(run_id).records],
+            )
+
         query = (
             db_select(
                 [
@@ -617,6 +929,16 @@ def get_step_stats_for_run(
         check.str_param(run_id, "run_id")
         check.opt_list_param(step_keys, "step_keys", of_type=str)
 
+        if self.is_run_archived(run_id):
+            return build_run_step_stats_from_events(
+                run_id,
+                [
+                    record.event_log_entry
+                    for record in self.get_records_for_run(run_id).records
+                    if not step_keys or record.event_log_entry.step_key in step_keys
+                ],
+            )
+
         # Originally, this was two different queries:
         # 1) one query which aggregated top-level step stats by grouping by event type / step_key in
         #    a single query, using pure SQL (e.g. start_time, end_time, status, attempt counts).
@@ -660,7 +982,7 @@ def get_step_stats_for_run(
             results = conn.execute(raw_event_query).fetchall()
 
         try:
-            records = [deserialize_value(json_str, EventLogEntry) for (json_str,) in results]
+            records = [self.deserialize_event(json_str) for (json_str,) in results]
             return build_run_step_stats_from_events(run_id, records)
         except (seven.JSONDecodeError, DeserializationError) as err:
             raise DagsterEventLogInvalidForRun(run_id=run_id) from err
@@ -704,6 +1026,9 @@ def wipe(self) -> None:
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_table("dynamic_partitions_versions"):
+                conn.execute(DynamicPartitionsVersionsTable.delete())
+
             if self.has_table("concurrency_limits"):
                 conn.execute(ConcurrencyLimitsTable.delete())
 
@@ -716,6 +1041,9 @@ def wipe(self) -> None:
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("asset_partition_latest"):
+                conn.execute(AssetPartitionLatestTable.delete())
+
         self._wipe_index()
 
     def _wipe_index(self):
@@ -729,6 +1057,9 @@ def _wipe_index(self):
             if self.has_table("dynamic_partitions"):
                 conn.execute(DynamicPartitionsTable.delete())
 
+            if self.has_table("dynamic_partitions_versions"):
+                conn.execute(DynamicPartitionsVersionsTable.delete())
+
             if self.has_table("concurrency_slots"):
                 conn.execute(ConcurrencySlotsTable.delete())
 
@@ -738,11 +1069,19 @@ def _wipe_index(self):
             if self.has_table("asset_check_executions"):
                 conn.execute(AssetCheckExecutionsTable.delete())
 
+            if self.has_table("asset_partition_latest"):
+                conn.execute(AssetPartitionLatestTable.delete())
+
     def delete_events(self, run_id: str) -> None:
+        partitions_by_asset_key = self._get_asset_partitions_with_latest_events_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
+        for asset_key, partitions in partitions_by_asset_key.items():
+            self.rebuild_asset_partition_latest(asset_key, partitions)
+        if self._event_log_archive is not None:
+            self._event_log_archive.delete_run(run_id)
         if self.supports_global_concurrency_limits:
             self.free_concurrency_slots_for_run(run_id)
 
@@ -793,7 +1132,7 @@ def update_event_log_record(self, record_id: int, event: EventLogEntry) -> None:
                 SqlEventLogStorageTable.update()
                 .where(SqlEventLogStorageTable.c.id == record_id)
                 .values(
-                    event=serialize_value(event),
+                    event=self.serialize_event(event),
                     dagster_event_type=dagster_event_type,
                     timestamp=datetime.utcfromtimestamp(event.timestamp),
                     step_key=event.step_key,
@@ -1003,7 +1342,7 @@ def _get_event_records(
         event_records = []
         for row_id, json_str in results:
             try:
-                event_record = deserialize_value(json_str, NamedTuple)
+                event_record = deserialize_value(decode_event_payload(json_str), NamedTuple)
                 if not isinstance(event_record, EventLogEntry):
                     logging.warning(
                         "Could not resolve event record as EventLogEntry for id `%s`.", row_id
@@ -1032,6 +1371,114 @@ def _get_event_records(
 
         return event_records
 
+    @property
+    def supports_batch_queries(self) -> bool:
+        """Whether the storage supports the window functions used to limit the number of event
+        records fetched for each asset key in a single query.
+        """
+        return True
+
+    def get_event_records_by_asset_key(
+        self,
+        records_filter: MultiAssetEventRecordsFilter,
+        limit: Optional[int] = None,
+    ) -> Mapping[AssetKey, Sequence[EventLogRecord]]:
+        check.inst_param(records_filter, "records_filter", MultiAssetEventRecordsFilter)
+        check.opt_int_param(limit, "limit")
+
+        if limit is not None and not self.supports_batch_queries:
+            return super().get_event_records_by_asset_key(records_filter, limit=limit)
+
+        asset_keys = records_filter.asset_keys
+        asset_key_by_str = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+        records_by_asset_key: Dict[AssetKey, List[EventLogRecord]] = {
+            asset_key: [] for asset_key in asset_keys
+        }
+
+        # batch the asset keys to bound the size of the filter expression
+        for i in range(0, len(asset_keys), ASSET_KEY_QUERY_BATCH_SIZE):
+            asset_key_batch = asset_keys[i : i + ASSET_KEY_QUERY_BATCH_SIZE]
+            query = self._get_event_records_by_asset_key_query(
+                records_filter, asset_key_batch, limit
+            )
+            with self.index_connection() as conn:
+                results = conn.execute(query).fetchall()
+
+            for row_id, asset_key_str, json_str in results:
+                try:
+                    event_record = deserialize_value(decode_event_payload(json_str), NamedTuple)
+                except seven.JSONDecodeError:
+                    logging.warning("Could not parse event record id `%s`.", row_id)
+                    continue
+
+                if not isinstance(event_record, EventLogEntry):
+                    logging.warning(
+                        "Could not resolve event record as EventLogEntry for id `%s`.", row_id
+                    )
+                    continue
+
+                records_by_asset_key[asset_key_by_str[asset_key_str]].append(
+                    EventLogRecord(storage_id=row_id, event_log_entry=event_record)
+                )
+
+        return records_by_asset_key
+
+    def _get_event_records_by_asset_key_query(
+        self,
+        records_filter: MultiAssetEventRecordsFilter,
+        asset_keys: Sequence[AssetKey],
+        limit: Optional[int],
+    ) -> SqlAlchemyQuery:
+        # each asset key is filtered by its own cursor and wipe timestamp
+        asset_key_clauses = []
+        for asset_key, asset_details in zip(asset_keys, self._get_assets_details(asset_keys)):
+            clauses = [SqlEventLogStorageTable.c.asset_key == asset_key.to_string()]
+            after_storage_id = records_filter.after_storage_id_by_asset_key[asset_key]
+            if after_storage_id is not None:
+                clauses.append(SqlEventLogStorageTable.c.id > after_storage_id)
+            if asset_details and asset_details.last_wipe_timestamp:
+                clauses.append(
+                    SqlEventLogStorageTable.c.timestamp
+                    > datetime.utcfromtimestamp(asset_details.last_wipe_timestamp)
+                )
+            asset_key_clauses.append(db.and_(*clauses))
+
+        columns = [
+            SqlEventLogStorageTable.c.id,
+            SqlEventLogStorageTable.c.asset_key,
+            SqlEventLogStorageTable.c.event,
+        ]
+        if limit is not None:
+            columns.append(
+                db.func.rank()
+                .over(
+                    order_by=SqlEventLogStorageTable.c.id.asc(),
+                    partition_by=SqlEventLogStorageTable.c.asset_key,
+                )
+                .label("rank")
+            )
+
+        query = db_select(columns).where(
+            db.and_(
+                SqlEventLogStorageTable.c.dagster_event_type == records_filter.event_type.value,
+                db.or_(*asset_key_clauses),
+            )
+        )
+        if records_filter.asset_partitions:
+            query = query.where(
+                SqlEventLogStorageTable.c.partition.in_(records_filter.asset_partitions)
+            )
+
+        if limit is None:
+            return query.order_by(SqlEventLogStorageTable.c.id.asc())
+
+        subquery = db_subquery(query, "ranked_asset_events_subquery")
+        return (
+            db_select([subquery.c.id, subquery.c.asset_key, subquery.c.event])
+            .where(subquery.c.rank <= limit)
+            .order_by(subquery.c.id.asc())
+        )
+
     def supports_event_consumer_queries(self) -> bool:
         return True
 
@@ -1205,7 +1652,7 @@ def get_logs_for_all_runs_by_log_id(
                 record_id,
                 json_str,
             ) in results:
-                events[record_id] = deserialize_value(json_str, EventLogEntry)
+                events[record_id] = self.deserialize_event(json_str)
         except (seven.JSONDecodeError, DeserializationError):
             logging.warning("Could not parse event record id `%s`.", record_id)
 
@@ -1307,7 +1754,7 @@ def _get_latest_materialization_records(
             if asset_key:
                 results[asset_key] = EventLogRecord(
                     storage_id=cast(int, row["id"]),
-                    event_log_entry=deserialize_value(cast(str, row["event"]), EventLogEntry),
+                    event_log_entry=self.deserialize_event(cast(str, row["event"])),
                 )
         return results
 
@@ -1794,12 +2241,37 @@ def wipe_asset(self, asset_key: AssetKey) -> None:
                 )
             )
 
+            if self.has_table(AssetPartitionLatestTable.name):
+                conn.execute(
+                    AssetPartitionLatestTable.delete().where(
+                        AssetPartitionLatestTable.c.asset_key == asset_key.to_string()
+                    )
+                )
+
     def get_materialized_partitions(
         self,
         asset_key: AssetKey,
         before_cursor: Optional[int] = None,
         after_cursor: Optional[int] = None,
     ) -> Set[str]:
+        # the latest materialization of a partition is after the cursor iff any of its
+        # materializations are, which does not hold for a before cursor
+        if before_cursor is None and self._has_asset_partition_latest_index():
+            query = db_select([AssetPartitionLatestTable.c.partition]).where(
+                db.and_(
+                    AssetPartitionLatestTable.c.asset_key == asset_key.to_string(),
+                    AssetPartitionLatestTable.c.dagster_event_type
+                    == DagsterEventType.ASSET_MATERIALIZATION.value,
+                )
+            )
+            if after_cursor:
+                query = query.where(AssetPartitionLatestTable.c.event_id > after_cursor)
+
+            with self.index_connection() as conn:
+                results = conn.execute(query.distinct()).fetchall()
+
+            return set([cast(str, row[0]) for row in results])
+
         query = (
             db_select(
                 [
@@ -1842,6 +2314,11 @@ def _latest_event_ids_by_partition_subquery(
         """Subquery for locating the latest event ids by partition for a given asset key and set
         of event types.
         """
+        if before_cursor is None and self._has_asset_partition_latest_index():
+            return self._latest_event_ids_by_partition_index_subquery(
+                asset_key, event_types, asset_partitions, after_cursor
+            )
+
         query = db_select(
             [
                 SqlEventLogStorageTable.c.dagster_event_type,
@@ -1876,6 +2353,43 @@ def _latest_event_ids_by_partition_subquery(
             "latest_event_ids_by_partition_subquery",
         )
 
+    def _latest_event_ids_by_partition_index_subquery(
+        self,
+        asset_key: AssetKey,
+        event_types: Sequence[DagsterEventType],
+        asset_partitions: Optional[Sequence[str]] = None,
+        after_cursor: Optional[int] = None,
+    ):
+        """Same as `_latest_event_ids_by_partition_subquery`, read from the asset_partition_latest
+        table. Wiped events are removed from the table, so no wipe filter is needed.
+        """
+        query = db_select(
+            [
+                AssetPartitionLatestTable.c.dagster_event_type,
+                AssetPartitionLatestTable.c.partition,
+                db.func.max(AssetPartitionLatestTable.c.event_id).label("id"),
+            ]
+        ).where(
+            db.and_(
+                AssetPartitionLatestTable.c.asset_key == asset_key.to_string(),
+                AssetPartitionLatestTable.c.dagster_event_type.in_(
+                    [event_type.value for event_type in event_types]
+                ),
+            )
+        )
+        if asset_partitions is not None:
+            query = query.where(AssetPartitionLatestTable.c.partition.in_(asset_partitions))
+        if after_cursor is not None:
+            query = query.where(AssetPartitionLatestTable.c.event_id > after_cursor)
+
+        return db_subquery(
+            query.group_by(
+                AssetPartitionLatestTable.c.dagster_event_type,
+                AssetPartitionLatestTable.c.partition,
+            ),
+            "latest_event_ids_by_partition_subquery",
+        )
+
     def get_latest_storage_id_by_partition(
         self, asset_key: AssetKey, event_type: DagsterEventType
     ) -> Mapping[str, int]:
@@ -2105,11 +2619,14 @@ def add_dynamic_partitions(
                         for partition_key in new_keys
                     ],
                 )
+                self._update_dynamic_partitions_version(
+                    conn, partitions_def_name, num_appended=len(new_keys)
+                )
 
     def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> None:
         self._check_partitions_table()
         with self.index_connection() as conn:
-            conn.execute(
+            result = conn.execute(
                 DynamicPartitionsTable.delete().where(
                     db.and_(
                         DynamicPartitionsTable.c.partitions_def_name == partitions_def_name,
@@ -2117,6 +2634,83 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
                     )
                 )
             )
+            if result.rowcount:
+                self._update_dynamic_partitions_version(
+                    conn, partitions_def_name, num_deleted=result.rowcount
+                )
+
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional[DynamicPartitionsVersion]:
+        check.str_param(partitions_def_name, "partitions_def_name")
+        if not self.has_table(DynamicPartitionsVersionsTable.name):
+            return None
+
+        query = db_select(
+            [
+                DynamicPartitionsVersionsTable.c.append_count,
+                DynamicPartitionsVersionsTable.c.delete_count,
+            ]
+        ).where(DynamicPartitionsVersionsTable.c.partitions_def_name == partitions_def_name)
+        with self.index_connection() as conn:
+            row = conn.execute(query).fetchone()
+            if row is None:
+                # the partition keys of this definition have not changed since the versions table
+                # was created
+                self._initialize_dynamic_partitions_version(conn, partitions_def_name)
+                row = conn.execute(query).fetchone()
+
+        return DynamicPartitionsVersion(
+            append_count=cast(int, row[0]),
+            delete_count=cast(int, row[1]),  # type: ignore
+        )
+
+    def _initialize_dynamic_partitions_version(
+        self, conn: Connection, partitions_def_name: str
+    ) -> None:
+        num_partitions = conn.execute(
+            db_select([db.func.count()])
+            .select_from(DynamicPartitionsTable)
+            .where(DynamicPartitionsTable.c.partitions_def_name == partitions_def_name)
+        ).scalar()
+        try:
+            conn.execute(
+                DynamicPartitionsVersionsTable.insert().values(
+                    partitions_def_name=partitions_def_name,
+                    append_count=num_partitions or 0,
+                    delete_count=0,
+                )
+            )
+        except db_exc.IntegrityError:
+            # initialized concurrently
+            pass
+
+    def _update_dynamic_partitions_version(
+        self,
+        conn: Connection,
+        partitions_def_name: str,
+        num_appended: int = 0,
+        num_deleted: int = 0,
+    ) -> None:
+        """Records partition keys added to or deleted from a dynamic partitions definition. Must be
+        called with the connection that modified its partition keys.
+        """
+        if not self.has_table(DynamicPartitionsVersionsTable.name):
+            return
+
+        # each column is only updated from itself, since MySQL evaluates assignments in order
+        result = conn.execute(
+            DynamicPartitionsVersionsTable.update()
+            .where(DynamicPartitionsVersionsTable.c.partitions_def_name == partitions_def_name)
+            .values(
+                append_count=DynamicPartitionsVersionsTable.c.append_count + num_appended,
+                delete_count=DynamicPartitionsVersionsTable.c.delete_count + num_deleted,
+                update_timestamp=pendulum.now("UTC"),
+            )
+        )
+        if not result.rowcount:
+            # counted from the partition keys after this change
+            self._initialize_dynamic_partitions_version(conn, partitions_def_name)
 
     @property
     def supports_global_concurrency_limits(self) -> bool:
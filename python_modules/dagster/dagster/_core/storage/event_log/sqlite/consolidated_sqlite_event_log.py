@@ -13,7 +13,15 @@
 import dagster._check as check
 from dagster._config import StringSource
 from dagster._core.storage.dagster_run import DagsterRunStatus
+from dagster._core.storage.event_log.archive import (
+    ParquetEventLogArchive,
+    event_log_archive_config_field,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.codec import (
+    check_event_payload_codec,
+    event_payload_codec_config_field,
+)
 from dagster._core.storage.sql import (
     check_alembic_revision,
     create_engine,
@@ -52,8 +60,17 @@ class ConsolidatedSqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     The ``base_dir`` param tells the event log storage where on disk to store the database.
     """
 
-    def __init__(self, base_dir, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir,
+        inst_data: Optional[ConfigurableClassData] = None,
+        event_payload_codec: Optional[str] = None,
+        event_log_archive_uri: Optional[str] = None,
+    ):
         self._base_dir = check.str_param(base_dir, "base_dir")
+        self._event_payload_codec = check_event_payload_codec(event_payload_codec)
+        if event_log_archive_uri:
+            self._event_log_archive = ParquetEventLogArchive(event_log_archive_uri)
         self._conn_string = create_db_conn_string(base_dir, SQLITE_EVENT_LOG_FILENAME)
         self._secondary_index_cache = {}
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
@@ -71,7 +88,11 @@ def inst_data(self):
 
     @classmethod
     def config_type(cls):
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "event_payload_codec": event_payload_codec_config_field(),
+            "event_log_archive_uri": event_log_archive_config_field(),
+        }
 
     @classmethod
     def from_config_value(
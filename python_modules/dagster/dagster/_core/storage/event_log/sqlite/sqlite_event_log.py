@@ -6,14 +6,15 @@
 import sqlite3
 import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, Any, ContextManager, Iterator, Optional, Sequence, Union
 
 import sqlalchemy as db
 import sqlalchemy.exc as db_exc
+from packaging.version import parse
 from sqlalchemy.engine import Connection, Engine
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import QueuePool
 from tqdm import tqdm
 from watchdog.events import FileSystemEvent, PatternMatchingEventHandler
 from watchdog.observers import Observer
@@ -33,17 +34,26 @@
 )
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.dagster_run import DagsterRunStatus, RunsFilter
+from dagster._core.storage.event_log.archive import (
+    ParquetEventLogArchive,
+    event_log_archive_config_field,
+)
 from dagster._core.storage.event_log.base import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster._core.storage.event_log.codec import (
+    check_event_payload_codec,
+    decode_event_payload,
+    event_payload_codec_config_field,
+)
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
-    create_engine,
+    create_storage_engine,
     get_alembic_config,
     run_alembic_upgrade,
     stamp_alembic_rev,
 )
 from dagster._core.storage.sqlalchemy_compat import db_select
-from dagster._core.storage.sqlite import create_db_conn_string
+from dagster._core.storage.sqlite import create_db_conn_string, get_sqlite_version
 from dagster._serdes import (
     ConfigurableClass,
     ConfigurableClassData,
@@ -60,6 +70,25 @@
 INDEX_SHARD_NAME = "index"
 
 
+# The max number of shards whose engines are cached by an event log storage. Each cached engine holds
+# a connection to the database of its shard open.
+MAX_CACHED_SHARD_ENGINES = 16
+
+# The number of seconds that a connection waits for a lock on a database held by another connection
+# (e.g. a write from another process) before failing with "database is locked".
+SQLITE_BUSY_TIMEOUT_SECONDS = 30
+
+# Window functions are used to limit the number of event records fetched per asset key
+MINIMUM_SQLITE_BATCH_VERSION = "3.25.0"
+
+
+def _set_synchronous_normal(dbapi_connection, _connection_record) -> None:
+    # In WAL mode, the databases stay consistent with synchronous=NORMAL, which syncs the write-ahead
+    # log to disk at checkpoints instead of at every commit. Only the last transactions before a
+    # power loss (but not an application crash) may be rolled back.
+    dbapi_connection.execute("PRAGMA synchronous=NORMAL")
+
+
 class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """SQLite-backed event log storage.
 
@@ -82,14 +111,25 @@ class SqliteEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     The ``base_dir`` param tells the event log storage where on disk to store the databases. To
     improve concurrent performance, event logs are stored in a separate SQLite database for each
-    run.
+    run. The optional ``event_payload_codec`` param (``zlib`` or ``zstd``) compresses the payload
+    of newly stored events, and the optional ``event_log_archive_uri`` param sets the directory or
+    object storage URI that the events of old runs are archived to.
     """
 
-    def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        event_payload_codec: Optional[str] = None,
+        event_log_archive_uri: Optional[str] = None,
+    ):
         """Note that idempotent initialization of the SQLite database is done on a per-run_id
         basis in the body of connect, since each run is stored in a separate database.
         """
         self._base_dir = os.path.abspath(check.str_param(base_dir, "base_dir"))
+        self._event_payload_codec = check_event_payload_codec(event_payload_codec)
+        if event_log_archive_uri:
+            self._event_log_archive = ParquetEventLogArchive(event_log_archive_uri)
         mkdir_p(self._base_dir)
 
         self._obs = None
@@ -101,18 +141,23 @@ def __init__(self, base_dir: str, inst_data: Optional[ConfigurableClassData] = N
         # ensuring that the database will be created if it doesn't exist
         self._initialized_dbs = set()
 
-        # Ensure that multiple threads (like the event log watcher) interact safely with each other
-        self._db_lock = threading.Lock()
+        # Engines of the most recently used shards. Their pools are shared by the threads of the
+        # process (like the event log watcher), and concurrent access to a database is handled by
+        # SQLite, whose databases are in WAL mode, so that reads do not block on writes.
+        self._engines: "OrderedDict[str, Engine]" = OrderedDict()
+        self._engines_lock = threading.Lock()
 
         if not os.path.exists(self.path_for_shard(INDEX_SHARD_NAME)):
-            conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
-            engine = create_engine(conn_string, poolclass=NullPool)
-            self._initdb(engine)
+            self._get_engine(INDEX_SHARD_NAME)
             self.reindex_events()
             self.reindex_assets()
 
         super().__init__()
 
+    @property
+    def supports_batch_queries(self) -> bool:
+        return parse(get_sqlite_version()) >= parse(MINIMUM_SQLITE_BATCH_VERSION)
+
     def upgrade(self) -> None:
         all_run_ids = self.get_all_run_ids()
         print(f"Updating event log storage for {len(all_run_ids)} runs on disk...")  # noqa: T201
@@ -126,6 +171,7 @@ def upgrade(self) -> None:
         with self.index_connection() as conn:
             run_alembic_upgrade(alembic_config, conn, "index")
 
+        self._dispose_engines()
         self._initialized_dbs = set()
 
     @property
@@ -134,7 +180,11 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "event_payload_codec": event_payload_codec_config_field(),
+            "event_log_archive_uri": event_log_archive_config_field(),
+        }
 
     @classmethod
     def from_config_value(
@@ -151,8 +201,7 @@ def get_all_run_ids(self) -> Sequence[str]:
         ]
 
     def has_table(self, table_name: str) -> bool:
-        conn_string = self.conn_string_for_shard(INDEX_SHARD_NAME)
-        engine = create_engine(conn_string, poolclass=NullPool)
+        engine = self._get_engine(INDEX_SHARD_NAME)
         with engine.connect() as conn:
             return bool(engine.dialect.has_table(conn, table_name))
 
@@ -205,22 +254,49 @@ def _initdb(self, engine: Engine) -> None:
                     time.sleep(0.2)
                     retry_limit -= 1
 
-    @contextmanager
-    def _connect(self, shard: str) -> Iterator[Connection]:
-        with self._db_lock:
-            check.str_param(shard, "shard")
-
-            conn_string = self.conn_string_for_shard(shard)
-            engine = create_engine(conn_string, poolclass=NullPool)
-
+    def _get_engine(self, shard: str) -> Engine:
+        with self._engines_lock:
+            engine = self._engines.get(shard)
+            if engine is not None:
+                self._engines.move_to_end(shard)
+                return engine
+
+            engine = create_storage_engine(
+                self.conn_string_for_shard(shard),
+                {
+                    "pool_size": 1,
+                    "max_overflow": 16,
+                    "pool_timeout": SQLITE_BUSY_TIMEOUT_SECONDS,
+                    "pool_recycle": -1,
+                    "pool_pre_ping": False,
+                },
+                poolclass=QueuePool,
+                connect_args={"check_same_thread": False, "timeout": SQLITE_BUSY_TIMEOUT_SECONDS},
+            )
+            db.event.listen(engine, "connect", _set_synchronous_normal)
             if shard not in self._initialized_dbs:
                 self._initdb(engine)
                 self._initialized_dbs.add(shard)
 
-            with engine.connect() as conn:
-                with conn.begin():
-                    yield conn
-            engine.dispose()
+            self._engines[shard] = engine
+            if len(self._engines) > MAX_CACHED_SHARD_ENGINES:
+                _, evicted_engine = self._engines.popitem(last=False)
+                # connections checked out of the evicted engine are closed when they are returned
+                evicted_engine.dispose()
+            return engine
+
+    def _dispose_engines(self) -> None:
+        with self._engines_lock:
+            for engine in self._engines.values():
+                engine.dispose()
+            self._engines.clear()
+
+    @contextmanager
+    def _connect(self, shard: str) -> Iterator[Connection]:
+        check.str_param(shard, "shard")
+        with self._get_engine(shard).connect() as conn:
+            with conn.begin():
+                yield conn
 
     def run_connection(self, run_id: Optional[str] = None) -> Any:
         return self._connect(run_id)  # type: ignore  # bad sig
@@ -358,7 +434,7 @@ def _get_run_sharded_event_records(
 
             for row_id, json_str in results:
                 try:
-                    event_record = deserialize_value(json_str, EventLogEntry)
+                    event_record = deserialize_value(decode_event_payload(json_str), EventLogEntry)
                     event_records.append(
                         EventLogRecord(storage_id=row_id, event_log_entry=event_record)
                     )
@@ -424,6 +500,7 @@ def supports_event_consumer_queries(self) -> bool:
         return False
 
     def delete_events(self, run_id: str) -> None:
+        partitions_by_asset_key = self._get_asset_partitions_with_latest_events_for_run(run_id)
         with self.run_connection(run_id) as conn:
             self.delete_events_for_run(conn, run_id)
 
@@ -431,8 +508,15 @@ def delete_events(self, run_id: str) -> None:
         with self.index_connection() as conn:
             self.delete_events_for_run(conn, run_id)
 
+        for asset_key, partitions in partitions_by_asset_key.items():
+            self.rebuild_asset_partition_latest(asset_key, partitions)
+
+        if self.event_log_archive is not None:
+            self.event_log_archive.delete_run(run_id)
+
     def wipe(self) -> None:
         # should delete all the run-sharded db files and drop the contents of the index
+        self._dispose_engines()
         for filename in (
             glob.glob(os.path.join(self._base_dir, "*.db"))
             + glob.glob(os.path.join(self._base_dir, "*.db-wal"))
@@ -485,6 +569,7 @@ def dispose(self) -> None:
         if self._obs:
             self._obs.stop()
             self._obs.join(timeout=15)
+        self._dispose_engines()
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = get_alembic_config(__file__)
@@ -515,8 +600,13 @@ def __init__(
         self._run_id = check.str_param(run_id, "run_id")
         self._cb = check.callable_param(callback, "callback")
         self._log_path = event_log_storage.path_for_shard(run_id)
+        # in WAL mode, new events are written to the write-ahead log of the database until they are
+        # checkpointed
+        self._wal_path = f"{self._log_path}-wal"
         self._cursor = cursor
-        super(SqliteEventLogStorageWatchdog, self).__init__(patterns=[self._log_path], **kwargs)
+        super(SqliteEventLogStorageWatchdog, self).__init__(
+            patterns=[self._log_path, self._wal_path], **kwargs
+        )
 
     def _process_log(self) -> None:
         connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
@@ -539,5 +629,5 @@ def _process_log(self) -> None:
                 self._event_log_storage.end_watch(self._run_id, self._cb)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
+        check.invariant(event.src_path in (self._log_path, self._wal_path))
         self._process_log()
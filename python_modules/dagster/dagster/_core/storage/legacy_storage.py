@@ -40,7 +40,11 @@
 if TYPE_CHECKING:
     from dagster._core.definitions.asset_check_spec import AssetCheckKey
     from dagster._core.definitions.run_request import InstigatorType
-    from dagster._core.event_api import AssetRecordsFilter, RunStatusChangeRecordsFilter
+    from dagster._core.event_api import (
+        AssetRecordsFilter,
+        MultiAssetEventRecordsFilter,
+        RunStatusChangeRecordsFilter,
+    )
     from dagster._core.events import DagsterEvent, DagsterEventType
     from dagster._core.events.log import EventLogEntry
     from dagster._core.execution.backfill import BulkActionStatus, PartitionBackfill
@@ -66,6 +70,7 @@
         RunsFilter,
         TagBucket,
     )
+    from dagster._core.storage.event_log.base import DynamicPartitionsVersion
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
     from dagster._daemon.types import DaemonHeartbeat
 
@@ -218,6 +223,11 @@ def get_run_ids(
     ) -> Iterable[str]:
         return self._storage.run_storage.get_run_ids(filters, cursor=cursor, limit=limit)
 
+    def get_runs_for_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Sequence["DagsterRun"]:
+        return self._storage.run_storage.get_runs_for_run_keys(selector_id, run_keys)
+
     def get_runs_count(self, filters: Optional["RunsFilter"] = None) -> int:
         return self._storage.run_storage.get_runs_count(filters)
 
@@ -459,6 +469,13 @@ def get_event_records(
             ascending,
         )
 
+    def get_event_records_by_asset_key(
+        self,
+        records_filter: "MultiAssetEventRecordsFilter",
+        limit: Optional[int] = None,
+    ) -> Mapping[AssetKey, Sequence[EventLogRecord]]:
+        return self._storage.event_log_storage.get_event_records_by_asset_key(records_filter, limit)
+
     def fetch_materializations(
         self,
         filters: Union[AssetKey, "AssetRecordsFilter"],
@@ -585,6 +602,11 @@ def delete_dynamic_partition(self, partitions_def_name: str, partition_key: str)
             partitions_def_name, partition_key
         )
 
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional["DynamicPartitionsVersion"]:
+        return self._storage.event_log_storage.get_dynamic_partitions_version(partitions_def_name)
+
     def get_event_tags_for_asset(
         self,
         asset_key: "AssetKey",
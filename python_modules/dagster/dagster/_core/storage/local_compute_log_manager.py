@@ -16,7 +16,13 @@
     _check as check,
 )
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.execution.compute_logs import mirror_stream_to_file
+from dagster._core.execution.compute_logs import (
+    COMPUTE_LOG_CAPTURE_MODES,
+    TAIL_CAPTURE_MODE,
+    THREAD_CAPTURE_MODE,
+    mirror_stream_to_file,
+    tee_stream_to_file,
+)
 from dagster._core.storage.dagster_run import DagsterRun
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from dagster._seven import json
@@ -52,18 +58,31 @@
 
 
 class LocalComputeLogManager(CapturedLogManager, ComputeLogManager, ConfigurableClass):
-    """Stores copies of stdout & stderr for each compute step locally on disk."""
+    """Stores copies of stdout & stderr for each compute step locally on disk.
+
+    With the default `tail` capture mode, each captured stream is mirrored to the terminal by a
+    `tail` subprocess. With the `thread` capture mode, captured output is instead drained from a pipe
+    by a single background thread per process, at the cost of losing output that has not yet been
+    drained if the process is hard-killed.
+    """
 
     def __init__(
         self,
         base_dir: str,
         polling_timeout: Optional[float] = None,
         inst_data: Optional[ConfigurableClassData] = None,
+        capture_mode: Optional[str] = None,
     ):
         self._base_dir = base_dir
         self._polling_timeout = check.opt_float_param(
             polling_timeout, "polling_timeout", DEFAULT_WATCHDOG_POLLING_TIMEOUT
         )
+        self._capture_mode = check.opt_str_param(capture_mode, "capture_mode", TAIL_CAPTURE_MODE)
+        check.invariant(
+            self._capture_mode in COMPUTE_LOG_CAPTURE_MODES,
+            f"Unknown compute log capture mode {self._capture_mode}, expected one of"
+            f" {', '.join(COMPUTE_LOG_CAPTURE_MODES)}",
+        )
         self._subscription_manager = LocalComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
@@ -75,11 +94,25 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
     def polling_timeout(self) -> float:
         return self._polling_timeout
 
+    @property
+    def capture_mode(self) -> str:
+        return self._capture_mode
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
         return {
             "base_dir": StringSource,
             "polling_timeout": Field(Float, is_required=False),
+            "capture_mode": Field(
+                StringSource,
+                is_required=False,
+                description=(
+                    "How captured output is mirrored to the terminal, one of"
+                    f" {', '.join(COMPUTE_LOG_CAPTURE_MODES)}. `tail` (the default) starts a tail"
+                    " subprocess per captured stream, `thread` drains the captured streams from a"
+                    " single background thread per process."
+                ),
+            ),
         }
 
     @classmethod
@@ -92,7 +125,12 @@ def from_config_value(
     def capture_logs(self, log_key: Sequence[str]) -> Generator[CapturedLogContext, None, None]:
         outpath = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDOUT])
         errpath = self.get_captured_local_path(log_key, IO_TYPE_EXTENSION[ComputeIOType.STDERR])
-        with mirror_stream_to_file(sys.stdout, outpath), mirror_stream_to_file(sys.stderr, errpath):
+        mirror = (
+            tee_stream_to_file
+            if self._capture_mode == THREAD_CAPTURE_MODE
+            else mirror_stream_to_file
+        )
+        with mirror(sys.stdout, outpath), mirror(sys.stderr, errpath):
             yield CapturedLogContext(log_key)
 
         # leave artifact on filesystem so that we know the capture is completed
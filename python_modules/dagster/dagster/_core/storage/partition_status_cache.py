@@ -1,3 +1,4 @@
+import hashlib
 from enum import Enum
 from typing import TYPE_CHECKING, List, NamedTuple, Optional, Sequence, Set, Tuple
 
@@ -33,7 +34,7 @@
 from dagster._serdes.serdes import deserialize_value
 
 if TYPE_CHECKING:
-    from dagster._core.storage.event_log.base import AssetRecord
+    from dagster._core.storage.event_log.base import AssetRecord, DynamicPartitionsVersion
 
 
 CACHEABLE_PARTITION_TYPES = (
@@ -43,6 +44,10 @@
     DynamicPartitionsDefinition,
 )
 RUN_FETCH_BATCH_SIZE = 100
+PARTITION_KEY_FETCH_BATCH_SIZE = 1000
+
+# prefix of the status cache partitions def id of dynamic partitions definitions with a version
+DYNAMIC_PARTITIONS_DEF_ID_PREFIX = "dynamic_partitions"
 
 
 class AssetPartitionStatus(Enum):
@@ -170,6 +175,112 @@ def deserialize_in_progress_partition_subsets(
         return partitions_def.deserialize_subset(self.serialized_in_progress_partition_subset)
 
 
+def get_partitions_def_status_cache_id(
+    partitions_def: PartitionsDefinition, dynamic_partitions_store: DynamicPartitionsStore
+) -> str:
+    """Returns an identifier for the partitions definition that changes whenever its partition keys
+    change. Unlike `get_serializable_unique_identifier`, the partition keys of a dynamic partitions
+    definition are not read if the store tracks the version of its partition keys.
+    """
+    if isinstance(partitions_def, DynamicPartitionsDefinition) and partitions_def.name:
+        version = dynamic_partitions_store.get_dynamic_partitions_version(
+            partitions_def_name=partitions_def.name
+        )
+        if version is not None:
+            return (
+                f"{DYNAMIC_PARTITIONS_DEF_ID_PREFIX}:{version.append_count}:{version.delete_count}:"
+                f"{partitions_def.name}"
+            )
+    elif isinstance(partitions_def, MultiPartitionsDefinition):
+        return hashlib.sha1(
+            str(
+                {
+                    dim_def.name: get_partitions_def_status_cache_id(
+                        dim_def.partitions_def, dynamic_partitions_store
+                    )
+                    for dim_def in partitions_def.partitions_defs
+                }
+            ).encode("utf-8")
+        ).hexdigest()
+
+    return partitions_def.get_serializable_unique_identifier(
+        dynamic_partitions_store=dynamic_partitions_store
+    )
+
+
+def _parse_dynamic_partitions_def_id(
+    partitions_def_id: Optional[str],
+) -> Optional[Tuple[str, "DynamicPartitionsVersion"]]:
+    from dagster._core.storage.event_log.base import DynamicPartitionsVersion
+
+    parts = partitions_def_id.split(":", 3) if partitions_def_id else []
+    if len(parts) != 4 or parts[0] != DYNAMIC_PARTITIONS_DEF_ID_PREFIX:
+        return None
+    try:
+        return parts[3], DynamicPartitionsVersion(
+            append_count=int(parts[1]), delete_count=int(parts[2])
+        )
+    except ValueError:
+        return None
+
+
+def get_appended_dynamic_partition_keys(
+    partitions_def: PartitionsDefinition,
+    stored_partitions_def_id: Optional[str],
+    partitions_def_id: str,
+    dynamic_partitions_store: DynamicPartitionsStore,
+) -> Optional[Sequence[str]]:
+    """If the partitions definition is a dynamic partitions definition whose partition keys were
+    only appended to since the stored partitions def id was computed, returns the appended keys.
+    Otherwise returns None.
+    """
+    if not isinstance(partitions_def, DynamicPartitionsDefinition) or not partitions_def.name:
+        return None
+
+    stored = _parse_dynamic_partitions_def_id(stored_partitions_def_id)
+    current = _parse_dynamic_partitions_def_id(partitions_def_id)
+    if not stored or not current or stored[0] != current[0]:
+        return None
+
+    (_, stored_version), (_, current_version) = stored, current
+    if (
+        current_version.delete_count != stored_version.delete_count
+        or current_version.append_count < stored_version.append_count
+    ):
+        return None
+
+    # partition keys are returned in the order they were added
+    partition_keys = partitions_def.get_partition_keys(
+        dynamic_partitions_store=dynamic_partitions_store
+    )
+    if len(partition_keys) != current_version.num_partitions:
+        # changed since the version was read
+        return None
+    return partition_keys[stored_version.num_partitions :]
+
+
+def _get_materialized_partitions_before(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partition_keys: Sequence[str],
+    before_storage_id: int,
+) -> Set[str]:
+    materialized_partitions: Set[str] = set()
+    for i in range(0, len(partition_keys), PARTITION_KEY_FETCH_BATCH_SIZE):
+        records = instance.get_event_records(
+            EventRecordsFilter(
+                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                asset_key=asset_key,
+                asset_partitions=list(partition_keys[i : i + PARTITION_KEY_FETCH_BATCH_SIZE]),
+                before_cursor=before_storage_id,
+            )
+        )
+        materialized_partitions.update(
+            record.partition_key for record in records if record.partition_key
+        )
+    return materialized_partitions
+
+
 def get_materialized_multipartitions(
     instance: DagsterInstance, asset_key: AssetKey, partitions_def: MultiPartitionsDefinition
 ) -> Sequence[str]:
@@ -202,6 +313,9 @@ def get_validated_partition_keys(
     partitions_def: PartitionsDefinition,
     partition_keys: Set[str],
 ):
+    if not partition_keys:
+        return set()
+
     if isinstance(partitions_def, (DynamicPartitionsDefinition, StaticPartitionsDefinition)):
         validated_partitions = (
             set(
@@ -243,9 +357,15 @@ def _build_status_cache(
     dynamic_partitions_store: DynamicPartitionsStore,
     stored_cache_value: Optional[AssetStatusCacheValue] = None,
     last_materialization_storage_id: Optional[int] = None,
+    partitions_def_id: Optional[str] = None,
+    appended_partition_keys: Optional[Sequence[str]] = None,
 ) -> Optional[AssetStatusCacheValue]:
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
+
+    If partition keys were appended to a dynamic partitions definition since the stored cache value
+    was computed, the materializations of the appended keys that were stored before they were
+    added are included in the updated cache value.
     """
     latest_storage_id = max(
         last_materialization_storage_id if last_materialization_storage_id else 0,
@@ -290,6 +410,15 @@ def _build_status_cache(
                 ),
             )
         )
+        if appended_partition_keys:
+            materialized_subset = materialized_subset.with_partition_keys(
+                _get_materialized_partitions_before(
+                    instance,
+                    asset_key,
+                    appended_partition_keys,
+                    before_storage_id=stored_cache_value.latest_storage_id + 1,
+                )
+            )
     else:
         materialized_subset = partitions_def.empty_subset().with_partition_keys(
             get_validated_partition_keys(
@@ -314,9 +443,8 @@ def _build_status_cache(
 
     return AssetStatusCacheValue(
         latest_storage_id=latest_storage_id,
-        partitions_def_id=partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
-        ),
+        partitions_def_id=partitions_def_id
+        or get_partitions_def_status_cache_id(partitions_def, dynamic_partitions_store),
         serialized_materialized_partition_subset=materialized_subset.serialize(),
         serialized_failed_partition_subset=failed_subset.serialize(),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
@@ -411,14 +539,27 @@ def get_and_update_asset_status_cache_value(
         latest_materialization_storage_id = asset_record.asset_entry.last_materialization_storage_id
 
     dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    partitions_def_id = (
+        get_partitions_def_status_cache_id(partitions_def, dynamic_partitions_store)
+        if partitions_def and is_cacheable_partition_type(partitions_def)
+        else None
+    )
     use_cached_value = (
         stored_cache_value
-        and partitions_def
-        and stored_cache_value.partitions_def_id
-        == partitions_def.get_serializable_unique_identifier(
-            dynamic_partitions_store=dynamic_partitions_store
-        )
+        and partitions_def_id
+        and stored_cache_value.partitions_def_id == partitions_def_id
     )
+    appended_partition_keys = None
+    if stored_cache_value and partitions_def and partitions_def_id and not use_cached_value:
+        # keep the cached value if partition keys were only appended to the partitions definition
+        appended_partition_keys = get_appended_dynamic_partition_keys(
+            partitions_def,
+            stored_cache_value.partitions_def_id,
+            partitions_def_id,
+            dynamic_partitions_store,
+        )
+        use_cached_value = appended_partition_keys is not None
+
     updated_cache_value = _build_status_cache(
         instance=instance,
         asset_key=asset_key,
@@ -426,6 +567,8 @@ def get_and_update_asset_status_cache_value(
         dynamic_partitions_store=dynamic_partitions_store,
         stored_cache_value=stored_cache_value if use_cached_value else None,
         last_materialization_storage_id=latest_materialization_storage_id,
+        partitions_def_id=partitions_def_id,
+        appended_partition_keys=appended_partition_keys,
     )
     if updated_cache_value is not None and updated_cache_value != stored_cache_value:
         instance.update_asset_cached_status_data(asset_key, updated_cache_value)
@@ -16,6 +16,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.tags import RUN_KEY_TAG
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -106,6 +107,31 @@ def get_run_ids(
             Sequence[str]
         """
 
+    def get_runs_for_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Sequence[DagsterRun]:
+        """Return the runs launched by the schedule or sensor with the given selector id for any of
+        the given run keys, used to deduplicate run requests.
+
+        Runs without an origin are not matched, since the schedule or sensor that launched them
+        cannot be determined.
+
+        Args:
+            selector_id (str): The selector id of the schedule or sensor.
+            run_keys (Sequence[str]): The run keys to look up.
+
+        Returns:
+            Sequence[DagsterRun]
+        """
+        runs = []
+        for run_key in run_keys:
+            runs.extend(
+                run
+                for run in self.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
+                if run.instigator_selector_id == selector_id
+            )
+        return runs
+
     @abstractmethod
     def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         """Return the number of runs present in the storage that match the given filters.
@@ -76,6 +76,23 @@
     db.Column("value", db.Text),
 )
 
+# Index of the run keys of the runs launched by schedules and sensors, used to deduplicate run
+# requests. `selector_id` is the selector id of the launching schedule or sensor.
+RunKeysTable = db.Table(
+    "run_keys",
+    RunStorageSqlMetadata,
+    db.Column(
+        "id",
+        db.BigInteger().with_variant(sqlite.INTEGER(), "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    ),
+    db.Column("run_id", None, db.ForeignKey("runs.run_id", ondelete="CASCADE"), unique=True),
+    db.Column("selector_id", db.String(255), nullable=False),
+    db.Column("run_key", db.Text, nullable=False),
+    db.Column("create_timestamp", db.DateTime, server_default=get_current_timestamp()),
+)
+
 SnapshotsTable = db.Table(
     "snapshots",
     RunStorageSqlMetadata,
@@ -148,6 +165,12 @@
 )
 
 db.Index("idx_run_tags", RunTagsTable.c.key, RunTagsTable.c.value, mysql_length=64)
+db.Index(
+    "idx_run_keys",
+    RunKeysTable.c.selector_id,
+    RunKeysTable.c.run_key,
+    mysql_length={"selector_id": 64, "run_key": 255},
+)
 db.Index("idx_run_partitions", RunsTable.c.partition_set, RunsTable.c.partition, mysql_length=64)
 db.Index(
     "idx_runs_by_job",
@@ -54,6 +54,7 @@
     PARTITION_SET_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import (
@@ -77,14 +78,17 @@
 from .migration import (
     OPTIONAL_DATA_MIGRATIONS,
     REQUIRED_DATA_MIGRATIONS,
+    RUN_KEYS,
     RUN_PARTITIONS,
     MigrationFn,
+    write_run_key,
 )
 from .schema import (
     BulkActionsTable,
     DaemonHeartbeatsTable,
     InstanceInfo,
     KeyValueStoreTable,
+    RunKeysTable,
     RunsTable,
     RunTagsTable,
     SecondaryIndexMigrationTable,
@@ -158,6 +162,9 @@ def add_run(self, dagster_run: DagsterRun) -> DagsterRun:
                     ],
                 )
 
+            if dagster_run.tags.get(RUN_KEY_TAG) and self._has_run_keys_table(conn):
+                write_run_key(conn, dagster_run)
+
         return dagster_run
 
     def handle_run_event(self, run_id: str, event: DagsterEvent) -> None:
@@ -359,6 +366,28 @@ def get_runs_count(self, filters: Optional[RunsFilter] = None) -> int:
         count = row["count"] if row else 0
         return count
 
+    def get_runs_for_run_keys(
+        self, selector_id: str, run_keys: Sequence[str]
+    ) -> Sequence[DagsterRun]:
+        check.str_param(selector_id, "selector_id")
+        check.sequence_param(run_keys, "run_keys", of_type=str)
+
+        if not run_keys:
+            return []
+
+        if not self.has_built_index(RUN_KEYS):
+            return super().get_runs_for_run_keys(selector_id, run_keys)
+
+        query = (
+            db_select([RunsTable.c.run_body, RunsTable.c.status])
+            .select_from(RunsTable.join(RunKeysTable, RunsTable.c.run_id == RunKeysTable.c.run_id))
+            .where(RunKeysTable.c.selector_id == selector_id)
+            .where(RunKeysTable.c.run_key.in_(run_keys))
+            .order_by(RunsTable.c.id.desc())
+        )
+        rows = self.fetchall(query)
+        return self._rows_to_runs(rows)
+
     def _get_run_by_id(self, run_id: str) -> Optional[DagsterRun]:
         check.str_param(run_id, "run_id")
 
@@ -535,6 +564,8 @@ def delete_run(self, run_id: str) -> None:
         check.str_param(run_id, "run_id")
         query = db.delete(RunsTable).where(RunsTable.c.run_id == run_id)
         with self.connect() as conn:
+            if self._has_run_keys_table(conn):
+                conn.execute(db.delete(RunKeysTable).where(RunKeysTable.c.run_id == run_id))
             conn.execute(query)
 
     def has_job_snapshot(self, job_snapshot_id: str) -> bool:
@@ -759,6 +790,9 @@ def has_run_stats_index_cols(self) -> bool:
             column_names = [x.get("name") for x in db.inspect(conn).get_columns(RunsTable.name)]
             return "start_time" in column_names and "end_time" in column_names
 
+    def _has_run_keys_table(self, conn: Connection) -> bool:
+        return RunKeysTable.name in db.inspect(conn).get_table_names()
+
     def has_bulk_actions_selector_cols(self) -> bool:
         with self.connect() as conn:
             column_names = [
@@ -802,6 +836,8 @@ def wipe(self) -> None:
         """Clears the run storage."""
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
+            if self._has_run_keys_table(conn):
+                conn.execute(RunKeysTable.delete())
             conn.execute(RunsTable.delete())
             conn.execute(RunTagsTable.delete())
             conn.execute(SnapshotsTable.delete())
@@ -900,6 +936,7 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
     # Migrating run history
     def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) -> None:
         new_label = job_origin.external_repository_origin.get_label()
+        new_selector_id = run.with_job_origin(job_origin).instigator_selector_id
         with self.connect() as conn:
             conn.execute(
                 RunsTable.update()
@@ -914,6 +951,12 @@ def replace_job_origin(self, run: DagsterRun, job_origin: ExternalJobOrigin) ->
                 .where(RunTagsTable.c.key == REPOSITORY_LABEL_TAG)
                 .values(value=new_label)
             )
+            if new_selector_id and self._has_run_keys_table(conn):
+                conn.execute(
+                    RunKeysTable.update()
+                    .where(RunKeysTable.c.run_id == run.run_id)
+                    .values(selector_id=new_selector_id)
+                )
 
 
 GET_PIPELINE_SNAPSHOT_QUERY_ID = "get-pipeline-snapshot"
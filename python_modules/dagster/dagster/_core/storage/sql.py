@@ -1,8 +1,11 @@
+import os
 import threading
 from functools import lru_cache
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Mapping, Optional, Tuple, Union
 
 import sqlalchemy as db
+import sqlalchemy.exc as db_exc
+import sqlalchemy.pool as db_pool
 from alembic.command import downgrade, stamp, upgrade
 from alembic.config import Config
 from alembic.runtime.environment import EnvironmentContext
@@ -17,6 +20,63 @@
 create_engine = db.create_engine  # exported
 
 
+def create_storage_engine(
+    url: str, pool_config: Optional[Mapping[str, Any]] = None, **kwargs: Any
+) -> db.engine.Engine:
+    """Creates the engine of a SQL storage. Without pool config, a connection is opened for each
+    use of the engine, so that no connections are held open per DagsterInstance. With pool config
+    (see :py:func:`~dagster._core.storage.config.sql_pool_config`), connections are held open in a
+    pool, which is safe to use from a forked process.
+    """
+    if pool_config is None:
+        return create_engine(url, poolclass=db_pool.NullPool, **kwargs)
+
+    engine = create_engine(
+        url,
+        pool_size=pool_config["pool_size"],
+        max_overflow=pool_config["max_overflow"],
+        pool_timeout=pool_config["pool_timeout"],
+        pool_recycle=pool_config["pool_recycle"],
+        pool_pre_ping=pool_config["pool_pre_ping"],
+        **kwargs,
+    )
+    _discard_connections_across_forks(engine)
+    return engine
+
+
+def webserver_pool_config(pool_recycle: int) -> Mapping[str, Any]:
+    """The pool of SQL storages in dagster-webserver when no pool is configured, which holds a
+    single connection open.
+    """
+    return {
+        "pool_size": 1,
+        "max_overflow": 10,
+        "pool_timeout": 30,
+        "pool_recycle": pool_recycle,
+        "pool_pre_ping": False,
+    }
+
+
+def _discard_connections_across_forks(engine: db.engine.Engine) -> None:
+    # A forked process (e.g. a run worker started with multiprocessing) inherits the pooled
+    # connections of its parent, whose sockets must not be shared between the two processes.
+    # Connections checked out in a process other than the one that opened them are discarded
+    # without being closed, and replaced by new ones.
+    @db.event.listens_for(engine, "connect")
+    def _connect(_dbapi_connection, connection_record):
+        connection_record.info["pid"] = os.getpid()
+
+    @db.event.listens_for(engine, "checkout")
+    def _checkout(_dbapi_connection, connection_record, connection_proxy):
+        pid = os.getpid()
+        if connection_record.info["pid"] != pid:
+            connection_record.dbapi_connection = connection_proxy.dbapi_connection = None
+            raise db_exc.DisconnectionError(
+                f"Connection record belongs to pid {connection_record.info['pid']}, attempting to"
+                f" check out in pid {pid}"
+            )
+
+
 ALEMBIC_SCRIPTS_LOCATION = "dagster:_core/storage/alembic"
 
 # Stand-in for a typed query object, which is only available in sqlalchemy 2+
@@ -1,6 +1,7 @@
 import logging
 import sys
 import threading
+import uuid
 from collections import defaultdict
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import AbstractContextManager
@@ -8,8 +9,8 @@
 from typing import (
     TYPE_CHECKING,
     Dict,
+    Iterable,
     Iterator,
-    List,
     Mapping,
     NamedTuple,
     Optional,
@@ -24,6 +25,7 @@
 
 import dagster._check as check
 import dagster._seven as seven
+from dagster._core.definitions.events import AssetKey
 from dagster._core.definitions.run_request import (
     AddDynamicPartitionsRequest,
     DagsterRunReaction,
@@ -51,8 +53,8 @@
     TickData,
     TickStatus,
 )
-from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus, RunsFilter
-from dagster._core.storage.tags import RUN_KEY_TAG, SENSOR_NAME_TAG
+from dagster._core.storage.dagster_run import DagsterRun, DagsterRunStatus
+from dagster._core.storage.tags import RUN_KEY_TAG
 from dagster._core.telemetry import SENSOR_RUN_CREATED, hash_name, log_action
 from dagster._core.workspace.context import IWorkspaceProcessContext
 from dagster._scheduler.stale import resolve_stale_or_missing_assets
@@ -262,6 +264,7 @@ def execute_sensor_iteration_loop(
     """
     sensor_state_lock = threading.Lock()
     sensor_tick_futures: Dict[str, Future] = {}
+    last_dispatched_asset_event_ids: Dict[str, int] = {}
     last_verbose_time = None
     while True:
         start_time = pendulum.now("UTC").timestamp()
@@ -281,6 +284,7 @@ def execute_sensor_iteration_loop(
             sensor_tick_futures=sensor_tick_futures,
             sensor_state_lock=sensor_state_lock,
             log_verbose_checks=verbose_logs_iteration,
+            last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
         )
         # Yield to check for heartbeats in case there were no yields within
         # execute_sensor_iteration
@@ -307,12 +311,18 @@ def execute_sensor_iteration(
     sensor_state_lock: Optional[threading.Lock] = None,
     log_verbose_checks: bool = True,
     debug_crash_flags: Optional[DebugCrashFlags] = None,
+    last_dispatched_asset_event_ids: Optional[Dict[str, int]] = None,
 ):
     instance = workspace_process_context.instance
 
     if not sensor_state_lock:
         sensor_state_lock = threading.Lock()
 
+    if last_dispatched_asset_event_ids is None:
+        last_dispatched_asset_event_ids = {}
+
+    trigger_on_asset_events = instance.get_sensor_settings().get("trigger_on_asset_events", False)
+
     workspace_snapshot = {
         location_entry.origin.location_name: location_entry
         for location_entry in workspace_process_context.create_request_context()
@@ -327,6 +337,10 @@ def execute_sensor_iteration(
 
     tick_retention_settings = instance.get_tick_retention_settings(InstigatorType.SENSOR)
 
+    # identifies the sensor evaluations in this iteration to the code servers, which share the run
+    # status change records fetched for one run status sensor with the others in the same iteration
+    evaluation_batch_id = str(uuid.uuid4())
+
     sensors: Dict[str, ExternalSensor] = {}
     for location_entry in workspace_snapshot.values():
         code_location = location_entry.code_location
@@ -386,12 +400,20 @@ def execute_sensor_iteration(
                     "Status tab.",
                 )
 
+    # forget stopped sensors, so that they are evaluated as soon as they are started again
+    for selector_id in set(last_dispatched_asset_event_ids) - set(sensors):
+        del last_dispatched_asset_event_ids[selector_id]
+
     if not sensors:
         if log_verbose_checks:
             logger.debug("Not checking for any runs since no sensors have been started.")
         yield
         return
 
+    latest_asset_event_ids = (
+        _get_latest_asset_event_ids(instance, sensors.values()) if trigger_on_asset_events else {}
+    )
+
     for external_sensor in sensors.values():
         sensor_name = external_sensor.name
         sensor_debug_crash_flags = debug_crash_flags.get(sensor_name) if debug_crash_flags else None
@@ -412,6 +434,25 @@ def execute_sensor_iteration(
         elif is_under_min_interval(sensor_state, external_sensor):
             continue
 
+        monitored_asset_keys = (
+            _get_monitored_asset_keys(external_sensor) if trigger_on_asset_events else None
+        )
+        latest_asset_event_id = None
+        if monitored_asset_keys is not None:
+            latest_asset_event_id = max(
+                [latest_asset_event_ids.get(asset_key, -1) for asset_key in monitored_asset_keys],
+                default=-1,
+            )
+            last_dispatched_asset_event_id = last_dispatched_asset_event_ids.get(
+                external_sensor.selector_id
+            )
+            if (
+                last_dispatched_asset_event_id is not None
+                and latest_asset_event_id <= last_dispatched_asset_event_id
+            ):
+                # no new materializations of the monitored assets since the last evaluation
+                continue
+
         if threadpool_executor:
             if sensor_tick_futures is None:
                 check.failed("sensor_tick_futures dict must be passed with threadpool_executor")
@@ -423,6 +464,9 @@ def execute_sensor_iteration(
             ):
                 continue
 
+            if latest_asset_event_id is not None:
+                last_dispatched_asset_event_ids[external_sensor.selector_id] = latest_asset_event_id
+
             future = threadpool_executor.submit(
                 _process_tick,
                 workspace_process_context,
@@ -433,11 +477,15 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor,
+                evaluation_batch_id,
             )
             sensor_tick_futures[external_sensor.selector_id] = future
             yield
 
         else:
+            if latest_asset_event_id is not None:
+                last_dispatched_asset_event_ids[external_sensor.selector_id] = latest_asset_event_id
+
             # evaluate the sensors in a loop, synchronously, yielding to allow the sensor daemon to
             # heartbeat
             yield from _process_tick_generator(
@@ -449,9 +497,41 @@ def execute_sensor_iteration(
                 sensor_debug_crash_flags,
                 tick_retention_settings,
                 submit_threadpool_executor=None,
+                evaluation_batch_id=evaluation_batch_id,
             )
 
 
+def _get_monitored_asset_keys(external_sensor: ExternalSensor) -> Optional[Sequence[AssetKey]]:
+    """Returns the asset keys monitored by an asset sensor or multi-asset sensor, or None if the
+    sensor can't be triggered by asset events.
+    """
+    if external_sensor.sensor_type not in (SensorType.ASSET, SensorType.MULTI_ASSET):
+        return None
+
+    return external_sensor.metadata.asset_keys if external_sensor.metadata else None
+
+
+def _get_latest_asset_event_ids(
+    instance: DagsterInstance, external_sensors: Iterable[ExternalSensor]
+) -> Mapping[AssetKey, int]:
+    """Fetches the storage id of the latest materialization of each asset monitored by the given
+    sensors, in a single query.
+    """
+    monitored_asset_keys = {
+        asset_key
+        for external_sensor in external_sensors
+        for asset_key in (_get_monitored_asset_keys(external_sensor) or [])
+    }
+    if not monitored_asset_keys:
+        return {}
+
+    return {
+        asset_record.asset_entry.asset_key: asset_record.asset_entry.last_materialization_storage_id
+        for asset_record in instance.get_asset_records(list(monitored_asset_keys))
+        if asset_record.asset_entry.last_materialization_storage_id is not None
+    }
+
+
 def _process_tick(
     workspace_process_context: IWorkspaceProcessContext,
     logger: logging.Logger,
@@ -461,6 +541,7 @@ def _process_tick(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    evaluation_batch_id: Optional[str] = None,
 ):
     # evaluate the tick immediately, but from within a thread.  The main thread should be able to
     # heartbeat to keep the daemon alive
@@ -474,6 +555,7 @@ def _process_tick(
             sensor_debug_crash_flags,
             tick_retention_settings,
             submit_threadpool_executor,
+            evaluation_batch_id,
         )
     )
 
@@ -487,6 +569,7 @@ def _process_tick_generator(
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags],
     tick_retention_settings,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
+    evaluation_batch_id: Optional[str] = None,
 ):
     instance = workspace_process_context.instance
     error_info = None
@@ -533,6 +616,7 @@ def _process_tick_generator(
                 sensor_state,
                 submit_threadpool_executor,
                 sensor_debug_crash_flags,
+                evaluation_batch_id,
             )
 
     except Exception:
@@ -652,6 +736,7 @@ def _evaluate_sensor(
     state: InstigatorState,
     submit_threadpool_executor: Optional[ThreadPoolExecutor],
     sensor_debug_crash_flags: Optional[SingleInstigatorDebugCrashFlags] = None,
+    evaluation_batch_id: Optional[str] = None,
 ):
     instance = workspace_process_context.instance
     context.logger.info(f"Checking for new runs for sensor: {external_sensor.name}")
@@ -668,6 +753,7 @@ def _evaluate_sensor(
         instigator_data.cursor if instigator_data else None,
         context.log_key,
         instigator_data.last_sensor_start_timestamp if instigator_data else None,
+        evaluation_batch_id=evaluation_batch_id,
     )
 
     yield
@@ -951,34 +1037,9 @@ def _fetch_existing_runs(
     if not run_keys:
         return {}
 
-    # fetch runs from the DB with only the run key tag
-    # note: while possible to filter more at DB level with tags - it is avoided here due to observed
-    # perf problems
-    runs_with_run_keys = []
-    for run_key in run_keys:
-        # do serial fetching, which has better perf than a single query with an IN clause, due to
-        # how the query planner does the runs/run_tags join
-        runs_with_run_keys.extend(
-            instance.get_runs(filters=RunsFilter(tags={RUN_KEY_TAG: run_key}))
-        )
-
-    # filter down to runs with run_key that match the sensor name and its namespace (repository)
-    valid_runs: List[DagsterRun] = []
-    for run in runs_with_run_keys:
-        # if the run doesn't have a set origin, just match on sensor name
-        if (
-            run.external_job_origin is None
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
-        # otherwise prevent the same named sensor across repos from effecting each other
-        elif (
-            run.external_job_origin is not None
-            and run.external_job_origin.external_repository_origin.get_selector_id()
-            == external_sensor.get_external_origin().external_repository_origin.get_selector_id()
-            and run.tags.get(SENSOR_NAME_TAG) == external_sensor.name
-        ):
-            valid_runs.append(run)
+    # fetch the runs launched by this sensor for any of the run keys in a single query, using the
+    # run key index
+    valid_runs = instance.get_runs_for_run_keys(external_sensor.selector_id, run_keys)
 
     existing_runs = {}
     for run in valid_runs:
@@ -0,0 +1,197 @@
+import threading
+from contextlib import ExitStack
+from typing import AbstractSet, Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+import pendulum
+
+import dagster._check as check
+from dagster._core.definitions.resource_definition import ResourceDefinition
+from dagster._core.definitions.run_status_sensor_definition import (
+    RunStatusChangeRecord,
+    RunStatusSensorCursor,
+    fetch_run_status_change_records,
+)
+from dagster._core.events import DagsterEventType
+from dagster._core.instance import DagsterInstance, InstanceRef
+from dagster._serdes import serialize_value
+
+# the number of run status change records fetched at a time on behalf of all the run status sensors
+# in an evaluation batch, so that sensors with slightly different cursors can share them
+RUN_STATUS_CHANGE_WINDOW_SIZE = 25
+
+
+class _RunStatusChangeWindow(NamedTuple):
+    evaluation_batch_id: str
+    instance: DagsterInstance
+    after_cursor: RunStatusSensorCursor
+    records: Sequence[RunStatusChangeRecord]
+    limit: int
+
+    def get_records_after(
+        self,
+        evaluation_batch_id: str,
+        instance: DagsterInstance,
+        cursor: RunStatusSensorCursor,
+        limit: int,
+    ) -> Optional[Sequence[RunStatusChangeRecord]]:
+        """Returns the records after the cursor, or None if they can't be served from this window."""
+        if (
+            evaluation_batch_id != self.evaluation_batch_id
+            or instance is not self.instance
+            or cursor.record_id < self.after_cursor.record_id
+            or pendulum.parse(cursor.update_timestamp)
+            < pendulum.parse(self.after_cursor.update_timestamp)
+        ):
+            return None
+
+        records = [
+            record for record in self.records if record.event_record.storage_id > cursor.record_id
+        ][:limit]
+        # if the window was truncated, it might not contain all the records the sensor needs
+        if len(records) < limit and len(self.records) >= self.limit:
+            return None
+
+        return records
+
+
+class EvaluationCache:
+    """Instances and resources that a code server reuses across sensor and schedule evaluations,
+    rather than constructing them for each evaluation.
+
+    Instances are cached by their InstanceRef. When `reuse_sensor_resources` is set, the resources
+    required by a sensor are initialized the first time a sensor requiring the same set of resources
+    is evaluated, and are shared by all subsequent evaluations of sensors in the same repository
+    requiring that set. Cached instances and resources are torn down when the cache is closed, on
+    server shutdown.
+
+    Run status change records are fetched once per event type for all the run status sensors
+    evaluated in the same evaluation batch (i.e. sensor daemon iteration), rather than by each
+    sensor.
+    """
+
+    def __init__(self, reuse_sensor_resources: bool = False):
+        self._reuse_sensor_resources = check.bool_param(
+            reuse_sensor_resources, "reuse_sensor_resources"
+        )
+        self._lock = threading.Lock()
+        self._exit_stack = ExitStack()
+        self._instances: Dict[str, DagsterInstance] = {}
+        self._resources: Dict[Tuple[str, AbstractSet[str]], Mapping[str, Any]] = {}
+        self._run_status_change_lock = threading.Lock()
+        self._run_status_change_windows: Dict[DagsterEventType, _RunStatusChangeWindow] = {}
+        self._metrics = {
+            "instances_constructed": 0,
+            "instance_cache_hits": 0,
+            "resources_constructed": 0,
+            "resource_cache_hits": 0,
+            "run_status_change_fetches": 0,
+            "run_status_change_cache_hits": 0,
+        }
+
+    @property
+    def reuse_sensor_resources(self) -> bool:
+        return self._reuse_sensor_resources
+
+    def get_metrics(self) -> Mapping[str, int]:
+        with self._lock:
+            return dict(self._metrics)
+
+    def get_instance(self, instance_ref: InstanceRef) -> DagsterInstance:
+        check.inst_param(instance_ref, "instance_ref", InstanceRef)
+        key = serialize_value(instance_ref)
+        with self._lock:
+            instance = self._instances.get(key)
+            if instance:
+                self._metrics["instance_cache_hits"] += 1
+                return instance
+
+            instance = self._exit_stack.enter_context(DagsterInstance.from_ref(instance_ref))
+            self._instances[key] = instance
+            self._metrics["instances_constructed"] += 1
+            return instance
+
+    def get_sensor_resource_defs(
+        self,
+        repository_name: str,
+        resource_defs: Mapping[str, ResourceDefinition],
+        instance: Optional[DagsterInstance],
+    ) -> Mapping[str, ResourceDefinition]:
+        """Returns the resource definitions to evaluate a sensor with. If resources are reused,
+        these return the long-lived resources initialized on first use rather than initializing
+        new resources.
+        """
+        from dagster._core.execution.build_resources import build_resources
+
+        if not self._reuse_sensor_resources or not resource_defs:
+            return resource_defs
+
+        key = (repository_name, frozenset(resource_defs.keys()))
+        with self._lock:
+            resources = self._resources.get(key)
+            if resources is not None:
+                self._metrics["resource_cache_hits"] += 1
+            else:
+                with ExitStack() as stack:
+                    built = stack.enter_context(
+                        build_resources(resources=resource_defs, instance=instance)
+                    )
+                    resources = dict(built.original_resource_dict)
+                    # keep the resources initialized until the cache is closed
+                    self._exit_stack.push(stack.pop_all())
+                self._resources[key] = resources
+                self._metrics["resources_constructed"] += len(resources)
+
+        return {
+            resource_key: ResourceDefinition.hardcoded_resource(resource)
+            for resource_key, resource in resources.items()
+        }
+
+    def get_run_status_change_records(
+        self,
+        evaluation_batch_id: str,
+        instance: DagsterInstance,
+        event_type: DagsterEventType,
+        cursor: RunStatusSensorCursor,
+        limit: int,
+    ) -> Sequence[RunStatusChangeRecord]:
+        """Returns the run status change records after the cursor, served from the records already
+        fetched for another run status sensor in the same evaluation batch when possible.
+        """
+        check.str_param(evaluation_batch_id, "evaluation_batch_id")
+        check.inst_param(event_type, "event_type", DagsterEventType)
+        check.inst_param(cursor, "cursor", RunStatusSensorCursor)
+        check.int_param(limit, "limit")
+
+        # hold the lock while fetching, so that concurrent evaluations wait for the shared records
+        # instead of fetching them again
+        with self._run_status_change_lock:
+            window = self._run_status_change_windows.get(event_type)
+            records = (
+                window.get_records_after(evaluation_batch_id, instance, cursor, limit)
+                if window
+                else None
+            )
+            if records is not None:
+                with self._lock:
+                    self._metrics["run_status_change_cache_hits"] += 1
+                return records
+
+            window_limit = max(limit, RUN_STATUS_CHANGE_WINDOW_SIZE)
+            self._run_status_change_windows[event_type] = _RunStatusChangeWindow(
+                evaluation_batch_id=evaluation_batch_id,
+                instance=instance,
+                after_cursor=cursor,
+                records=fetch_run_status_change_records(instance, event_type, cursor, window_limit),
+                limit=window_limit,
+            )
+            with self._lock:
+                self._metrics["run_status_change_fetches"] += 1
+            return self._run_status_change_windows[event_type].records[:limit]
+
+    def close(self) -> None:
+        with self._run_status_change_lock:
+            self._run_status_change_windows = {}
+        with self._lock:
+            self._instances = {}
+            self._resources = {}
+            self._exit_stack.close()
@@ -1,5 +1,6 @@
 """Workhorse functions for individual API requests."""
 
+import functools
 import os
 import sys
 from contextlib import contextmanager
@@ -61,6 +62,7 @@
     snapshot_from_execution_plan,
 )
 from dagster._core.storage.dagster_run import DagsterRun
+from dagster._grpc.evaluation_cache import EvaluationCache
 from dagster._grpc.types import ExecutionPlanSnapshotArgs
 from dagster._serdes import deserialize_value
 from dagster._serdes.ipc import IPCErrorMessage
@@ -301,6 +303,7 @@ def get_external_schedule_execution(
     scheduled_execution_timestamp: Optional[float],
     scheduled_execution_timezone: Optional[str],
     log_key: Optional[Sequence[str]],
+    evaluation_cache: Optional[EvaluationCache] = None,
 ) -> Union["ScheduleExecutionData", ExternalScheduleExecutionErrorData]:
     from dagster._core.execution.resources_init import get_transitive_required_resource_keys
 
@@ -331,6 +334,7 @@ def get_external_schedule_execution(
             schedule_name,
             resources=resources_to_build,
             repository_def=repo_def,
+            instance_loader=evaluation_cache.get_instance if evaluation_cache else None,
         ) as schedule_context:
             with user_code_error_boundary(
                 ScheduleExecutionError,
@@ -354,6 +358,8 @@ def get_external_sensor_execution(
     cursor: Optional[str],
     log_key: Optional[Sequence[str]],
     last_sensor_start_timestamp: Optional[float],
+    evaluation_cache: Optional[EvaluationCache] = None,
+    evaluation_batch_id: Optional[str] = None,
 ) -> Union["SensorExecutionData", ExternalSensorExecutionErrorData]:
     from dagster._core.execution.resources_init import get_transitive_required_resource_keys
 
@@ -369,6 +375,18 @@ def get_external_sensor_execution(
             if k in required_resource_keys
         }
 
+        instance = None
+        if evaluation_cache and evaluation_cache.reuse_sensor_resources and resources_to_build:
+            # build (or reuse) the long-lived resources up front, which requires the instance
+            instance = evaluation_cache.get_instance(instance_ref) if instance_ref else None
+            with user_code_error_boundary(
+                SensorExecutionError,
+                lambda: f"Error occurred while initializing resources for sensor {sensor_def.name}",
+            ):
+                resources_to_build = evaluation_cache.get_sensor_resource_defs(
+                    repo_def.name, resources_to_build, instance
+                )
+
         with SensorEvaluationContext(
             instance_ref,
             last_tick_completion_time=last_tick_completion_timestamp,
@@ -380,6 +398,15 @@ def get_external_sensor_execution(
             sensor_name=sensor_name,
             resources=resources_to_build,
             last_sensor_start_time=last_sensor_start_timestamp,
+            instance=instance,
+            instance_loader=evaluation_cache.get_instance if evaluation_cache else None,
+            run_status_change_records_loader=(
+                functools.partial(
+                    evaluation_cache.get_run_status_change_records, evaluation_batch_id
+                )
+                if evaluation_cache and evaluation_batch_id
+                else None
+            ),
         ) as sensor_context:
             with user_code_error_boundary(
                 SensorExecutionError,
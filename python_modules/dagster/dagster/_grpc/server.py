@@ -66,6 +66,7 @@
 
 from .__generated__ import api_pb2
 from .__generated__.api_pb2_grpc import DagsterApiServicer, add_DagsterApiServicer_to_server
+from .evaluation_cache import EvaluationCache
 from .impl import (
     RunInSubprocessComplete,
     StartRunInSubprocessSuccessful,
@@ -143,6 +144,12 @@ def _record_utilization_metrics(logger: logging.Logger) -> None:
         _UTILIZATION_METRICS["resource_utilization"].update(utilization_metrics)
 
 
+def _record_evaluation_cache_metrics(evaluation_cache: EvaluationCache) -> None:
+    metrics = evaluation_cache.get_metrics()
+    with _METRICS_LOCK:
+        _UTILIZATION_METRICS["evaluation_cache"].update(metrics)
+
+
 class CouldNotBindGrpcServerToAddress(Exception):
     pass
 
@@ -290,6 +297,7 @@ def __init__(
         instance_ref: Optional[InstanceRef] = None,
         location_name: Optional[str] = None,
         enable_metrics: bool = False,
+        reuse_sensor_resources: bool = False,
     ):
         super(DagsterApiServer, self).__init__()
 
@@ -344,6 +352,15 @@ def __init__(
 
         self._enable_metrics = check.bool_param(enable_metrics, "enable_metrics")
 
+        # Instances (and, if enabled, sensor resources) reused across sensor and schedule
+        # evaluations, torn down when the server shuts down
+        self._evaluation_cache = EvaluationCache(
+            reuse_sensor_resources=check.bool_param(
+                reuse_sensor_resources, "reuse_sensor_resources"
+            )
+        )
+        self._exit_stack.callback(self._evaluation_cache.close)
+
         try:
             if inject_env_vars_from_instance:
                 from dagster._cli.utils import get_instance_for_cli
@@ -475,6 +492,8 @@ def ReloadCode(
     @retrieve_metrics()
     def Ping(self, request, _context: grpc.ServicerContext) -> api_pb2.PingReply:
         echo = request.echo
+        if self._enable_metrics:
+            _record_evaluation_cache_metrics(self._evaluation_cache)
         return api_pb2.PingReply(
             echo=echo, serialized_server_utilization_metrics=json.dumps(_UTILIZATION_METRICS)
         )
@@ -814,6 +833,7 @@ def _external_schedule_execution(
                     args.scheduled_execution_timestamp,
                     args.scheduled_execution_timezone,
                     args.log_key,
+                    evaluation_cache=self._evaluation_cache,
                 )
             )
         except Exception:
@@ -840,6 +860,8 @@ def _external_sensor_execution(self, request: api_pb2.ExternalSensorExecutionReq
                     args.cursor,
                     args.log_key,
                     args.last_sensor_start_time,
+                    evaluation_cache=self._evaluation_cache,
+                    evaluation_batch_id=args.evaluation_batch_id,
                 )
             )
         except Exception:
@@ -16,6 +16,7 @@
 )
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.origin import JobPythonOrigin, get_python_environment_entry_point
+from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
 from dagster._serdes import serialize_value, whitelist_for_serdes
 from dagster._serdes.serdes import SetToSequenceFieldSerializer
 from dagster._utils.error import SerializableErrorInfo
@@ -241,6 +242,9 @@ class ExecuteStepArgs(
             ("known_state", Optional[KnownExecutionState]),
             ("should_verify_step", Optional[bool]),
             ("print_serialized_events", bool),
+            # Snapshot of the part of the plan needed to execute the steps, which avoids building
+            # the plan for the whole job in the step worker
+            ("execution_plan_snapshot", Optional[ExecutionPlanSnapshot]),
         ],
     )
 ):
@@ -254,6 +258,7 @@ def __new__(
         known_state: Optional[KnownExecutionState] = None,
         should_verify_step: Optional[bool] = None,
         print_serialized_events: Optional[bool] = None,
+        execution_plan_snapshot: Optional[ExecutionPlanSnapshot] = None,
     ):
         return super(ExecuteStepArgs, cls).__new__(
             cls,
@@ -271,6 +276,9 @@ def __new__(
             print_serialized_events=check.opt_bool_param(
                 print_serialized_events, "print_serialized_events", False
             ),
+            execution_plan_snapshot=check.opt_inst_param(
+                execution_plan_snapshot, "execution_plan_snapshot", ExecutionPlanSnapshot
+            ),
         )
 
     def _get_compressed_args(self) -> str:
@@ -593,6 +601,7 @@ class SensorExecutionArgs(
             ("last_sensor_start_time", Optional[float]),
             # deprecated
             ("last_completion_time", Optional[float]),
+            ("evaluation_batch_id", Optional[str]),
         ],
     )
 ):
@@ -609,6 +618,7 @@ def __new__(
         last_sensor_start_time: Optional[float] = None,
         # deprecated param
         last_completion_time: Optional[float] = None,
+        evaluation_batch_id: Optional[str] = None,
     ):
         # populate both last_tick_completion_time and last_completion_time for backcompat, so that
         # older versions can still construct the correct context object.  We manually create the
@@ -633,6 +643,7 @@ def __new__(
                 last_sensor_start_time, "last_sensor_start_time"
             ),
             last_completion_time=normalized_last_tick_completion_time,
+            evaluation_batch_id=check.opt_str_param(evaluation_batch_id, "evaluation_batch_id"),
         )
 
 
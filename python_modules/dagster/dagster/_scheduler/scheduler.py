@@ -624,13 +624,14 @@ def _submit_run_request(
     workspace_process_context: IWorkspaceProcessContext,
     external_schedule: ExternalSchedule,
     schedule_time: datetime.datetime,
+    existing_runs: Sequence[DagsterRun],
     logger,
     debug_crash_flags,
 ) -> SubmitRunRequestResult:
     instance = workspace_process_context.instance
     schedule_origin = external_schedule.get_external_origin()
 
-    run = _get_existing_run_for_request(instance, external_schedule, schedule_time, run_request)
+    run = _get_existing_run_for_request(existing_runs, run_request)
     if run:
         if run.status != DagsterRunStatus.NOT_STARTED:
             # A run already exists and was launched for this time period,
@@ -776,11 +777,16 @@ def _schedule_runs_at_time(
 
         run_requests.append(run_request)
 
+    # fetch the runs already created for this execution of the schedule once for all of the run
+    # requests of the tick
+    existing_runs = _get_existing_runs_for_schedule_time(instance, external_schedule, schedule_time)
+
     submit_run_request = lambda run_request: _submit_run_request(
         run_request,
         workspace_process_context,
         external_schedule,
         schedule_time,
+        existing_runs,
         logger,
         debug_crash_flags,
     )
@@ -807,20 +813,17 @@ def _schedule_runs_at_time(
     tick_context.update_state(TickStatus.SUCCESS)
 
 
-def _get_existing_run_for_request(
+def _get_existing_runs_for_schedule_time(
     instance: DagsterInstance,
     external_schedule: ExternalSchedule,
     schedule_time: datetime.datetime,
-    run_request: RunRequest,
-) -> Optional[DagsterRun]:
+) -> Sequence[DagsterRun]:
     tags = merge_dicts(
         DagsterRun.tags_for_schedule(external_schedule),
         {
             SCHEDULED_EXECUTION_TIME_TAG: to_timezone(schedule_time, "UTC").isoformat(),
         },
     )
-    if run_request.run_key:
-        tags[RUN_KEY_TAG] = run_request.run_key
     runs_filter = RunsFilter(tags=tags)
     existing_runs = instance.get_runs(runs_filter)
 
@@ -837,10 +840,18 @@ def _get_existing_run_for_request(
         ):
             matching_runs.append(run)
 
-    if not len(matching_runs):
-        return None
+    return matching_runs
+
+
+def _get_existing_run_for_request(
+    existing_runs: Sequence[DagsterRun],
+    run_request: RunRequest,
+) -> Optional[DagsterRun]:
+    for run in existing_runs:
+        if not run_request.run_key or run.tags.get(RUN_KEY_TAG) == run_request.run_key:
+            return run
 
-    return matching_runs[0]
+    return None
 
 
 def _create_scheduler_run(
@@ -14,6 +14,7 @@
 """
 import collections.abc
 import dataclasses
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import is_dataclass
 from enum import Enum
@@ -226,6 +227,33 @@ def create() -> "WhitelistMap":
 
 _WHITELIST_MAP: Final[WhitelistMap] = WhitelistMap.create()
 
+_public_api_lock = threading.Lock()
+_loaded_public_api = False
+
+
+def _load_public_api_for_whitelist(whitelist_map: WhitelistMap) -> bool:
+    """Classes are registered with the default whitelist map when the modules that define them are
+    imported, but the dagster public API is loaded lazily. Before a name is treated as unknown to
+    the default whitelist map, import the full public API once, so that every class it reaches is
+    registered.
+
+    Returns True if the whitelist map should be checked again for the name.
+    """
+    global _loaded_public_api  # noqa: PLW0603
+
+    if whitelist_map is not _WHITELIST_MAP:
+        return False
+
+    with _public_api_lock:
+        if not _loaded_public_api:
+            import dagster
+
+            dagster._load_public_api()  # noqa: SLF001
+            _loaded_public_api = True
+
+    return True
+
+
 T = TypeVar("T")
 U = TypeVar("U")
 T_Type = TypeVar("T_Type", bound=Type[object])
@@ -934,8 +962,10 @@ def deserialize_value(
     """
     check.str_param(val, "val")
 
-    # Never issue warnings when deserializing deprecated objects.
-    with disable_dagster_warnings():
+    # Never issue warnings when deserializing deprecated objects. The members of serialized
+    # collections were checked when the serialized objects were constructed, so only the cheap
+    # top-level type checks are run when reconstructing them.
+    with disable_dagster_warnings(), check.reduced_checks():
         context = UnpackContext()
         unpacked_value = seven.json.loads(
             val, object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context)
@@ -962,7 +992,10 @@ def __init__(self, message: str, value: Mapping[str, UnpackedValue]):
 def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContext):
     if "__class__" in val:
         klass_name = cast(str, val["__class__"])
-        if not whitelist_map.has_object_deserializer(klass_name):
+        if not whitelist_map.has_object_deserializer(klass_name) and not (
+            _load_public_api_for_whitelist(whitelist_map)
+            and whitelist_map.has_object_deserializer(klass_name)
+        ):
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f'Attempted to deserialize class "{klass_name}" which is not in the whitelist.',
@@ -977,7 +1010,9 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
     if "__enum__" in val:
         enum = cast(str, val["__enum__"])
         name, member = enum.split(".")
-        if not whitelist_map.has_enum_entry(name):
+        if not whitelist_map.has_enum_entry(name) and not (
+            _load_public_api_for_whitelist(whitelist_map) and whitelist_map.has_enum_entry(name)
+        ):
             return context.observe_unknown_value(
                 UnknownSerdesValue(
                     f"Attempted to deserialize enum {name} which was not in the whitelist.",
@@ -48,7 +48,7 @@
 
 if TYPE_CHECKING:
     from dagster._core.storage.event_log import EventLogRecord
-    from dagster._core.storage.event_log.base import AssetRecord
+    from dagster._core.storage.event_log.base import AssetRecord, DynamicPartitionsVersion
 
 
 class CachingInstanceQueryer(DynamicPartitionsStore):
@@ -494,6 +494,12 @@ def get_dynamic_partitions(self, partitions_def_name: str) -> Sequence[str]:
     def has_dynamic_partition(self, partitions_def_name: str, partition_key: str) -> bool:
         return partition_key in self.get_dynamic_partitions(partitions_def_name)
 
+    @cached_method
+    def get_dynamic_partitions_version(
+        self, partitions_def_name: str
+    ) -> Optional["DynamicPartitionsVersion"]:
+        return self.instance.get_dynamic_partitions_version(partitions_def_name)
+
     @cached_method
     def asset_partitions_with_newly_updated_parents(
         self,
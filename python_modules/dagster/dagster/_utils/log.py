@@ -2,10 +2,9 @@
 import logging
 import sys
 import traceback
-from typing import Mapping, NamedTuple, Optional
+from typing import TYPE_CHECKING, Mapping, NamedTuple, Optional
 
 import coloredlogs
-import structlog
 
 import dagster._check as check
 import dagster._seven as seven
@@ -13,6 +12,9 @@
 from dagster._core.definitions.logger_definition import logger
 from dagster._core.utils import coerce_valid_log_level
 
+if TYPE_CHECKING:
+    import structlog
+
 
 class JsonFileHandler(logging.Handler):
     def __init__(self, json_path: str):
@@ -216,6 +218,10 @@ def define_default_formatter():
 
 
 def get_structlog_shared_processors():
+    # structlog is only needed to configure the loggers of long-running processes, so it is
+    # imported lazily to keep it out of the import of dagster
+    import structlog
+
     timestamper = structlog.processors.TimeStamper(fmt="iso", utc=True)
 
     shared_processors = [
@@ -228,7 +234,9 @@ def get_structlog_shared_processors():
     return shared_processors
 
 
-def get_structlog_json_formatter() -> structlog.stdlib.ProcessorFormatter:
+def get_structlog_json_formatter() -> "structlog.stdlib.ProcessorFormatter":
+    import structlog
+
     return structlog.stdlib.ProcessorFormatter(
         foreign_pre_chain=get_structlog_shared_processors(),
         processors=[
@@ -244,6 +252,8 @@ def get_structlog_json_formatter() -> structlog.stdlib.ProcessorFormatter:
     emit_runtime_warning=False,
 )
 def configure_loggers(handler="default", formatter="colored", log_level="INFO"):
+    import structlog
+
     structlog.configure(
         processors=[
             *get_structlog_shared_processors(),
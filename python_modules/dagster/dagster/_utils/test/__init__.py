@@ -333,6 +333,9 @@ def check_concurrency_claim(
 def get_all_direct_subclasses_of_marker(marker_interface_cls: Type) -> List[Type]:
     import dagster as dagster
 
+    # the public API is resolved lazily, so resolve all of it before inspecting the namespace
+    dagster._load_public_api()  # noqa: SLF001
+
     return [
         symbol
         for symbol in dagster.__dict__.values()
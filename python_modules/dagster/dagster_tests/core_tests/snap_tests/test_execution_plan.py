@@ -1,7 +1,14 @@
-from dagster import GraphOut, In, Out, graph, job, op
+from dagster import DynamicOut, DynamicOutput, GraphOut, In, Out, graph, job, op
 from dagster._core.execution.api import create_execution_plan
-from dagster._core.snap import create_job_snapshot_id, snapshot_from_execution_plan
-from dagster._serdes import serialize_pp
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.snap import (
+    create_job_snapshot_id,
+    snapshot_from_execution_plan,
+    step_subset_snapshot_from_execution_plan,
+)
+from dagster._serdes import deserialize_value, serialize_pp, serialize_value
 
 
 def test_create_noop_execution_plan(snapshot):
@@ -109,3 +116,86 @@ def noop_job():
             )
         )
     )
+
+
+def test_step_subset_snapshot():
+    @op
+    def op_one():
+        return 1
+
+    @op
+    def op_two(num):
+        return num + 1
+
+    @op
+    def op_three(num):
+        return num + 1
+
+    @op
+    def unrelated_op():
+        pass
+
+    @job
+    def the_job():
+        op_three(op_two(op_one()))
+        unrelated_op()
+
+    execution_plan = create_execution_plan(the_job)
+    job_snapshot_id = create_job_snapshot_id(the_job.get_job_snapshot())
+
+    plan_snapshot = step_subset_snapshot_from_execution_plan(
+        execution_plan, job_snapshot_id, ["op_two"]
+    )
+    assert [step.key for step in plan_snapshot.steps] == ["op_one", "op_two"]
+    assert plan_snapshot.step_keys_to_execute == ["op_two"]
+    assert plan_snapshot.initial_known_state is None
+
+    plan_snapshot = deserialize_value(serialize_value(plan_snapshot))
+    known_state = KnownExecutionState(previous_retry_attempts={"op_two": 1})
+    rebuilt_plan = ExecutionPlan.rebuild_from_snapshot(
+        "the_job", plan_snapshot, known_state=known_state
+    )
+    assert rebuilt_plan.step_keys_to_execute == ["op_two"]
+    assert rebuilt_plan.known_state == known_state
+    assert rebuilt_plan.get_step_output(StepOutputHandle("op_one", "result")).name == "result"
+    assert not rebuilt_plan.has_step(execution_plan.get_step_by_key("unrelated_op").handle)
+
+
+def test_step_subset_snapshot_dynamic():
+    @op(out=DynamicOut())
+    def emit():
+        for i in range(2):
+            yield DynamicOutput(i, mapping_key=str(i))
+
+    @op
+    def double(num):
+        return num * 2
+
+    @op
+    def total(nums):
+        return sum(nums)
+
+    @job
+    def dynamic_job():
+        total(emit().map(double).collect())
+
+    known_state = KnownExecutionState(dynamic_mappings={"emit": {"result": ["0", "1"]}})
+    execution_plan = create_execution_plan(dynamic_job, known_state=known_state)
+    job_snapshot_id = create_job_snapshot_id(dynamic_job.get_job_snapshot())
+
+    for step_keys, expected_keys in [
+        (["double[1]"], ["double[1]", "emit"]),
+        (["total"], ["double[0]", "double[1]", "total"]),
+    ]:
+        plan_snapshot = deserialize_value(
+            serialize_value(
+                step_subset_snapshot_from_execution_plan(execution_plan, job_snapshot_id, step_keys)
+            )
+        )
+        assert [step.key for step in plan_snapshot.steps] == expected_keys
+
+        rebuilt_plan = ExecutionPlan.rebuild_from_snapshot(
+            "dynamic_job", plan_snapshot, known_state=known_state
+        )
+        assert rebuilt_plan.step_keys_to_execute == step_keys
+        assert [step.key for step in rebuilt_plan.get_steps_to_execute_in_topo_order()] == step_keys
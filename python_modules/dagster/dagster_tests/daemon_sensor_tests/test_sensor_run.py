@@ -920,7 +920,13 @@ def asset_sensor_repo():
 FUTURES_TIMEOUT = 75
 
 
-def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=FUTURES_TIMEOUT):
+def evaluate_sensors(
+    workspace_context,
+    executor,
+    submit_executor=None,
+    timeout=FUTURES_TIMEOUT,
+    last_dispatched_asset_event_ids=None,
+):
     logger = get_default_daemon_logger("SensorDaemon")
     futures = {}
     list(
@@ -930,6 +936,7 @@ def evaluate_sensors(workspace_context, executor, submit_executor=None, timeout=
             threadpool_executor=executor,
             sensor_tick_futures=futures,
             submit_threadpool_executor=submit_executor,
+            last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
         )
     )
 
@@ -1980,6 +1987,97 @@ def test_asset_sensor(executor, instance, workspace_context, external_repo):
         assert run.tags.get("dagster/sensor_name") == "asset_foo_sensor"
 
 
+def test_asset_sensors_triggered_on_asset_events(executor, workspace_context, external_repo):
+    freeze_datetime = to_timezone(
+        create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
+        "US/Central",
+    )
+    with instance_for_test(
+        overrides={
+            "run_launcher": {"module": "dagster._core.test_utils", "class": "MockedRunLauncher"},
+            "sensors": {"trigger_on_asset_events": True},
+        },
+    ) as instance:
+        triggered_workspace_context = workspace_context.copy_for_test_instance(instance)
+        last_dispatched_asset_event_ids = {}
+
+        foo_sensor = external_repo.get_external_sensor("asset_foo_sensor")
+        a_and_b_sensor = external_repo.get_external_sensor("asset_a_and_b_sensor")
+        assert foo_sensor.metadata and foo_sensor.metadata.asset_keys == [AssetKey("foo")]
+        assert a_and_b_sensor.metadata and a_and_b_sensor.metadata.asset_keys == [
+            AssetKey("asset_a"),
+            AssetKey("asset_b"),
+        ]
+
+        def _get_ticks():
+            return instance.get_ticks(foo_sensor.get_external_origin_id(), foo_sensor.selector_id)
+
+        with pendulum.test(freeze_datetime):
+            instance.start_sensor(foo_sensor)
+
+            # sensors are evaluated the first time they are seen
+            evaluate_sensors(
+                triggered_workspace_context,
+                executor,
+                last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
+            )
+            assert len(_get_ticks()) == 1
+            validate_tick(_get_ticks()[0], foo_sensor, freeze_datetime, TickStatus.SKIPPED)
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+        with pendulum.test(freeze_datetime):
+            # no new materializations, so the sensor is not evaluated
+            evaluate_sensors(
+                triggered_workspace_context,
+                executor,
+                last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
+            )
+            assert len(_get_ticks()) == 1
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+        with pendulum.test(freeze_datetime):
+            foo_job.execute_in_process(instance=instance)
+
+            evaluate_sensors(
+                triggered_workspace_context,
+                executor,
+                last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
+            )
+            assert len(_get_ticks()) == 2
+            validate_tick(_get_ticks()[0], foo_sensor, freeze_datetime, TickStatus.SUCCESS)
+            assert instance.get_runs_count() == 2
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+        with pendulum.test(freeze_datetime):
+            evaluate_sensors(
+                triggered_workspace_context,
+                executor,
+                last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
+            )
+            assert len(_get_ticks()) == 2
+
+            # stopped sensors are evaluated again once they are restarted
+            instance.stop_sensor(
+                foo_sensor.get_external_origin_id(), foo_sensor.selector_id, foo_sensor
+            )
+            evaluate_sensors(
+                triggered_workspace_context,
+                executor,
+                last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
+            )
+            assert last_dispatched_asset_event_ids == {}
+
+        freeze_datetime = freeze_datetime.add(seconds=60)
+        with pendulum.test(freeze_datetime):
+            instance.start_sensor(foo_sensor)
+            evaluate_sensors(
+                triggered_workspace_context,
+                executor,
+                last_dispatched_asset_event_ids=last_dispatched_asset_event_ids,
+            )
+            assert len(_get_ticks()) == 3
+
+
 def test_asset_job_sensor(executor, instance, workspace_context, external_repo):
     freeze_datetime = to_timezone(
         create_pendulum_time(year=2019, month=2, day=27, tz="UTC"),
@@ -1507,3 +1507,44 @@ def test_opt_iterable():
 
     with pytest.raises(CheckError, match="Member of iterable mismatches type"):
         check.opt_iterable_param(["atr", None], "nonedoesntcount", of_type=str)
+
+
+# ###################################################################################################
+# ##### CHECK MODE
+# ###################################################################################################
+
+
+def test_reduced_checks():
+    assert not check.reduced_checks_enabled()
+
+    with check.reduced_checks():
+        assert check.reduced_checks_enabled()
+
+        # members of collections are not checked
+        assert check.sequence_param([1], "seq", of_type=str) == [1]
+        assert check.list_param([1], "lst", of_type=str) == [1]
+        assert check.set_param({1}, "st", of_type=str) == {1}
+        assert check.tuple_param((1,), "tpl", of_type=str) == (1,)
+        assert check.tuple_param((1, 2), "tpl", of_shape=(str,)) == (1, 2)
+        assert check.mapping_param({1: 2}, "map", key_type=str, value_type=str) == {1: 2}
+        assert check.opt_dict_param({1: 2}, "dct", key_type=str, value_type=str) == {1: 2}
+        assert check.two_dim_dict_param({"a": {1: 2}}, "dct", key_type=str) == {"a": {1: 2}}
+
+        # the collections themselves still are
+        with pytest.raises(ParameterCheckError):
+            check.sequence_param(1, "seq", of_type=str)
+        with pytest.raises(ParameterCheckError):
+            check.mapping_param([], "map", key_type=str)
+        with pytest.raises(ParameterCheckError):
+            check.inst_param(1, "inst", str)
+
+        with check.reduced_checks(False):
+            assert not check.reduced_checks_enabled()
+            with pytest.raises(CheckError, match="Member of sequence mismatches type"):
+                check.sequence_param([1], "seq", of_type=str)
+
+        assert check.reduced_checks_enabled()
+
+    assert not check.reduced_checks_enabled()
+    with pytest.raises(CheckError, match="Member of sequence mismatches type"):
+        check.sequence_param([1], "seq", of_type=str)
@@ -0,0 +1,222 @@
+from dagster import (
+    Definitions,
+    RunRequest,
+    job,
+    op,
+    resource,
+    run_failure_sensor,
+    schedule,
+    sensor,
+)
+from dagster._core.definitions.run_status_sensor_definition import RunStatusSensorCursor
+from dagster._core.definitions.schedule_definition import ScheduleExecutionData
+from dagster._core.definitions.sensor_definition import SensorExecutionData
+from dagster._core.test_utils import create_run_for_test, instance_for_test
+from dagster._grpc.evaluation_cache import EvaluationCache
+from dagster._grpc.impl import get_external_schedule_execution, get_external_sensor_execution
+
+EVENTS = []
+
+
+@resource
+def tracked_resource(_):
+    EVENTS.append("setup")
+    try:
+        yield "the_value"
+    finally:
+        EVENTS.append("teardown")
+
+
+@op
+def the_op():
+    pass
+
+
+@job
+def the_job():
+    the_op()
+
+
+@sensor(job=the_job, required_resource_keys={"tracked"})
+def the_sensor(context):
+    assert context.resources.tracked == "the_value"
+    return RunRequest(run_key=str(context.instance.get_runs_count()))
+
+
+@schedule(job=the_job, cron_schedule="* * * * *")
+def the_schedule(context):
+    context.instance.get_runs_count()
+    return {}
+
+
+@run_failure_sensor(monitor_all_repositories=True)
+def first_failure_sensor(context):
+    pass
+
+
+@run_failure_sensor(monitor_all_repositories=True)
+def second_failure_sensor(context):
+    pass
+
+
+defs = Definitions(
+    jobs=[the_job],
+    sensors=[the_sensor, first_failure_sensor, second_failure_sensor],
+    schedules=[the_schedule],
+    resources={"tracked": tracked_resource},
+)
+
+
+def _evaluate_sensor(instance, evaluation_cache):
+    result = get_external_sensor_execution(
+        defs.get_repository_def(),
+        instance.get_ref(),
+        "the_sensor",
+        None,
+        None,
+        None,
+        None,
+        None,
+        evaluation_cache=evaluation_cache,
+    )
+    assert isinstance(result, SensorExecutionData), result
+    assert len(result.run_requests) == 1
+
+
+def test_sensor_resources_not_reused_by_default():
+    EVENTS.clear()
+    with instance_for_test() as instance:
+        evaluation_cache = EvaluationCache()
+        for _ in range(3):
+            _evaluate_sensor(instance, evaluation_cache)
+        assert EVENTS == ["setup", "teardown"] * 3
+
+        assert evaluation_cache.get_metrics() == {
+            "instances_constructed": 1,
+            "instance_cache_hits": 2,
+            "resources_constructed": 0,
+            "resource_cache_hits": 0,
+            "run_status_change_fetches": 0,
+            "run_status_change_cache_hits": 0,
+        }
+        evaluation_cache.close()
+
+
+def test_reuse_sensor_resources():
+    EVENTS.clear()
+    with instance_for_test() as instance:
+        evaluation_cache = EvaluationCache(reuse_sensor_resources=True)
+        for _ in range(3):
+            _evaluate_sensor(instance, evaluation_cache)
+        assert EVENTS == ["setup"]
+
+        assert evaluation_cache.get_metrics() == {
+            "instances_constructed": 1,
+            "instance_cache_hits": 2,
+            "resources_constructed": 1,
+            "resource_cache_hits": 2,
+            "run_status_change_fetches": 0,
+            "run_status_change_cache_hits": 0,
+        }
+
+        evaluation_cache.close()
+        assert EVENTS == ["setup", "teardown"]
+
+
+def test_schedule_instance_reused():
+    with instance_for_test() as instance:
+        evaluation_cache = EvaluationCache()
+        for _ in range(2):
+            result = get_external_schedule_execution(
+                defs.get_repository_def(),
+                instance.get_ref(),
+                "the_schedule",
+                None,
+                None,
+                None,
+                evaluation_cache=evaluation_cache,
+            )
+            assert isinstance(result, ScheduleExecutionData), result
+
+        metrics = evaluation_cache.get_metrics()
+        assert metrics["instances_constructed"] == 1
+        assert metrics["instance_cache_hits"] == 1
+
+        cached_instance = evaluation_cache.get_instance(instance.get_ref())
+        evaluation_cache.close()
+        assert evaluation_cache.get_instance(instance.get_ref()) is not cached_instance
+        evaluation_cache.close()
+
+
+def _evaluate_failure_sensor(instance, evaluation_cache, sensor_name, cursor, evaluation_batch_id):
+    result = get_external_sensor_execution(
+        defs.get_repository_def(),
+        instance.get_ref(),
+        sensor_name,
+        None,
+        None,
+        cursor,
+        None,
+        None,
+        evaluation_cache=evaluation_cache,
+        evaluation_batch_id=evaluation_batch_id,
+    )
+    assert isinstance(result, SensorExecutionData), result
+    return result
+
+
+def test_run_status_change_records_shared_within_batch():
+    with instance_for_test() as instance:
+        failed_run_ids = []
+        for _ in range(2):
+            run = create_run_for_test(instance, job_name="the_job")
+            instance.report_run_failed(run)
+            failed_run_ids.append(run.run_id)
+
+        cursor = RunStatusSensorCursor(
+            record_id=-1, update_timestamp="2000-01-01T00:00:00+00:00"
+        ).to_json()
+        evaluation_cache = EvaluationCache()
+
+        for sensor_name in ["first_failure_sensor", "second_failure_sensor"]:
+            result = _evaluate_failure_sensor(
+                instance, evaluation_cache, sensor_name, cursor, "first_batch"
+            )
+            assert [
+                reaction.dagster_run.run_id for reaction in result.dagster_run_reactions
+            ] == failed_run_ids
+
+        metrics = evaluation_cache.get_metrics()
+        assert metrics["run_status_change_fetches"] == 1
+        assert metrics["run_status_change_cache_hits"] == 1
+
+        # sensors with advanced cursors are served from the records fetched in the same batch
+        result = _evaluate_failure_sensor(
+            instance, evaluation_cache, "first_failure_sensor", result.cursor, "first_batch"
+        )
+        assert not result.dagster_run_reactions
+        assert evaluation_cache.get_metrics()["run_status_change_fetches"] == 1
+
+        # a new batch fetches the records again, picking up new events
+        run = create_run_for_test(instance, job_name="the_job")
+        instance.report_run_failed(run)
+        result = _evaluate_failure_sensor(
+            instance, evaluation_cache, "second_failure_sensor", result.cursor, "second_batch"
+        )
+        assert [reaction.dagster_run.run_id for reaction in result.dagster_run_reactions] == [
+            run.run_id
+        ]
+        assert evaluation_cache.get_metrics()["run_status_change_fetches"] == 2
+
+        # without a batch, records are fetched by the sensor itself
+        _evaluate_failure_sensor(instance, evaluation_cache, "first_failure_sensor", cursor, None)
+        assert evaluation_cache.get_metrics() == {
+            "instances_constructed": 1,
+            "instance_cache_hits": 4,
+            "resources_constructed": 0,
+            "resource_cache_hits": 0,
+            "run_status_change_fetches": 2,
+            "run_status_change_cache_hits": 2,
+        }
+
+        evaluation_cache.close()
@@ -1,5 +1,12 @@
+import ast
+import importlib
+import inspect
+import json
 import subprocess
+import sys
+from typing import Dict, List, Set
 
+import dagster
 import pytest
 from dagster._seven import IS_WINDOWS
 from dagster._utils import file_relative_path
@@ -29,3 +36,60 @@ def test_import_perf():
 
     # one way to debug imports is to `pip install tuna` then run
     # python -X importtime python_modules/dagster/dagster_tests/general_tests/simple.py &> /tmp/import.txt && tuna /tmp/import.txt
+
+
+def _modules_imported_by(statement: str) -> Set[str]:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; {statement}; print(json.dumps(sorted(sys.modules)))",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return set(json.loads(result.stdout.decode("utf-8").strip().splitlines()[-1]))
+
+
+def test_import_dagster_is_lazy():
+    modules = _modules_imported_by("import dagster")
+
+    # the public API is only resolved on access
+    assert "dagster._config.pythonic_config" not in modules
+    assert "dagster._core.execution.api" not in modules
+
+    # heavy dependencies are deferred until storage, gRPC or logging configuration is used
+    for heavy_module in ["alembic", "grpc", "sqlalchemy", "structlog"]:
+        assert heavy_module not in modules
+
+    modules = _modules_imported_by("from dagster import Config, execute_job")
+    assert "dagster._config.pythonic_config" in modules
+    assert "dagster._core.execution.api" in modules
+
+
+def test_public_api_matches_type_checking_imports():
+    # every symbol of the public API is declared both in the TYPE_CHECKING block, for static
+    # analysis, and in the mapping used to resolve it lazily at runtime
+    module_ast = ast.parse(inspect.getsource(dagster))
+    type_checking_imports: Dict[str, List[str]] = {}
+    for node in module_ast.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            for import_node in node.body:
+                if isinstance(import_node, ast.ImportFrom) and import_node.module:
+                    for alias in import_node.names:
+                        assert alias.asname == alias.name, alias.name
+                        type_checking_imports.setdefault(import_node.module, []).append(alias.name)
+
+    assert type_checking_imports == {
+        module: list(names)
+        for module, names in dagster._PUBLIC_API.items()  # noqa: SLF001
+    }
+
+    for module, names in dagster._PUBLIC_API.items():  # noqa: SLF001
+        for name in names:
+            assert getattr(dagster, name) is getattr(importlib.import_module(module), name)
+            assert name in dir(dagster)
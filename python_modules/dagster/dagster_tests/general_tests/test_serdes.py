@@ -7,7 +7,14 @@
 
 import pydantic
 import pytest
-from dagster._check import ParameterCheckError, inst_param, set_param
+from dagster._check import (
+    CheckError,
+    ParameterCheckError,
+    inst_param,
+    reduced_checks_enabled,
+    sequence_param,
+    set_param,
+)
 from dagster._serdes.errors import DeserializationError, SerdesUsageError, SerializationError
 from dagster._serdes.serdes import (
     EnumSerializer,
@@ -411,6 +418,25 @@ def __new__(cls, reg_set, frozen_set):
     assert snap_id == roundtrip_snap_id
 
 
+def test_deserialize_with_reduced_checks():
+    test_map = WhitelistMap.create()
+    checks_enabled = []
+
+    @_whitelist_for_serdes(whitelist_map=test_map)
+    class HasNames(NamedTuple("_HasNames", [("names", Sequence[str])])):
+        def __new__(cls, names: Sequence[str]):
+            checks_enabled.append(not reduced_checks_enabled())
+            return super(HasNames, cls).__new__(cls, sequence_param(names, "names", of_type=str))
+
+    with pytest.raises(CheckError, match="Member of sequence mismatches type"):
+        HasNames([1])
+
+    # members were checked on construction, so they are not checked again when deserializing
+    serialized = serialize_value(HasNames(["a", "b"]), whitelist_map=test_map)
+    assert deserialize_value(serialized, whitelist_map=test_map) == HasNames(["a", "b"])
+    assert checks_enabled == [True, True, False, True]
+
+
 def test_named_tuple() -> None:
     test_map = WhitelistMap.create()
 
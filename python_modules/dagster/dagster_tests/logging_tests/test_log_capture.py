@@ -1,9 +1,11 @@
+import subprocess
 import sys
 
 import pytest
 from dagster._core.execution.compute_logs import (
     mirror_stream_to_file,
     should_disable_io_stream_redirect,
+    tee_stream_to_file,
 )
 from dagster._utils.test import get_temp_file_name
 
@@ -18,3 +20,25 @@ def test_capture():
 
         with open(capture_filepath, "r", encoding="utf8") as capture_stream:
             assert "HELLO" in capture_stream.read()
+
+
+@pytest.mark.skipif(
+    should_disable_io_stream_redirect(), reason="compute logs disabled for win / py3.6+"
+)
+def test_tee_capture():
+    with get_temp_file_name() as outer_filepath, get_temp_file_name() as inner_filepath:
+        with tee_stream_to_file(sys.stdout, outer_filepath):
+            print("OUTER")  # noqa: T201
+            with tee_stream_to_file(sys.stdout, inner_filepath):
+                print("INNER")  # noqa: T201
+                # output written to the file descriptor by subprocesses is captured too
+                subprocess.check_call(
+                    [sys.executable, "-c", "print('SUBPROCESS')"], stdout=sys.stdout
+                )
+
+        with open(inner_filepath, "r", encoding="utf8") as capture_stream:
+            assert capture_stream.read() == "INNER\nSUBPROCESS\n"
+
+        # the inner capture tees to the outer one
+        with open(outer_filepath, "r", encoding="utf8") as capture_stream:
+            assert capture_stream.read() == "OUTER\nINNER\nSUBPROCESS\n"
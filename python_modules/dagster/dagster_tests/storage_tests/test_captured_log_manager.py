@@ -5,6 +5,7 @@
 
 import pytest
 from dagster import job, op
+from dagster._check import CheckError
 from dagster._core.events import DagsterEventType
 from dagster._core.storage.captured_log_manager import CapturedLogContext
 from dagster._core.storage.local_compute_log_manager import LocalComputeLogManager
@@ -31,6 +32,21 @@ def captured_log_manager(self):
             return LocalComputeLogManager(tmpdir_path)
 
 
+class TestThreadCaptureLocalCapturedLogManager(TestCapturedLogManager):
+    __test__ = True
+
+    @pytest.fixture(name="captured_log_manager")
+    def captured_log_manager(self):
+        with tempfile.TemporaryDirectory() as tmpdir_path:
+            return LocalComputeLogManager(tmpdir_path, capture_mode="thread")
+
+
+def test_invalid_capture_mode():
+    with tempfile.TemporaryDirectory() as tmpdir_path:
+        with pytest.raises(CheckError, match="Unknown compute log capture mode"):
+            LocalComputeLogManager(tmpdir_path, capture_mode="foo")
+
+
 class ExternalTestComputeLogManager(NoOpComputeLogManager):
     """Test compute log manager that does not actually capture logs, but generates an external url
     to be shown within the Dagster UI.
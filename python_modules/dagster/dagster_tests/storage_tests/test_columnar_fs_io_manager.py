@@ -0,0 +1,134 @@
+import os
+import pickle
+import tempfile
+
+import pytest
+from dagster import (
+    ColumnarFilesystemIOManager,
+    DailyPartitionsDefinition,
+    FilesystemIOManager,
+    asset,
+    materialize,
+)
+from dagster._core.storage.fs_io_manager import (
+    ARROW_IPC_MAGIC,
+    NPY_MAGIC,
+    ColumnarObjectFilesystemIOManager,
+)
+
+
+def _read_magic(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read(len(ARROW_IPC_MAGIC))
+
+
+def _materialize_and_load(io_manager, value):
+    @asset
+    def upstream():
+        return value
+
+    loaded = {}
+
+    @asset
+    def downstream(upstream):
+        loaded["value"] = upstream
+
+    result = materialize([upstream, downstream], resources={"io_manager": io_manager})
+    assert result.success
+    return loaded["value"]
+
+
+def test_columnar_io_manager_pickle_fallback():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        io_manager = ColumnarFilesystemIOManager(base_dir=tmp_dir)
+        assert _materialize_and_load(io_manager, {"a": [1, 2, 3]}) == {"a": [1, 2, 3]}
+
+        with open(os.path.join(tmp_dir, "upstream"), "rb") as f:
+            assert pickle.load(f) == {"a": [1, 2, 3]}
+
+
+def test_columnar_io_manager_loads_pickled_outputs():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        @asset
+        def upstream():
+            return [1, 2, 3]
+
+        @asset
+        def downstream(upstream):
+            assert upstream == [1, 2, 3]
+
+        assert materialize(
+            [upstream], resources={"io_manager": FilesystemIOManager(base_dir=tmp_dir)}
+        ).success
+        assert materialize(
+            [upstream.to_source_asset(), downstream],
+            resources={"io_manager": ColumnarFilesystemIOManager(base_dir=tmp_dir)},
+        ).success
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_columnar_io_manager_numpy(memory_map):
+    np = pytest.importorskip("numpy")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        io_manager = ColumnarFilesystemIOManager(base_dir=tmp_dir, memory_map=memory_map)
+        value = np.arange(100, dtype="float64").reshape(10, 10)
+        loaded = _materialize_and_load(io_manager, value)
+
+        assert _read_magic(os.path.join(tmp_dir, "upstream")).startswith(NPY_MAGIC)
+        np.testing.assert_array_equal(loaded, value)
+        assert isinstance(loaded, np.memmap) == memory_map
+
+        # object arrays can't be stored without pickling
+        object_value = np.array([{"a": 1}, None], dtype=object)
+        loaded = _materialize_and_load(io_manager, object_value)
+        assert list(loaded) == [{"a": 1}, None]
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_columnar_io_manager_pandas(memory_map):
+    pd = pytest.importorskip("pandas")
+    pytest.importorskip("pyarrow")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        io_manager = ColumnarFilesystemIOManager(base_dir=tmp_dir, memory_map=memory_map)
+        value = pd.DataFrame(
+            {"a": [1, 2, 3], "b": ["x", "y", "z"]}, index=pd.Index([10, 20, 30], name="idx")
+        )
+        loaded = _materialize_and_load(io_manager, value)
+
+        assert _read_magic(os.path.join(tmp_dir, "upstream")) == ARROW_IPC_MAGIC
+        pd.testing.assert_frame_equal(loaded, value)
+
+        # columns that arrow can't represent are pickled instead
+        mixed_value = pd.DataFrame({"a": [1, "x", {"b": 2}]})
+        loaded = _materialize_and_load(io_manager, mixed_value)
+        assert _read_magic(os.path.join(tmp_dir, "upstream")) != ARROW_IPC_MAGIC
+        pd.testing.assert_frame_equal(loaded, mixed_value)
+
+
+def test_columnar_io_manager_pyarrow_partitioned():
+    pa = pytest.importorskip("pyarrow")
+
+    partitions_def = DailyPartitionsDefinition(start_date="2022-01-01")
+
+    @asset(partitions_def=partitions_def)
+    def table_asset(context):
+        return pa.table({"partition": [context.partition_key]})
+
+    @asset(partitions_def=partitions_def)
+    def downstream(table_asset):
+        assert isinstance(table_asset, pa.Table)
+        assert table_asset.column("partition").to_pylist() == ["2022-01-02"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        io_manager = ColumnarObjectFilesystemIOManager(base_dir=tmp_dir)
+        assert materialize(
+            [table_asset, downstream],
+            partition_key="2022-01-02",
+            resources={"io_manager": io_manager},
+        ).success
+
+        path = os.path.join(tmp_dir, "table_asset", "2022-01-02")
+        assert _read_magic(path) == ARROW_IPC_MAGIC
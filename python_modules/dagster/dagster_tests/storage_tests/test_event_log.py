@@ -6,10 +6,15 @@
 import traceback
 from concurrent.futures import ThreadPoolExecutor
 
+import pendulum
 import pytest
 import sqlalchemy
 import sqlalchemy as db
+from dagster import AssetKey, AssetMaterialization, Output, job, op
+from dagster._check import CheckError
 from dagster._core.errors import DagsterEventLogInvalidForRun
+from dagster._core.events import DagsterEventType
+from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import (
     ConsolidatedSqliteEventLogStorage,
     InMemoryEventLogStorage,
@@ -17,11 +22,22 @@
     SqlEventLogStorageTable,
     SqliteEventLogStorage,
 )
+from dagster._core.storage.event_log.archive import archive_old_run_events
+from dagster._core.storage.event_log.codec import (
+    ZLIB_CODEC,
+    decode_event_payload,
+    encode_event_payload,
+    get_event_payload_codec,
+)
+from dagster._core.storage.event_log.migration import reencode_event_payloads
 from dagster._core.storage.event_log.schema import ConcurrencyLimitsTable, ConcurrencySlotsTable
+from dagster._core.storage.event_log.sqlite import sqlite_event_log
 from dagster._core.storage.legacy_storage import LegacyEventLogStorage
 from dagster._core.storage.sql import create_engine
 from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
+from dagster._core.test_utils import instance_for_test
+from dagster._serdes import serialize_value
 from dagster._utils.test import ConcurrencyEnabledSqliteTestEventLogStorage
 from sqlalchemy.engine import Connection
 
@@ -116,6 +132,55 @@ def test_concurrent_sqlite_event_log_connections(self, storage):
             excs.append(exceptions.get())
         assert not excs, excs
 
+    def test_shard_engines_cached(self, storage, monkeypatch):
+        monkeypatch.setattr(sqlite_event_log, "MAX_CACHED_SHARD_ENGINES", 3)
+        create_storage_engine = sqlite_event_log.create_storage_engine
+        created_shards = []
+
+        def _create_storage_engine(url, *args, **kwargs):
+            created_shards.append(os.path.splitext(os.path.basename(url))[0])
+            return create_storage_engine(url, *args, **kwargs)
+
+        monkeypatch.setattr(sqlite_event_log, "create_storage_engine", _create_storage_engine)
+
+        for _ in range(3):
+            for run_id in ["a", "b"]:
+                storage.store_event(_create_event(run_id, "message"))
+                assert len(storage.get_logs_for_run(run_id)) > 0
+
+        # one engine is created for each shard, and reused for every read and write
+        assert sorted(created_shards) == ["a", "b"]
+
+        # the least recently used engines are evicted once more shards are used
+        for run_id in ["c", "d"]:
+            storage.store_event(_create_event(run_id, "message"))
+        assert list(storage._engines) == ["b", "c", "d"]  # noqa: SLF001
+        assert len(storage.get_logs_for_run("a")) == 3
+        assert created_shards[-1] == "a"
+
+        # the engines of deleted shards are disposed
+        storage.wipe()
+        assert list(storage._engines) == ["index"]  # noqa: SLF001
+        assert storage.get_logs_for_run("a") == []
+
+    def test_concurrent_threads(self, storage):
+        run_ids = ["a", "b", "c"]
+        num_events = 50
+
+        def _store_and_read(run_id):
+            for i in range(num_events):
+                storage.store_event(_create_event(run_id, str(i)))
+                storage.get_logs_for_run(run_id)
+            return run_id
+
+        # the threads of a process write to and read from shards concurrently
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(_store_and_read, run_ids * 2))
+
+        assert results == run_ids * 2
+        for run_id in run_ids:
+            assert len(storage.get_logs_for_run(run_id)) == num_events * 2
+
 
 class TestConsolidatedSqliteEventLogStorage(TestEventLogStorage):
     __test__ = True
@@ -132,6 +197,21 @@ def event_log_storage(self):
                 storage.dispose()
 
 
+class TestCompressedSqliteEventLogStorage(TestEventLogStorage):
+    __test__ = True
+
+    @pytest.fixture(scope="function", name="storage")
+    def event_log_storage(self):
+        # make the temp dir in the cwd since default temp roots
+        # have issues with FS notif based event log watching
+        with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+            storage = SqliteEventLogStorage(tmpdir_path, event_payload_codec=ZLIB_CODEC)
+            try:
+                yield storage
+            finally:
+                storage.dispose()
+
+
 class TestLegacyStorage(TestEventLogStorage):
     __test__ = True
 
@@ -246,3 +326,195 @@ def test_concurrency_reconcile():
             assert _get_slot_count(conn, "bar") == 3
             assert _get_limit_row_num(conn, "foo") == 5
             assert _get_limit_row_num(conn, "bar") == 3
+
+
+def _create_event(run_id: str, message: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        level="debug",
+        user_message=message,
+        run_id=run_id,
+        timestamp=time.time(),
+    )
+
+
+def _stored_event_payloads(storage, run_id):
+    with storage.run_connection(run_id) as conn:
+        return [
+            value
+            for (value,) in conn.execute(
+                db_select([SqlEventLogStorageTable.c.event]).order_by(
+                    SqlEventLogStorageTable.c.id.asc()
+                )
+            ).fetchall()
+        ]
+
+
+def test_event_payload_codec():
+    payload = serialize_value(_create_event("foo", "x" * 1000))
+    encoded = encode_event_payload(payload, ZLIB_CODEC)
+    assert encoded.startswith("zlib:1:")
+    assert len(encoded) < len(payload)
+    assert get_event_payload_codec(encoded) == ZLIB_CODEC
+    assert decode_event_payload(encoded) == payload
+
+    # small payloads and payloads without a codec are stored as is
+    small_payload = serialize_value(_create_event("foo", "x"))
+    assert encode_event_payload(small_payload, ZLIB_CODEC) == small_payload
+    assert encode_event_payload(payload, None) == payload
+    assert decode_event_payload(payload) == payload
+    assert get_event_payload_codec(payload) is None
+
+    with pytest.raises(CheckError, match="Unknown event payload codec"):
+        SqliteEventLogStorage(os.getcwd(), event_payload_codec="lz4")
+
+
+def test_reencode_event_payloads():
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+        storage = SqliteEventLogStorage(tmpdir_path)
+        try:
+            storage.store_event(_create_event("foo", "uncompressed " * 100))
+            storage.store_event(_create_event("foo", "short"))
+            assert all(
+                get_event_payload_codec(value) is None
+                for value in _stored_event_payloads(storage, "foo")
+            )
+        finally:
+            storage.dispose()
+
+        storage = SqliteEventLogStorage(tmpdir_path, event_payload_codec=ZLIB_CODEC)
+        try:
+            storage.store_event(_create_event("foo", "compressed " * 100))
+            assert [
+                get_event_payload_codec(value) for value in _stored_event_payloads(storage, "foo")
+            ] == [None, None, ZLIB_CODEC]
+
+            # rows written with and without the codec are both readable
+            messages = [event.user_message for event in storage.get_logs_for_run("foo")]
+            assert messages == ["uncompressed " * 100, "short", "compressed " * 100]
+
+            assert reencode_event_payloads(storage, ZLIB_CODEC) == 1
+            assert [
+                get_event_payload_codec(value) for value in _stored_event_payloads(storage, "foo")
+            ] == [ZLIB_CODEC, None, ZLIB_CODEC]
+            # re-encoding is idempotent
+            assert reencode_event_payloads(storage, ZLIB_CODEC) == 0
+            assert [event.user_message for event in storage.get_logs_for_run("foo")] == messages
+
+            assert reencode_event_payloads(storage, None) == 2
+            assert all(
+                get_event_payload_codec(value) is None
+                for value in _stored_event_payloads(storage, "foo")
+            )
+            assert [event.user_message for event in storage.get_logs_for_run("foo")] == messages
+        finally:
+            storage.dispose()
+
+
+@op
+def materialize_op():
+    yield AssetMaterialization(asset_key="archived_asset")
+    yield Output(1)
+
+
+@job
+def archived_job():
+    materialize_op()
+
+
+def _stored_event_types(storage, run_id):
+    with storage.run_connection(run_id) as conn:
+        return {
+            event_type
+            for (event_type,) in conn.execute(
+                db_select([SqlEventLogStorageTable.c.dagster_event_type]).where(
+                    SqlEventLogStorageTable.c.run_id == run_id
+                )
+            ).fetchall()
+        }
+
+
+def test_archive_run_events():
+    with tempfile.TemporaryDirectory(dir=os.getcwd()) as tmpdir_path:
+        with instance_for_test(
+            overrides={
+                "event_log_storage": {
+                    "module": "dagster._core.storage.event_log",
+                    "class": "SqliteEventLogStorage",
+                    "config": {
+                        "base_dir": os.path.join(tmpdir_path, "events"),
+                        "event_log_archive_uri": os.path.join(tmpdir_path, "archive"),
+                    },
+                }
+            }
+        ) as instance:
+            storage = instance.event_log_storage
+            run_id = archived_job.execute_in_process(instance=instance).run_id
+
+            records = storage.get_records_for_run(run_id).records
+            stats = storage.get_stats_for_run(run_id)
+            step_stats = storage.get_step_stats_for_run(run_id)
+            latest_materialization = instance.get_latest_materialization_event(
+                AssetKey("archived_asset")
+            )
+            assert not storage.is_run_archived(run_id)
+
+            # runs updated after the cutoff are not archived
+            assert archive_old_run_events(instance, pendulum.now("UTC").subtract(days=1)) == 0
+            assert archive_old_run_events(instance, pendulum.now("UTC").add(days=1)) == 1
+            assert storage.is_run_archived(run_id)
+
+            # only asset and run status events are left in the event log table
+            assert _stored_event_types(storage, run_id) == {
+                DagsterEventType.ASSET_MATERIALIZATION.value,
+                DagsterEventType.RUN_START.value,
+                DagsterEventType.RUN_SUCCESS.value,
+            }
+
+            # per-run reads are served from the archive
+            assert storage.get_records_for_run(run_id).records == records
+            archived_stats = storage.get_stats_for_run(run_id)
+            # timestamps stored in the event log table are truncated to microseconds
+            assert archived_stats._replace(start_time=None, end_time=None) == stats._replace(
+                start_time=None, end_time=None
+            )
+            assert archived_stats.start_time == pytest.approx(stats.start_time, abs=1e-5)
+            assert archived_stats.end_time == pytest.approx(stats.end_time, abs=1e-5)
+            assert storage.get_step_stats_for_run(run_id) == step_stats
+            assert (
+                instance.get_latest_materialization_event(AssetKey("archived_asset"))
+                == latest_materialization
+            )
+
+            # paging through an archived run
+            first_page = storage.get_records_for_run(run_id, limit=3)
+            assert first_page.has_more
+            assert first_page.records == records[:3]
+            second_page = storage.get_records_for_run(run_id, cursor=first_page.cursor, limit=3)
+            assert second_page.records == records[3:6]
+            assert storage.get_records_for_run(run_id, ascending=False).records == list(
+                reversed(records)
+            )
+            assert [
+                record.storage_id
+                for record in storage.get_records_for_run(
+                    run_id, of_type=DagsterEventType.STEP_SUCCESS
+                ).records
+            ] == [
+                record.storage_id
+                for record in records
+                if record.event_log_entry.dagster_event_type == DagsterEventType.STEP_SUCCESS
+            ]
+
+            # events stored after the run was archived are read from the event log table
+            instance.report_engine_event("after archival", instance.get_run_by_id(run_id))
+            new_records = storage.get_records_for_run(run_id).records
+            assert new_records[:-1] == records
+            assert new_records[-1].event_log_entry.message == "after archival"
+
+            # archiving again is a no-op
+            assert archive_old_run_events(instance, pendulum.now("UTC").add(days=1)) == 0
+            assert storage.get_records_for_run(run_id).records == new_records
+
+            instance.delete_run(run_id)
+            assert not storage.is_run_archived(run_id)
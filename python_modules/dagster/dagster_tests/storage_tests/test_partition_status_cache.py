@@ -27,6 +27,8 @@
     AssetStatusCacheValue,
     build_failed_and_in_progress_partition_subset,
     get_and_update_asset_status_cache_value,
+    get_appended_dynamic_partition_keys,
+    get_partitions_def_status_cache_id,
 )
 from dagster._core.test_utils import create_run_for_test, instance_for_test
 from dagster._core.utils import make_new_run_id
@@ -325,6 +327,87 @@ def asset1():
         assert cached_status.serialized_materialized_partition_subset is None
 
 
+def test_dynamic_partitions_status_cache_appended_partitions():
+    dynamic = DynamicPartitionsDefinition(name="foo")
+
+    @asset(partitions_def=dynamic)
+    def asset1():
+        return 1
+
+    asset_key = AssetKey("asset1")
+    asset_graph = AssetGraph.from_assets([asset1])
+    asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+    def _materialized_keys(cached_status):
+        return set(
+            dynamic.deserialize_subset(
+                cached_status.serialized_materialized_partition_subset
+            ).get_partition_keys()
+        )
+
+    with instance_for_test() as created_instance:
+        created_instance.add_dynamic_partitions("foo", ["a", "b"])
+        asset_job.execute_in_process(instance=created_instance, partition_key="a")
+
+        # materialized before the partition key was added
+        created_instance.report_runless_asset_event(
+            AssetMaterialization(asset_key=asset_key, partition="c")
+        )
+
+        cached_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert cached_status
+        assert _materialized_keys(cached_status) == {"a"}
+
+        created_instance.add_dynamic_partitions("foo", ["c", "d"])
+        asset_job.execute_in_process(instance=created_instance, partition_key="d")
+        assert get_appended_dynamic_partition_keys(
+            dynamic,
+            cached_status.partitions_def_id,
+            get_partitions_def_status_cache_id(dynamic, created_instance),
+            created_instance,
+        ) == ["c", "d"]
+
+        traced_counter.set(Counter())
+        updated_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert updated_status
+        assert updated_status.partitions_def_id != cached_status.partitions_def_id
+        assert _materialized_keys(updated_status) == {"a", "c", "d"}
+        # the cached value was updated incrementally rather than rebuilt
+        counts = traced_counter.get().counts()
+        assert counts.get("DagsterInstance.get_materialized_partitions") == 1
+
+        # unchanged partition keys are not read to check the cached value
+        traced_counter.set(Counter())
+        assert (
+            get_and_update_asset_status_cache_value(
+                created_instance, asset_key, asset_graph.get_partitions_def(asset_key)
+            )
+            == updated_status
+        )
+        assert not traced_counter.get().counts().get("DagsterInstance.get_dynamic_partitions")
+
+        # deleting a partition key rebuilds the cached value
+        created_instance.delete_dynamic_partition("foo", "a")
+        assert (
+            get_appended_dynamic_partition_keys(
+                dynamic,
+                updated_status.partitions_def_id,
+                get_partitions_def_status_cache_id(dynamic, created_instance),
+                created_instance,
+            )
+            is None
+        )
+        rebuilt_status = get_and_update_asset_status_cache_value(
+            created_instance, asset_key, asset_graph.get_partitions_def(asset_key)
+        )
+        assert rebuilt_status
+        assert _materialized_keys(rebuilt_status) == {"c", "d"}
+
+
 def test_failure_cache():
     partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
 
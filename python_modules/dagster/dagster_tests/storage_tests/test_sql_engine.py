@@ -0,0 +1,75 @@
+import multiprocessing
+import os
+
+import sqlalchemy as db
+import sqlalchemy.pool as db_pool
+from dagster._core.storage.sql import create_storage_engine, webserver_pool_config
+
+POOL_CONFIG = {
+    "pool_size": 2,
+    "max_overflow": 0,
+    "pool_timeout": 30,
+    "pool_recycle": 3600,
+    "pool_pre_ping": True,
+}
+
+
+def _count_connects(engine):
+    pids = []
+    db.event.listen(engine, "connect", lambda *_args: pids.append(os.getpid()))
+    return pids
+
+
+def _select_one(engine):
+    with engine.connect() as conn:
+        return conn.execute(db.text("select 1")).scalar()
+
+
+def test_unpooled_engine(tmpdir):
+    engine = create_storage_engine(f"sqlite:///{tmpdir}/test.db")
+    assert isinstance(engine.pool, db_pool.NullPool)
+
+    connects = _count_connects(engine)
+    for _ in range(3):
+        assert _select_one(engine) == 1
+    assert len(connects) == 3
+
+
+def test_pooled_engine(tmpdir):
+    engine = create_storage_engine(f"sqlite:///{tmpdir}/test.db", POOL_CONFIG)
+    assert isinstance(engine.pool, db_pool.QueuePool)
+    assert engine.pool.size() == 2
+
+    connects = _count_connects(engine)
+    for _ in range(3):
+        assert _select_one(engine) == 1
+    assert len(connects) == 1
+
+    webserver_engine = create_storage_engine(
+        f"sqlite:///{tmpdir}/test.db", webserver_pool_config(pool_recycle=-1)
+    )
+    assert webserver_engine.pool.size() == 1
+
+
+def _select_in_child(engine, connects, queue):
+    queue.put((_select_one(engine), connects))
+
+
+def test_pooled_engine_across_fork(tmpdir):
+    engine = create_storage_engine(f"sqlite:///{tmpdir}/test.db", POOL_CONFIG)
+    connects = _count_connects(engine)
+    assert _select_one(engine) == 1
+
+    ctx = multiprocessing.get_context("fork")
+    queue = ctx.Queue()
+    process = ctx.Process(target=_select_in_child, args=(engine, connects, queue))
+    process.start()
+    result, child_connects = queue.get(timeout=30)
+    process.join()
+    assert process.exitcode == 0
+
+    # the connection inherited by the child is replaced by a new one there, and kept by the parent
+    assert result == 1
+    assert child_connects == [os.getpid(), process.pid]
+    assert _select_one(engine) == 1
+    assert connects == [os.getpid()]
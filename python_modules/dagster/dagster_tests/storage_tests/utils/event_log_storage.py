@@ -55,7 +55,11 @@
 )
 from dagster._core.definitions.unresolved_asset_job_definition import define_asset_job
 from dagster._core.errors import DagsterInvalidInvocationError, DagsterInvariantViolationError
-from dagster._core.event_api import EventLogCursor, EventRecordsResult
+from dagster._core.event_api import (
+    EventLogCursor,
+    EventRecordsResult,
+    MultiAssetEventRecordsFilter,
+)
 from dagster._core.events import (
     EVENT_TYPE_TO_PIPELINE_RUN_STATUS,
     AssetMaterializationPlannedData,
@@ -87,10 +91,15 @@
 from dagster._core.storage.event_log import InMemoryEventLogStorage, SqlEventLogStorage
 from dagster._core.storage.event_log.base import EventLogStorage
 from dagster._core.storage.event_log.migration import (
+    ASSET_PARTITION_LATEST_INDEX,
     EVENT_LOG_DATA_MIGRATIONS,
     migrate_asset_key_data,
+    migrate_asset_partition_latest_data,
+)
+from dagster._core.storage.event_log.schema import (
+    AssetPartitionLatestTable,
+    SqlEventLogStorageTable,
 )
-from dagster._core.storage.event_log.schema import SqlEventLogStorageTable
 from dagster._core.storage.event_log.sqlite.sqlite_event_log import SqliteEventLogStorage
 from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 from dagster._core.storage.sqlalchemy_compat import db_select
@@ -99,7 +108,6 @@
 from dagster._core.utils import make_new_run_id
 from dagster._legacy import build_assets_job
 from dagster._loggers import colored_console_logger
-from dagster._serdes.serdes import deserialize_value
 from dagster._utils import datetime_as_float
 from dagster._utils.concurrency import ConcurrencySlotStatus
 
@@ -733,7 +741,7 @@ def test_basic_event_store(self, test_run_id, storage):
 
         rows = _fetch_all_events(storage, run_id=test_run_id)
 
-        out_events = list(map(lambda r: deserialize_value(r[0], EventLogEntry), rows))
+        out_events = list(map(lambda r: storage.deserialize_event(r[0]), rows))
 
         # messages can come out of order
         event_type_counts = CollectionsCounter(_event_types(out_events))
@@ -1986,6 +1994,85 @@ def op_partitioned(context):
                 )
                 assert len(records) == 3
 
+    def test_get_event_records_by_asset_key(self, storage, instance):
+        a = AssetKey("a")
+        b = AssetKey(["b", "x"])
+        c = AssetKey("c")
+
+        @op
+        def materialize_op():
+            yield AssetMaterialization(asset_key=a, partition="one")
+            yield AssetMaterialization(asset_key=b, partition="one")
+            yield AssetMaterialization(asset_key=a, partition="two")
+            yield Output(1)
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_ids = [make_new_run_id() for _ in range(2)]
+            with create_and_delete_test_runs(instance, run_ids):
+                for run_id in run_ids:
+                    events, _ = _synthesize_events(
+                        lambda: materialize_op(), instance=created_instance, run_id=run_id
+                    )
+                    for event in events:
+                        storage.store_event(event)
+
+                def _get_records_by_key(after_storage_id_by_asset_key, limit=None, **kwargs):
+                    return storage.get_event_records_by_asset_key(
+                        MultiAssetEventRecordsFilter(
+                            event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                            after_storage_id_by_asset_key=after_storage_id_by_asset_key,
+                            **kwargs,
+                        ),
+                        limit=limit,
+                    )
+
+                records_by_key = _get_records_by_key({a: None, b: None, c: None})
+                assert set(records_by_key.keys()) == {a, b, c}
+                assert len(records_by_key[a]) == 4
+                assert len(records_by_key[b]) == 2
+                assert records_by_key[c] == []
+                for asset_key in [a, b]:
+                    assert all(
+                        record.asset_key == asset_key for record in records_by_key[asset_key]
+                    )
+                    # matches the single asset key query, in ascending order
+                    assert [record.storage_id for record in records_by_key[asset_key]] == [
+                        record.storage_id
+                        for record in storage.get_event_records(
+                            EventRecordsFilter(
+                                event_type=DagsterEventType.ASSET_MATERIALIZATION,
+                                asset_key=asset_key,
+                            ),
+                            ascending=True,
+                        )
+                    ]
+
+                all_a_ids = [record.storage_id for record in records_by_key[a]]
+                all_b_ids = [record.storage_id for record in records_by_key[b]]
+
+                # each asset key is filtered by its own cursor
+                records_by_key = _get_records_by_key({a: all_a_ids[1], b: None})
+                assert [record.storage_id for record in records_by_key[a]] == all_a_ids[2:]
+                assert [record.storage_id for record in records_by_key[b]] == all_b_ids
+
+                records_by_key = _get_records_by_key({a: all_a_ids[0], b: None}, limit=1)
+                assert [record.storage_id for record in records_by_key[a]] == [all_a_ids[1]]
+                assert [record.storage_id for record in records_by_key[b]] == [all_b_ids[0]]
+
+                records_by_key = _get_records_by_key({a: None, b: None}, asset_partitions=["two"])
+                assert len(records_by_key[a]) == 2
+                assert all(record.partition_key == "two" for record in records_by_key[a])
+                assert records_by_key[b] == []
+
+                if self.can_wipe():
+                    storage.wipe_asset(b)
+                    records_by_key = _get_records_by_key({a: None, b: None})
+                    assert len(records_by_key[a]) == 4
+                    assert records_by_key[b] == []
+
     def test_get_asset_keys(self, storage, test_run_id):
         @op
         def gen_op():
@@ -2140,6 +2227,89 @@ def materialize_three():
                     assert storage.get_materialized_partitions(c, after_cursor=9999999999) == set()
                     assert storage.get_materialized_partitions(d, after_cursor=9999999999) == set()
 
+    def test_asset_partition_latest_index(self, storage, instance):
+        if not isinstance(storage, SqlEventLogStorage) or not storage.has_table(
+            AssetPartitionLatestTable.name
+        ):
+            pytest.skip("This test is for storages with the asset_partition_latest table")
+
+        a = AssetKey("asset_a")
+        b = AssetKey("asset_b")
+
+        @op
+        def materialize():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetMaterialization(a, partition="y")
+            yield AssetObservation(a, partition="x")
+            yield AssetMaterialization(b)
+            yield Output(None)
+
+        @op
+        def materialize_again():
+            yield AssetMaterialization(a, partition="x")
+            yield AssetObservation(b, partition="z")
+            yield Output(None)
+
+        def _latest_ids_from_event_log(asset_key, event_type):
+            latest_ids = {}
+            for record in storage.get_event_records(
+                EventRecordsFilter(event_type=event_type, asset_key=asset_key), ascending=True
+            ):
+                partition = record.event_log_entry.dagster_event.partition
+                if partition:
+                    latest_ids[partition] = record.storage_id
+            return latest_ids
+
+        def _assert_latest_ids(expected_materialized_partitions):
+            for asset_key in [a, b]:
+                for event_type in [
+                    DagsterEventType.ASSET_MATERIALIZATION,
+                    DagsterEventType.ASSET_OBSERVATION,
+                ]:
+                    assert storage.get_latest_storage_id_by_partition(
+                        asset_key, event_type
+                    ) == _latest_ids_from_event_log(asset_key, event_type)
+            assert storage.get_materialized_partitions(a) == expected_materialized_partitions
+
+        with instance_for_test() as created_instance:
+            if not storage.has_instance:
+                storage.register_instance(created_instance)
+
+            run_id_1 = make_new_run_id()
+            run_id_2 = make_new_run_id()
+
+            with create_and_delete_test_runs(instance, [run_id_1, run_id_2]):
+                cursor_run1 = _store_materialization_events(
+                    storage, materialize, created_instance, run_id_1
+                )
+                _store_materialization_events(
+                    storage, materialize_again, created_instance, run_id_2
+                )
+
+                assert storage.has_secondary_index(ASSET_PARTITION_LATEST_INDEX)
+                _assert_latest_ids({"x", "y"})
+                assert storage.get_materialized_partitions(a, after_cursor=cursor_run1) == {"x"}
+
+                # rebuild the table from scratch, as for storages created before the table existed
+                with storage.index_connection() as conn:
+                    conn.execute(AssetPartitionLatestTable.delete())
+                migrate_asset_partition_latest_data(storage)
+                _assert_latest_ids({"x", "y"})
+
+                # deleting a run falls back to the latest events of earlier runs
+                storage.delete_events(run_id_2)
+                _assert_latest_ids({"x", "y"})
+                assert (
+                    storage.get_latest_storage_id_by_partition(
+                        b, DagsterEventType.ASSET_OBSERVATION
+                    )
+                    == {}
+                )
+
+                if self.can_wipe():
+                    storage.wipe_asset(a)
+                    _assert_latest_ids(set())
+
     def test_get_latest_storage_ids_by_partition(self, storage, instance):
         a = AssetKey(["a"])
         b = AssetKey(["b"])
@@ -3965,6 +4135,31 @@ def test_delete_dynamic_partitions(self, storage):
         storage.delete_dynamic_partition(partitions_def_name="bar", partition_key="foo")
         assert set(storage.get_dynamic_partitions("baz")) == set()
 
+    def test_dynamic_partitions_version(self, storage):
+        if storage.get_dynamic_partitions_version("foo") is None:
+            pytest.skip("storage does not track dynamic partitions versions")
+
+        assert storage.get_dynamic_partitions_version("foo") == (0, 0)
+
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo", "bar"])
+        assert storage.get_dynamic_partitions_version("foo") == (2, 0)
+
+        # adding existing or no partitions does not change the version
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo"])
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=[])
+        assert storage.get_dynamic_partitions_version("foo") == (2, 0)
+
+        storage.add_dynamic_partitions(partitions_def_name="foo", partition_keys=["foo", "baz"])
+        assert storage.get_dynamic_partitions_version("foo") == (3, 0)
+
+        storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="foo")
+        storage.delete_dynamic_partition(partitions_def_name="foo", partition_key="foo")
+        version = storage.get_dynamic_partitions_version("foo")
+        assert version == (3, 1)
+        assert version.num_partitions == len(storage.get_dynamic_partitions("foo")) == 2
+
+        assert storage.get_dynamic_partitions_version("bar") == (0, 0)
+
     def test_has_dynamic_partition(self, storage):
         assert storage
         assert storage.get_dynamic_partitions("foo") == []
@@ -8,6 +8,7 @@
 import pytest
 from dagster import _seven, job, op
 from dagster._core.definitions import GraphDefinition
+from dagster._core.definitions.selector import InstigatorSelector
 from dagster._core.errors import (
     DagsterRunAlreadyExists,
     DagsterRunNotFoundError,
@@ -32,7 +33,8 @@
 from dagster._core.storage.noop_compute_log_manager import NoOpComputeLogManager
 from dagster._core.storage.root import LocalArtifactStorage
 from dagster._core.storage.runs.base import RunStorage
-from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS
+from dagster._core.storage.runs.migration import REQUIRED_DATA_MIGRATIONS, RUN_KEYS
+from dagster._core.storage.runs.schema import RunKeysTable, SecondaryIndexMigrationTable
 from dagster._core.storage.runs.sql_run_storage import SqlRunStorage
 from dagster._core.storage.tags import (
     PARENT_RUN_ID_TAG,
@@ -40,12 +42,14 @@
     PARTITION_SET_TAG,
     REPOSITORY_LABEL_TAG,
     ROOT_RUN_ID_TAG,
+    RUN_KEY_TAG,
+    SENSOR_NAME_TAG,
 )
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._core.utils import make_new_run_id
 from dagster._daemon.daemon import SensorDaemon
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import serialize_pp
+from dagster._serdes import create_snapshot_id, serialize_pp
 from dagster._seven.compat.pendulum import create_pendulum_time, to_timezone
 
 win_py36 = _seven.IS_WINDOWS and sys.version_info[0] == 3 and sys.version_info[1] == 6
@@ -1234,6 +1238,82 @@ def test_secondary_index(self, storage):
         for name in REQUIRED_DATA_MIGRATIONS.keys():
             assert storage.has_built_index(name)
 
+    def test_get_runs_for_run_keys(self, storage):
+        assert storage
+        origin_one = self.fake_job_origin("some_job", "fake_repo_one")
+        origin_two = self.fake_job_origin("some_job", "fake_repo_two")
+
+        def _selector_id(repo_name, name):
+            return create_snapshot_id(
+                InstigatorSelector(
+                    origin_one.external_repository_origin.code_location_origin.location_name,
+                    repo_name,
+                    name,
+                )
+            )
+
+        def _add_run(run_key, origin, sensor_name="my_sensor"):
+            run = TestRunStorage.build_run(
+                run_id=make_new_run_id(),
+                job_name="some_job",
+                tags={SENSOR_NAME_TAG: sensor_name, RUN_KEY_TAG: run_key},
+                external_job_origin=origin,
+            )
+            return storage.add_run(run).run_id
+
+        a = _add_run("a", origin_one)
+        b = _add_run("b", origin_one)
+        _add_run("c", origin_one)
+        other_repo = _add_run("a", origin_two)
+        _add_run("a", origin_one, sensor_name="other_sensor")
+        _add_run("a", None)
+
+        selector_id = _selector_id("fake_repo_one", "my_sensor")
+        runs = storage.get_runs_for_run_keys(selector_id, ["a", "b", "d"])
+        assert {run.run_id for run in runs} == {a, b}
+        assert storage.get_runs_for_run_keys(selector_id, []) == []
+
+        runs = storage.get_runs_for_run_keys(_selector_id("fake_repo_two", "my_sensor"), ["a"])
+        assert [run.run_id for run in runs] == [other_repo]
+
+        if self.can_delete_runs():
+            storage.delete_run(a)
+            runs = storage.get_runs_for_run_keys(selector_id, ["a", "b"])
+            assert [run.run_id for run in runs] == [b]
+
+    def test_migrate_run_keys(self, storage):
+        if not isinstance(storage, SqlRunStorage):
+            return
+
+        origin = self.fake_job_origin("some_job")
+        run_id = make_new_run_id()
+        storage.add_run(
+            TestRunStorage.build_run(
+                run_id=run_id,
+                job_name="some_job",
+                tags={SENSOR_NAME_TAG: "my_sensor", RUN_KEY_TAG: "a"},
+                external_job_origin=origin,
+            )
+        )
+        selector_id = storage.get_runs(RunsFilter(run_ids=[run_id]))[0].instigator_selector_id
+
+        # simulate runs added before the run key index
+        with storage.connect() as conn:
+            conn.execute(RunKeysTable.delete())
+            conn.execute(
+                SecondaryIndexMigrationTable.delete().where(
+                    SecondaryIndexMigrationTable.c.name == RUN_KEYS
+                )
+            )
+        assert not storage.has_built_index(RUN_KEYS)
+        runs = storage.get_runs_for_run_keys(selector_id, ["a"])
+        assert [run.run_id for run in runs] == [run_id]
+
+        storage.migrate()
+        assert storage.has_built_index(RUN_KEYS)
+        runs = storage.get_runs_for_run_keys(selector_id, ["a"])
+        assert [run.run_id for run in runs] == [run_id]
+
     def test_handle_run_event_job_success_test(self, storage):
         run_id = make_new_run_id()
         run_to_add = TestRunStorage.build_run(job_name="pipeline_name", run_id=run_id)
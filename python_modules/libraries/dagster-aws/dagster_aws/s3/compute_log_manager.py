@@ -70,6 +70,8 @@ class S3ComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
         upload_extra_args: (Optional[dict]): Extra args for S3 file upload
         show_url_only: (Optional[bool]): Only show the URL of the log file in the UI, instead of fetching and displaying the full content. Default False.
         region: (Optional[str]): The region of the S3 bucket. If not specified, will use the default region of the AWS session.
+        capture_mode: (Optional[str]): How captured output is mirrored to the terminal, either ``tail`` (the default) or ``thread``. See ``LocalComputeLogManager``.
+        chunked_uploads: (Optional[bool]): Upload partial log files every ``upload_interval`` as chunks containing only the bytes written since the previous upload, instead of re-uploading the whole file. Default False.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -89,6 +91,8 @@ def __init__(
         upload_extra_args=None,
         show_url_only=False,
         region=None,
+        capture_mode=None,
+        chunked_uploads=False,
     ):
         _verify = False if not verify else verify_cert_path
         self._s3_session = boto3.resource(
@@ -101,11 +105,12 @@ def __init__(
         if not local_dir:
             local_dir = seven.get_system_temp_directory()
 
-        self._local_manager = LocalComputeLogManager(local_dir)
+        self._local_manager = LocalComputeLogManager(local_dir, capture_mode=capture_mode)
         self._subscription_manager = PollingComputeLogSubscriptionManager(self)
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self._skip_empty_files = check.bool_param(skip_empty_files, "skip_empty_files")
         self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
+        self._chunked_uploads = check.bool_param(chunked_uploads, "chunked_uploads")
         check.opt_dict_param(upload_extra_args, "upload_extra_args")
         self._upload_extra_args = upload_extra_args
         self._show_url_only = show_url_only
@@ -136,6 +141,8 @@ def config_type(cls):
             ),
             "show_url_only": Field(bool, is_required=False, default_value=False),
             "region": Field(StringSource, is_required=False),
+            "capture_mode": Field(StringSource, is_required=False),
+            "chunked_uploads": Field(bool, is_required=False, default_value=False),
         }
 
     @classmethod
@@ -152,6 +159,10 @@ def local_manager(self) -> LocalComputeLogManager:
     def upload_interval(self) -> Optional[int]:
         return self._upload_interval if self._upload_interval else None
 
+    @property
+    def chunked_uploads(self) -> bool:
+        return self._chunked_uploads
+
     def _clean_prefix(self, prefix):
         parts = prefix.split("/")
         return "/".join([part for part in parts if part])
@@ -206,6 +217,10 @@ def delete_logs(
             to_delete = [{"Key": key} for key in s3_keys_to_remove]
             self._s3_session.delete_objects(Bucket=self._s3_bucket, Delete={"Objects": to_delete})
 
+        if log_key and self._chunked_uploads:
+            self.delete_chunks_from_cloud_storage(log_key, ComputeIOType.STDOUT)
+            self.delete_chunks_from_cloud_storage(log_key, ComputeIOType.STDERR)
+
     def download_url_for_type(self, log_key: Sequence[str], io_type: ComputeIOType):
         if not self.is_capture_complete(log_key):
             return None
@@ -259,6 +274,45 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._s3_session.download_fileobj(self._s3_bucket, s3_key, fileobj)
 
+    def _s3_chunk_prefix(self, log_key, io_type):
+        return f"{self._s3_key(log_key, io_type, partial=True)}.chunks/"
+
+    def upload_chunk_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ):
+        s3_key = f"{self._s3_chunk_prefix(log_key, io_type)}{chunk_name}"
+        extra_args = {
+            "ContentType": "text/plain",
+            **(self._upload_extra_args if self._upload_extra_args else {}),
+        }
+        self._s3_session.put_object(Bucket=self._s3_bucket, Key=s3_key, Body=data, **extra_args)
+
+    def list_chunks_in_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        s3_prefix = self._s3_chunk_prefix(log_key, io_type)
+        paginator = self._s3_session.get_paginator("list_objects_v2")
+        return [
+            (obj["Key"][len(s3_prefix) :], obj["Size"])
+            for page in paginator.paginate(Bucket=self._s3_bucket, Prefix=s3_prefix)
+            for obj in page.get("Contents", [])
+        ]
+
+    def download_chunk_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> bytes:
+        s3_key = f"{self._s3_chunk_prefix(log_key, io_type)}{chunk_name}"
+        return self._s3_session.get_object(Bucket=self._s3_bucket, Key=s3_key)["Body"].read()
+
+    def delete_chunks_from_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        s3_prefix = self._s3_chunk_prefix(log_key, io_type)
+        s3_keys = [
+            f"{s3_prefix}{chunk_name}"
+            for chunk_name, _ in self.list_chunks_in_cloud_storage(log_key, io_type)
+        ]
+        # delete_objects accepts at most 1000 keys per request
+        for i in range(0, len(s3_keys), 1000):
+            to_delete = [{"Key": key} for key in s3_keys[i : i + 1000]]
+            self._s3_session.delete_objects(Bucket=self._s3_bucket, Delete={"Objects": to_delete})
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
@@ -264,3 +264,60 @@ def my_job():
         entry = captured_log_entries[0]
         assert entry.dagster_event.logs_captured_data.external_stdout_url
         assert entry.dagster_event.logs_captured_data.external_stderr_url
+
+
+def test_chunked_uploads(mock_s3_bucket):
+    with tempfile.TemporaryDirectory() as write_dir, tempfile.TemporaryDirectory() as read_dir:
+        write_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=write_dir,
+            chunked_uploads=True,
+        )
+        read_manager = S3ComputeLogManager(
+            bucket=mock_s3_bucket.name,
+            prefix="my_prefix",
+            local_dir=read_dir,
+            chunked_uploads=True,
+        )
+        log_key = ["chunked", "log", "key"]
+        uploaded_offsets = {}
+        with write_manager.open_log_stream(log_key, ComputeIOType.STDOUT) as write_stream:
+            write_stream.write("hello ")
+            write_stream.flush()
+            write_manager.upload_new_chunks(log_key, uploaded_offsets)
+            write_stream.write("world")
+            write_stream.flush()
+            write_manager.upload_new_chunks(log_key, uploaded_offsets)
+
+            # nothing new was written, so no chunk is uploaded
+            write_manager.upload_new_chunks(log_key, uploaded_offsets)
+            assert [
+                obj.key
+                for obj in mock_s3_bucket.objects.filter(Prefix="my_prefix/storage/chunked/")
+            ] == [
+                "my_prefix/storage/chunked/log/key.out.partial.chunks/00000000000000000000",
+                "my_prefix/storage/chunked/log/key.out.partial.chunks/00000000000000000006",
+            ]
+
+            # uploads resume from the chunks in cloud storage
+            write_stream.write("!")
+            write_stream.flush()
+            write_manager.upload_new_chunks(log_key, {})
+
+            log_data = read_manager.get_log_data(log_key)
+            assert log_data.stdout == b"hello world!"
+            assert not read_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDOUT)
+
+            # reads with a cursor span chunk boundaries
+            log_data = read_manager.get_log_data(log_key, cursor="4:0", max_bytes=4)
+            assert log_data.stdout == b"o wo"
+            log_data = read_manager.get_log_data(log_key, cursor=log_data.cursor)
+            assert log_data.stdout == b"rld!"
+            log_data = read_manager.get_log_data(log_key, cursor=log_data.cursor)
+            assert log_data.stdout == b""
+
+        # the chunks are replaced by the complete log file
+        assert read_manager.cloud_storage_has_logs(log_key, ComputeIOType.STDOUT)
+        assert not read_manager.list_chunks_in_cloud_storage(log_key, ComputeIOType.STDOUT)
+        assert read_manager.get_log_data(log_key).stdout == b"hello world!"
@@ -61,6 +61,8 @@ class AzureBlobComputeLogManager(CloudStorageComputeLogManager, ConfigurableClas
             ``dagster._seven.get_system_temp_directory()``.
         prefix (Optional[str]): Prefix for the log file keys.
         upload_interval: (Optional[int]): Interval in seconds to upload partial log files blob storage. By default, will only upload when the capture is complete.
+        capture_mode: (Optional[str]): How captured output is mirrored to the terminal, either ``tail`` (the default) or ``thread``. See ``LocalComputeLogManager``.
+        chunked_uploads: (Optional[bool]): Upload partial log files every ``upload_interval`` as chunks containing only the bytes written since the previous upload, instead of re-uploading the whole file. Default False.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when newed up from config.
     """
@@ -75,6 +77,8 @@ def __init__(
         prefix="dagster",
         upload_interval=None,
         default_azure_credential=None,
+        capture_mode=None,
+        chunked_uploads=False,
     ):
         self._storage_account = check.str_param(storage_account, "storage_account")
         self._container = check.str_param(container, "container")
@@ -101,9 +105,10 @@ def __init__(
         if not local_dir:
             local_dir = seven.get_system_temp_directory()
 
-        self._local_manager = LocalComputeLogManager(local_dir)
+        self._local_manager = LocalComputeLogManager(local_dir, capture_mode=capture_mode)
         self._subscription_manager = PollingComputeLogSubscriptionManager(self)
         self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
+        self._chunked_uploads = check.bool_param(chunked_uploads, "chunked_uploads")
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
 
     @contextmanager
@@ -130,6 +135,8 @@ def config_type(cls):
             "local_dir": Field(StringSource, is_required=False),
             "prefix": Field(StringSource, is_required=False, default_value="dagster"),
             "upload_interval": Field(Noneable(int), is_required=False, default_value=None),
+            "capture_mode": Field(StringSource, is_required=False),
+            "chunked_uploads": Field(bool, is_required=False, default_value=False),
         }
 
     @classmethod
@@ -146,6 +153,10 @@ def local_manager(self) -> LocalComputeLogManager:
     def upload_interval(self) -> Optional[int]:
         return self._upload_interval if self._upload_interval else None
 
+    @property
+    def chunked_uploads(self) -> bool:
+        return self._chunked_uploads
+
     def _clean_prefix(self, prefix):
         parts = prefix.split("/")
         return "/".join([part for part in parts if part])
@@ -185,7 +196,13 @@ def delete_logs(
                 self._blob_key(log_key, ComputeIOType.STDOUT, partial=True),
                 self._blob_key(log_key, ComputeIOType.STDERR, partial=True),
             ]
-            to_remove = [key for key in known_keys if key in blob_list]
+            chunk_prefixes = (
+                self._blob_chunk_prefix(log_key, ComputeIOType.STDOUT),
+                self._blob_chunk_prefix(log_key, ComputeIOType.STDERR),
+            )
+            to_remove = [key for key in known_keys if key in blob_list] + [
+                key for key in blob_list if key.startswith(chunk_prefixes)
+            ]
         elif prefix:
             to_remove = list(blob_list)
         else:
@@ -249,6 +266,39 @@ def download_from_cloud_storage(
             blob = self._container_client.get_blob_client(blob_key)
             blob.download_blob().readinto(fileobj)
 
+    def _blob_chunk_prefix(self, log_key, io_type):
+        return f"{self._blob_key(log_key, io_type, partial=True)}.chunks/"
+
+    def upload_chunk_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ):
+        blob_key = f"{self._blob_chunk_prefix(log_key, io_type)}{chunk_name}"
+        blob = self._container_client.get_blob_client(blob_key)
+        blob.upload_blob(data, overwrite=True)
+
+    def list_chunks_in_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        blob_prefix = self._blob_chunk_prefix(log_key, io_type)
+        return [
+            (blob.name[len(blob_prefix) :], blob.size)
+            for blob in self._container_client.list_blobs(name_starts_with=blob_prefix)
+        ]
+
+    def download_chunk_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> bytes:
+        blob_key = f"{self._blob_chunk_prefix(log_key, io_type)}{chunk_name}"
+        blob = self._container_client.get_blob_client(blob_key)
+        return blob.download_blob().readall()
+
+    def delete_chunks_from_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        blob_prefix = self._blob_chunk_prefix(log_key, io_type)
+        to_remove = [
+            f"{blob_prefix}{chunk_name}"
+            for chunk_name, _ in self.list_chunks_in_cloud_storage(log_key, io_type)
+        ]
+        if to_remove:
+            self._container_client.delete_blobs(*to_remove)
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
@@ -36,12 +36,10 @@
     has_self_dependency,
 )
 from .dagster_dbt_translator import DagsterDbtTranslator, DbtManifestWrapper, validate_translator
-from .dbt_manifest import DbtManifestParam, validate_manifest
+from .dbt_manifest import DbtManifestParam, get_manifest_index, validate_manifest
 from .utils import (
     ASSET_RESOURCE_TYPES,
-    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
     output_name_fn,
-    select_unique_ids_from_manifest,
 )
 
 
@@ -258,11 +256,10 @@ def partitionshop_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource
     """
     dagster_dbt_translator = validate_translator(dagster_dbt_translator)
     manifest = validate_manifest(manifest)
+    manifest_index = get_manifest_index(manifest)
 
-    unique_ids = select_unique_ids_from_manifest(
-        select=select, exclude=exclude or "", manifest_json=manifest
-    )
-    node_info_by_dbt_unique_id = get_dbt_resource_props_by_dbt_unique_id_from_manifest(manifest)
+    unique_ids = manifest_index.select_unique_ids(select=select, exclude=exclude or "")
+    node_info_by_dbt_unique_id = manifest_index.dbt_nodes
     dbt_unique_id_deps = get_deps(
         dbt_nodes=node_info_by_dbt_unique_id,
         selected_unique_ids=unique_ids,
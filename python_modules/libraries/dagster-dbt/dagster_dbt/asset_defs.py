@@ -64,13 +64,13 @@
 from dagster_dbt.core.types import DbtCliOutput
 from dagster_dbt.core.utils import build_command_args_from_flags, execute_cli
 from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator, validate_opt_translator
+from dagster_dbt.dbt_manifest import get_manifest_index
 from dagster_dbt.errors import DagsterDbtError
 from dagster_dbt.types import DbtOutput
 from dagster_dbt.utils import (
     ASSET_RESOURCE_TYPES,
     output_name_fn,
     result_to_events,
-    select_unique_ids_from_manifest,
 )
 
 
@@ -899,8 +899,8 @@ def _load_assets_from_dbt_manifest(
         select = select if select is not None else "fqn:*"
         exclude = exclude if exclude is not None else ""
 
-        selected_unique_ids = select_unique_ids_from_manifest(
-            select=select, exclude=exclude, manifest_json=manifest
+        selected_unique_ids = get_manifest_index(manifest).select_unique_ids(
+            select=select, exclude=exclude
         )
         if len(selected_unique_ids) == 0:
             raise DagsterInvalidSubsetError(f"No dbt models match the selection string '{select}'.")
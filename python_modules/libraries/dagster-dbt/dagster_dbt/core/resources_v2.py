@@ -1,22 +1,28 @@
 import atexit
 import contextlib
 import os
+import queue
 import shutil
 import signal
 import subprocess
 import sys
+import threading
 import uuid
 from contextlib import suppress
 from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 from typing import (
+    IO,
     Any,
     Dict,
     Iterator,
     List,
     Mapping,
     Optional,
+    Sequence,
     Union,
+    cast,
 )
 
 import dateutil.parser
@@ -53,10 +59,11 @@
 )
 from ..dbt_manifest import (
     DbtManifestParam,
+    get_manifest_index,
     validate_manifest,
 )
 from ..errors import DagsterDbtCliRuntimeError
-from ..utils import ASSET_RESOURCE_TYPES, get_dbt_resource_props_by_dbt_unique_id_from_manifest
+from ..utils import ASSET_RESOURCE_TYPES
 
 logger = get_dagster_logger()
 
@@ -66,11 +73,63 @@
 DBT_PROFILES_YML_NAME = "profiles.yml"
 PARTIAL_PARSE_FILE_NAME = "partial_parse.msgpack"
 
+# The max number of bytes read at a time from the stdout of the dbt CLI process. All complete log
+# lines in a read are parsed as a batch.
+DBT_STDOUT_READ_SIZE = 64 * 1024
+
+REFABLE_NODE_TYPES = NodeType.refable()
+
 
 def _get_dbt_target_path() -> Path:
     return Path(os.getenv("DBT_TARGET_PATH", "target"))
 
 
+def _parse_dbt_timestamp(timestamp: str) -> datetime:
+    # dbt logs timestamps like `2024-01-01T00:00:00.123456Z`, which `fromisoformat` only parses
+    # on Python 3.11+ unless the `Z` suffix is replaced
+    try:
+        return datetime.fromisoformat(
+            timestamp[:-1] + "+00:00" if timestamp.endswith("Z") else timestamp
+        )
+    except ValueError:
+        return dateutil.parser.isoparse(timestamp)
+
+
+class _StdoutEchoWriter:
+    """Echoes the logs of the dbt CLI process to stdout from a background thread, so that writing
+    and flushing stdout does not slow down the parsing of the logs. All logs queued since the
+    previous write are written and flushed at once.
+    """
+
+    def __init__(self, stream: IO[str]):
+        self._stream = stream
+        self._queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="dbt-stdout-echo", daemon=True)
+        self._thread.start()
+
+    def write(self, text: str) -> None:
+        self._queue.put(text)
+
+    def close(self) -> None:
+        # wait for all queued logs to be written
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        done = False
+        while not done:
+            texts = [self._queue.get()]
+            with suppress(queue.Empty):
+                while True:
+                    texts.append(self._queue.get_nowait())
+            if texts[-1] is None:
+                done = True
+                texts.pop()
+
+            self._stream.write("".join(cast(List[str], texts)))
+            self._stream.flush()
+
+
 @dataclass
 class DbtCliEventMessage:
     """The representation of a dbt CLI event.
@@ -148,9 +207,9 @@ def to_default_asset_events(
 
         is_node_successful = node_status == NodeStatus.Success
         is_node_finished = bool(event_node_info.get("node_finished_at"))
-        if node_resource_type in NodeType.refable() and is_node_successful:
-            started_at = dateutil.parser.isoparse(event_node_info["node_started_at"])
-            finished_at = dateutil.parser.isoparse(event_node_info["node_finished_at"])
+        if node_resource_type in REFABLE_NODE_TYPES and is_node_successful:
+            started_at = _parse_dbt_timestamp(event_node_info["node_started_at"])
+            finished_at = _parse_dbt_timestamp(event_node_info["node_finished_at"])
             duration_seconds = (finished_at - started_at).total_seconds()
 
             if has_asset_def:
@@ -387,12 +446,13 @@ def stream(
                 def my_dbt_assets(context, dbt: DbtCliResource):
                     yield from dbt.cli(["run"], context=context).stream()
         """
-        for event in self.stream_raw_events():
-            yield from event.to_default_asset_events(
-                manifest=self.manifest,
-                dagster_dbt_translator=self.dagster_dbt_translator,
-                context=self.context,
-            )
+        for events in self._stream_raw_event_batches():
+            for event in events:
+                yield from event.to_default_asset_events(
+                    manifest=self.manifest,
+                    dagster_dbt_translator=self.dagster_dbt_translator,
+                    context=self.context,
+                )
 
     @public
     def stream_raw_events(self) -> Iterator[DbtCliEventMessage]:
@@ -401,30 +461,68 @@ def stream_raw_events(self) -> Iterator[DbtCliEventMessage]:
         Returns:
             Iterator[DbtCliEventMessage]: An iterator of events from the dbt CLI process.
         """
-        with self.process.stdout or contextlib.nullcontext():
-            for raw_line in self.process.stdout or []:
-                log: str = raw_line.decode().strip()
-                try:
-                    event = DbtCliEventMessage.from_log(log=log)
+        for events in self._stream_raw_event_batches():
+            yield from events
 
-                    # Parse the error message from the event, if it exists.
-                    is_error_message = event.raw_event["info"]["level"] == "error"
-                    if is_error_message:
-                        self._error_messages.append(str(event))
+    def _stream_raw_event_batches(self) -> Iterator[Sequence[DbtCliEventMessage]]:
+        """Stream the events from the dbt CLI process, in batches of the events parsed from each
+        read of its stdout.
+        """
+        echo_writer = _StdoutEchoWriter(sys.stdout)
+        try:
+            with self.process.stdout or contextlib.nullcontext():
+                for raw_lines in self._read_stdout_lines():
+                    events: List[DbtCliEventMessage] = []
+                    echo_lines: List[str] = []
+                    for raw_line in raw_lines:
+                        try:
+                            event = DbtCliEventMessage(raw_event=orjson.loads(raw_line))
+                            message = str(event)
+
+                            # Parse the error message from the event, if it exists.
+                            is_error_message = event.raw_event["info"]["level"] == "error"
+                            if is_error_message:
+                                self._error_messages.append(message)
+
+                            events.append(event)
+                        except:
+                            # If we can't parse the log, then just emit it as a raw log.
+                            message = raw_line.decode().strip()
+
+                        echo_lines.append(message)
 
                     # Re-emit the logs from dbt CLI process into stdout.
-                    sys.stdout.write(str(event) + "\n")
-                    sys.stdout.flush()
+                    echo_lines.append("")
+                    echo_writer.write("\n".join(echo_lines))
 
-                    yield event
-                except:
-                    # If we can't parse the log, then just emit it as a raw log.
-                    sys.stdout.write(log + "\n")
-                    sys.stdout.flush()
+                    if events:
+                        yield events
+        finally:
+            echo_writer.close()
 
         # Ensure that the dbt CLI process has completed.
         self._raise_on_error()
 
+    def _read_stdout_lines(self) -> Iterator[Sequence[bytes]]:
+        """Read the stdout of the dbt CLI process in large chunks, yielding the complete lines of
+        each chunk.
+        """
+        if not self.process.stdout:
+            return
+
+        remainder = b""
+        while True:
+            chunk = self.process.stdout.read1(DBT_STDOUT_READ_SIZE)  # type: ignore  # (BufferedReader)
+            if not chunk:
+                break
+
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            yield lines
+
+        if remainder:
+            yield [remainder]
+
     @public
     def get_artifact(
         self,
@@ -1030,7 +1128,7 @@ def get_subset_selection_for_context(
 def get_dbt_resource_props_by_output_name(
     manifest: Mapping[str, Any],
 ) -> Mapping[str, Mapping[str, Any]]:
-    node_info_by_dbt_unique_id = get_dbt_resource_props_by_dbt_unique_id_from_manifest(manifest)
+    node_info_by_dbt_unique_id = get_manifest_index(manifest).dbt_nodes
 
     return {
         output_name_fn(node): node
@@ -1,12 +1,32 @@
-from functools import lru_cache
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import suppress
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Mapping, Union, cast
+from typing import AbstractSet, Any, Dict, Mapping, Optional, Sequence, Union, cast
 
 import dagster._check as check
 import orjson
+from dagster import get_dagster_logger
+
+logger = get_dagster_logger()
 
 DbtManifestParam = Union[Mapping[str, Any], str, Path]
 
+# Bump when the format of the persisted manifest index changes.
+MANIFEST_INDEX_VERSION = 1
+MANIFEST_INDEX_FILE_SUFFIX = ".dagster_index.json"
+
+# The max number of indexes kept for manifests that were not read from a path.
+MAX_IN_MEMORY_MANIFEST_INDEXES = 32
+
+# Selection methods whose results depend on artifacts other than the manifest, e.g. the state of
+# a previous run, so their results are never cached.
+UNCACHEABLE_SELECTION_METHODS = ("state:", "result:", "source_status:")
+
 
 @lru_cache(maxsize=None)
 def read_manifest_path(manifest_path: Path) -> Mapping[str, Any]:
@@ -18,7 +38,18 @@ def read_manifest_path(manifest_path: Path) -> Mapping[str, Any]:
     If we fix the fact that the manifest is held in memory instead of garbage collected, we
     can delete this cache.
     """
-    return cast(Mapping[str, Any], orjson.loads(manifest_path.read_bytes()))
+    manifest_bytes = manifest_path.read_bytes()
+    manifest = cast(Mapping[str, Any], orjson.loads(manifest_bytes))
+
+    _manifest_index_registry.register_path_manifest(
+        DbtManifestIndex(
+            manifest=manifest,
+            manifest_hash=hashlib.sha1(manifest_bytes).hexdigest(),
+            index_path=manifest_path.with_name(f"{manifest_path.stem}{MANIFEST_INDEX_FILE_SUFFIX}"),
+        )
+    )
+
+    return manifest
 
 
 def validate_manifest(manifest: DbtManifestParam) -> Mapping[str, Any]:
@@ -32,3 +63,157 @@ def validate_manifest(manifest: DbtManifestParam) -> Mapping[str, Any]:
         manifest = read_manifest_path(manifest.resolve())
 
     return manifest
+
+
+class DbtManifestIndex:
+    """An index of a dbt manifest, built once per manifest and shared by every dbt asset definition
+    and asset selection that uses it.
+
+    Resolving a dbt selection string requires building dbt's graph from the manifest, so resolved
+    selections are cached. When the manifest was read from a path, they are also persisted next to
+    the manifest, keyed by the content hash of the manifest and the dbt version, so that they are
+    reused when the code location is loaded again.
+    """
+
+    def __init__(
+        self,
+        manifest: Mapping[str, Any],
+        manifest_hash: Optional[str] = None,
+        index_path: Optional[Path] = None,
+    ):
+        self._manifest = manifest
+        self._manifest_hash = manifest_hash
+        self._index_path = index_path
+        self._lock = threading.Lock()
+        self._selections: Optional[Dict[str, Sequence[str]]] = None
+
+    @property
+    def manifest(self) -> Mapping[str, Any]:
+        return self._manifest
+
+    @property
+    def manifest_hash(self) -> Optional[str]:
+        return self._manifest_hash
+
+    @property
+    def index_path(self) -> Optional[Path]:
+        return self._index_path
+
+    @cached_property
+    def dbt_nodes(self) -> Mapping[str, Mapping[str, Any]]:
+        """A mapping of a dbt node's unique id to the node's dictionary representation in the
+        manifest.
+        """
+        from .utils import get_dbt_resource_props_by_dbt_unique_id_from_manifest
+
+        return get_dbt_resource_props_by_dbt_unique_id_from_manifest(self._manifest)
+
+    def select_unique_ids(self, select: str, exclude: str = "") -> AbstractSet[str]:
+        """Returns the unique ids of the dbt nodes matching a dbt selection string."""
+        from .utils import select_unique_ids_from_manifest
+
+        if any(method in f"{select} {exclude}" for method in UNCACHEABLE_SELECTION_METHODS):
+            return select_unique_ids_from_manifest(
+                select=select, exclude=exclude, manifest_json=self._manifest
+            )
+
+        selection_key = orjson.dumps([select, exclude]).decode()
+        with self._lock:
+            selections = self._get_selections()
+            if selection_key not in selections:
+                selections[selection_key] = sorted(
+                    select_unique_ids_from_manifest(
+                        select=select, exclude=exclude, manifest_json=self._manifest
+                    )
+                )
+                self._persist_selections()
+
+            return set(selections[selection_key])
+
+    def _get_selections(self) -> Dict[str, Sequence[str]]:
+        if self._selections is None:
+            self._selections = self._load_persisted_selections()
+        return self._selections
+
+    def _index_header(self) -> Mapping[str, Any]:
+        from dbt.version import __version__ as dbt_version
+
+        return {
+            "version": MANIFEST_INDEX_VERSION,
+            "dbt_version": dbt_version,
+            "manifest_hash": self._manifest_hash,
+        }
+
+    def _load_persisted_selections(self) -> Dict[str, Sequence[str]]:
+        if not self._index_path or not self._manifest_hash or not self._index_path.exists():
+            return {}
+
+        try:
+            persisted_index = orjson.loads(self._index_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+        # the index is stale if the manifest or the dbt version has changed
+        if persisted_index.get("header") != self._index_header():
+            return {}
+
+        return dict(persisted_index.get("selections", {}))
+
+    def _persist_selections(self) -> None:
+        if not self._index_path or not self._manifest_hash:
+            return
+
+        # write to a temporary file first, so that a partially written index is never read
+        tmp_path = self._index_path.with_name(f"{self._index_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            tmp_path.write_bytes(
+                orjson.dumps({"header": self._index_header(), "selections": self._selections})
+            )
+            os.replace(tmp_path, self._index_path)
+        except OSError:
+            # e.g. if the directory of the manifest is read-only, fall back to the in-memory index
+            logger.debug(f"Could not persist the dbt manifest index to {self._index_path}.")
+            with suppress(OSError):
+                tmp_path.unlink()
+
+
+class _DbtManifestIndexRegistry:
+    """Holds the index of each manifest, keyed by the id of the manifest.
+
+    Indexes of manifests read from a path are kept for as long as the cached manifest. Indexes of
+    other manifests are kept in a bounded LRU cache. Each index references its manifest, so that the
+    id of a manifest is never reused while its index is registered.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._path_manifest_indexes: Dict[int, DbtManifestIndex] = {}
+        self._manifest_indexes: "OrderedDict[int, DbtManifestIndex]" = OrderedDict()
+
+    def register_path_manifest(self, index: DbtManifestIndex) -> None:
+        with self._lock:
+            self._path_manifest_indexes[id(index.manifest)] = index
+
+    def get(self, manifest: Mapping[str, Any]) -> DbtManifestIndex:
+        with self._lock:
+            index = self._path_manifest_indexes.get(id(manifest))
+            if index is not None:
+                return index
+
+            index = self._manifest_indexes.get(id(manifest))
+            if index is None:
+                index = DbtManifestIndex(manifest=manifest)
+                self._manifest_indexes[id(manifest)] = index
+                if len(self._manifest_indexes) > MAX_IN_MEMORY_MANIFEST_INDEXES:
+                    self._manifest_indexes.popitem(last=False)
+            else:
+                self._manifest_indexes.move_to_end(id(manifest))
+            return index
+
+
+_manifest_index_registry = _DbtManifestIndexRegistry()
+
+
+def get_manifest_index(manifest: DbtManifestParam) -> DbtManifestIndex:
+    """Returns the shared index of a dbt manifest."""
+    return _manifest_index_registry.get(validate_manifest(manifest))
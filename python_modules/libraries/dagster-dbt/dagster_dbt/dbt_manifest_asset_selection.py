@@ -10,12 +10,8 @@
 
 from .asset_utils import is_non_asset_node
 from .dagster_dbt_translator import DagsterDbtTranslator
-from .dbt_manifest import DbtManifestParam, validate_manifest
-from .utils import (
-    ASSET_RESOURCE_TYPES,
-    get_dbt_resource_props_by_dbt_unique_id_from_manifest,
-    select_unique_ids_from_manifest,
-)
+from .dbt_manifest import DbtManifestParam, get_manifest_index, validate_manifest
+from .utils import ASSET_RESOURCE_TYPES
 
 
 class DbtManifestAssetSelection(AssetSelection):
@@ -59,14 +55,11 @@ def __init__(
         )
 
     def resolve_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetKey]:
-        dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(self.manifest)
+        manifest_index = get_manifest_index(self.manifest)
+        dbt_nodes = manifest_index.dbt_nodes
 
         keys = set()
-        for unique_id in select_unique_ids_from_manifest(
-            select=self.select,
-            exclude=self.exclude,
-            manifest_json=self.manifest,
-        ):
+        for unique_id in manifest_index.select_unique_ids(select=self.select, exclude=self.exclude):
             dbt_resource_props = dbt_nodes[unique_id]
             is_dbt_asset = dbt_resource_props["resource_type"] in ASSET_RESOURCE_TYPES
             if is_dbt_asset and not is_non_asset_node(dbt_resource_props):
@@ -79,14 +72,11 @@ def resolve_checks_inner(self, asset_graph: AssetGraph) -> AbstractSet[AssetChec
         if not self.dagster_dbt_translator.settings.enable_asset_checks:
             return set()
 
-        dbt_nodes = get_dbt_resource_props_by_dbt_unique_id_from_manifest(self.manifest)
+        manifest_index = get_manifest_index(self.manifest)
+        dbt_nodes = manifest_index.dbt_nodes
 
         keys = set()
-        for unique_id in select_unique_ids_from_manifest(
-            select=self.select,
-            exclude=self.exclude,
-            manifest_json=self.manifest,
-        ):
+        for unique_id in manifest_index.select_unique_ids(select=self.select, exclude=self.exclude):
             dbt_resource_props = dbt_nodes[unique_id]
             if dbt_resource_props["resource_type"] != "test":
                 continue
@@ -2,6 +2,7 @@
 import json
 import os
 import shutil
+import subprocess
 from pathlib import Path
 from typing import List, Optional, Union, cast
 
@@ -22,6 +23,7 @@
 from dagster_dbt.core.resources_v2 import (
     PARTIAL_PARSE_FILE_NAME,
     DbtCliEventMessage,
+    DbtCliInvocation,
     DbtCliResource,
 )
 from dagster_dbt.dagster_dbt_translator import DagsterDbtTranslator, DagsterDbtTranslatorSettings
@@ -584,3 +586,48 @@ def test_dbt_tests_to_events(mocker: MockerFixture, is_asset_check: bool) -> Non
 
     assert len(asset_events) == 1
     assert all(isinstance(e, expected_event_type) for e in asset_events)
+
+
+def test_stream_raw_events_from_chunked_stdout(
+    capsys: pytest.CaptureFixture, tmp_path: Path
+) -> None:
+    log_lines = [
+        json.dumps(
+            {
+                "info": {"level": "info", "msg": f"message {i}", "invocation_id": "1-2-3"},
+                "data": {},
+            }
+        )
+        for i in range(5000)
+    ]
+    log_lines.insert(10, "not a json log")
+    log_lines.append(
+        json.dumps({"info": {"level": "error", "msg": "an error"}, "data": {}}),
+    )
+    log_path = tmp_path.joinpath("dbt.log")
+    # the last line is not terminated by a newline
+    log_path.write_text("\n".join(log_lines))
+
+    dbt_cli_invocation = DbtCliInvocation(
+        process=subprocess.Popen(["cat", str(log_path)], stdout=subprocess.PIPE),
+        manifest={},
+        dagster_dbt_translator=DagsterDbtTranslator(),
+        project_dir=tmp_path,
+        target_path=tmp_path,
+        raise_on_error=False,
+    )
+    events = list(dbt_cli_invocation.stream_raw_events())
+
+    assert [str(event) for event in events] == [
+        *[f"message {i}" for i in range(5000)],
+        "an error",
+    ]
+    assert dbt_cli_invocation._error_messages == ["an error"]  # noqa: SLF001
+
+    # all logs are echoed to stdout, in order
+    assert capsys.readouterr().out.splitlines() == [
+        *[f"message {i}" for i in range(10)],
+        "not a json log",
+        *[f"message {i}" for i in range(10, 5000)],
+        "an error",
+    ]
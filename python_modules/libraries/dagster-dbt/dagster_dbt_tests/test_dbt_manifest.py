@@ -0,0 +1,88 @@
+import json
+import shutil
+from pathlib import Path
+from typing import List
+
+import orjson
+from dagster_dbt import dbt_manifest, utils
+from dagster_dbt.dbt_manifest import DbtManifestIndex, get_manifest_index
+
+manifest_path = Path(__file__).joinpath("..", "sample_manifest.json").resolve()
+
+
+def _count_selections(monkeypatch) -> List[str]:
+    select_unique_ids_from_manifest = utils.select_unique_ids_from_manifest
+    calls = []
+
+    def _select_unique_ids_from_manifest(select, exclude, manifest_json):
+        calls.append(select)
+        return select_unique_ids_from_manifest(
+            select=select, exclude=exclude, manifest_json=manifest_json
+        )
+
+    monkeypatch.setattr(utils, "select_unique_ids_from_manifest", _select_unique_ids_from_manifest)
+    return calls
+
+
+def test_manifest_index_caches_selections(monkeypatch):
+    manifest = json.loads(manifest_path.read_bytes())
+    calls = _count_selections(monkeypatch)
+
+    index = get_manifest_index(manifest)
+    assert get_manifest_index(manifest) is index
+
+    selected = index.select_unique_ids(select="fqn:*", exclude="tag:not_a_tag")
+    assert selected == utils.select_unique_ids_from_manifest(
+        select="fqn:*", exclude="tag:not_a_tag", manifest_json=manifest
+    )
+    assert index.select_unique_ids(select="fqn:*", exclude="tag:not_a_tag") == selected
+
+    # one call by the index, and one in the assertion above
+    assert len(calls) == 2
+
+    # in-memory manifests are not persisted
+    assert index.index_path is None
+
+
+def test_manifest_index_persisted(tmp_path: Path, monkeypatch):
+    path = tmp_path / "manifest.json"
+    shutil.copy(manifest_path, path)
+    manifest_bytes = path.read_bytes()
+    manifest = orjson.loads(manifest_bytes)
+    calls = _count_selections(monkeypatch)
+
+    index = DbtManifestIndex(
+        manifest=manifest,
+        manifest_hash="abc",
+        index_path=tmp_path / f"manifest{dbt_manifest.MANIFEST_INDEX_FILE_SUFFIX}",
+    )
+    selected = index.select_unique_ids(select="fqn:*")
+    assert index.index_path and index.index_path.exists()
+    assert len(calls) == 1
+
+    # a new index of the same manifest reuses the persisted selections
+    reloaded_index = DbtManifestIndex(
+        manifest=manifest, manifest_hash="abc", index_path=index.index_path
+    )
+    assert reloaded_index.select_unique_ids(select="fqn:*") == selected
+    assert len(calls) == 1
+
+    # the persisted selections are ignored once the manifest has changed
+    changed_index = DbtManifestIndex(
+        manifest=manifest, manifest_hash="def", index_path=index.index_path
+    )
+    assert changed_index.select_unique_ids(select="fqn:*") == selected
+    assert len(calls) == 2
+
+
+def test_manifest_index_read_from_path(tmp_path: Path):
+    path = tmp_path / "manifest.json"
+    shutil.copy(manifest_path, path)
+
+    index = get_manifest_index(path)
+    assert index.manifest_hash
+    assert index.index_path == tmp_path / f"manifest{dbt_manifest.MANIFEST_INDEX_FILE_SUFFIX}"
+    assert get_manifest_index(str(path)) is index
+
+    index.select_unique_ids(select="fqn:*")
+    assert index.index_path.exists()
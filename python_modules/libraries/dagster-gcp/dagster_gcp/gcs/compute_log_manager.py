@@ -56,6 +56,8 @@ class GCSComputeLogManager(CloudStorageComputeLogManager, ConfigurableClass):
             Can be used when the private key cannot be used as a file.
         upload_interval: (Optional[int]): Interval in seconds to upload partial log files to GCS. By default, will only upload when the capture is complete.
         show_url_only: (Optional[bool]): Only show the URL of the log file in the UI, instead of fetching and displaying the full content. Default False.
+        capture_mode: (Optional[str]): How captured output is mirrored to the terminal, either ``tail`` (the default) or ``thread``. See ``LocalComputeLogManager``.
+        chunked_uploads: (Optional[bool]): Upload partial log files every ``upload_interval`` as chunks containing only the bytes written since the previous upload, instead of re-uploading the whole file. Default False.
         inst_data (Optional[ConfigurableClassData]): Serializable representation of the compute
             log manager when instantiated from config.
     """
@@ -69,6 +71,8 @@ def __init__(
         json_credentials_envvar=None,
         upload_interval=None,
         show_url_only=False,
+        capture_mode=None,
+        chunked_uploads=False,
     ):
         self._bucket_name = check.str_param(bucket, "bucket")
         self._prefix = self._clean_prefix(check.str_param(prefix, "prefix"))
@@ -92,7 +96,8 @@ def __init__(
             local_dir = seven.get_system_temp_directory()
 
         self._upload_interval = check.opt_int_param(upload_interval, "upload_interval")
-        self._local_manager = LocalComputeLogManager(local_dir)
+        self._chunked_uploads = check.bool_param(chunked_uploads, "chunked_uploads")
+        self._local_manager = LocalComputeLogManager(local_dir, capture_mode=capture_mode)
         self._subscription_manager = PollingComputeLogSubscriptionManager(self)
         self._show_url_only = show_url_only
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
@@ -110,6 +115,8 @@ def config_type(cls):
             "json_credentials_envvar": Field(StringSource, is_required=False),
             "upload_interval": Field(Noneable(int), is_required=False, default_value=None),
             "show_url_only": Field(bool, is_required=False, default_value=False),
+            "capture_mode": Field(StringSource, is_required=False),
+            "chunked_uploads": Field(bool, is_required=False, default_value=False),
         }
 
     @classmethod
@@ -126,6 +133,10 @@ def local_manager(self) -> LocalComputeLogManager:
     def upload_interval(self) -> Optional[int]:
         return self._upload_interval if self._upload_interval else None
 
+    @property
+    def chunked_uploads(self) -> bool:
+        return self._chunked_uploads
+
     def _clean_prefix(self, prefix):
         parts = prefix.split("/")
         return "/".join([part for part in parts if part])
@@ -170,6 +181,9 @@ def delete_logs(
             ]
             # if the blob doesn't exist, do nothing instead of raising a not found exception
             self._bucket.delete_blobs(gcs_keys_to_remove, on_error=lambda _: None)
+            if self._chunked_uploads:
+                self.delete_chunks_from_cloud_storage(log_key, ComputeIOType.STDOUT)
+                self.delete_chunks_from_cloud_storage(log_key, ComputeIOType.STDERR)
         elif prefix:
             # add the trailing '/' to make sure that ['a'] does not match ['apple']
             delete_prefix = "/".join([self._prefix, "storage", *prefix, ""])
@@ -229,6 +243,32 @@ def download_from_cloud_storage(
         with open(path, "wb") as fileobj:
             self._bucket.blob(gcs_key).download_to_file(fileobj)
 
+    def _gcs_chunk_prefix(self, log_key, io_type):
+        return f"{self._gcs_key(log_key, io_type, partial=True)}.chunks/"
+
+    def upload_chunk_to_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str, data: bytes
+    ):
+        gcs_key = f"{self._gcs_chunk_prefix(log_key, io_type)}{chunk_name}"
+        self._bucket.blob(gcs_key).upload_from_string(data, content_type="text/plain")
+
+    def list_chunks_in_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        gcs_prefix = self._gcs_chunk_prefix(log_key, io_type)
+        return [
+            (blob.name[len(gcs_prefix) :], blob.size)
+            for blob in self._bucket.list_blobs(prefix=gcs_prefix)
+        ]
+
+    def download_chunk_from_cloud_storage(
+        self, log_key: Sequence[str], io_type: ComputeIOType, chunk_name: str
+    ) -> bytes:
+        gcs_key = f"{self._gcs_chunk_prefix(log_key, io_type)}{chunk_name}"
+        return self._bucket.blob(gcs_key).download_as_bytes()
+
+    def delete_chunks_from_cloud_storage(self, log_key: Sequence[str], io_type: ComputeIOType):
+        to_delete = self._bucket.list_blobs(prefix=self._gcs_chunk_prefix(log_key, io_type))
+        self._bucket.delete_blobs(list(to_delete), on_error=lambda _: None)
+
     def on_subscribe(self, subscription):
         self._subscription_manager.add_subscription(subscription)
 
@@ -8,7 +8,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     SqlEventLogStorage,
@@ -21,8 +21,10 @@
     AlembicVersion,
     check_alembic_revision,
     create_engine,
+    create_storage_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
+    webserver_pool_config,
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from sqlalchemy.engine import Connection
@@ -32,10 +34,13 @@
     mysql_alembic_config,
     mysql_isolation_level,
     mysql_url_from_config,
+    parse_mysql_version,
     retry_mysql_connection_fn,
     retry_mysql_creation_fn,
 )
 
+MINIMUM_MYSQL_BATCH_VERSION = "8.0.0"
+
 
 class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
     """MySQL-backed event log storage.
@@ -55,18 +60,23 @@ class MySQLEventLogStorage(SqlEventLogStorage, ConfigurableClass):
 
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = check.str_param(mysql_url, "mysql_url")
         self._disposed = False
 
         self._event_watcher = SqlPollingEventWatcher(self)
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level=mysql_isolation_level(),
-            poolclass=db_pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a pool is configured
+        self._pool_config = pool_config
+        self._engine = create_storage_engine(
+            self.mysql_url, self._pool_config, isolation_level=mysql_isolation_level()
         )
         self._secondary_index_cache = {}
 
@@ -89,13 +99,13 @@ def _init_db(self) -> None:
             stamp_alembic_rev(mysql_alembic_config(__file__), conn)
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
-        # When running in dagster-webserver, hold an open connection
+        # When running in dagster-webserver, hold an open connection (or the configured pool)
         # https://github.com/dagster-io/dagster/issues/3719
-        self._engine = create_engine(
+        self._engine.dispose()
+        self._engine = create_storage_engine(
             self.mysql_url,
+            self._pool_config or webserver_pool_config(pool_recycle),
             isolation_level=mysql_isolation_level(),
-            pool_size=1,
-            pool_recycle=pool_recycle,
         )
 
     def upgrade(self) -> None:
@@ -116,7 +126,9 @@ def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLEventLogStorage":
         return MySQLEventLogStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -134,6 +146,15 @@ def create_clean_storage(conn_string: str) -> "MySQLEventLogStorage":
         MySQLEventLogStorage.wipe_storage(conn_string)
         return MySQLEventLogStorage(conn_string)
 
+    @property
+    def supports_batch_queries(self) -> bool:
+        if not self._mysql_version:
+            return False
+
+        return parse_mysql_version(self._mysql_version) >= parse_mysql_version(
+            MINIMUM_MYSQL_BATCH_VERSION
+        )
+
     def get_server_version(self) -> Optional[str]:
         with self.index_connection() as conn:
             row = conn.execute(db.text("select version()")).fetchone()
@@ -172,6 +193,8 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+        self.store_asset_partition_latest(event, event_id)
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -5,7 +5,7 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -17,8 +17,10 @@
     AlembicVersion,
     check_alembic_revision,
     create_engine,
+    create_storage_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
+    webserver_pool_config,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
@@ -55,15 +57,20 @@ class MySQLRunStorage(SqlRunStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level=mysql_isolation_level(),
-            poolclass=db_pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a pool is configured
+        self._pool_config = pool_config
+        self._engine = create_storage_engine(
+            self.mysql_url, self._pool_config, isolation_level=mysql_isolation_level()
         )
 
         self._index_migration_cache = {}
@@ -89,13 +96,13 @@ def _init_db(self) -> None:
             stamp_alembic_rev(mysql_alembic_config(__file__), conn)
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
-        # When running in dagster-webserver, hold 1 open connection
+        # When running in dagster-webserver, hold 1 open connection (or the configured pool)
         # https://github.com/dagster-io/dagster/issues/3719
-        self._engine = create_engine(
+        self._engine.dispose()
+        self._engine = create_storage_engine(
             self.mysql_url,
+            self._pool_config or webserver_pool_config(pool_recycle),
             isolation_level=mysql_isolation_level(),
-            pool_size=1,
-            pool_recycle=pool_recycle,
         )
 
     @property
@@ -119,7 +126,11 @@ def get_server_version(self) -> Optional[str]:
     def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLRunStorage":
-        return MySQLRunStorage(inst_data=inst_data, mysql_url=mysql_url_from_config(config_value))
+        return MySQLRunStorage(
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
+        )
 
     @staticmethod
     def wipe_storage(mysql_url: str) -> None:
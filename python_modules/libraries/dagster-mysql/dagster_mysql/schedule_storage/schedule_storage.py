@@ -9,7 +9,7 @@
 from dagster._core.definitions.auto_materialize_rule_evaluation import (
     AutoMaterializeAssetEvaluation,
 )
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.schedules import ScheduleStorageSqlMetadata, SqlScheduleStorage
 from dagster._core.storage.schedules.schema import (
     AssetDaemonAssetEvaluationsTable,
@@ -19,8 +19,10 @@
     AlembicVersion,
     check_alembic_revision,
     create_engine,
+    create_storage_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
+    webserver_pool_config,
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
 from sqlalchemy.engine import Connection
@@ -55,15 +57,20 @@ class MySQLScheduleStorage(SqlScheduleStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.mysql_url,
-            isolation_level=mysql_isolation_level(),
-            poolclass=db_pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a pool is configured
+        self._pool_config = pool_config
+        self._engine = create_storage_engine(
+            self.mysql_url, self._pool_config, isolation_level=mysql_isolation_level()
         )
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -86,13 +93,13 @@ def _init_db(self) -> None:
         self.optimize()
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
-        # When running in dagster-webserver, hold an open connection
+        # When running in dagster-webserver, hold an open connection (or the configured pool)
         # https://github.com/dagster-io/dagster/issues/3719
-        self._engine = create_engine(
+        self._engine.dispose()
+        self._engine = create_storage_engine(
             self.mysql_url,
+            self._pool_config or webserver_pool_config(pool_recycle),
             isolation_level=mysql_isolation_level(),
-            pool_size=1,
-            pool_recycle=pool_recycle,
         )
 
     @property
@@ -108,7 +115,9 @@ def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLScheduleStorage":
         return MySQLScheduleStorage(
-            inst_data=inst_data, mysql_url=mysql_url_from_config(config_value)
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -3,7 +3,7 @@
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.base_storage import DagsterStorage
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, SqlPoolConfig, mysql_config
 from dagster._core.storage.event_log import EventLogStorage
 from dagster._core.storage.runs import RunStorage
 from dagster._core.storage.schedules import ScheduleStorage
@@ -33,12 +33,17 @@ class DagsterMySQLStorage(DagsterStorage, ConfigurableClass):
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
     """
 
-    def __init__(self, mysql_url, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url,
+        inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
+    ):
         self.mysql_url = mysql_url
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = MySQLRunStorage(mysql_url)
-        self._event_log_storage = MySQLEventLogStorage(mysql_url)
-        self._schedule_storage = MySQLScheduleStorage(mysql_url)
+        self._run_storage = MySQLRunStorage(mysql_url, pool_config=pool_config)
+        self._event_log_storage = MySQLEventLogStorage(mysql_url, pool_config=pool_config)
+        self._schedule_storage = MySQLScheduleStorage(mysql_url, pool_config=pool_config)
         super().__init__()
 
     @property
@@ -56,6 +61,7 @@ def from_config_value(
         return DagsterMySQLStorage(
             inst_data=inst_data,
             mysql_url=mysql_url_from_config(config_value),
+            pool_config=config_value.get("pool"),
         )
 
     @property
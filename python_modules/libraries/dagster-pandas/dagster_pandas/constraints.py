@@ -1,8 +1,9 @@
 import sys
 from collections import defaultdict
 from datetime import datetime
-from functools import wraps
+from functools import cached_property, wraps
 
+import numpy as np
 import pandas as pd
 from dagster import (
     DagsterType,
@@ -389,6 +390,74 @@ def apply_ignore_missing_data_to_mask(mask, column):
     return mask & ~column.isnull()
 
 
+def _to_mask(values):
+    """Converts a boolean series to a numpy mask. Missing values of nullable boolean series are
+    treated as False, as they are when indexing a dataframe with the series.
+    """
+    if isinstance(values.dtype, np.dtype):
+        return values.to_numpy()
+    return values.to_numpy(dtype=bool, na_value=False)
+
+
+class ColumnValues:
+    """The values of a column under validation. Intermediate results that are shared by the
+    constraints on the column, like the mask of its missing values, are computed once, on first use.
+
+    Args:
+        column (pd.Series): The column to validate.
+        factorize (Optional[bool]): If true, the values are hashed once, by factorizing them, and
+            the mask of missing values, category membership and duplicates are derived from the
+            codes. Worthwhile for object columns with several constraints that hash their values.
+    """
+
+    def __init__(self, column, factorize=False):
+        self.column = check.inst_param(column, "column", pd.Series)
+        self.factorize = check.bool_param(factorize, "factorize")
+
+    @cached_property
+    def _factorized(self):
+        return pd.factorize(self.column)
+
+    @cached_property
+    def null_mask(self):
+        if self.factorize:
+            # missing values are factorized to -1
+            return self._factorized[0] == -1
+        return self.column.isna().to_numpy()
+
+    def _is_strictly_monotonic(self):
+        # e.g. the ids of rows, which are unique without having to hash them
+        if not (isinstance(self.column.dtype, np.dtype) and self.column.dtype.kind in "iufmM"):
+            return False
+        values = self.column.to_numpy()
+        # comparisons with NaN and NaT are false
+        return bool((values[1:] > values[:-1]).all() or (values[1:] < values[:-1]).all())
+
+    def isin(self, values):
+        if not self.factorize:
+            return _to_mask(self.column.isin(values))
+
+        codes, uniques = self._factorized
+        # append the membership of missing values, which are indexed by their code of -1
+        is_in = np.append(_to_mask(pd.Series(uniques, dtype=object).isin(values)), False)[codes]
+        if self.null_mask.any():
+            is_in[self.null_mask] = _to_mask(self.column[self.null_mask].isin(values))
+        return is_in
+
+    def duplicated(self):
+        if self._is_strictly_monotonic():
+            return np.zeros(len(self.column), dtype=bool)
+
+        if not self.factorize:
+            return self.column.duplicated().to_numpy()
+
+        duplicated = pd.Series(self._factorized[0]).duplicated().to_numpy()
+        if self.null_mask.any():
+            # missing values of different kinds, e.g. None and NaN, share a code
+            duplicated[self.null_mask] = self.column[self.null_mask].duplicated().to_numpy()
+        return duplicated
+
+
 class ColumnAggregateConstraintWithMetadata(ConstraintWithMetadata):
     """Similar to the base class, but now your validation functions should take in columns (pd.Series) not Dataframes.
 
@@ -890,6 +959,36 @@ def __init__(self, error_description=None, markdown_description=None):
     def validate(self, dataframe, column_name):
         pass
 
+    def get_invalid_mask(self, values):
+        """Returns a boolean numpy mask of the values of a column that violate this constraint, or
+        None if the constraint does not apply to individual values, e.g. dtype constraints.
+
+        Args:
+            values (ColumnValues): The values of the column to validate.
+        """
+        return None
+
+    def raise_for_invalid_mask(self, dataframe, column_name, invalid, max_offending_rows=None):
+        """Raises a ColumnConstraintViolationException if any value of the column violates this
+        constraint, collecting at most max_offending_rows offending rows.
+        """
+        if not invalid.any():
+            return
+
+        if max_offending_rows is None:
+            offending_dataframe = dataframe[invalid]
+        else:
+            offending_dataframe = dataframe.iloc[np.flatnonzero(invalid)[:max_offending_rows]]
+        raise ColumnConstraintViolationException(
+            constraint_name=self.name,
+            constraint_description=self.error_description,
+            column_name=column_name,
+            offending_rows=self.get_offending_rows(offending_dataframe, column_name),
+        )
+
+    def get_offending_rows(self, offending_dataframe, column_name):
+        return offending_dataframe
+
     @staticmethod
     def get_offending_row_pairs(dataframe, column_name):
         return zip(dataframe.index.tolist(), dataframe[column_name].tolist())
@@ -956,14 +1055,15 @@ def __init__(self):
         )
 
     def validate(self, dataframe, column_name):
-        rows_with_null_columns = dataframe[dataframe[column_name].isna()]
-        if not rows_with_null_columns.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=self.get_offending_row_pairs(rows_with_null_columns, column_name),
-            )
+        self.raise_for_invalid_mask(
+            dataframe, column_name, self.get_invalid_mask(ColumnValues(dataframe[column_name]))
+        )
+
+    def get_invalid_mask(self, values):
+        return values.null_mask
+
+    def get_offending_rows(self, offending_dataframe, column_name):
+        return self.get_offending_row_pairs(offending_dataframe, column_name)
 
 
 class UniqueColumnConstraint(ColumnConstraint):
@@ -981,17 +1081,15 @@ def __init__(self, ignore_missing_vals):
         )
 
     def validate(self, dataframe, column_name):
-        invalid = dataframe[column_name].duplicated()
+        self.raise_for_invalid_mask(
+            dataframe, column_name, self.get_invalid_mask(ColumnValues(dataframe[column_name]))
+        )
+
+    def get_invalid_mask(self, values):
+        invalid = values.duplicated()
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_duplicated_values = dataframe[invalid]
-        if not rows_with_duplicated_values.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_duplicated_values,
-            )
+            invalid = invalid & ~values.null_mask
+        return invalid
 
 
 class CategoricalColumnConstraint(ColumnConstraint):
@@ -1011,17 +1109,15 @@ def __init__(self, categories, ignore_missing_vals):
         )
 
     def validate(self, dataframe, column_name):
-        invalid = ~dataframe[column_name].isin(self.categories)
+        self.raise_for_invalid_mask(
+            dataframe, column_name, self.get_invalid_mask(ColumnValues(dataframe[column_name]))
+        )
+
+    def get_invalid_mask(self, values):
+        invalid = ~values.isin(self.categories)
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        rows_with_unexpected_buckets = dataframe[invalid]
-        if not rows_with_unexpected_buckets.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=rows_with_unexpected_buckets,
-            )
+            invalid &= ~values.null_mask
+        return invalid
 
 
 class MinValueColumnConstraint(ColumnConstraint):
@@ -1042,17 +1138,15 @@ def __init__(self, min_value, ignore_missing_vals):
         )
 
     def validate(self, dataframe, column_name):
-        invalid = dataframe[column_name] < self.min_value
+        self.raise_for_invalid_mask(
+            dataframe, column_name, self.get_invalid_mask(ColumnValues(dataframe[column_name]))
+        )
+
+    def get_invalid_mask(self, values):
+        invalid = _to_mask(values.column < self.min_value)
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+            invalid = invalid & ~values.null_mask
+        return invalid
 
 
 class MaxValueColumnConstraint(ColumnConstraint):
@@ -1073,17 +1167,15 @@ def __init__(self, max_value, ignore_missing_vals):
         )
 
     def validate(self, dataframe, column_name):
-        invalid = dataframe[column_name] > self.max_value
+        self.raise_for_invalid_mask(
+            dataframe, column_name, self.get_invalid_mask(ColumnValues(dataframe[column_name]))
+        )
+
+    def get_invalid_mask(self, values):
+        invalid = _to_mask(values.column > self.max_value)
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+            invalid = invalid & ~values.null_mask
+        return invalid
 
 
 class InRangeColumnConstraint(ColumnConstraint):
@@ -1109,14 +1201,23 @@ def __init__(self, min_value, max_value, ignore_missing_vals):
         )
 
     def validate(self, dataframe, column_name):
-        invalid = ~dataframe[column_name].between(self.min_value, self.max_value)
+        self.raise_for_invalid_mask(
+            dataframe, column_name, self.get_invalid_mask(ColumnValues(dataframe[column_name]))
+        )
+
+    def get_invalid_mask(self, values):
+        column = values.column
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biuf":
+            # Comparisons with missing values are false, so missing values are out of range. Infinite
+            # bounds, the defaults of numeric columns, only exclude missing values.
+            invalid = values.null_mask.copy()
+            if self.min_value != -float("inf"):
+                invalid |= (column < self.min_value).to_numpy()
+            if self.max_value != float("inf"):
+                invalid |= (column > self.max_value).to_numpy()
+        else:
+            invalid = _to_mask(~column.between(self.min_value, self.max_value))
+
         if self.ignore_missing_vals:
-            invalid = apply_ignore_missing_data_to_mask(invalid, dataframe[column_name])
-        out_of_bounds_rows = dataframe[invalid]
-        if not out_of_bounds_rows.empty:
-            raise ColumnConstraintViolationException(
-                constraint_name=self.name,
-                constraint_description=self.error_description,
-                column_name=column_name,
-                offending_rows=out_of_bounds_rows,
-            )
+            invalid &= ~values.null_mask
+        return invalid
@@ -23,7 +23,7 @@
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import DataFrameValidator, PandasColumn
 
 CONSTRAINT_BLACKLIST = {ColumnDTypeFnConstraint, ColumnDTypeInSetConstraint}
 
@@ -143,6 +143,8 @@ def create_dagster_pandas_dataframe_type(
     metadata_fn=None,
     dataframe_constraints=None,
     loader=None,
+    sample_size=None,
+    max_offending_rows=None,
 ):
     """Constructs a custom pandas dataframe dagster type.
 
@@ -159,6 +161,10 @@ def create_dagster_pandas_dataframe_type(
         loader (Optional[DagsterTypeLoader]): An instance of a class that
             inherits from :py:class:`~dagster.DagsterTypeLoader`. If None, we will default
             to using `dataframe_loader`.
+        sample_size (Optional[int]): If set, the constraints on the values of columns are evaluated
+            on a random sample of this many rows of larger dataframes.
+        max_offending_rows (Optional[int]): The max number of offending rows reported when a
+            column constraint is violated. Defaults to reporting all of them.
     """
     # We allow for the plugging in of a dagster_type_loader so that users can load their custom
     # dataframes via configuration their own way if the default configs don't suffice. This is
@@ -169,6 +175,12 @@ def create_dagster_pandas_dataframe_type(
         check.opt_str_param(description, "description", default=""),
         check.opt_list_param(columns, "columns", of_type=PandasColumn),
     )
+    validator = DataFrameValidator(
+        pandas_columns=columns,
+        dataframe_constraints=dataframe_constraints,
+        sample_size=sample_size,
+        max_offending_rows=max_offending_rows,
+    )
 
     def _dagster_type_check(_, value):
         if not isinstance(value, pd.DataFrame):
@@ -180,11 +192,7 @@ def _dagster_type_check(_, value):
             )
 
         try:
-            validate_constraints(
-                value,
-                pandas_columns=columns,
-                dataframe_constraints=dataframe_constraints,
-            )
+            validator.validate(value)
         except ConstraintViolationException as e:
             return TypeCheck(success=False, description=str(e))
 
@@ -1,3 +1,4 @@
+import numpy as np
 from dagster import (
     DagsterInvariantViolationError,
     _check as check,
@@ -13,8 +14,10 @@
 
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
+    ColumnConstraint,
     ColumnDTypeFnConstraint,
     ColumnDTypeInSetConstraint,
+    ColumnValues,
     Constraint,
     ConstraintViolationException,
     DataFrameConstraint,
@@ -368,19 +371,129 @@ def categorical_column(
         )
 
 
-def validate_constraints(dataframe, pandas_columns=None, dataframe_constraints=None):
-    dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
-    pandas_columns = check.opt_list_param(
-        pandas_columns, "column_constraints", of_type=PandasColumn
-    )
-    dataframe_constraints = check.opt_list_param(
-        dataframe_constraints, "dataframe_constraints", of_type=DataFrameConstraint
+def _has_invalid_mask(constraint):
+    return (
+        isinstance(constraint, ColumnConstraint)
+        and type(constraint).get_invalid_mask is not ColumnConstraint.get_invalid_mask
     )
 
-    if pandas_columns:
-        for column in pandas_columns:
-            column.validate(dataframe)
 
-    if dataframe_constraints:
-        for dataframe_constraint in dataframe_constraints:
+class DataFrameValidator:
+    """Validates dataframes against a fixed set of column and dataframe constraints.
+
+    The constraints are planned once, when the validator is constructed. The constraints on the
+    values of a column are evaluated as vectorized masks over the column, which share the mask of
+    its missing values, and the offending rows of a constraint are only collected when it is
+    violated. Constraints are evaluated in the order they are declared, so the same constraint
+    violation is raised as when validating each constraint separately.
+
+    Args:
+        pandas_columns (Optional[List[PandasColumn]]): The columns to validate.
+        dataframe_constraints (Optional[List[DataFrameConstraint]]): The dataframe-level
+            constraints to validate.
+        sample_size (Optional[int]): If set, the constraints on the values of columns are evaluated
+            on a random sample of this many rows of larger dataframes. The presence and dtypes of
+            columns, and dataframe-level constraints, are always validated on the whole dataframe.
+        max_offending_rows (Optional[int]): The max number of offending rows collected when a
+            constraint is violated. Defaults to collecting all of them.
+        random_state (Optional[int]): The seed used to sample rows.
+    """
+
+    def __init__(
+        self,
+        pandas_columns=None,
+        dataframe_constraints=None,
+        sample_size=None,
+        max_offending_rows=None,
+        random_state=None,
+    ):
+        pandas_columns = check.opt_list_param(
+            pandas_columns, "column_constraints", of_type=PandasColumn
+        )
+        self.dataframe_constraints = check.opt_list_param(
+            dataframe_constraints, "dataframe_constraints", of_type=DataFrameConstraint
+        )
+        self.sample_size = check.opt_int_param(sample_size, "sample_size")
+        self.max_offending_rows = check.opt_int_param(max_offending_rows, "max_offending_rows")
+        self.random_state = check.opt_int_param(random_state, "random_state")
+        check.invariant(
+            self.sample_size is None or self.sample_size > 0, "sample_size must be positive"
+        )
+        check.invariant(
+            self.max_offending_rows is None or self.max_offending_rows > 0,
+            "max_offending_rows must be positive",
+        )
+
+        self._column_plans = []
+        for pandas_column in pandas_columns:
+            column_plan = [
+                (constraint, _has_invalid_mask(constraint))
+                for constraint in pandas_column.constraints
+            ]
+            # object columns are factorized once if several of their constraints hash the values
+            factorize_objects = (
+                any(
+                    isinstance(constraint, (CategoricalColumnConstraint, UniqueColumnConstraint))
+                    for constraint in pandas_column.constraints
+                )
+                and sum(has_invalid_mask for _, has_invalid_mask in column_plan) > 1
+            )
+            self._column_plans.append((pandas_column, column_plan, factorize_objects))
+
+    def _sample(self, dataframe):
+        if self.sample_size is None or len(dataframe) <= self.sample_size:
+            return dataframe
+        # sorted, so that offending rows are reported in the order of the dataframe
+        positions = np.random.default_rng(self.random_state).choice(
+            len(dataframe), size=self.sample_size, replace=False
+        )
+        return dataframe.iloc[np.sort(positions)]
+
+    def validate(self, dataframe):
+        dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
+        sampled_dataframe = None
+
+        for pandas_column, column_plan, factorize_objects in self._column_plans:
+            if pandas_column.name not in dataframe.columns:
+                # raises if the column is required
+                pandas_column.validate(dataframe)
+                continue
+
+            values = None
+            for constraint, has_invalid_mask in column_plan:
+                if not has_invalid_mask:
+                    constraint.validate(dataframe, pandas_column.name)
+                    continue
+
+                if values is None:
+                    if sampled_dataframe is None:
+                        sampled_dataframe = self._sample(dataframe)
+                    column = sampled_dataframe[pandas_column.name]
+                    values = ColumnValues(
+                        column, factorize=factorize_objects and column.dtype == object
+                    )
+                constraint.raise_for_invalid_mask(
+                    sampled_dataframe,
+                    pandas_column.name,
+                    constraint.get_invalid_mask(values),
+                    max_offending_rows=self.max_offending_rows,
+                )
+
+        for dataframe_constraint in self.dataframe_constraints:
             dataframe_constraint.validate(dataframe)
+
+
+def validate_constraints(
+    dataframe,
+    pandas_columns=None,
+    dataframe_constraints=None,
+    sample_size=None,
+    max_offending_rows=None,
+):
+    dataframe = check.inst_param(dataframe, "dataframe", DataFrame)
+    DataFrameValidator(
+        pandas_columns=pandas_columns,
+        dataframe_constraints=dataframe_constraints,
+        sample_size=sample_size,
+        max_offending_rows=max_offending_rows,
+    ).validate(dataframe)
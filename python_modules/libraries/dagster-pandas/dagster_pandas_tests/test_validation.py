@@ -1,6 +1,7 @@
 import pytest
 from dagster_pandas.constraints import (
     CategoricalColumnConstraint,
+    ColumnConstraintViolationException,
     ColumnDTypeFnConstraint,
     ColumnDTypeInSetConstraint,
     ConstraintViolationException,
@@ -9,7 +10,7 @@
     RowCountConstraint,
     UniqueColumnConstraint,
 )
-from dagster_pandas.validation import PandasColumn, validate_constraints
+from dagster_pandas.validation import DataFrameValidator, PandasColumn, validate_constraints
 from pandas import DataFrame, Timestamp
 
 
@@ -220,3 +221,89 @@ def test_datetime_column_with_tz_validation_fails_when_incorrect_tz():
                 PandasColumn.datetime_column("datetime_utc", tz="UTC"),
             ],
         )
+
+
+def test_dataframe_validator_matches_column_validation():
+    dataframe = DataFrame(
+        {
+            "foo": ["a", None, "b", "b", float("nan"), "c"],
+            "bar": [1.0, float("nan"), 2.0, 3.0, 4.0, 5.0],
+        }
+    )
+    column_constraints = [
+        PandasColumn.categorical_column("foo", {"a", "b", "c"}, unique=True),
+        PandasColumn.float_column("bar", min_value=0.0, ignore_missing_vals=True),
+    ]
+
+    with pytest.raises(ColumnConstraintViolationException) as expected:
+        for column in column_constraints:
+            column.validate(dataframe)
+
+    with pytest.raises(ColumnConstraintViolationException) as validated:
+        DataFrameValidator(pandas_columns=column_constraints).validate(dataframe)
+
+    assert validated.value.constraint_name == expected.value.constraint_name
+    assert validated.value.column_name == expected.value.column_name == "foo"
+    assert validated.value.offending_rows.index.tolist() == [1, 4]
+    assert expected.value.offending_rows.index.tolist() == [1, 4]
+
+
+def test_dataframe_validator_max_offending_rows():
+    dataframe = DataFrame({"foo": list(range(-10, 10))})
+    validator = DataFrameValidator(
+        pandas_columns=[PandasColumn.integer_column("foo", min_value=0)],
+        max_offending_rows=3,
+    )
+    with pytest.raises(ColumnConstraintViolationException) as exc_info:
+        validator.validate(dataframe)
+    assert exc_info.value.offending_rows.index.tolist() == [0, 1, 2]
+
+    with pytest.raises(ConstraintViolationException) as exc_info:
+        validate_constraints(
+            dataframe,
+            pandas_columns=[PandasColumn.integer_column("foo", non_nullable=True, unique=True)],
+            dataframe_constraints=[RowCountConstraint(10)],
+        )
+    assert "RowCountConstraint" in str(exc_info.value)
+
+
+def test_dataframe_validator_sample_size():
+    dataframe = DataFrame({"foo": [1] * 99 + [-1], "bar": ["a"] * 100})
+    column_constraints = [
+        PandasColumn.integer_column("foo", min_value=0),
+        PandasColumn.string_column("bar"),
+    ]
+
+    # the offending row is excluded from the sample
+    validator = DataFrameValidator(pandas_columns=column_constraints, sample_size=10)
+    validator._sample = lambda dataframe: dataframe.head(10)  # noqa: SLF001
+    validator.validate(dataframe)
+
+    # dtypes are validated on the whole dataframe
+    with pytest.raises(ColumnConstraintViolationException, match="is_string_dtype"):
+        validator.validate(DataFrame({"foo": [1] * 100, "bar": [1] * 100}))
+
+    with pytest.raises(ColumnConstraintViolationException):
+        DataFrameValidator(pandas_columns=column_constraints, sample_size=100).validate(dataframe)
+
+
+@pytest.mark.parametrize(
+    "values, duplicated",
+    [
+        ([1, 2, 3], []),
+        ([3, 2, 1], []),
+        ([1, 2, 2], [2]),
+        ([1.0, float("nan"), float("nan")], [2]),
+        (["a", None, "a", None], [2, 3]),
+    ],
+)
+def test_dataframe_validator_unique(values, duplicated):
+    validator = DataFrameValidator(
+        pandas_columns=[PandasColumn(name="foo", constraints=[UniqueColumnConstraint(False)])]
+    )
+    if not duplicated:
+        validator.validate(DataFrame({"foo": values}))
+    else:
+        with pytest.raises(ColumnConstraintViolationException) as exc_info:
+            validator.validate(DataFrame({"foo": values}))
+        assert exc_info.value.offending_rows.index.tolist() == duplicated
@@ -10,7 +10,7 @@
 from dagster._core.event_api import EventHandlerFn
 from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.config import pg_config
+from dagster._core.storage.config import SqlPoolConfig, pg_config
 from dagster._core.storage.event_log import (
     AssetKeyTable,
     DynamicPartitionsTable,
@@ -18,18 +18,28 @@
     SqlEventLogStorageMetadata,
     SqlEventLogStorageTable,
 )
+from dagster._core.storage.event_log.archive import (
+    ParquetEventLogArchive,
+    event_log_archive_config_field,
+)
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.codec import (
+    check_event_payload_codec,
+    event_payload_codec_config_field,
+)
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
     create_engine,
+    create_storage_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
+    webserver_pool_config,
 )
 from dagster._core.storage.sqlalchemy_compat import db_select
-from dagster._serdes import ConfigurableClass, ConfigurableClassData, deserialize_value
+from dagster._serdes import ConfigurableClass, ConfigurableClassData
 from sqlalchemy.engine import Connection
 
 from ..utils import (
@@ -78,18 +88,26 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        event_payload_codec: Optional[str] = None,
+        event_log_archive_uri: Optional[str] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = check.str_param(postgres_url, "postgres_url")
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self._event_payload_codec = check_event_payload_codec(event_payload_codec)
+        if event_log_archive_uri:
+            self._event_log_archive = ParquetEventLogArchive(event_log_archive_uri)
 
         self._disposed = False
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a pool is configured
+        self._pool_config = pool_config
+        self._engine = create_storage_engine(
+            self.postgres_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
 
         self._event_watcher = SqlPollingEventWatcher(self)
@@ -114,19 +132,20 @@ def _init_db(self) -> None:
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
-        # When running in dagster-webserver, hold an open connection and set statement_timeout
+        # When running in dagster-webserver, hold an open connection (or the configured pool) and
+        # set statement_timeout
         existing_options = self._engine.url.query.get("options")
         timeout_option = pg_statement_timeout(statement_timeout)
         if existing_options:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
-        self._engine = create_engine(
+        self._engine.dispose()
+        self._engine = create_storage_engine(
             self.postgres_url,
+            self._pool_config or webserver_pool_config(pool_recycle),
             isolation_level="AUTOCOMMIT",
-            pool_size=1,
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
         )
 
     def upgrade(self) -> None:
@@ -140,7 +159,11 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {
+            **pg_config(),
+            "event_payload_codec": event_payload_codec_config_field(),
+            "event_log_archive_uri": event_log_archive_config_field(),
+        }
 
     @classmethod
     def from_config_value(
@@ -150,6 +173,9 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
+            event_payload_codec=config_value.get("event_payload_codec"),
+            event_log_archive_uri=config_value.get("event_log_archive_uri"),
         )
 
     @staticmethod
@@ -259,6 +285,8 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+        self.store_asset_partition_latest(event, event_id)
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -268,7 +296,7 @@ def add_dynamic_partitions(
         # Overload base implementation to push upsert logic down into the db layer
         self._check_partitions_table()
         with self.index_connection() as conn:
-            conn.execute(
+            result = conn.execute(
                 db_dialects.postgresql.insert(DynamicPartitionsTable)
                 .values(
                     [
@@ -278,6 +306,10 @@ def add_dynamic_partitions(
                 )
                 .on_conflict_do_nothing(),
             )
+            if result.rowcount:
+                self._update_dynamic_partitions_version(
+                    conn, partitions_def_name, num_appended=result.rowcount
+                )
 
     def _connect(self) -> ContextManager[Connection]:
         return create_pg_connection(self._engine)
@@ -332,7 +364,7 @@ def _gen_event_log_entry_from_cursor(self, cursor) -> EventLogEntry:
                     SqlEventLogStorageTable.c.id == cursor
                 ),
             )
-            return deserialize_value(cursor_res.scalar(), EventLogEntry)  # type: ignore
+            return self.deserialize_event(cursor_res.scalar())  # type: ignore
 
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
         self._event_watcher.unwatch_run(run_id, handler)
@@ -6,7 +6,7 @@
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -19,8 +19,10 @@
     AlembicVersion,
     check_alembic_revision,
     create_engine,
+    create_storage_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
+    webserver_pool_config,
 )
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
@@ -70,6 +72,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -77,11 +80,11 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url,
-            isolation_level="AUTOCOMMIT",
-            poolclass=db_pool.NullPool,
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a pool is configured
+        self._pool_config = pool_config
+        self._engine = create_storage_engine(
+            self.postgres_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
 
         self._index_migration_cache = {}
@@ -107,19 +110,20 @@ def _init_db(self) -> None:
                 stamp_alembic_rev(pg_alembic_config(__file__), conn)
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
-        # When running in dagster-webserver, hold 1 open connection and set statement_timeout
+        # When running in dagster-webserver, hold 1 open connection (or the configured pool) and
+        # set statement_timeout
         existing_options = self._engine.url.query.get("options")
         timeout_option = pg_statement_timeout(statement_timeout)
         if existing_options:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
-        self._engine = create_engine(
+        self._engine.dispose()
+        self._engine = create_storage_engine(
             self.postgres_url,
+            self._pool_config or webserver_pool_config(pool_recycle),
             isolation_level="AUTOCOMMIT",
-            pool_size=1,
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
         )
 
     @property
@@ -138,6 +142,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -10,7 +10,7 @@
     AutoMaterializeAssetEvaluation,
 )
 from dagster._core.scheduler.instigation import InstigatorState
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.schedules import ScheduleStorageSqlMetadata, SqlScheduleStorage
 from dagster._core.storage.schedules.schema import (
     AssetDaemonAssetEvaluationsTable,
@@ -20,8 +20,10 @@
     AlembicVersion,
     check_alembic_revision,
     create_engine,
+    create_storage_engine,
     run_alembic_upgrade,
     stamp_alembic_rev,
+    webserver_pool_config,
 )
 from dagster._serdes import ConfigurableClass, ConfigurableClassData, serialize_value
 from sqlalchemy.engine import Connection
@@ -69,6 +71,7 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
@@ -76,9 +79,11 @@ def __init__(
             should_autocreate_tables, "should_autocreate_tables"
         )
 
-        # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
-        self._engine = create_engine(
-            self.postgres_url, isolation_level="AUTOCOMMIT", poolclass=db_pool.NullPool
+        # Default to not holding any connections open to prevent accumulating connections per
+        # DagsterInstance, unless a pool is configured
+        self._pool_config = pool_config
+        self._engine = create_storage_engine(
+            self.postgres_url, self._pool_config, isolation_level="AUTOCOMMIT"
         )
 
         # Stamp and create tables if the main table does not exist (we can't check alembic
@@ -102,19 +107,20 @@ def _init_db(self) -> None:
         self.optimize()
 
     def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> None:
-        # When running in dagster-webserver, hold an open connection and set statement_timeout
+        # When running in dagster-webserver, hold an open connection (or the configured pool) and
+        # set statement_timeout
         existing_options = self._engine.url.query.get("options")
         timeout_option = pg_statement_timeout(statement_timeout)
         if existing_options:
             options = f"{timeout_option} {existing_options}"
         else:
             options = timeout_option
-        self._engine = create_engine(
+        self._engine.dispose()
+        self._engine = create_storage_engine(
             self.postgres_url,
+            self._pool_config or webserver_pool_config(pool_recycle),
             isolation_level="AUTOCOMMIT",
-            pool_size=1,
             connect_args={"options": options},
-            pool_recycle=pool_recycle,
         )
 
     @property
@@ -133,6 +139,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            pool_config=config_value.get("pool"),
         )
 
     @staticmethod
@@ -3,8 +3,10 @@
 from dagster import _check as check
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.base_storage import DagsterStorage
-from dagster._core.storage.config import PostgresStorageConfig, pg_config
+from dagster._core.storage.config import PostgresStorageConfig, SqlPoolConfig, pg_config
 from dagster._core.storage.event_log import EventLogStorage
+from dagster._core.storage.event_log.archive import event_log_archive_config_field
+from dagster._core.storage.event_log.codec import event_payload_codec_config_field
 from dagster._core.storage.runs import RunStorage
 from dagster._core.storage.schedules import ScheduleStorage
 from dagster._serdes import ConfigurableClass, ConfigurableClassData
@@ -39,15 +41,28 @@ def __init__(
         postgres_url,
         should_autocreate_tables=True,
         inst_data: Optional[ConfigurableClassData] = None,
+        event_payload_codec: Optional[str] = None,
+        event_log_archive_uri: Optional[str] = None,
+        pool_config: Optional[SqlPoolConfig] = None,
     ):
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
-        self._run_storage = PostgresRunStorage(postgres_url, should_autocreate_tables)
-        self._event_log_storage = PostgresEventLogStorage(postgres_url, should_autocreate_tables)
-        self._schedule_storage = PostgresScheduleStorage(postgres_url, should_autocreate_tables)
+        self._run_storage = PostgresRunStorage(
+            postgres_url, should_autocreate_tables, pool_config=pool_config
+        )
+        self._event_log_storage = PostgresEventLogStorage(
+            postgres_url,
+            should_autocreate_tables,
+            event_payload_codec=event_payload_codec,
+            event_log_archive_uri=event_log_archive_uri,
+            pool_config=pool_config,
+        )
+        self._schedule_storage = PostgresScheduleStorage(
+            postgres_url, should_autocreate_tables, pool_config=pool_config
+        )
         super().__init__()
 
     @property
@@ -56,7 +71,11 @@ def inst_data(self) -> Optional[ConfigurableClassData]:
 
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {
+            **pg_config(),
+            "event_payload_codec": event_payload_codec_config_field(),
+            "event_log_archive_uri": event_log_archive_config_field(),
+        }
 
     @classmethod
     def from_config_value(
@@ -66,6 +85,9 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            event_payload_codec=config_value.get("event_payload_codec"),
+            event_log_archive_uri=config_value.get("event_log_archive_uri"),
+            pool_config=config_value.get("pool"),
         )
 
     @property
@@ -158,6 +158,21 @@ def schema_specified_pg_config(hostname):
     """
 
 
+def pooled_pg_config(hostname):
+    return f"""
+      storage:
+        postgres:
+          postgres_db:
+            username: test
+            password: test
+            hostname: {hostname}
+            db_name: test
+          pool:
+            pool_size: 2
+            max_overflow: 0
+    """
+
+
 def test_load_instance(hostname):
     with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))):
         pass
@@ -195,6 +210,38 @@ def test_connection_leak(hostname, conn_string):
     tempdir.cleanup()
 
 
+def test_pooled_connections(hostname):
+    with instance_for_test(overrides=yaml.safe_load(pooled_pg_config(hostname))) as instance:
+        storages = [
+            instance._run_storage,  # noqa: SLF001
+            instance._event_storage,  # noqa: SLF001
+            instance._schedule_storage,  # noqa: SLF001
+        ]
+        num_connects = [0] * len(storages)
+        for i, storage in enumerate(storages):
+
+            def _count_connect(*_args, i=i):
+                num_connects[i] += 1
+
+            db.event.listen(storage._engine, "connect", _count_connect)  # noqa: SLF001
+
+        for _ in range(10):
+            instance.get_runs()
+            instance.all_asset_keys()
+            instance.all_instigator_state()
+
+        # connections are reused across queries, instead of opened for each of them
+        assert all(count <= 1 for count in num_connects)
+        for storage in storages:
+            assert storage._engine.pool.size() == 2  # noqa: SLF001
+
+        # the configured pool is kept by dagster-webserver
+        instance.optimize_for_webserver(statement_timeout=500, pool_recycle=-1)
+        for storage in storages:
+            assert storage._engine.pool.size() == 2  # noqa: SLF001
+        instance.get_runs()
+
+
 def test_statement_timeouts(hostname):
     with instance_for_test(overrides=yaml.safe_load(full_pg_config(hostname))) as instance:
         instance.optimize_for_webserver(statement_timeout=500, pool_recycle=-1)  # 500ms
@@ -1,4 +1,7 @@
-from typing import Mapping, Optional, Sequence, Type
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Callable, Mapping, Optional, Sequence, Type
 
 import pandas as pd
 import pandas.core.dtypes.common as pd_core_dtypes_common
@@ -10,6 +13,10 @@
 from dagster_snowflake.snowflake_io_manager import SnowflakeDbClient, SnowflakeIOManager
 from snowflake.connector.pandas_tools import pd_writer
 
+# The max number of rows in each Parquet file uploaded by a bulk load. Snowflake loads the files of
+# a stage in parallel.
+BULK_LOAD_CHUNK_SIZE = 1_000_000
+
 
 def _table_exists(table_slice: TableSlice, connection):
     tables = connection.execute(
@@ -81,6 +88,107 @@ def _add_missing_timezone(
     return s
 
 
+def _convert_time_columns(
+    df: pd.DataFrame, convert_fn: Callable[[pd.Series], pd.Series]
+) -> pd.DataFrame:
+    """Applies a conversion to the time columns of a DataFrame, leaving the other columns as is,
+    without copying them.
+    """
+    time_columns = [
+        name
+        for name, dtype in df.dtypes.items()
+        if pd_core_dtypes_common.is_datetime_or_timedelta_dtype(dtype)  # type: ignore  # (bad stubs)
+    ]
+    if not time_columns:
+        return df
+
+    df = df.copy(deep=False)
+    for name in time_columns:
+        df[name] = convert_fn(df[name])
+    return df
+
+
+def _write_parquet_chunks(df: pd.DataFrame, directory: str, chunk_size: int) -> Sequence[str]:
+    """Writes a DataFrame to Parquet files of at most chunk_size rows. An empty DataFrame is
+    written to a single file, so that the schema of the table can be inferred from it.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    paths = []
+    for i, offset in enumerate(range(0, max(table.num_rows, 1), chunk_size)):
+        path = str(Path(directory, f"chunk_{i}.parquet"))
+        # Snowflake does not support Parquet timestamps with nanosecond precision
+        pq.write_table(
+            table.slice(offset, chunk_size),
+            path,
+            compression="snappy",
+            coerce_timestamps="us",
+            allow_truncated_timestamps=True,
+        )
+        paths.append(path)
+    return paths
+
+
+def _bulk_load(
+    table_slice: TableSlice,
+    df: pd.DataFrame,
+    connection,
+    table_exists: bool,
+    chunk_size: int = BULK_LOAD_CHUNK_SIZE,
+) -> None:
+    """Uploads a DataFrame to a temporary stage as Parquet files, and loads them into the table of
+    the table slice with COPY INTO, creating the table from the schema of the files if it does not
+    exist.
+    """
+    schema = f"{table_slice.database}.{table_slice.schema}"
+    object_suffix = uuid.uuid4().hex.upper()
+    stage = f"{schema}.DAGSTER_STAGE_{object_suffix}"
+    file_format = f"{schema}.DAGSTER_PARQUET_{object_suffix}"
+    table = f"{schema}.{table_slice.table}"
+
+    connection.execute(f"CREATE TEMPORARY FILE FORMAT {file_format} TYPE = PARQUET")
+    connection.execute(f"CREATE TEMPORARY STAGE {stage} FILE_FORMAT = {file_format}")
+    try:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            _write_parquet_chunks(df, temp_dir, chunk_size)
+            connection.execute(
+                f"PUT 'file://{Path(temp_dir).as_posix()}/*.parquet' @{stage}"
+                " PARALLEL = 4 AUTO_COMPRESS = FALSE"
+            )
+
+        if not table_exists:
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} USING TEMPLATE (SELECT"
+                " ARRAY_AGG(OBJECT_CONSTRUCT(*)) WITHIN GROUP (ORDER BY ORDER_ID) FROM"
+                f" TABLE(INFER_SCHEMA(LOCATION => '@{stage}', FILE_FORMAT => '{file_format}')))"
+            )
+
+        connection.execute(
+            f"COPY INTO {table} FROM @{stage} FILE_FORMAT = {file_format}"
+            " MATCH_BY_COLUMN_NAME = CASE_INSENSITIVE PURGE = TRUE ON_ERROR = ABORT_STATEMENT"
+        )
+    finally:
+        connection.execute(f"DROP STAGE IF EXISTS {stage}")
+        connection.execute(f"DROP FILE FORMAT IF EXISTS {file_format}")
+
+
+def _fetch_pandas(connection, sql: str) -> pd.DataFrame:
+    """Runs a query with the Snowflake connector underlying a SQLAlchemy connection, and fetches
+    the result in Arrow batches, which are converted to pandas as they are received.
+    """
+    cursor = connection.connection.cursor()
+    try:
+        cursor.execute(sql)
+        batches = list(cursor.fetch_pandas_batches())
+        if not batches:
+            return pd.DataFrame(columns=[column[0] for column in cursor.description])
+        return batches[0] if len(batches) == 1 else pd.concat(batches, ignore_index=True)
+    finally:
+        cursor.close()
+
+
 class SnowflakePandasTypeHandler(DbTypeHandler[pd.DataFrame]):
     """Plugin for the Snowflake I/O Manager that can store and load Pandas DataFrames as Snowflake tables.
 
@@ -122,21 +230,31 @@ def handle_output(
         if context.resource_config and context.resource_config.get(
             "store_timestamps_as_strings", False
         ):
-            with_uppercase_cols = with_uppercase_cols.apply(
+            with_uppercase_cols = _convert_time_columns(
+                with_uppercase_cols,
                 lambda x: _convert_timestamp_to_string(x, column_types, table_slice.table),
-                axis="index",
             )
         else:
-            with_uppercase_cols = with_uppercase_cols.apply(
-                lambda x: _add_missing_timezone(x, column_types, table_slice.table), axis="index"
+            with_uppercase_cols = _convert_time_columns(
+                with_uppercase_cols,
+                lambda x: _add_missing_timezone(x, column_types, table_slice.table),
+            )
+
+        if context.resource_config and context.resource_config.get("bulk_load", False):
+            _bulk_load(
+                table_slice,
+                with_uppercase_cols,
+                connection,
+                table_exists=column_types is not None,
+            )
+        else:
+            with_uppercase_cols.to_sql(
+                table_slice.table,
+                con=connection.engine,
+                if_exists="append",
+                index=False,
+                method=pd_writer,
             )
-        with_uppercase_cols.to_sql(
-            table_slice.table,
-            con=connection.engine,
-            if_exists="append",
-            index=False,
-            method=pd_writer,
-        )
 
         return {
             "row_count": obj.shape[0],
@@ -155,9 +273,12 @@ def load_input(
     ) -> pd.DataFrame:
         if table_slice.partition_dimensions and len(context.asset_partition_keys) == 0:
             return pd.DataFrame()
-        result = pd.read_sql(
-            sql=SnowflakeDbClient.get_select_statement(table_slice), con=connection
-        )
+        if context.resource_config and context.resource_config.get("bulk_load", False):
+            result = _fetch_pandas(connection, SnowflakeDbClient.get_select_statement(table_slice))
+        else:
+            result = pd.read_sql(
+                sql=SnowflakeDbClient.get_select_statement(table_slice), con=connection
+            )
         if context.resource_config and context.resource_config.get(
             "store_timestamps_as_strings", False
         ):
@@ -0,0 +1,174 @@
+"""A local stand-in for a Snowflake connection, which implements the statements used to stage and
+bulk load DataFrames, backed by a local directory for stages and by DataFrames for tables.
+"""
+
+import glob
+import os
+import re
+import shutil
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+
+class LocalResult:
+    def __init__(self, rows: Sequence[Tuple]):
+        self._rows = list(rows)
+
+    def fetchall(self) -> List[Tuple]:
+        return self._rows
+
+
+class LocalCursor:
+    def __init__(self, connection: "LocalSnowflakeConnection", batch_size: int):
+        self._connection = connection
+        self._batch_size = batch_size
+        self._result: Optional[pd.DataFrame] = None
+        self.description: Optional[List[Tuple]] = None
+        self.closed = False
+
+    def execute(self, sql: str) -> None:
+        match = re.fullmatch(r"SELECT (.+) FROM (\S+)(?: WHERE\n.*)?", sql, flags=re.DOTALL)
+        assert match, f"Unsupported query: {sql}"
+        columns, table = match.groups()
+        result = self._connection.get_table(table)
+        if columns != "*":
+            result = result[[column.strip().upper() for column in columns.split(",")]]
+        self._result = result
+        self.description = [(name, None) for name in result.columns]
+
+    def fetch_pandas_batches(self) -> Iterator[pd.DataFrame]:
+        assert self._result is not None
+        for offset in range(0, len(self._result), self._batch_size):
+            yield self._result.iloc[offset : offset + self._batch_size].reset_index(drop=True)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class _RawConnection:
+    def __init__(self, connection: "LocalSnowflakeConnection"):
+        self._connection = connection
+
+    def cursor(self) -> LocalCursor:
+        cursor = LocalCursor(self._connection, self._connection.batch_size)
+        self._connection.cursors.append(cursor)
+        return cursor
+
+
+class LocalSnowflakeConnection:
+    """Stands in for the SQLAlchemy connection to Snowflake passed to the type handler.
+
+    Args:
+        stage_dir (str): The directory in which the files of stages are stored.
+        batch_size (int): The number of rows in each batch fetched with fetch_pandas_batches.
+    """
+
+    def __init__(self, stage_dir: str, batch_size: int = 1000):
+        self.stage_dir = stage_dir
+        self.batch_size = batch_size
+        self.tables: Dict[str, pd.DataFrame] = {}
+        self.stages: Dict[str, str] = {}
+        self.file_formats: Dict[str, str] = {}
+        self.statements: List[str] = []
+        self.uploaded_files: List[str] = []
+        self.cursors: List[LocalCursor] = []
+        self.connection = _RawConnection(self)
+
+    @staticmethod
+    def _table_key(name: str) -> str:
+        # tables are addressed both by their name and by their fully qualified name
+        return name.split(".")[-1].upper()
+
+    def get_table(self, name: str) -> pd.DataFrame:
+        return self.tables[self._table_key(name)]
+
+    def execute(self, sql: str) -> LocalResult:
+        self.statements.append(sql)
+        for pattern, handler in (
+            (r"SHOW TABLES LIKE '(\S+)' IN SCHEMA \S+", self._show_tables),
+            (r"DESCRIBE TABLE (\S+)", self._describe_table),
+            (r"CREATE TEMPORARY FILE FORMAT (\S+) TYPE = PARQUET", self._create_file_format),
+            (r"CREATE TEMPORARY STAGE (\S+) FILE_FORMAT = (\S+)", self._create_stage),
+            (r"PUT 'file://(.+)' @(\S+) .*", self._put),
+            (
+                r"CREATE TABLE IF NOT EXISTS (\S+) USING TEMPLATE .*INFER_SCHEMA\(LOCATION =>"
+                r" '@(\S+)', FILE_FORMAT => '(\S+)'\)\)\)",
+                self._create_table_using_template,
+            ),
+            (
+                r"COPY INTO (\S+) FROM @(\S+) FILE_FORMAT = (\S+) MATCH_BY_COLUMN_NAME ="
+                r" CASE_INSENSITIVE PURGE = TRUE .*",
+                self._copy_into,
+            ),
+            (r"DROP STAGE IF EXISTS (\S+)", self._drop_stage),
+            (r"DROP FILE FORMAT IF EXISTS (\S+)", self._drop_file_format),
+        ):
+            match = re.fullmatch(pattern, sql, flags=re.DOTALL)
+            if match:
+                return LocalResult(handler(*match.groups()) or [])
+
+        raise Exception(f"Unsupported statement: {sql}")
+
+    def _show_tables(self, table: str):
+        return [(table,)] if self._table_key(table) in self.tables else []
+
+    def _describe_table(self, table: str):
+        df = self.get_table(table)
+        return [(name, _snowflake_type(str(dtype))) for name, dtype in df.dtypes.items()]
+
+    def _create_file_format(self, name: str):
+        self.file_formats[name] = "PARQUET"
+
+    def _create_stage(self, name: str, file_format: str):
+        assert file_format in self.file_formats
+        path = os.path.join(self.stage_dir, name)
+        os.makedirs(path)
+        self.stages[name] = path
+
+    def _put(self, pattern: str, stage: str):
+        for path in sorted(glob.glob(pattern)):
+            shutil.copy(path, self.stages[stage])
+            self.uploaded_files.append(os.path.basename(path))
+
+    def _staged_files(self, stage: str) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.stages[stage], "*.parquet")))
+
+    def _create_table_using_template(self, table: str, stage: str, file_format: str):
+        assert file_format in self.file_formats
+        if self._table_key(table) in self.tables:
+            return
+        schema = pq.read_schema(self._staged_files(stage)[0])
+        self.tables[self._table_key(table)] = schema.empty_table().to_pandas()
+
+    def _copy_into(self, table: str, stage: str, file_format: str):
+        assert file_format in self.file_formats
+        existing = self.get_table(table)
+        columns_by_upper_name = {name.upper(): name for name in existing.columns}
+        loaded = [existing]
+        for path in self._staged_files(stage):
+            df = pq.read_table(path).to_pandas()
+            loaded.append(df.rename(columns=lambda name: columns_by_upper_name[name.upper()]))
+            os.remove(path)
+        self.tables[self._table_key(table)] = pd.concat(loaded, ignore_index=True)
+
+    def _drop_stage(self, name: str):
+        path = self.stages.pop(name, None)
+        if path:
+            shutil.rmtree(path)
+
+    def _drop_file_format(self, name: str):
+        self.file_formats.pop(name, None)
+
+
+def _snowflake_type(dtype: str) -> str:
+    if dtype.startswith("datetime64"):
+        return "TIMESTAMP_NTZ(9)"
+    if dtype.startswith(("int", "uint")):
+        return "NUMBER(38,0)"
+    if dtype.startswith("float"):
+        return "FLOAT"
+    if dtype == "bool":
+        return "BOOLEAN"
+    return "VARCHAR(16777216)"
@@ -40,11 +40,14 @@
 )
 from dagster_snowflake_pandas.snowflake_pandas_type_handler import (
     _add_missing_timezone,
+    _bulk_load,
     _convert_string_to_timestamp,
     _convert_timestamp_to_string,
 )
 from pandas import DataFrame, Timestamp
 
+from dagster_snowflake_pandas_tests.local_snowflake import LocalSnowflakeConnection
+
 resource_config = {
     "database": "database_abc",
     "account": "account_abc",
@@ -140,6 +143,119 @@ def test_load_input():
         assert df.equals(DataFrame([{"col1": "a", "col2": 1}]))
 
 
+def _table_slice(table: str = "my_table") -> TableSlice:
+    return TableSlice(
+        table=table,
+        schema="my_schema",
+        database="my_db",
+        columns=None,
+        partition_dimensions=[],
+    )
+
+
+def test_bulk_load_handle_output(tmp_path):
+    handler = SnowflakePandasTypeHandler()
+    connection = LocalSnowflakeConnection(str(tmp_path))
+    df = DataFrame(
+        {
+            "col1": ["a", "b", "c"],
+            "col2": [1, 2, 3],
+            "col3": pandas.date_range("2023-01-01", periods=3),
+        }
+    )
+    output_context = build_output_context(resource_config={**resource_config, "bulk_load": True})
+
+    metadata = handler.handle_output(output_context, _table_slice(), df, connection)
+    assert metadata["row_count"] == 3
+
+    # the table is created from the schema of the staged files, with uppercase columns
+    assert [statement.split(" ")[0] for statement in connection.statements] == [
+        "SHOW",
+        "CREATE",
+        "CREATE",
+        "PUT",
+        "CREATE",
+        "COPY",
+        "DROP",
+        "DROP",
+    ]
+    assert connection.statements[4].startswith(
+        "CREATE TABLE IF NOT EXISTS my_db.my_schema.my_table"
+    )
+    table = connection.get_table("my_db.my_schema.my_table")
+    assert list(table.columns) == ["COL1", "COL2", "COL3"]
+    assert table["COL1"].tolist() == ["a", "b", "c"]
+    assert (table["COL3"] == df["col3"].dt.tz_localize("UTC")).all()
+
+    # the stage and the file format are dropped, and the staged files purged
+    assert not connection.stages
+    assert not connection.file_formats
+    assert not list(tmp_path.iterdir())
+
+    # a second output is appended to the existing table, without creating it
+    connection.statements.clear()
+    handler.handle_output(output_context, _table_slice(), df, connection)
+    assert not any(statement.startswith("CREATE TABLE") for statement in connection.statements)
+    assert len(connection.get_table("my_table")) == 6
+
+
+def test_bulk_load_timestamps_as_strings(tmp_path):
+    handler = SnowflakePandasTypeHandler()
+    connection = LocalSnowflakeConnection(str(tmp_path))
+    df = DataFrame({"col1": pandas.date_range("2023-01-01", periods=3), "col2": [1, 2, 3]})
+    config = {**resource_config, "bulk_load": True, "store_timestamps_as_strings": True}
+
+    handler.handle_output(
+        build_output_context(resource_config=config), _table_slice(), df, connection
+    )
+    assert (
+        connection.get_table("my_table")["COL1"]
+        == _convert_timestamp_to_string(df["col1"], None, "my_table")
+    ).all()
+
+    loaded = handler.load_input(
+        build_input_context(resource_config=config), _table_slice(), connection
+    )
+    assert (loaded["col1"] == df["col1"]).all()
+
+
+def test_bulk_load_chunks(tmp_path):
+    connection = LocalSnowflakeConnection(str(tmp_path))
+    df = DataFrame({"COL1": range(10)})
+
+    _bulk_load(_table_slice(), df, connection, table_exists=False, chunk_size=4)
+    assert sorted(connection.uploaded_files) == [
+        "chunk_0.parquet",
+        "chunk_1.parquet",
+        "chunk_2.parquet",
+    ]
+    assert connection.get_table("my_table")["COL1"].tolist() == list(range(10))
+
+    # an empty DataFrame is still staged, so that the schema of the table can be inferred
+    connection = LocalSnowflakeConnection(str(tmp_path))
+    _bulk_load(_table_slice("empty_table"), df.iloc[:0], connection, table_exists=False)
+    assert connection.uploaded_files == ["chunk_0.parquet"]
+    assert list(connection.get_table("empty_table").columns) == ["COL1"]
+
+
+def test_bulk_load_input(tmp_path):
+    handler = SnowflakePandasTypeHandler()
+    connection = LocalSnowflakeConnection(str(tmp_path), batch_size=2)
+    connection.tables["MY_TABLE"] = DataFrame({"COL1": ["a", "b", "c"], "COL2": [1, 2, 3]})
+    input_context = build_input_context(resource_config={**resource_config, "bulk_load": True})
+
+    df = handler.load_input(input_context, _table_slice(), connection)
+    assert df.equals(DataFrame({"col1": ["a", "b", "c"], "col2": [1, 2, 3]}))
+    # the result is fetched in batches with the cursor of the underlying connection
+    assert len(connection.cursors) == 1
+    assert connection.cursors[0].closed
+
+    connection.tables["MY_TABLE"] = connection.tables["MY_TABLE"].iloc[:0]
+    df = handler.load_input(input_context, _table_slice(), connection)
+    assert list(df.columns) == ["col1", "col2"]
+    assert df.empty
+
+
 def test_type_conversions():
     # no timestamp data
     no_time = pandas.Series([1, 2, 3, 4, 5])
@@ -277,6 +277,15 @@ def my_table_a(my_table: pd.DataFrame) -> pd.DataFrame:
             " set to UTC timezone to avoid a Snowflake bug. Defaults to False."
         ),
     )
+    bulk_load: bool = Field(
+        default=False,
+        description=(
+            "If using Pandas DataFrames, whether to store DataFrames by uploading them to a"
+            " temporary stage as Parquet files and loading them with COPY INTO, and to load"
+            " DataFrames by fetching them in Arrow batches, instead of inserting and fetching rows"
+            " through SQLAlchemy. Recommended for large DataFrames. Defaults to False."
+        ),
+    )
     authenticator: Optional[str] = Field(
         default=None,
         description="Optional parameter to specify the authentication mechanism to use.",